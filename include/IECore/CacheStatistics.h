@@ -0,0 +1,137 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORE_CACHESTATISTICS_H
+#define IECORE_CACHESTATISTICS_H
+
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+
+namespace IECore
+{
+
+/// Statistics describing the use of a cache, as returned by the
+/// `statistics()` methods of LRUCache, ComputationCache, ObjectPool
+/// and CachedReader. These are gathered without locking, so may be
+/// queried cheaply at any time, but when queried during concurrent
+/// use the individual values are not guaranteed to be consistent
+/// with one another.
+struct CacheStatistics
+{
+
+	CacheStatistics()
+		:	hits( 0 ), misses( 0 ), evictions( 0 ), evictedCost( 0 ), getterTime( 0 ), concurrentWaits( 0 )
+	{
+	}
+
+	/// The number of lookups which found an item in the cache.
+	size_t hits;
+	/// The number of lookups which did not find an item in the cache.
+	size_t misses;
+	/// The number of items discarded to keep the cache within its
+	/// maximum cost. Explicit calls to `clear()` and `erase()` are
+	/// not counted.
+	size_t evictions;
+	/// The total cost of the evicted items. For ObjectPool this is
+	/// measured in bytes.
+	size_t evictedCost;
+	/// The total time spent computing items following a miss, in seconds.
+	double getterTime;
+	/// The number of lookups which had to wait for another thread to
+	/// finish with an item before proceeding.
+	size_t concurrentWaits;
+
+};
+
+namespace Detail
+{
+
+/// Lock-free counters used to accumulate CacheStatistics.
+struct CacheStatisticsCounters
+{
+
+	CacheStatisticsCounters()
+	{
+		reset();
+	}
+
+	void reset()
+	{
+		hits = 0;
+		misses = 0;
+		evictions = 0;
+		evictedCost = 0;
+		getterTime = 0;
+		concurrentWaits = 0;
+	}
+
+	CacheStatistics statistics() const
+	{
+		CacheStatistics result;
+		result.hits = hits;
+		result.misses = misses;
+		result.evictions = evictions;
+		result.evictedCost = evictedCost;
+		result.getterTime = std::chrono::duration<double>( std::chrono::steady_clock::duration( getterTime ) ).count();
+		result.concurrentWaits = concurrentWaits;
+		return result;
+	}
+
+	static void increment( std::atomic<size_t> &counter, size_t value = 1 )
+	{
+		counter.fetch_add( value, std::memory_order_relaxed );
+	}
+
+	void addGetterTime( std::chrono::steady_clock::duration duration )
+	{
+		getterTime.fetch_add( duration.count(), std::memory_order_relaxed );
+	}
+
+	std::atomic<size_t> hits;
+	std::atomic<size_t> misses;
+	std::atomic<size_t> evictions;
+	std::atomic<size_t> evictedCost;
+	// In std::chrono::steady_clock ticks.
+	std::atomic<int64_t> getterTime;
+	std::atomic<size_t> concurrentWaits;
+
+};
+
+} // namespace Detail
+
+} // namespace IECore
+
+#endif // IECORE_CACHESTATISTICS_H
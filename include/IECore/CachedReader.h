@@ -62,7 +62,6 @@ IE_CORE_FORWARDDECLARE( CachedReader );
 /// \todo We probably need a way of setting parameters for the
 /// Readers, and treating reads with different parameters as different
 /// entities in the cache.
-/// \todo Stats on cache misses etc.
 /// \todo Can we do something to make sure that two paths to the same
 /// file (symlinks) result in only a single cache entry?
 /// \ingroup ioGroup
@@ -110,6 +109,17 @@ class IECORE_API CachedReader : public RefCounted
 		/// Returns the ObjectPool object used by this CachedReader.
 		ObjectPool *objectPool() const;
 
+		/// Returns statistics describing the use of the cache since construction
+		/// or the last call to `resetStatistics()`. Hits and misses count the lookups
+		/// made by `read()` and `cached()`, and getterTime measures the time spent
+		/// loading files.
+		/// Note that the loaded objects themselves are held in the ObjectPool, which
+		/// provides its own statistics.
+		CacheStatistics statistics() const;
+
+		/// Resets all statistics to zero.
+		void resetStatistics();
+
 		/// Returns a static CachedReader instance to be used by anything
 		/// wishing to share it's cache with others. It makes sense to use
 		/// this wherever possible to conserve memory. This initially
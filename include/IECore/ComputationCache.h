@@ -35,6 +35,7 @@
 #ifndef IECORE_COMPUTATIONCACHE_H
 #define IECORE_COMPUTATIONCACHE_H
 
+#include "IECore/CacheStatistics.h"
 #include "IECore/LRUCache.h"
 #include "IECore/ObjectPool.h"
 
@@ -101,6 +102,16 @@ class ComputationCache : public RefCounted
 		/// Returns the ObjectPool object used by this computation cache.
 		ObjectPool *objectPool() const;
 
+		/// Returns statistics describing the use of the cache since construction
+		/// or the last call to `resetStatistics()`. Hits and misses count calls
+		/// to `get()`, getterTime measures the time spent in the ComputeFn, and
+		/// evictions count computations discarded to stay within the maximum
+		/// number of computations.
+		CacheStatistics statistics() const;
+
+		/// Resets all statistics to zero.
+		void resetStatistics();
+
 	private :
 
 		ComputeFn m_computeFn;
@@ -111,6 +122,10 @@ class ComputationCache : public RefCounted
 
 		ObjectPoolPtr m_objectPool;
 
+		Detail::CacheStatisticsCounters m_statistics;
+
+		ConstObjectPtr compute( const T &args );
+
 		static MurmurHash cacheGetter( const MurmurHash &h, size_t &cost );
 };
 
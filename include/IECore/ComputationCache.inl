@@ -37,6 +37,8 @@
 
 #include "IECore/MessageHandler.h"
 
+#include <chrono>
+
 namespace IECore
 {
 
@@ -94,13 +96,15 @@ ConstObjectPtr ComputationCache<T>::get( const T &args, ComputationCache::Missin
 		/// don't know the computation hash... check the missing behaviour
 		if ( missingBehaviour == ThrowIfMissing )
 		{
+			Detail::CacheStatisticsCounters::increment( m_statistics.misses );
 			throw Exception( "Computation not available in the cache!" );
 		}
 		else if ( missingBehaviour == NullIfMissing )
 		{
+			Detail::CacheStatisticsCounters::increment( m_statistics.misses );
 			return nullptr;
 		}
-		obj = m_computeFn(args);
+		obj = compute(args);
 		if ( obj )
 		{
 			m_cache.set( computationHash, obj->hash(), 1 );
@@ -115,13 +119,15 @@ ConstObjectPtr ComputationCache<T>::get( const T &args, ComputationCache::Missin
 			/// the computation result was not in the object pool.... check the missing behavour
 			if ( missingBehaviour == ThrowIfMissing )
 			{
+				Detail::CacheStatisticsCounters::increment( m_statistics.misses );
 				throw Exception( "Computation result not available in the cache!" );
 			}
 			else if ( missingBehaviour == NullIfMissing )
 			{
+				Detail::CacheStatisticsCounters::increment( m_statistics.misses );
 				return nullptr;
 			}
-			obj = m_computeFn(args);
+			obj = compute(args);
 			if ( obj )
 			{
 				obj = m_objectPool->store( obj.get(), ObjectPool::StoreReference );
@@ -134,10 +140,32 @@ ConstObjectPtr ComputationCache<T>::get( const T &args, ComputationCache::Missin
 				}
 			}
 		}
+		else
+		{
+			Detail::CacheStatisticsCounters::increment( m_statistics.hits );
+		}
 	}
 	return obj;
 }
 
+template< typename T >
+ConstObjectPtr ComputationCache<T>::compute( const T &args )
+{
+	Detail::CacheStatisticsCounters::increment( m_statistics.misses );
+	const auto startTime = std::chrono::steady_clock::now();
+	try
+	{
+		ConstObjectPtr result = m_computeFn( args );
+		m_statistics.addGetterTime( std::chrono::steady_clock::now() - startTime );
+		return result;
+	}
+	catch( ... )
+	{
+		m_statistics.addGetterTime( std::chrono::steady_clock::now() - startTime );
+		throw;
+	}
+}
+
 template< typename T >
 void ComputationCache<T>::set( const T &args, const Object *obj, StoreMode storeMode )
 {
@@ -162,6 +190,24 @@ ObjectPool *ComputationCache<T>::objectPool() const
 	return m_objectPool.get();
 }
 
+template< typename T >
+CacheStatistics ComputationCache<T>::statistics() const
+{
+	CacheStatistics result = m_statistics.statistics();
+	const CacheStatistics cacheStatistics = m_cache.statistics();
+	result.evictions = cacheStatistics.evictions;
+	result.evictedCost = cacheStatistics.evictedCost;
+	result.concurrentWaits = cacheStatistics.concurrentWaits;
+	return result;
+}
+
+template< typename T >
+void ComputationCache<T>::resetStatistics()
+{
+	m_statistics.reset();
+	m_cache.resetStatistics();
+}
+
 } // namespace IECore
 
 #endif // IECORE_COMPUTATIONCACHE_H
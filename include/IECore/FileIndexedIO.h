@@ -59,6 +59,8 @@ class IECORE_API FileIndexedIO : public StreamIndexedIO
 		/// 	"compressor" : String [ 'blosclz' | 'lz4' | 'lz4hc' | 'snappy' | 'zlib']
 		///		"compressionLevel" : Int [ 0 = no compression, 9 = max compression ]
 		///		"maxCompressedBlockSize" : UInt [ size of compression block ]
+		///		"memoryMapped" : Bool [ map the file into memory when opened read-only, sharing
+		///		                        the page cache between processes and avoiding copies of uncompressed data ]
 		FileIndexedIO(const std::string &path, const IndexedIO::EntryIDList &root, IndexedIO::OpenMode mode, const CompoundData *options = nullptr);
 
 		~FileIndexedIO() override;
@@ -39,6 +39,8 @@
 #include "IECore/FileSequence.h"
 #include "IECore/FrameList.h"
 
+#include <ctime>
+
 namespace IECore
 {
 
@@ -58,6 +60,31 @@ IECORE_API void ls( const std::string &path, std::vector< FileSequencePtr > &seq
 /// Attempts to find a sequence matching the given sequence template (e.g. with at least one '#' character).
 IECORE_API void ls( const std::string &sequencePath, FileSequencePtr &sequence, size_t minSequenceSize = 2 );
 
+/// Describes the files in a sequence found by `lsSequenceInfo()`.
+struct IECORE_API FileSequenceInfo
+{
+
+	FileSequenceInfo();
+
+	FileSequencePtr sequence;
+	/// True if every file in the sequence is a regular file, or a symbolic link to one.
+	bool isFiles;
+	/// True if every file in the sequence is a directory, or a symbolic link to one.
+	bool isDirectories;
+	/// The modification time of each file, in the order given by `sequence->fileNames()`.
+	/// Only filled in when requested, since it requires a `stat()` per file.
+	std::vector<std::time_t> modificationTimes;
+
+};
+
+/// Generates all sequences with at least minSequenceSize elements residing in the given directory,
+/// and in subdirectories up to maxDepth levels below it. Subdirectories are listed in parallel, and
+/// file types are taken from the directory entries themselves where the platform provides them, so
+/// that files need only be stat'ed when modificationTimes is true. The file names of the sequences
+/// are relative to path, and the results are sorted by file name. Symbolic links to directories are
+/// listed, but only recursed into if followLinks is true.
+IECORE_API void lsSequenceInfo( const std::string &path, std::vector<FileSequenceInfo> &sequences, size_t minSequenceSize = 2, size_t maxDepth = 0, bool followLinks = false, bool modificationTimes = false );
+
 /// Returns a FrameList instance that "best" represents the specified list of integer
 /// frame numbers. This function attempts to be intelligent and uses a CompoundFrameList
 /// of FrameRange objects to represent the specified frames compactly.
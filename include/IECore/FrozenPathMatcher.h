@@ -0,0 +1,147 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECORE_FROZENPATHMATCHER_H
+#define IECORE_FROZENPATHMATCHER_H
+
+#include "IECore/IndexedIO.h"
+#include "IECore/PathMatcher.h"
+
+#include "boost/iterator/iterator_facade.hpp"
+
+#include <memory>
+
+namespace IECore
+{
+
+/// An immutable form of PathMatcher, optimised for memory usage and for
+/// serialisation. Rather than a tree of individually allocated nodes, the
+/// paths are stored in a few contiguous arrays, with the nodes laid out in
+/// breadth-first order so that the children of each node are adjacent.
+/// Siblings are sorted by name, so that the layout depends only on the paths
+/// contained, and can be written to and read from an IndexedIO without any
+/// further processing. Copies share the same storage, and are therefore cheap.
+class IECORE_API FrozenPathMatcher
+{
+
+	public :
+
+		/// Constructs an empty matcher.
+		FrozenPathMatcher();
+		/// Constructs a matcher containing all the paths in `paths`,
+		/// including those containing wildcards.
+		explicit FrozenPathMatcher( const PathMatcher &paths );
+
+		/// Converts back to a PathMatcher, which may be edited.
+		PathMatcher pathMatcher() const;
+
+		bool isEmpty() const;
+		/// Returns the number of paths in the matcher. Unlike
+		/// `PathMatcher::size()`, this has constant complexity.
+		size_t size() const;
+		/// Returns the number of bytes used to store the paths.
+		size_t memoryUsage() const;
+
+		/// Fills the paths container with all the paths held
+		/// within this matcher.
+		void paths( std::vector<std::string> &paths ) const;
+
+		/// As for `PathMatcher::match()`.
+		unsigned match( const std::string &path ) const;
+		unsigned match( const std::vector<IECore::InternedString> &path ) const;
+
+		/// Returns a matcher for the paths in both this and `paths`.
+		/// Complexity is linear in the number of paths in the smaller
+		/// of the two matchers.
+		FrozenPathMatcher intersection( const FrozenPathMatcher &paths ) const;
+
+		bool operator == ( const FrozenPathMatcher &other ) const;
+		bool operator != ( const FrozenPathMatcher &other ) const;
+
+		/// Writes the matcher into a subdirectory of `io` called `name`.
+		void save( IndexedIO *io, const IndexedIO::EntryID &name ) const;
+		/// Loads a matcher previously written by `save()`.
+		static FrozenPathMatcher load( const IndexedIO *io, const IndexedIO::EntryID &name );
+
+		class Iterator;
+
+		/// Iterators over the paths held in the matcher, equivalent
+		/// to `PathMatcher::Iterator`. Siblings are visited in
+		/// alphabetical order.
+		Iterator begin() const;
+		Iterator end() const;
+
+	private :
+
+		struct Storage;
+		typedef std::shared_ptr<const Storage> ConstStoragePtr;
+
+		FrozenPathMatcher( const ConstStoragePtr &storage );
+
+		ConstStoragePtr m_storage;
+
+};
+
+class IECORE_API FrozenPathMatcher::Iterator : public boost::iterator_facade<Iterator, const std::vector<IECore::InternedString>, boost::forward_traversal_tag>
+{
+
+	private :
+
+		friend class boost::iterator_core_access;
+		friend class FrozenPathMatcher;
+
+		Iterator( const ConstStoragePtr &storage, bool atEnd );
+
+		void increment();
+		bool equal( const Iterator &other ) const;
+		const std::vector<IECore::InternedString> &dereference() const;
+
+		// Moves to the next node in depth-first order, regardless of
+		// whether or not it is a terminator.
+		void incrementNode();
+		bool atEnd() const;
+		size_t node() const;
+
+		ConstStoragePtr m_storage;
+		// The range of sibling nodes being iterated at each depth,
+		// as a pair of ( current, end ) node indices. The root is
+		// represented by a single range of length 1.
+		std::vector<std::pair<size_t, size_t>> m_stack;
+		std::vector<IECore::InternedString> m_path;
+
+};
+
+} // namespace IECore
+
+#endif // IECORE_FROZENPATHMATCHER_H
@@ -436,6 +436,102 @@ class IECORE_API IndexedIO : public RunTimeTyped
 		/// \param arrayLength The number of elements in the array
 		virtual void read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long arrayLength) const  = 0;
 
+		/// The ranged read methods below provide access to part of an array without
+		/// reading the whole thing. The default implementations read the entire
+		/// array and copy the requested range, but derived classes may override
+		/// them to read only the data required.
+
+		/// Read a range of elements from a float array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, float *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a double array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, double *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a half array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, half *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from an int array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, int *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a long array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, int64_t *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a long array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, uint64_t *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from an unsigned int array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, unsigned int *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a char array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, char *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from an unsigned char array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, unsigned char *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a short array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, short *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from an unsigned short array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, unsigned short *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from a string array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, std::string *&x, unsigned long offset, unsigned long count) const;
+
+		/// Read a range of elements from an InternedString array in an existing file.
+		/// \param name The name of the file to be read
+		/// \param x The buffer to fill. If 0 is passed, then memory is allocated and should be freed by the caller.
+		/// \param offset The index of the first element to read
+		/// \param count The number of elements to read. An exception is thrown if the range exceeds the array length.
+		virtual void read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long offset, unsigned long count) const;
+
 		/// Read a float from an existing file.
 		/// \param name The name of the file to be read
 		/// \param x Returns the data read.
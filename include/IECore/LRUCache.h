@@ -35,6 +35,8 @@
 #ifndef IECORE_LRUCACHE_H
 #define IECORE_LRUCACHE_H
 
+#include "IECore/CacheStatistics.h"
+
 #include "boost/function.hpp"
 #include "boost/noncopyable.hpp"
 #include "boost/variant.hpp"
@@ -136,6 +138,15 @@ class LRUCache : private boost::noncopyable
 		/// Returns the current cost of all cached items.
 		Cost currentCost() const;
 
+		/// Returns statistics describing the use of the cache since
+		/// construction or the last call to `resetStatistics()`. Hits
+		/// and misses count calls to `get()`, and getterTime measures
+		/// the time spent in the GetterFunction.
+		CacheStatistics statistics() const;
+
+		/// Resets all statistics to zero.
+		void resetStatistics();
+
 	private :
 
 		// Data
@@ -182,6 +193,8 @@ class LRUCache : private boost::noncopyable
 
 		Cost m_maxCost;
 
+		Detail::CacheStatisticsCounters m_statistics;
+
 		// Methods
 		// =======
 
@@ -48,7 +48,9 @@
 #include "tbb/spin_rw_mutex.h"
 #include "tbb/tbb_thread.h"
 
+#include <atomic>
 #include <cassert>
+#include <chrono>
 #include <iostream>
 #include <tuple>
 #include <vector>
@@ -129,7 +131,7 @@ class Serial
 		typedef typename MapAndList::template nth_index<1>::type List;
 
 		Serial()
-			:	currentCost( 0 )
+			:	currentCost( 0 ), concurrentWaits( 0 )
 		{
 		}
 
@@ -264,6 +266,10 @@ class Serial
 		}
 
 		typename LRUCache::Cost currentCost;
+		// The number of times `acquire()` had to wait for
+		// another thread. Always 0, as we don't support
+		// threaded access.
+		std::atomic<size_t> concurrentWaits;
 
 	private :
 
@@ -345,6 +351,7 @@ class Parallel
 			m_popBinIndex = 0;
 			m_popIterator = m_bins[0].map.begin();
 			currentCost = 0;
+			concurrentWaits = 0;
 		}
 
 		struct Handle : private boost::noncopyable
@@ -381,9 +388,10 @@ class Parallel
 
 			private :
 
-				bool acquire( Bin &bin, const Key &key, AcquireMode mode )
+				bool acquire( Bin &bin, const Key &key, AcquireMode mode, std::atomic<size_t> &concurrentWaits )
 				{
 					assert( !m_item );
+					bool waited = false;
 
 					// Acquiring a handle requires taking two
 					// locks, first the lock for the Bin, and
@@ -447,6 +455,11 @@ class Parallel
 							// the Item lock calls back into the cache and tries to
 							// access another item in the same Bin.
 							binLock.release();
+							if( !waited )
+							{
+								concurrentWaits.fetch_add( 1, std::memory_order_relaxed );
+								waited = true;
+							}
 						}
 					}
 				}
@@ -461,7 +474,7 @@ class Parallel
 
 		bool acquire( const Key &key, Handle &handle, AcquireMode mode )
 		{
-			return handle.acquire( bin( key ), key, mode );
+			return handle.acquire( bin( key ), key, mode, concurrentWaits );
 		}
 
 		void push( Handle &handle )
@@ -550,6 +563,7 @@ class Parallel
 		}
 
 		AtomicCost currentCost;
+		std::atomic<size_t> concurrentWaits;
 
 	private :
 
@@ -649,6 +663,21 @@ typename LRUCache<Key, Value, Policy, GetterKey>::Cost LRUCache<Key, Value, Poli
 	return m_policy.currentCost;
 }
 
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+CacheStatistics LRUCache<Key, Value, Policy, GetterKey>::statistics() const
+{
+	CacheStatistics result = m_statistics.statistics();
+	result.concurrentWaits = m_policy.concurrentWaits;
+	return result;
+}
+
+template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
+void LRUCache<Key, Value, Policy, GetterKey>::resetStatistics()
+{
+	m_statistics.reset();
+	m_policy.concurrentWaits = 0;
+}
+
 template<typename Key, typename Value, template <typename> class Policy, typename GetterKey>
 Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 {
@@ -659,17 +688,22 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 
 	if( status==Uncached )
 	{
+		Detail::CacheStatisticsCounters::increment( m_statistics.misses );
+
 		Value value = Value();
 		Cost cost = 0;
+		const auto startTime = std::chrono::steady_clock::now();
 		try
 		{
 			value = m_getter( key, cost );
 		}
 		catch( ... )
 		{
+			m_statistics.addGetterTime( std::chrono::steady_clock::now() - startTime );
 			handle.writable().state = std::current_exception();
 			throw;
 		}
+		m_statistics.addGetterTime( std::chrono::steady_clock::now() - startTime );
 
 		assert( cacheEntry.status() != Cached ); // this would indicate that another thread somehow
 		assert( cacheEntry.status() != Failed ); // loaded the same thing as us, which is not the intention.
@@ -684,11 +718,13 @@ Value LRUCache<Key, Value, Policy, GetterKey>::get( const GetterKey &key )
 	}
 	else if( status==Cached )
 	{
+		Detail::CacheStatisticsCounters::increment( m_statistics.hits );
 		m_policy.push( handle );
 		return boost::get<Value>( cacheEntry.state );
 	}
 	else
 	{
+		Detail::CacheStatisticsCounters::increment( m_statistics.hits );
 		std::rethrow_exception( boost::get<std::exception_ptr>( cacheEntry.state ) );
 	}
 }
@@ -775,7 +811,12 @@ void LRUCache<Key, Value, Policy, GetterKey>::limitCost( Cost cost )
 			break;
 		}
 
-		eraseInternal( key, cacheEntry );
+		const Cost evictedCost = cacheEntry.cost;
+		if( eraseInternal( key, cacheEntry ) )
+		{
+			Detail::CacheStatisticsCounters::increment( m_statistics.evictions );
+			Detail::CacheStatisticsCounters::increment( m_statistics.evictedCost, evictedCost );
+		}
 	}
 }
 
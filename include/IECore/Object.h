@@ -264,18 +264,33 @@ class IECORE_API Object : public RunTimeTyped
 				template<class T>
 				/// Load an Object instance previously saved by SaveContext::save().
 				typename T::Ptr load( const IndexedIO *container, const IndexedIO::EntryID &name );
+				/// Loads only the elements [offset, offset + count) of a vector Data instance previously saved
+				/// by SaveContext::save(), reading just the required part of the file. The range is clamped to
+				/// the number of elements available. Objects which don't support ranged loading are loaded in
+				/// full. Ranged loads do not share objects with other loads made via this context.
+				template<class T>
+				typename T::Ptr load( const IndexedIO *container, const IndexedIO::EntryID &name, size_t offset, size_t count );
+				/// May be called from load() implementations to determine the range of elements to be loaded,
+				/// given the number of elements available. Returns the full range unless a ranged load was
+				/// requested.
+				void elementRange( size_t numElements, size_t &offset, size_t &count ) const;
 				/// Returns an interface to a raw container created by SaveContext::rawContainer() - please see
 				/// documentation and cautionary notes for that function.
 				const IndexedIO *rawContainer();
 
 			private :
 				struct LoadedObjects;
-				LoadContext( ConstIndexedIOPtr ioInterface, std::shared_ptr<LoadedObjects> loadedObjects );
+				LoadContext( ConstIndexedIOPtr ioInterface, std::shared_ptr<LoadedObjects> loadedObjects, bool ranged = false, size_t offset = 0, size_t count = 0 );
 				ObjectPtr loadObjectOrReference( const IndexedIO *container, const IndexedIO::EntryID &name );
-				ObjectPtr loadObject( const IndexedIO *container );
+				ObjectPtr loadObjectOrReference( const IndexedIO *container, const IndexedIO::EntryID &name, size_t offset, size_t count );
+				ObjectPtr loadObject( const IndexedIO *container, bool ranged = false, size_t offset = 0, size_t count = 0 );
+				void referencePath( const IndexedIO *container, const IndexedIO::EntryID &name, IndexedIO::EntryIDList &pathParts );
 
 				ConstIndexedIOPtr m_ioInterface;
 				std::shared_ptr<LoadedObjects> m_loadedObjects;
+				bool m_ranged;
+				size_t m_offset;
+				size_t m_count;
 		};
 		IE_CORE_DECLAREPTR( LoadContext );
 
@@ -87,6 +87,12 @@ typename T::Ptr Object::LoadContext::load( const IndexedIO *i, const IndexedIO::
 	return runTimeCast<T>( loadObjectOrReference( i, name ) );
 }
 
+template<class T>
+typename T::Ptr Object::LoadContext::load( const IndexedIO *i, const IndexedIO::EntryID &name, size_t offset, size_t count )
+{
+	return runTimeCast<T>( loadObjectOrReference( i, name, offset, count ) );
+}
+
 } // namespace IECore
 
 #endif // IE_CORE_OBJECT_INL
@@ -35,6 +35,7 @@
 #ifndef IECORE_OBJECTPOOL_H
 #define IECORE_OBJECTPOOL_H
 
+#include "IECore/CacheStatistics.h"
 #include "IECore/Export.h"
 #include "IECore/MurmurHash.h"
 #include "IECore/Object.h"
@@ -81,6 +82,16 @@ class IECORE_API ObjectPool : public RefCounted
 		/// Returns the current memory cost of items held in the pool
 		size_t memoryUsage() const;
 
+		/// Returns statistics describing the use of the pool since construction
+		/// or the last call to `resetStatistics()`. Hits and misses count calls
+		/// to `retrieve()`, and evictions count the objects discarded to stay
+		/// within the memory limit, with evictedCost measured in bytes. This
+		/// can be used to choose a suitable limit for IECORE_OBJECTPOOL_MEMORY.
+		CacheStatistics statistics() const;
+
+		/// Resets all statistics to zero.
+		void resetStatistics();
+
 		/// Returns true if the object with the given hash is in the pool.
 		/// Note: this function doesn't garantee that retrieve() will return an object in a multi-threaded application.
 		bool contains( const MurmurHash &hash ) const;
@@ -39,6 +39,7 @@
 #define IECORE_PATHMATCHER_H
 
 #include "IECore/InternedString.h"
+#include "IECore/MurmurHash.h"
 #include "IECore/RefCounted.h"
 
 #include "boost/iterator_adaptors.hpp"
@@ -98,6 +99,17 @@ class IECORE_API PathMatcher
 		/// Returns a PathMatcher for objects matching both this and the given PathMatcher
 		PathMatcher intersection( const PathMatcher &paths ) const;
 
+		/// N-ary set operations, returning a new PathMatcher. Branches are
+		/// processed in parallel, and branches which are identical in all
+		/// inputs are reused without being traversed, so the result shares
+		/// unmodified nodes with the inputs.
+		/// Returns the paths which are in any of `matchers`.
+		static PathMatcher unionOf( const std::vector<PathMatcher> &matchers );
+		/// Returns the paths which are in all of `matchers`.
+		static PathMatcher intersectionOf( const std::vector<PathMatcher> &matchers );
+		/// Returns the paths in `paths` which are not in any of `pathsToRemove`.
+		static PathMatcher differenceOf( const PathMatcher &paths, const std::vector<PathMatcher> &pathsToRemove );
+
 		/// Removes the specified path and all descendant paths.
 		/// Returns true if something was removed, false otherwise.
 		bool prune( const std::string &path );
@@ -115,6 +127,12 @@ class IECORE_API PathMatcher
 		/// added. Complexity : linear in the number of stored
 		/// locations.
 		size_t size() const;
+		/// Returns an estimate of `size()`, visiting approximately
+		/// `maxLocations` locations at most. Where a location has too
+		/// many children to visit within the budget, the count is
+		/// extrapolated from a sample of them. The estimate is exact
+		/// for small matchers.
+		size_t sizeEstimate( size_t maxLocations = 1000 ) const;
 
 		/// Fills the paths container with all the paths held
 		/// within this matcher. Iterators should be preferred
@@ -143,6 +161,8 @@ class IECORE_API PathMatcher
 
 	private :
 
+		friend class FrozenPathMatcher;
+
 		IE_CORE_FORWARDDECLARE( Node )
 
 		PathMatcher( const NodePtr &root );
@@ -245,6 +265,19 @@ class IECORE_API PathMatcher
 
 		void matchWalk( const Node *node, const NameIterator &start, const NameIterator &end, unsigned &result ) const;
 
+		// Walks used by the n-ary set operations. These never modify the input
+		// nodes, and return them in place of copies wherever possible. A null
+		// result denotes an empty tree. Branches are processed in parallel until
+		// `parallelDepth` levels with more than one child have been visited,
+		// after which unions and differences fall back to the pairwise walks above.
+		typedef std::vector<const Node *> ConstNodes;
+		NodePtr unionWalk( ConstNodes &nodes, int parallelDepth );
+		NodePtr intersectionWalk( ConstNodes &nodes, int parallelDepth );
+		// The first element of `nodes` is the node to remove paths from.
+		NodePtr differenceWalk( ConstNodes &nodes, int parallelDepth );
+		static IECore::MurmurHash hashWalk( const Node *node );
+		static double sizeEstimateWalk( const Node *node, size_t budget );
+
 		NodePtr m_root;
 
 };
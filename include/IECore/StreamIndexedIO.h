@@ -140,6 +140,19 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 		void read(const IndexedIO::EntryID &name, short *&x, unsigned long arrayLength) const override;
 		void read(const IndexedIO::EntryID &name, unsigned short *&x, unsigned long arrayLength) const override;
 		void read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long arrayLength) const override;
+		void read(const IndexedIO::EntryID &name, float *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, double *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, half *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, int *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, int64_t *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, uint64_t *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, unsigned int *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, char *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, unsigned char *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, std::string *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, short *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, unsigned short *&x, unsigned long offset, unsigned long count) const override;
+		void read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long offset, unsigned long count) const override;
 		void read(const IndexedIO::EntryID &name, float &x) const override;
 		void read(const IndexedIO::EntryID &name, double &x) const override;
 		void read(const IndexedIO::EntryID &name, half &x) const override;
@@ -178,6 +191,11 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 				/// see 'setInput'
 				void read( char *buffer, size_t size, size_t pos);
 
+				/// returns a pointer to 'size' bytes at 'pos' offset in the file
+				/// if the file is memory mapped, or nullptr otherwise. The pointer
+				/// remains valid for the lifetime of the StreamFile.
+				const char *data( size_t size, size_t pos );
+
 				void seekg( size_t pos, std::ios_base::seekdir dir );
 				void seekp( size_t pos, std::ios_base::seekdir dir );
 				void read( char *buffer, size_t size );
@@ -205,8 +223,9 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 				StreamFile( IndexedIO::OpenMode mode );
 
 				/// Called during construction of derived classes. Assigns a stream and tells if the stream is empty.
-				/// Optionally provide a filename to use for lock free reading
-				void setInput( std::iostream *stream, bool emptyFile, const std::string& fileName );
+				/// Optionally provide a filename to use for lock free reading, and request
+				/// that the file is memory mapped (only honoured for read-only files).
+				void setInput( std::iostream *stream, bool emptyFile, const std::string& fileName, bool memoryMapped = false );
 
 				IndexedIO::OpenMode m_openmode;
 				std::iostream *m_stream;
@@ -250,6 +269,14 @@ class IECORE_API StreamIndexedIO : public IndexedIO
 		template<typename T>
 		void rawRead(const IndexedIO::EntryID &name, T *&x, unsigned long arrayLength) const;
 
+		// Read a range of an array of POD types
+		template<typename T>
+		void read(const IndexedIO::EntryID &name, T *&x, unsigned long offset, unsigned long count) const;
+
+		// Read a range of an array of POD types (without temporary buffers - used on little endian platforms)
+		template<typename T>
+		void rawRead(const IndexedIO::EntryID &name, T *&x, unsigned long offset, unsigned long count) const;
+
 		// Write an instance of a type which is able to flatten itself.
 		template<typename T>
 		void write(const IndexedIO::EntryID &name, const T &x);
@@ -60,6 +60,11 @@ class IECOREGL_API CachedConverter : public IECore::RefCounted
 		/// Returns the object converted to an appropriate IECoreGL type, reusing
 		/// a previous conversion where possible.
 		IECore::ConstRunTimeTypedPtr convert( const IECore::Object *object );
+		/// As above, but if a conversion of `previous` is still in the cache, it
+		/// is passed to ToGLConverter::update() to convert `object` incrementally.
+		/// This is intended for animated objects, with `previous` being the object
+		/// converted for the previous frame.
+		IECore::ConstRunTimeTypedPtr convert( const IECore::Object *object, const IECore::Object *previous );
 
 		/// Returns the maximum amount of memory (in bytes) the cache will use.
 		size_t getMaxMemory() const;
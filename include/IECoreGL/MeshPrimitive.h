@@ -51,9 +51,18 @@ class IECOREGL_API MeshPrimitive : public Primitive
 
 		IE_CORE_DECLARERUNTIMETYPEDEXTENSION( IECoreGL::MeshPrimitive, MeshPrimitiveTypeId, Primitive );
 
+		/// Constructs a mesh of unconnected triangles, with FaceVarying
+		/// primitive variables providing three vertices per triangle.
 		MeshPrimitive( unsigned numTriangles );
+		/// Constructs a mesh of triangles which index into a shared set of
+		/// vertices, three indices per triangle. Vertex attributes are provided
+		/// by Vertex primitive variables, with one value per indexed vertex.
+		MeshPrimitive( IECore::ConstUIntVectorDataPtr vertexIds );
 		~MeshPrimitive() override;
 
+		/// Returns the vertex indices for an indexed mesh, and null otherwise.
+		const IECore::UIntVectorData *vertexIds() const;
+
 		Imath::Box3f bound() const override;
 
 		void addPrimitiveVariable( const std::string &name, const IECoreScene::PrimitiveVariable &primVar ) override;
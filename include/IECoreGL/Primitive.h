@@ -44,6 +44,7 @@
 #include "IECoreScene/PrimitiveVariable.h"
 
 #include "IECore/Export.h"
+#include "IECore/MurmurHash.h"
 #include "IECore/VectorTypedData.h"
 
 IECORE_PUSH_DEFAULT_VISIBILITY
@@ -137,6 +138,26 @@ class IECOREGL_API Primitive : public Renderable
 		virtual void renderInstances( size_t numInstances = 1 ) const = 0;
 		///@}
 
+		//! @name Incremental conversion
+		/// Converters record hashes of the topology and primitive variables
+		/// a Primitive was converted from, so that ToGLConverter::update()
+		/// can reuse the results of a previous conversion when converting a
+		/// new version of an object.
+		//////////////////////////////////////////////////////////////////////////////
+		//@{
+		void setTopologyHash( const IECore::MurmurHash &hash );
+		/// Returns the hash set by setTopologyHash(), or a default
+		/// constructed hash if none has been set.
+		const IECore::MurmurHash &getTopologyHash() const;
+		void setPrimitiveVariableHash( const std::string &name, const IECore::MurmurHash &hash );
+		/// Returns the hash set by setPrimitiveVariableHash(), or a default
+		/// constructed hash if none has been set.
+		IECore::MurmurHash getPrimitiveVariableHash( const std::string &name ) const;
+		/// Returns the vertex or uniform attribute added for the named
+		/// primitive variable, or null if there is none.
+		IECore::ConstDataPtr getPrimitiveVariableData( const std::string &name ) const;
+		//@}
+
 		//! @name StateComponents
 		/// The following StateComponent classes have an effect only on
 		/// Primitive objects.
@@ -189,6 +210,10 @@ class IECOREGL_API Primitive : public Renderable
 		AttributeMap m_vertexAttributes;
 		AttributeMap m_uniformAttributes;
 
+		IECore::MurmurHash m_topologyHash;
+		typedef std::map<std::string, IECore::MurmurHash> HashMap;
+		HashMap m_primitiveVariableHashes;
+
 };
 
 IE_CORE_DECLAREPTR( Primitive );
@@ -38,13 +38,17 @@
 #include "IECoreGL/Export.h"
 #include "IECoreGL/TypeIds.h"
 
+#include "IECoreScene/PrimitiveVariable.h"
+
 #include "IECore/CompoundObject.h"
 #include "IECore/FromCoreConverter.h"
+#include "IECore/MurmurHash.h"
 
 namespace IECoreGL
 {
 
 IE_CORE_FORWARDDECLARE( ToGLConverter )
+IE_CORE_FORWARDDECLARE( Primitive )
 
 /// The ToGLConverter class is a to be used as a base for all classes able to perform
 /// some kind of conversion from an IECore datatype to an IECoreGL datatype.
@@ -66,6 +70,13 @@ class IECOREGL_API ToGLConverter : public IECore::FromCoreConverter
 		/// Returns the object in srcParameter() converted to an appropriate IECoreGL
 		/// type.
 		IECore::RunTimeTypedPtr convert();
+		/// As for convert(), but reusing the work done for `previous`, which should
+		/// be the result of converting an earlier version of the object, such as the
+		/// previous frame of a deforming mesh. When the topology is unchanged, only
+		/// the primitive variables which differ are converted again, and the results
+		/// for the others are shared with `previous`. When nothing can be reused, this
+		/// is equivalent to convert().
+		IECore::RunTimeTypedPtr update( IECore::ConstRunTimeTypedPtr previous );
 
 		//! @name Factory
 		/////////////////////////////////////////////////////////////////////////////////
@@ -99,6 +110,21 @@ class IECOREGL_API ToGLConverter : public IECore::FromCoreConverter
 		/// this function will never be called when the contents of the parameters
 		/// are in a bad state. Must be implemented in derived classes.
 		virtual IECore::RunTimeTypedPtr doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const = 0;
+		/// Called by update(). `previous` may be null, or of an unexpected type, in which
+		/// case implementations should perform a full conversion. The default implementation
+		/// ignores `previous` and calls doConversion().
+		virtual IECore::RunTimeTypedPtr doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const;
+
+		/// Utility for use in doUpdate() implementations. Returns a hash of the
+		/// interpolation, data and indices of a primitive variable, suitable for
+		/// passing to Primitive::setPrimitiveVariableHash().
+		static IECore::MurmurHash primitiveVariableHash( const IECoreScene::PrimitiveVariable &primitiveVariable );
+		/// Utility for use in doUpdate() implementations. If `previous` has the same
+		/// topology hash as `result`, and was converted from a primitive variable with
+		/// the specified hash, adds the converted data from `previous` to `result` and
+		/// returns true. Otherwise returns false, and the primitive variable must be
+		/// converted again.
+		static bool reusePrimitiveVariable( const Primitive *previous, Primitive *result, const std::string &name, IECoreScene::PrimitiveVariable::Interpolation interpolation, const IECore::MurmurHash &hash );
 
 	private :
 
@@ -66,6 +66,7 @@ class IECOREGL_API ToGLPointsConverter : public ToGLConverter
 	protected :
 
 		IECore::RunTimeTypedPtr doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const override;
+		IECore::RunTimeTypedPtr doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const override;
 
 	private :
 
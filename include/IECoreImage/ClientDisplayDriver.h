@@ -49,6 +49,24 @@ namespace IECoreImage
 /// This client class works synchronously.
 /// It forwards all parameters to the server and also includes one called "clientPID" to help grouping AOVs from the same render.
 /// You must set the parameter 'remoteDisplayType' with a registered display driver to be instantiated in the server side.
+///
+/// The following optional parameters control the transport of the image data :
+///
+/// - "displayTransportBatchSize" (IntData) : Buckets are accumulated into messages of at
+///   least this many bytes before being sent. Defaults to 0, sending each bucket individually.
+/// - "displayTransportHalf" (BoolData) : Sends the data as half floats, halving the bandwidth
+///   at the expense of precision. Defaults to false.
+/// - "displayTransportCompression" (BoolData) : Compresses each message using Blosc's
+///   lz4 compressor. Defaults to false.
+/// - "displayTransportQueueSize" (IntData) : When non-zero, imageData() queues messages to
+///   be sent by a background thread, blocking only when this many messages are already
+///   waiting to be sent. Defaults to 0, sending synchronously.
+/// - "displayTransportSharedMemorySize" (IntData) : When non-zero, a POSIX shared memory buffer
+///   of this many bytes is used to pass batches to servers running on the same host, with only
+///   their location being sent via the socket. Defaults to 0.
+///
+/// Batching, half floats, compression and shared memory are negotiated with the server when
+/// the image is opened, and require a server which supports them.
 /// \ingroup renderingGroup
 class IECOREIMAGE_API ClientDisplayDriver : public DisplayDriver
 {
@@ -52,7 +52,7 @@ namespace IECoreImage
 /// Server class that receives images from ClientDisplayDriver connections and forwards the data to local display drivers.
 /// The type of the local display drivers is defined by the 'remoteDisplayType' parameter.
 ///
-/// The server object creates a thread to control the socket connection. The thread dies when the object is destroyed.
+/// The server object creates threads to control the socket connections. The threads die when the object is destroyed.
 /// \ingroup renderingGroup
 class IECOREIMAGE_API DisplayDriverServer : public IECore::RunTimeTyped
 {
@@ -62,8 +62,11 @@ class IECOREIMAGE_API DisplayDriverServer : public IECore::RunTimeTyped
 
 		/// A port number of 0 causes a free port to be chosen
 		/// automatically. Call `portNumber()` after construction
-		/// to retrieve the actual number.
-		DisplayDriverServer( int portNumber = 0 );
+		/// to retrieve the actual number. Sessions are serviced by
+		/// `numThreads` threads, so that data from several clients
+		/// may be processed concurrently. A value of 0 uses one
+		/// thread per hardware thread.
+		DisplayDriverServer( int portNumber = 0, int numThreads = 1 );
 		~DisplayDriverServer() override;
 
 		int portNumber();
@@ -43,6 +43,8 @@
 #include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/TypeIds.h"
 
+#include "tbb/mutex.h"
+
 namespace IECoreImage
 {
 
@@ -62,6 +64,8 @@ class IECOREIMAGE_API ImageDisplayDriver : public DisplayDriver
 
 		bool scanLineOrderOnly() const override;
 		bool acceptsRepeatedData() const override;
+		/// May be called concurrently from multiple threads, provided
+		/// that the boxes do not overlap.
 		void imageData( const Imath::Box2i &box, const float *data, size_t dataSize ) override;
 		void imageClose() override;
 
@@ -90,6 +94,7 @@ class IECOREIMAGE_API ImageDisplayDriver : public DisplayDriver
 		static const DisplayDriverDescription<ImageDisplayDriver> g_description;
 
 		ImagePrimitivePtr m_image;
+		tbb::mutex m_channelsMutex;
 
 };
 
@@ -85,6 +85,10 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 		/// The parameter specifying the miplevel to be read from the image file.
 		IECore::IntParameter *mipLevelParameter();
 		const IECore::IntParameter *mipLevelParameter() const;
+		/// The parameter specifying the region of the data window to be read.
+		/// An empty box (the default) reads the whole data window.
+		IECore::Box2iParameter *regionOfInterestParameter();
+		const IECore::Box2iParameter *regionOfInterestParameter() const;
 		//@}
 
 		//! @name Image specific reading functions
@@ -107,6 +111,25 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 		IECore::DataPtr readChannel( const std::string &name, bool raw = false );
 		//@}
 
+		//! @name Block reading functions
+		/// These allow large images to be streamed a block at a time rather
+		/// than being loaded in their entirety. All reads share the same
+		/// ImageCache, so pixels already cached by one call are reused by the
+		/// next.
+		///////////////////////////////////////////////////////////////
+		//@{
+		/// Returns a list of non-overlapping blocks covering the intersection
+		/// of `region` and the data window. Blocks are aligned to the native
+		/// tiles of the file, or to strips of scanlines for untiled files,
+		/// so that each can be read without decoding pixels belonging to
+		/// another. An empty region is equivalent to the whole data window.
+		std::vector<Imath::Box2i> blocks( const Imath::Box2i &region = Imath::Box2i() );
+		/// Reads an image containing just the pixels inside `region`, which
+		/// must be contained within the data window. The channelNames, rawChannels
+		/// and miplevel parameters are respected, but no metadata is loaded.
+		ImagePrimitivePtr readRegion( const Imath::Box2i &region );
+		//@}
+
 	protected :
 
 		/// Implemented using displayWindow(), dataWindow() and channelNames()
@@ -117,12 +140,14 @@ class IECOREIMAGE_API ImageReader : public IECore::Reader
 		/// Fills the passed vector with the intersection of channelNames() and
 		/// the channels requested by the user in channelNamesParameter().
 		void channelsToRead( std::vector<std::string> &names );
+		ImagePrimitivePtr readRegionInternal( const Imath::Box2i &region, bool rawChannels );
 
 		static const ReaderDescription<ImageReader> g_readerDescription;
 
 		IECore::StringVectorParameterPtr m_channelNamesParameter;
 		IECore::BoolParameterPtr m_rawChannelsParameter;
 		IECore::IntParameterPtr m_miplevelParameter;
+		IECore::Box2iParameterPtr m_regionOfInterestParameter;
 
 		class Implementation;
 		std::unique_ptr<Implementation> m_implementation;
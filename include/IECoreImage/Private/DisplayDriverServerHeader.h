@@ -44,14 +44,39 @@ namespace IECoreImage
 * 7 bytes long:
 * [0] - magic number ( 0x82 )
 * [1] - protocol version ( 1 )
-* [2] - message type ( imageOpen, imageData, imageClose )
+* [2] - message type ( imageOpen, imageData, imageClose, exception, imageDataBatch, imageDataShared )
 * [3-6] - length of following data block.
+*
+* The imageDataBatch message is only sent by clients which have negotiated
+* a transport with the server. The client requests a transport by including
+* an IntData "transport" entry containing TransportFlags in the imageOpen block,
+* and the server responds with a third imageOpen message containing the flags
+* it accepts. The data block of an imageDataBatch message contains a sequence
+* of buckets, each consisting of an Imath::Box2i, a uint32_t number of values
+* and the values themselves. Values are stored as half or float according to
+* the HalfData flag, and the whole block is compressed with Blosc if the
+* CompressedData flag is set.
+*
+* If the SharedMemoryData flag is accepted, the client also provides the name
+* of a DisplayDriverSharedMemory segment in a "sharedMemoryName" StringData entry.
+* Batches may then be written to the segment and sent as imageDataShared messages,
+* whose data block contains only the uint64_t position and size of the uncompressed
+* batch within the segment.
 */
 class DisplayDriverServerHeader
 {
 	public:
 
-		enum MessageType { imageOpen = 1, imageData = 2, imageClose = 3, exception = 4 };
+		enum MessageType { imageOpen = 1, imageData = 2, imageClose = 3, exception = 4, imageDataBatch = 5, imageDataShared = 6 };
+
+		enum TransportFlags
+		{
+			BatchedData = 1,
+			HalfData = 2,
+			CompressedData = 4,
+			SharedMemoryData = 8,
+			AllTransportFlags = BatchedData | HalfData | CompressedData | SharedMemoryData
+		};
 
 		static const unsigned char headerLength = 7;
 		static const unsigned char magicNumber = 0x82;
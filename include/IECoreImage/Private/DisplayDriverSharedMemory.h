@@ -0,0 +1,113 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#ifndef IECOREIMAGE_DISPLAYDRIVERSHAREDMEMORY_H
+#define IECOREIMAGE_DISPLAYDRIVERSHAREDMEMORY_H
+
+#include "boost/noncopyable.hpp"
+
+#include <atomic>
+#include <cstdint>
+#include <string>
+
+namespace IECoreImage
+{
+
+/// A single producer, single consumer ring buffer stored in POSIX shared
+/// memory. This is used by ClientDisplayDriver to pass image data to a
+/// DisplayDriverServer on the same host, with only small messages describing
+/// the location of the data being sent via the socket.
+///
+/// Positions are monotonically increasing byte offsets, and data is never
+/// split across the end of the buffer. The consumer frees space by calling
+/// `release()` with the end position of the data it has finished with.
+class DisplayDriverSharedMemory : boost::noncopyable
+{
+
+	public :
+
+		/// Creates a new segment with a unique name, able to hold at
+		/// least `capacity` bytes of data. Throws if shared memory is
+		/// not available.
+		explicit DisplayDriverSharedMemory( size_t capacity );
+		/// Opens the existing segment with the specified name,
+		/// throwing if it can not be opened.
+		explicit DisplayDriverSharedMemory( const std::string &name );
+		~DisplayDriverSharedMemory();
+
+		const std::string &name() const;
+		size_t capacity() const;
+
+		/// Removes the name from the system, so that the memory is freed
+		/// as soon as both processes have closed it. Called automatically
+		/// by the destructor of the creating process.
+		void unlink();
+
+		/// Producer interface. Copies `size` bytes into the buffer, waiting
+		/// for up to `timeout` seconds for the consumer to free sufficient
+		/// space. Returns the position of the data. `size` must not exceed
+		/// `capacity()`.
+		uint64_t write( const void *data, size_t size, double timeout = 60.0 );
+
+		/// Consumer interface. Returns a pointer to the data at the specified
+		/// position, throwing if the range is invalid.
+		const char *data( uint64_t position, size_t size ) const;
+		/// Consumer interface. Marks all data before `position` as free
+		/// for reuse by the producer.
+		void release( uint64_t position );
+
+	private :
+
+		struct Header
+		{
+			std::atomic<uint64_t> consumed;
+			uint64_t capacity;
+		};
+
+		static const size_t g_headerSize = 64;
+
+		Header *header() const;
+		char *buffer() const;
+
+		std::string m_name;
+		bool m_owner;
+		size_t m_mappedSize;
+		void *m_memory;
+		uint64_t m_produced;
+
+};
+
+} // namespace IECoreImage
+
+#endif // IECOREIMAGE_DISPLAYDRIVERSHAREDMEMORY_H
@@ -40,6 +40,7 @@
 #include "IECoreScene/PrimitiveEvaluator.h"
 
 #include "IECore/BoundedKDTree.h"
+#include "IECore/CompoundData.h"
 
 #include "tbb/mutex.h"
 
@@ -106,13 +107,28 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 
 		static PrimitiveEvaluatorPtr create( ConstPrimitivePtr primitive );
 
-		MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh );
+		/// The acceleration structure used by closestPoint(), intersectionPoint()
+		/// and intersectionPoints().
+		enum AccelerationStructure
+		{
+			/// The BoundedKDTree returned by triangleBoundTree().
+			KDTree,
+			/// A bounding volume hierarchy built in parallel using the surface
+			/// area heuristic, and stored as a flat array of cache aligned nodes.
+			/// This is faster to build and to query than the KDTree, particularly
+			/// for large meshes.
+			BoundingVolumeHierarchy
+		};
+
+		MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh, AccelerationStructure accelerationStructure = KDTree );
 
 		~MeshPrimitiveEvaluator() override;
 
 		ConstPrimitivePtr primitive() const override;
 		MeshPrimitive::ConstPtr mesh() const;
 
+		AccelerationStructure accelerationStructure() const;
+
 		PrimitiveEvaluator::ResultPtr createResult() const override;
 
 		void validateResult( PrimitiveEvaluator::Result *result ) const override;
@@ -132,6 +148,28 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 
 		bool signedDistance( const Imath::V3f &p, float &distance, PrimitiveEvaluator::Result *result ) const override;
 
+		//! @name Batched queries
+		/// These perform many queries in parallel, returning the results in
+		/// a CompoundData containing the following arrays, with one element
+		/// per query :
+		///
+		/// - "triangleIndex" (IntVectorData) : The index of the triangle, or -1 if the query failed.
+		/// - "barycentricCoordinates" (V3fVectorData)
+		/// - "P" (V3fVectorData)
+		/// - "N" (V3fVectorData) : The geometric normal.
+		/// - "uv" (V2fVectorData) : Only present if the mesh has suitable uvs.
+		///
+		/// Elements for failed queries are zero.
+		//////////////////////////////////////////////////////////////////////////
+		//@{
+		/// Equivalent to calling closestPoint() for each point.
+		IECore::CompoundDataPtr closestPoints( const std::vector<Imath::V3f> &points ) const;
+		/// Equivalent to calling intersectionPoint() for each origin. The directions
+		/// must either contain one direction per origin, or a single direction to be
+		/// used for all rays.
+		IECore::CompoundDataPtr nearestIntersectionPoints( const std::vector<Imath::V3f> &origins, const std::vector<Imath::V3f> &directions, float maxDistance = Imath::limits<float>::max() ) const;
+		//@}
+
 		float volume() const override;
 
 		Imath::V3f centerOfGravity() const override;
@@ -158,6 +196,8 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 		const TriangleBoundVector *triangleBounds() const;
 		/// Returns a pointer to a tree that can be used for performing fast spacial queries.
 		///  The iterators in this tree point to elements in the vector returned by triangleBounds().
+		/// If the evaluator uses the BoundingVolumeHierarchy, then the tree is built on demand by
+		/// the first call to this function.
 		const TriangleBoundTree *triangleBoundTree() const;
 
 		/// A type for storing the uv bounding box for a triangle.
@@ -182,7 +222,15 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 		const std::vector<int> *m_meshVertexIds;
 
 		TriangleBoundVector m_triangles;
-		TriangleBoundTree *m_tree;
+
+		AccelerationStructure m_accelerationStructure;
+
+		typedef tbb::mutex TreeMutex;
+		mutable TreeMutex m_treeMutex;
+		mutable TriangleBoundTree *m_tree;
+
+		class BVH;
+		BVH *m_bvh;
 
 		UVBoundVector m_uvTriangles;
 		UVBoundTree *m_uvTree;
@@ -192,6 +240,15 @@ class IECORESCENE_API MeshPrimitiveEvaluator : public PrimitiveEvaluator
 		bool intersectionPointWalk( TriangleBoundTree::NodeIndex nodeIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result, bool &hit ) const;
 		void intersectionPointsWalk( TriangleBoundTree::NodeIndex nodeIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
 
+		void closestPointBVH( const Imath::V3f &p, float &closestDistanceSqrd, Result *result ) const;
+		bool intersectionPointBVH( const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const;
+		void intersectionPointsBVH( const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
+
+		/// Tests against individual triangles, shared by the KDTree and BVH traversals.
+		void closestPointTriangle( size_t triangleIndex, const Imath::V3f &p, float &closestDistanceSqrd, Result *result ) const;
+		bool intersectionPointTriangle( size_t triangleIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const;
+		void intersectionPointsTriangle( size_t triangleIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const;
+
 		void calculateMassProperties() const;
 		void calculateAverageNormals() const;
 
@@ -140,9 +140,16 @@ class IECORESCENE_API Primitive : public VisibleRenderable
 		/// \param name Name of the entry where the Primitive is stored under the file location.
 		/// \param primVarNames List of primitive variable names that will be attempted to be loaded.
 		static PrimitiveVariableMap loadPrimitiveVariables( const IECore::IndexedIO *ioInterface, const IECore::IndexedIO::EntryID &name, const IECore::IndexedIO::EntryIDList &primVarNames );
+		/// As above, but loading only the elements [offset, offset + count) of each non-constant primitive variable,
+		/// reading just the required part of the file. The range is clamped to the size of each variable. For indexed
+		/// variables the range is applied to the indices, and the data is loaded in full. Note that the range is applied
+		/// regardless of interpolation, so is most useful when loading variables which share an interpolation.
+		static PrimitiveVariableMap loadPrimitiveVariables( const IECore::IndexedIO *ioInterface, const IECore::IndexedIO::EntryID &name, const IECore::IndexedIO::EntryIDList &primVarNames, size_t offset, size_t count );
 
 	private:
 
+		static PrimitiveVariableMap loadPrimitiveVariablesInternal( const IECore::IndexedIO *ioInterface, const IECore::IndexedIO::EntryID &name, const IECore::IndexedIO::EntryIDList &primVarNames, bool ranged, size_t offset, size_t count );
+
 		static const unsigned int m_ioVersion;
 
 };
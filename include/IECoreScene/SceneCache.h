@@ -35,6 +35,8 @@
 #ifndef IECORESCENE_SCENECACHE_H
 #define IECORESCENE_SCENECACHE_H
 
+#include "IECore/CacheStatistics.h"
+#include "IECore/Canceller.h"
 #include "IECore/PathMatcherData.h"
 
 #include "IECoreScene/Export.h"
@@ -68,7 +70,27 @@ class IECORESCENE_API SceneCache : public SampledSceneInterface
 		/// open mode is Read, only the const methods may be used and
 		/// when the open mode is Write, the non-const methods
 		/// may be used in addition. Append mode is currently not supported.
-		SceneCache( const std::string &fileName, IECore::IndexedIO::OpenMode mode );
+		/// The options are passed to IndexedIO::create(), and may additionally
+		/// contain the following, to bound the memory used by the read caches
+		/// of this file :
+		///
+		/// - "objectCacheMemory" (UInt64Data) : Bytes of objects to cache.
+		/// - "attributeCacheMemory" (UInt64Data) : Bytes of attributes to cache.
+		/// - "transformCacheMemory" (UInt64Data) : Bytes of transforms to cache.
+		///
+		/// When these options are not specified, the cached data is shared
+		/// with all other readers in pools limited by the IECORESCENE_SCENECACHE_OBJECT_MEMORY,
+		/// IECORESCENE_SCENECACHE_ATTRIBUTE_MEMORY and IECORESCENE_SCENECACHE_TRANSFORM_MEMORY
+		/// environment variables, specified in megabytes (defaulting to 500, 50 and 50
+		/// respectively).
+		///
+		/// When writing, the following option is also supported :
+		///
+		/// - "setIndex" (BoolData) : When true (the default), an index of all
+		///   sets and tags in the file is written at the root, allowing `readSet()`
+		///   to be answered without visiting every location in the hierarchy.
+		///   Files written with an index remain readable by previous versions.
+		SceneCache( const std::string &fileName, IECore::IndexedIO::OpenMode mode, const IECore::CompoundData *options = nullptr );
 		/// Constructor which uses an already-opened IndexedIO, this
 		/// can be used if you wish to use an alternative IndexedIO
 		/// implementation for the backend. The given IndexedIO should be
@@ -124,6 +146,7 @@ class IECORESCENE_API SceneCache : public SampledSceneInterface
 		double objectSampleInterval( double time, size_t &floorIndex, size_t &ceilIndex ) const override;
 		IECore::ConstObjectPtr readObjectAtSample( size_t sampleIndex ) const override;
 		PrimitiveVariableMap readObjectPrimitiveVariables( const std::vector<IECore::InternedString> &primVarNames, double time ) const override;
+		PrimitiveVariableMap readObjectPrimitiveVariablesRange( const std::vector<IECore::InternedString> &primVarNames, double time, size_t offset, size_t count ) const override;
 		void writeObject( const IECore::Object *object, double time ) override;
 
 		bool hasChild( const Name &name ) const override;
@@ -139,6 +162,32 @@ class IECORESCENE_API SceneCache : public SampledSceneInterface
 		/// tells you if this scene cache is read only or writable:
 		bool readOnly() const;
 
+		/// Reads the locations matched by `paths` (relative to this location) at each
+		/// of the given frames, warming the internal caches so that subsequent reads
+		/// at those times are served from memory. The `flags` are a mask of
+		/// SceneAlgo::ProcessFlags specifying what to read - Tags and Sets are ignored.
+		/// Locations are read in parallel, and the call blocks until complete, so
+		/// it is intended to be run on a background thread ahead of the reads it
+		/// serves. The work may be abandoned early via the `canceller`, in which case
+		/// IECore::Cancelled is thrown. Only available in Read mode.
+		void prefetch( const IECore::PathMatcher &paths, int startFrame, int endFrame, float frameRate, unsigned int flags, const IECore::Canceller *canceller = nullptr ) const;
+
+		/// Statistics for the caches used when reading objects, transforms
+		/// and attributes.
+		struct ReadCacheStatistics
+		{
+			IECore::CacheStatistics object;
+			IECore::CacheStatistics transform;
+			IECore::CacheStatistics attribute;
+		};
+
+		/// Returns statistics for the read caches, which are shared by all
+		/// locations in the file. These are gathered with lock-free counters,
+		/// so may be queried at any time. Only available in Read mode.
+		ReadCacheStatistics readCacheStatistics() const;
+		/// Resets the read cache statistics to zero. Only available in Read mode.
+		void resetReadCacheStatistics();
+
 		// The attribute names used to mark animated topology and primitive variables
 		// when SceneCache objects are Primitives.
 		static const Name &animatedObjectTopologyAttribute;
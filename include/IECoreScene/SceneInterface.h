@@ -234,6 +234,11 @@ class IECORESCENE_API SceneInterface : public IECore::RunTimeTyped
 		/// Reads primitive variables from the object of type Primitive stored at this path in the scene at the given time.
 		/// Raises exception if it turns out not to be a Primitive object.
 		virtual PrimitiveVariableMap readObjectPrimitiveVariables( const std::vector<IECore::InternedString> &primVarNames, double time ) const = 0;
+		/// As above, but returning only the elements [offset, offset + count) of each non-constant
+		/// primitive variable, clamped to the size of the variable. For indexed variables the range
+		/// is applied to the indices. The default implementation reads the variables in full and then
+		/// slices them, but implementations may override it to read only the requested elements.
+		virtual PrimitiveVariableMap readObjectPrimitiveVariablesRange( const std::vector<IECore::InternedString> &primVarNames, double time, size_t offset, size_t count ) const;
 		/// Writes a geometry to this path in the scene.
 		/// Raises an exception if you try to write an object in the root path.
 		virtual void writeObject( const IECore::Object *object, double time ) = 0;
@@ -0,0 +1,131 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#ifndef IECORESCENE_MESHTOPOLOGY_H
+#define IECORESCENE_MESHTOPOLOGY_H
+
+#include "IECoreScene/Export.h"
+#include "IECoreScene/MeshPrimitive.h"
+
+#include "IECore/RefCounted.h"
+#include "IECore/VectorTypedData.h"
+
+#include <mutex>
+#include <vector>
+
+namespace IECoreScene
+{
+
+IE_CORE_FORWARDDECLARE( MeshTopology );
+
+/// Data derived from the topology of a MeshPrimitive, for use by the
+/// algorithms in MeshAlgo. Computing this data is often as expensive as the
+/// algorithms themselves, but for deforming meshes it is identical from frame
+/// to frame. MeshTopology objects are therefore shared between all meshes with
+/// the same topology via a global LRU cache keyed on `topologyHash()` and
+/// bounded by memory usage. Each structure is computed on first use.
+class IECORESCENE_API MeshTopology : public IECore::RefCounted
+{
+
+	public :
+
+		IE_CORE_DECLAREMEMBERPTR( MeshTopology );
+
+		~MeshTopology() override;
+
+		/// Returns the topology for `mesh`, from the cache if possible.
+		static ConstMeshTopologyPtr get( const MeshPrimitive *mesh );
+
+		/// The maximum memory used by the cache. Defaults to the value of
+		/// the `IECORESCENE_MESHTOPOLOGY_MEMORY` environment variable in
+		/// megabytes, or 100 megabytes if it is not set.
+		static size_t getMemoryLimit();
+		static void setMemoryLimit( size_t bytes );
+		static void clear();
+
+		/// The index of the first face-vertex of each face.
+		const std::vector<int> &faceVertexOffsets() const;
+		/// The index of the face that each face-vertex belongs to.
+		const std::vector<int> &faceVertexFaces() const;
+
+		/// The face-vertices referencing each vertex, in ascending order. Those for
+		/// vertex `v` are `vertexFaceVertices()[vertexFaceVertexOffsets()[v]]` up to
+		/// but not including `vertexFaceVertices()[vertexFaceVertexOffsets()[v+1]]`.
+		const std::vector<int> &vertexFaceVertexOffsets() const;
+		const std::vector<int> &vertexFaceVertices() const;
+
+		/// The topology of the mesh produced by `MeshAlgo::triangulate()`, along with
+		/// the face-vertex and face of the original mesh corresponding to each
+		/// face-vertex and face of the triangulated one.
+		IECore::ConstIntVectorDataPtr triangleVerticesPerFace() const;
+		IECore::ConstIntVectorDataPtr triangleVertexIds() const;
+		const std::vector<int> &triangleFaceVertices() const;
+		const std::vector<int> &triangleFaces() const;
+
+	private :
+
+		MeshTopology( const MeshPrimitive *mesh );
+
+		/// An upper bound on the memory used once all
+		/// structures have been computed.
+		size_t memoryUsage() const;
+
+		struct Cache;
+
+		IECore::ConstIntVectorDataPtr m_verticesPerFace;
+		IECore::ConstIntVectorDataPtr m_vertexIds;
+		size_t m_numVertices;
+
+		mutable std::once_flag m_faceVertexOffsetsFlag;
+		mutable std::vector<int> m_faceVertexOffsets;
+
+		mutable std::once_flag m_faceVertexFacesFlag;
+		mutable std::vector<int> m_faceVertexFaces;
+
+		mutable std::once_flag m_vertexFaceVerticesFlag;
+		mutable std::vector<int> m_vertexFaceVertexOffsets;
+		mutable std::vector<int> m_vertexFaceVertices;
+
+		mutable std::once_flag m_triangulationFlag;
+		mutable IECore::IntVectorDataPtr m_triangleVerticesPerFace;
+		mutable IECore::IntVectorDataPtr m_triangleVertexIds;
+		mutable std::vector<int> m_triangleFaceVertices;
+		mutable std::vector<int> m_triangleFaces;
+
+};
+
+} // namespace IECoreScene
+
+#endif // IECORESCENE_MESHTOPOLOGY_H
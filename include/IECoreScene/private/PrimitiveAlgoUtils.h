@@ -51,6 +51,8 @@
 #include "tbb/blocked_range.h"
 #include "tbb/parallel_for.h"
 
+#include <algorithm>
+#include <map>
 #include <unordered_set>
 #include <type_traits>
 
@@ -75,19 +77,79 @@ inline int numPrimitives(const IECoreScene::PointsPrimitive *points)
 	return points->getNumPoints();
 }
 
-inline IECoreScene::PrimitiveVariable::Interpolation splitPrimvarInterpolation(const IECoreScene::MeshPrimitive *mesh)
+/// Returns true if `interpolation` provides one value per primitive, as
+/// counted by `numPrimitives()`.
+inline bool isPrimitiveInterpolation( const IECoreScene::MeshPrimitive *mesh, PrimitiveVariable::Interpolation interpolation )
 {
-	return IECoreScene::PrimitiveVariable::Interpolation::Uniform;
+	return interpolation == PrimitiveVariable::Uniform;
 }
 
-inline IECoreScene::PrimitiveVariable::Interpolation splitPrimvarInterpolation(const IECoreScene::CurvesPrimitive *curves)
+inline bool isPrimitiveInterpolation( const IECoreScene::CurvesPrimitive *curves, PrimitiveVariable::Interpolation interpolation )
 {
-	return IECoreScene::PrimitiveVariable::Interpolation::Uniform;
+	return interpolation == PrimitiveVariable::Uniform;
 }
 
-inline IECoreScene::PrimitiveVariable::Interpolation splitPrimvarInterpolation(const IECoreScene::PointsPrimitive *points)
+inline bool isPrimitiveInterpolation( const IECoreScene::PointsPrimitive *points, PrimitiveVariable::Interpolation interpolation )
 {
-	return IECoreScene::PrimitiveVariable::Interpolation::Vertex;
+	return interpolation == PrimitiveVariable::Vertex || interpolation == PrimitiveVariable::Varying;
+}
+
+/// Returns the index of the first face-vertex of each face.
+inline std::vector<int> faceVertexOffsets( const std::vector<int> &verticesPerFace )
+{
+	std::vector<int> result;
+	result.reserve( verticesPerFace.size() );
+	int offset = 0;
+	for( int numVerts : verticesPerFace )
+	{
+		result.push_back( offset );
+		offset += numVerts;
+	}
+	return result;
+}
+
+/// Returns the index of the face that each face-vertex belongs to.
+inline std::vector<int> faceVertexFaces( const std::vector<int> &verticesPerFace, const std::vector<int> &faceVertexOffsets, size_t numFaceVertices )
+{
+	std::vector<int> result( numFaceVertices );
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, verticesPerFace.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t f = range.begin(); f != range.end(); ++f )
+			{
+				std::fill_n( result.begin() + faceVertexOffsets[f], verticesPerFace[f], f );
+			}
+		},
+		taskGroupContext
+	);
+	return result;
+}
+
+/// Inverts `indices`, which maps each element of an array onto one of `numTargets` targets.
+/// On return, the elements mapping to target `t` are given in ascending order by
+/// `inverse[offsets[t]]` to `inverse[offsets[t+1]-1]`. This allows per-target values to be
+/// gathered from per-element values in parallel, without any synchronisation.
+inline void invertIndices( const std::vector<int> &indices, size_t numTargets, std::vector<int> &offsets, std::vector<int> &inverse )
+{
+	offsets.assign( numTargets + 1, 0 );
+	for( int t : indices )
+	{
+		++offsets[t + 1];
+	}
+
+	for( size_t t = 0; t < numTargets; ++t )
+	{
+		offsets[t + 1] += offsets[t];
+	}
+
+	inverse.resize( indices.size() );
+	std::vector<int> cursors( offsets.begin(), offsets.end() - 1 );
+	for( size_t i = 0; i < indices.size(); ++i )
+	{
+		inverse[cursors[indices[i]]++] = i;
+	}
 }
 
 template< typename T > struct IsArithmeticVectorTypedData
@@ -191,129 +253,19 @@ inline IECore::DataPtr createArrayData( PrimitiveVariable& primitiveVariable, co
 	return nullptr;
 }
 
-/// template to dispatch only primvars which are supported by the SplitTask
-/// Numeric & string like arrays, which contain elements which can be added to a std::set
+/// template to dispatch only primvars which are supported by the TaskSegmenter
+/// Numeric & string like arrays, which contain elements which can be added to a std::map
 template<typename T> struct IsDeletablePrimVar : boost::mpl::or_< IECore::TypeTraits::IsStringVectorTypedData<T>, IECore::TypeTraits::IsNumericVectorTypedData<T> > {};
 
-
-template<typename T, typename S, typename P>
-class SplitTask : public tbb::task
-{
-	private:
-		typedef typename P::Ptr Ptr;
-	public:
-		SplitTask(const std::vector<T> &segments, typename P::Ptr primitive, const S& splitter, const std::string &primvarName, std::vector<Ptr> &outputPrimitives, size_t offset, size_t depth = 0)
-			: m_segments(segments), m_primitive(primitive), m_splitter(splitter), m_primvarName(primvarName), m_outputPrimitives( outputPrimitives ), m_offset(offset), m_depth(depth)
-		{
-		}
-
-		task *execute() override
-		{
-
-			if ( numPrimitives ( m_primitive.get() ) == 0 && !m_segments.empty() )
-			{
-				m_outputPrimitives[m_offset] = m_primitive;
-				return nullptr;
-			}
-
-			if ( m_segments.size () == 0 )
-			{
-				return nullptr;
-			}
-
-			size_t offset = m_segments.size() / 2;
-			typename std::vector<T>::iterator mid = m_segments.begin() + offset;
-
-			IECoreScene::PrimitiveVariable segmentPrimVar = m_primitive->variables.find( m_primvarName )->second;
-
-			std::vector<T> lowerSegments (m_segments.begin(), mid);
-			std::vector<T> upperSegments (mid, m_segments.end());
-
-			std::set<T> lowerSegmentsSet ( m_segments.begin(), mid );
-			std::set<T> upperSegmentsSet (mid, m_segments.end());
-
-			const auto &readable = IECore::runTimeCast<IECore::TypedData<std::vector<T> > >( segmentPrimVar.data )->readable();
-
-			IECore::BoolVectorDataPtr deletionArrayLower = new IECore::BoolVectorData();
-			auto &writableLower = deletionArrayLower->writable();
-
-			IECore::BoolVectorDataPtr deletionArrayUpper = new IECore::BoolVectorData();
-			auto &writableUpper = deletionArrayUpper->writable();
-
-			size_t deleteCount = 0;
-			if( segmentPrimVar.indices )
-			{
-				auto &readableIndices = segmentPrimVar.indices->readable();
-				writableLower.resize( readableIndices.size() );
-				writableUpper.resize( readableIndices.size() );
-
-				for( size_t i = 0; i < readableIndices.size(); ++i )
-				{
-					size_t index = readableIndices[i];
-					writableLower[i] = lowerSegmentsSet.find( readable[index] ) == lowerSegmentsSet.end();
-					writableUpper[i] = upperSegmentsSet.find( readable[index] ) == upperSegmentsSet.end();
-
-					deleteCount += ( writableLower[i] && !lowerSegments.empty() ) || ( writableUpper[i] && !upperSegments.empty() ) ? 1 : 0;
-				}
-			}
-			else
-			{
-				writableLower.resize( readable.size() );
-				writableUpper.resize( readable.size() );
-
-				for( size_t i = 0; i < readable.size(); ++i )
-				{
-					writableLower[i] = lowerSegmentsSet.find( readable[i] ) == lowerSegmentsSet.end();
-					writableUpper[i] = upperSegmentsSet.find( readable[i] ) == upperSegmentsSet.end();
-					deleteCount += ( writableLower[i] && !lowerSegments.empty() ) || ( writableUpper[i] && !upperSegments.empty() ) ? 1 : 0;
-				}
-			}
-
-			if ( m_segments.size() == 1 && deleteCount == 0)
-			{
-				m_outputPrimitives[m_offset] = m_primitive;
-				return nullptr;
-			}
-
-			IECoreScene::PrimitiveVariable::Interpolation i = splitPrimvarInterpolation( m_primitive.get() );
-
-			IECoreScene::PrimitiveVariable delPrimVarLower( i, deletionArrayLower );
-			Ptr a = m_splitter( m_primitive.get(), delPrimVarLower, false ) ;
-
-			IECoreScene::PrimitiveVariable delPrimVarUpper( i, deletionArrayUpper);
-			Ptr b = m_splitter( m_primitive.get(), delPrimVarUpper, false ) ;
-
-			size_t numSplits = 2;
-
-			set_ref_count( 1 + numSplits);
-
-			SplitTask *tA = new( allocate_child() ) SplitTask( lowerSegments, a, m_splitter,  m_primvarName, m_outputPrimitives, m_offset, m_depth + 1);
-			spawn( *tA );
-
-			SplitTask *tB = new( allocate_child() ) SplitTask( upperSegments, b, m_splitter, m_primvarName, m_outputPrimitives, m_offset + offset, m_depth + 1 );
-			spawn( *tB );
-
-			wait_for_all();
-
-			return nullptr;
-		}
-
-	private:
-
-		std::vector<T> m_segments;
-		typename P::Ptr m_primitive;
-		const S &m_splitter;
-		std::string m_primvarName;
-		std::vector<Ptr> &m_outputPrimitives;
-		size_t m_offset;
-		size_t m_depth;
-};
-
-template<typename P, typename S>
+/// Splits a primitive into one primitive per segment value. The segment primitive
+/// variable is scanned once to bucket the primitives by segment, and the outputs are
+/// then built in parallel by `builder`, which is called with the primitive indices
+/// belonging to each segment and must return the corresponding primitive.
+template<typename P, typename B>
 class TaskSegmenter
 {
 	public:
-		TaskSegmenter( const P *primitive, IECore::Data *data, const std::string &primVarName, S &splitter ) : m_primitive( primitive ), m_data( data ), m_primVarName( primVarName ), m_splitter(splitter)
+		TaskSegmenter( const P *primitive, IECore::Data *data, const std::string &primVarName, const B &builder ) : m_primitive( primitive ), m_data( data ), m_primVarName( primVarName ), m_builder( builder )
 		{
 		}
 
@@ -338,20 +290,86 @@ class TaskSegmenter
 				);
 			}
 
+			const PrimitiveVariable &segmentPrimVar = m_primitive->variables.find( m_primVarName )->second;
+			PrimitiveVariable::IndexedView<T> segmentView( array->readable(), segmentPrimVar.indices ? &segmentPrimVar.indices->readable() : nullptr );
+
+			if( !isPrimitiveInterpolation( m_primitive, segmentPrimVar.interpolation ) )
+			{
+				throw IECore::InvalidArgumentException(
+					( boost::format( "Segment primitive variable \"%s\" has unsupported interpolation" ) % m_primVarName ).str()
+				);
+			}
+
+			const size_t numPrims = numPrimitives( m_primitive );
+			if( segmentView.size() != numPrims )
+			{
+				throw IECore::InvalidArgumentException(
+					(
+						boost::format( "Segment primitive variable \"%s\" has %d values but the primitive has %d elements" ) %
+							m_primVarName %
+							segmentView.size() %
+							numPrims
+					).str()
+				);
+			}
+
 			const auto &segmentsReadable = segments->readable();
 
 			ReturnType results( segmentsReadable.size() );
 
+			if( numPrims == 0 )
+			{
+				if( !results.empty() )
+				{
+					results[0] = const_cast<P *>( m_primitive );
+				}
+				return results;
+			}
+
+			// Map each segment value to a bucket. Repeated segment values
+			// share a bucket, but still receive their own output primitive.
+
+			std::map<T, size_t> bucketIndices;
+			std::vector<size_t> segmentBuckets( segmentsReadable.size() );
+			for( size_t s = 0; s < segmentsReadable.size(); ++s )
+			{
+				segmentBuckets[s] = bucketIndices.insert( { segmentsReadable[s], bucketIndices.size() } ).first->second;
+			}
+
+			// Bucket the primitives in a single pass over the segment primitive variable.
+
+			std::vector<std::vector<int>> buckets( bucketIndices.size() );
+			for( size_t i = 0; i < segmentView.size(); ++i )
+			{
+				auto it = bucketIndices.find( segmentView[i] );
+				if( it != bucketIndices.end() )
+				{
+					buckets[it->second].push_back( i );
+				}
+			}
+
+			// Build the output primitives in parallel.
+
 			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
-			SplitTask<T, S, P> *task = new( tbb::task::allocate_root( taskGroupContext ) ) SplitTask<T, S, P>(
-				segmentsReadable,
-				const_cast<P *>(m_primitive),
-				m_splitter,
-				m_primVarName,
-				results,
-				0
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, segmentsReadable.size() ),
+				[&]( const tbb::blocked_range<size_t> &range )
+				{
+					for( size_t s = range.begin(); s != range.end(); ++s )
+					{
+						const std::vector<int> &bucket = buckets[segmentBuckets[s]];
+						if( bucket.size() == numPrims )
+						{
+							results[s] = const_cast<P *>( m_primitive );
+						}
+						else
+						{
+							results[s] = m_builder( bucket );
+						}
+					}
+				},
+				taskGroupContext
 			);
-			tbb::task::spawn_root_and_wait( *task );
 
 			return results;
 
@@ -368,7 +386,7 @@ class TaskSegmenter
 		const P *m_primitive;
 		IECore::Data *m_data;
 		std::string m_primVarName;
-		const S &m_splitter;
+		const B &m_builder;
 };
 
 
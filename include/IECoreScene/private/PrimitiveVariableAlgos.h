@@ -418,6 +418,52 @@ class DeleteFlaggedVertexFunctor : public DeleteFlagged<U>
 		IECore::IntVectorDataPtr m_remappingData;
 };
 
+/// Filter a primitive variable to the elements listed in `elementIndices`, in the
+/// order given. Unlike the DeleteFlagged functors the cost is proportional to the
+/// number of elements kept, which makes it suitable for extracting many small
+/// subsets from the same primitive.
+/// Lifetime of elementIndices & dataIndices should be longer than this functor.
+class GatherFunctor
+{
+	public:
+
+		GatherFunctor( const std::vector<int> &elementIndices )
+			: m_elementIndices( elementIndices ), m_dataIndices( nullptr )
+		{
+		}
+
+		void setIndices( const IECore::TypedData<std::vector<int> > *dataIndices )
+		{
+			m_dataIndices = dataIndices ? &dataIndices->readable() : nullptr;
+		}
+
+		template<typename T, template<typename> class V>
+		IndexedData operator()( const V<std::vector<T> > *data )
+		{
+			IECoreScene::PrimitiveVariable::IndexedView<T> dataView( data->readable(), m_dataIndices );
+			IndexedPrimitiveVariableBuilder<T, V> builder( m_elementIndices.size(), m_dataIndices ? m_elementIndices.size() : 0, data );
+
+			for( int i : m_elementIndices )
+			{
+				builder.addIndexedValue( dataView, i );
+			}
+
+			return builder.indexedData();
+		}
+
+		IndexedData operator()( const IECore::Data *data )
+		{
+			throw IECore::Exception(
+				boost::str( boost::format( "Unexpected Data: %1%" ) % ( data ? data->typeName() : std::string( "nullptr" ) ) )
+			);
+		}
+
+	private:
+
+		const std::vector<int> &m_elementIndices;
+		const std::vector<int> *m_dataIndices;
+};
+
 } // PrimitiveVariableAlgos
 
 } // IECoreScene
@@ -33,11 +33,11 @@
 ##########################################################################
 
 import os
-import glob
 import re
+import json
 import os.path
 import threading
-from fnmatch import fnmatch
+from fnmatch import fnmatch, filter as fnfilter
 
 import six
 if six.PY3 :
@@ -45,7 +45,7 @@ if six.PY3 :
 else :
 	import imp
 
-from IECore import Msg, msg, SearchPath, warning
+from IECore import Msg, msg, SearchPath, warning, MurmurHash
 
 ## This class defines methods for creating instances of classes
 # defined in python modules on disk. We could just use the standard
@@ -62,16 +62,30 @@ from IECore import Msg, msg, SearchPath, warning
 # And for performance sake, it will not explore directories which
 # contain files that match this:
 # <any path>/<className>/<className>*.*
+#
+# The results of scanning the search paths may be stored in a persistent
+# index, so that subsequent processes need only check the modification
+# times of the directories rather than listing them all again. Directories
+# which have been modified since the index was written are rescanned
+# automatically.
 class ClassLoader :
 
 	## Creates a ClassLoader which will load
 	# classes found on the SearchPath object passed
-	# in.
-	def __init__( self, searchPaths ) :
+	# in. If indexDirectory is specified, then the
+	# index of each search path is stored in a file
+	# within it, to be reused by other ClassLoaders
+	# and processes.
+	def __init__( self, searchPaths, indexDirectory = "" ) :
 
 		self.__searchPaths = searchPaths
+		self.__indexDirectory = indexDirectory
 		self.__defaultVersions = {}
 		self.__loadMutex = threading.RLock()
+		# maps from search path to the index of the
+		# directories within it, as described in
+		# __scanDirectory().
+		self.__indexes = {}
 		self.refresh()
 
 	## Returns a copy of the searchpath used to find classes.
@@ -189,7 +203,8 @@ class ClassLoader :
 	## The ClassLoader uses a caching mechanism to speed
 	# up frequent reloads of the same class. This method
 	# can be used to force an update of the cache to
-	# reflect changes on the filesystem.
+	# reflect changes on the filesystem. Only directories
+	# whose modification time has changed are rescanned.
 	def refresh( self ) :
 
 		# __classes is a dictionary mapping from a class name
@@ -208,7 +223,9 @@ class ClassLoader :
 	__defaultLoaderMutex = threading.Lock()
 	## Returns a ClassLoader configured to load from the paths defined by the
 	# specified environment variable. The same object is returned each time,
-	# allowing one loader to be shared by many callers.
+	# allowing one loader to be shared by many callers. If the
+	# IECORE_CLASSLOADER_INDEX_PATH environment variable is set, it specifies
+	# the directory in which persistent indexes are stored.
 	@classmethod
 	def defaultLoader( cls, envVar ) :
 
@@ -224,7 +241,10 @@ class ClassLoader :
 			else :
 				msg( Msg.Level.Warning, "ClassLoader.defaultLoader", "Environment variable %s not set." % envVar )
 
-			loader = cls( SearchPath( os.path.expandvars( sp ) ) )
+			loader = cls(
+				SearchPath( os.path.expandvars( sp ) ),
+				os.path.expandvars( os.environ.get( "IECORE_CLASSLOADER_INDEX_PATH", "" ) )
+			)
 			cls.__defaultLoaders[envVar] = loader
 
 			return loader
@@ -240,30 +260,49 @@ class ClassLoader :
 
 	def __updateClassFromSearchPath( self, searchPath, name ) :
 
-		pattern = re.compile( r".*-(\d+).py$" )
-		pruneDir = False
+		directory = os.path.join( searchPath, name )
+		try :
+			entries = os.listdir( directory )
+		except OSError :
+			return False
+
+		isClass, versions = self.__classVersions( name, entries )
+		if versions :
+			self.__addVersions( name, versions )
+
+		return isClass
+
+	# Returns a tuple containing a bool specifying whether or not the directory
+	# contains a class definition, and the versions of the class it contains. We
+	# match any extension rather than .py to avoid exploring shader directories
+	# without Python files, in which case the bool is True but there are no versions.
+	@staticmethod
+	def __classVersions( name, entries ) :
+
 		nameTail = os.path.split( name )[-1]
+		if not nameTail.startswith( "." ) :
+			# mimic glob, which ignores hidden files
+			entries = [ e for e in entries if not e.startswith( "." ) ]
 
-		# globbing for any extension rather than .py to avoid exploring shader
-		# directories without Python files. Function returns true on those cases.
-		gf = glob.glob( os.path.join( searchPath, name, nameTail + "*.*" ) )
-		for f in gf :
+		matches = fnfilter( entries, nameTail + "*.*" )
 
-			pruneDir = True
+		versions = set()
+		for f in matches :
+			m = re.match( ClassLoader.__versionPattern, f )
+			if m is not None :
+				versions.add( int( m.group( 1 ) ) )
 
-			m = re.match( pattern, f )
-			try :
-				version = int( m.group( 1 ) )
-			except :
-				continue
+		return bool( matches ), sorted( versions )
 
-			c = self.__classes.setdefault( name, { "versions" : [], "imports" : {} } )
+	__versionPattern = re.compile( r".*-(\d+).py$" )
 
-			if not version in c["versions"]:
-				c["versions"].append( version )
-				c["versions"].sort()
+	def __addVersions( self, name, versions ) :
 
-		return pruneDir
+		c = self.__classes.setdefault( name, { "versions" : [], "imports" : {} } )
+		for version in versions :
+			if not version in c["versions"] :
+				c["versions"].append( version )
+		c["versions"].sort()
 
 	def __findClass( self, name ) :
 
@@ -284,23 +323,127 @@ class ClassLoader :
 		self.__classes = {}
 		for path in self.__searchPaths.paths :
 
-			for root, dirs, files in os.walk( path ) :
+			oldIndex = self.__indexes.get( path )
+			if oldIndex is None :
+				oldIndex = self.__readIndex( path )
 
-				if path.endswith( '/' ) :
-					nameBase = root[len(path):]
-				else :
-					nameBase = root[len(path)+1:]
+			newIndex = {}
+			self.__scanDirectory( path, "", oldIndex, newIndex, recurse = True )
 
-				dirsToPrune = set()
-				for d in dirs :
+			self.__indexes[path] = newIndex
+			if newIndex != oldIndex :
+				self.__writeIndex( path, newIndex )
 
-					if self.__updateClassFromSearchPath( path, os.path.join( nameBase, d ) ) :
-						dirsToPrune.add( d )
+		self.__foundAllClasses = True
 
-				for d in dirsToPrune :
-					dirs.remove( d )
+	# Adds the classes found within the named directory to __classes, and
+	# records the directory in newIndex. Each index entry stores the modification
+	# time of the directory along with the results of listing it :
+	#
+	# {
+	#		"mtime" : float,
+	#		"dirs" : [ [ name, isLink ], ... ], # the subdirectories
+	#		"isClass" : bool, # true if the directory contains a class definition
+	#		"versions" : [], # the versions of the class
+	# }
+	#
+	# The entry from oldIndex is reused when the modification time matches,
+	# so that only modified directories are listed. Like os.walk(), we don't
+	# recurse into symbolic links, but do check whether they are classes.
+	def __scanDirectory( self, path, name, oldIndex, newIndex, recurse ) :
+
+		directory = os.path.join( path, name )
+		try :
+			mtime = os.stat( directory ).st_mtime
+		except OSError :
+			return
 
-		self.__foundAllClasses = True
+		entry = oldIndex.get( name )
+		if entry is None or entry["mtime"] != mtime :
+			try :
+				entries = os.listdir( directory )
+			except OSError :
+				return
+			isClass, versions = self.__classVersions( name, entries )
+			entry = {
+				"mtime" : mtime,
+				"dirs" : sorted(
+					[ e, os.path.islink( os.path.join( directory, e ) ) ]
+					for e in entries if os.path.isdir( os.path.join( directory, e ) )
+				),
+				"isClass" : isClass,
+				"versions" : versions,
+			}
+
+		newIndex[name] = entry
+
+		if name and entry["isClass"] :
+			if entry["versions"] :
+				self.__addVersions( name, entry["versions"] )
+			return
+
+		if not recurse :
+			return
+
+		for d, isLink in entry["dirs"] :
+			self.__scanDirectory( path, os.path.join( name, d ), oldIndex, newIndex, recurse = not isLink )
+
+	def __indexFileName( self, path ) :
+
+		h = MurmurHash()
+		h.append( os.path.abspath( path ) )
+		return os.path.join( self.__indexDirectory, "classLoader-" + h.toString() + ".json" )
+
+	def __readIndex( self, path ) :
+
+		if not self.__indexDirectory :
+			return {}
+
+		fileName = self.__indexFileName( path )
+		if not os.path.exists( fileName ) :
+			return {}
+
+		try :
+			with open( fileName, "r" ) as f :
+				index = json.load( f )
+		except Exception as e :
+			msg( Msg.Level.Warning, "ClassLoader", "Unable to read index \"%s\" : %s" % ( fileName, e ) )
+			return {}
+
+		if index.get( "version" ) != self.__indexVersion or index.get( "path" ) != os.path.abspath( path ) :
+			return {}
+
+		return index["directories"]
+
+	def __writeIndex( self, path, directories ) :
+
+		if not self.__indexDirectory :
+			return
+
+		fileName = self.__indexFileName( path )
+		# Write to a temporary file and rename it, so that concurrent
+		# processes never see a partially written index.
+		tempFileName = "%s.%d.tmp" % ( fileName, os.getpid() )
+		try :
+			if not os.path.isdir( self.__indexDirectory ) :
+				os.makedirs( self.__indexDirectory )
+			with open( tempFileName, "w" ) as f :
+				json.dump(
+					{
+						"version" : self.__indexVersion,
+						"path" : os.path.abspath( path ),
+						"directories" : directories,
+					},
+					f
+				)
+			if six.PY3 :
+				os.replace( tempFileName, fileName )
+			else :
+				os.rename( tempFileName, fileName )
+		except Exception as e :
+			msg( Msg.Level.Warning, "ClassLoader", "Unable to write index \"%s\" : %s" % ( fileName, e ) )
+
+	__indexVersion = 1
 
 	# throws an exception if the version is no good
 	@staticmethod
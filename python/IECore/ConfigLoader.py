@@ -37,16 +37,37 @@ import os
 import os.path
 import sys
 import six
+import time
+import marshal
 import traceback
 import IECore
 
+if six.PY3 :
+	import importlib.util
+	__magic = importlib.util.MAGIC_NUMBER
+else :
+	import imp
+	__magic = imp.get_magic()
+
 ## This function provides an easy means of providing a flexible configuration
 # mechanism for any software. It works by executing all .py files found on
 # a series of searchpaths. A copy of the `contextDict` is used as the locals
 # dictionary for the execution of each config file; this is typically used
 # to pass objects which the config files will manipulate.
+#
+# If `recursive` is False, then only the files directly within each search
+# path (or the specified subdirectory of it) are loaded. This allows the loading
+# of subdirectories to be deferred until they are first needed, by calling
+# loadConfig() again with the `subdirectory` argument.
+#
+# The compiled code for each file is cached in memory, keyed by its modification
+# time and size, so that repeated loading of the same file does not recompile it.
+# If the IECORE_CONFIG_CACHE_PATH environment variable is set, then the compiled
+# code is also stored in that directory, to be reused by subsequent processes.
+# If the IECORE_CONFIG_TIMINGS environment variable is set, then a report of the
+# time taken to load each file is output as an Info message.
 # \ingroup python
-def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirectory = "" ) :
+def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirectory = "", recursive = True ) :
 
 	if isinstance( searchPaths, six.string_types ) :
 		searchPaths = IECore.SearchPath( os.environ.get( searchPaths, "" ) )
@@ -54,6 +75,9 @@ def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirec
 	paths = searchPaths.paths
 	paths.reverse()
 
+	cacheDirectory = os.path.expandvars( os.environ.get( "IECORE_CONFIG_CACHE_PATH", "" ) )
+	timings = []
+
 	visitedPaths = set()
 	for path in paths :
 
@@ -64,6 +88,10 @@ def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirec
 
 		pyExtTest = re.compile( r"^[^~].*\.py$" )
 		for dirPath, dirNames, fileNames in os.walk( os.path.join( path, subdirectory ) ) :
+
+			if not recursive :
+				del dirNames[:]
+
 			for fileName in filter( pyExtTest.search, sorted( fileNames ) ) :
 				fullFileName = os.path.abspath( os.path.join( dirPath, fileName ) )
 
@@ -72,12 +100,12 @@ def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirec
 				fileContextDict = contextDict.copy()
 				fileContextDict["__file__"] = fullFileName
 
+				startTime = time.time()
 				try :
-					with open( fullFileName ) as f :
-						six.exec_(
-							compile( f.read(), fullFileName, "exec" ),
-							fileContextDict, fileContextDict
-						)
+					six.exec_(
+						__compile( fullFileName, cacheDirectory ),
+						fileContextDict, fileContextDict
+					)
 				except Exception as m :
 					if raiseExceptions :
 						raise
@@ -85,6 +113,79 @@ def loadConfig( searchPaths, contextDict = {}, raiseExceptions = False, subdirec
 						stacktrace = traceback.format_exc()
 						IECore.msg( IECore.Msg.Level.Error, "IECore.loadConfig", "Error executing file \"%s\" - \"%s\".\n %s" % ( fullFileName, m, stacktrace ) )
 
+				timings.append( ( time.time() - startTime, fullFileName ) )
+
 				del fileContextDict["__file__"]
 
+	if timings and "IECORE_CONFIG_TIMINGS" in os.environ :
+		__reportTimings( timings )
+
+# Maps from file name to ( ( mtime, size ), code ).
+__codeCache = {}
+
+def __compile( fileName, cacheDirectory ) :
+
+	stat = os.stat( fileName )
+	key = ( stat.st_mtime, stat.st_size )
+
+	cached = __codeCache.get( fileName )
+	if cached is not None and cached[0] == key :
+		return cached[1]
+
+	cacheFileName = None
+	code = None
+	if cacheDirectory :
+		h = IECore.MurmurHash()
+		h.append( fileName )
+		cacheFileName = os.path.join( cacheDirectory, h.toString() + ".pyc" )
+		code = __readCachedCode( cacheFileName, fileName, key )
+
+	if code is None :
+		with open( fileName ) as f :
+			code = compile( f.read(), fileName, "exec" )
+		if cacheFileName is not None :
+			__writeCachedCode( cacheFileName, fileName, key, code )
+
+	__codeCache[fileName] = ( key, code )
+	return code
+
+def __readCachedCode( cacheFileName, fileName, key ) :
+
+	try :
+		with open( cacheFileName, "rb" ) as f :
+			magic, cachedFileName, cachedKey, code = marshal.loads( f.read() )
+	except Exception :
+		# Missing, or written by an incompatible version of Python.
+		return None
+
+	if magic != __magic or cachedFileName != fileName or tuple( cachedKey ) != key :
+		return None
+
+	return code
+
+def __writeCachedCode( cacheFileName, fileName, key, code ) :
+
+	# Write to a temporary file and rename it, so that concurrent
+	# processes never see a partially written file.
+	tempFileName = "%s.%d.tmp" % ( cacheFileName, os.getpid() )
+	try :
+		if not os.path.isdir( os.path.dirname( cacheFileName ) ) :
+			os.makedirs( os.path.dirname( cacheFileName ) )
+		with open( tempFileName, "wb" ) as f :
+			f.write( marshal.dumps( ( __magic, fileName, key, code ) ) )
+		if six.PY3 :
+			os.replace( tempFileName, cacheFileName )
+		else :
+			os.rename( tempFileName, cacheFileName )
+	except Exception as e :
+		IECore.msg( IECore.Msg.Level.Warning, "IECore.loadConfig", "Unable to write cache file \"%s\" : %s" % ( cacheFileName, e ) )
+
+def __reportTimings( timings ) :
+
+	report = "Loaded %d files in %.3fs :" % ( len( timings ), sum( t[0] for t in timings ) )
+	for loadTime, fileName in sorted( timings, reverse = True ) :
+		report += "\n\t%.3fs : %s" % ( loadTime, fileName )
+
+	IECore.msg( IECore.Msg.Level.Info, "IECore.loadConfig", report )
+
 loadConfig( "IECORE_CONFIG_PATHS", { "IECore" : IECore } )
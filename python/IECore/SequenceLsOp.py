@@ -179,76 +179,29 @@ class SequenceLsOp( IECore.Op ) :
 			]
 		)
 
-	@staticmethod
-	def __walk(top, topdown=True, followlinks=False):
-
-		from os.path import join, isdir, islink
-		from os import listdir, error
-
-		try:
-			names = listdir(top)
-		except error :
-		        return
-
-		dirs, nondirs = [], []
-		for name in names:
-			if isdir(join(top, name)):
-				dirs.append(name)
-			else:
-				nondirs.append(name)
-
-		if topdown:
-			yield top, dirs, nondirs
-
-		for name in dirs:
-			path = join(top, name)
-			if followlinks or not islink(path):
-				for x in IECore.SequenceLsOp.__walk(path, topdown, followlinks):
-					yield x
-
-		if not topdown:
-			yield top, dirs, nondirs
-
-
 	def doOperation( self, operands ) :
 
-		# recursively find sequences
+		# find sequences, recursively if requested. this lists directories
+		# in parallel, and gathers all the file information needed by the
+		# filters below in the same pass.
 		baseDirectory = operands["dir"].value
 		if baseDirectory != "/" and baseDirectory[-1] == '/' :
 			baseDirectory = baseDirectory[:-1]
 
-		sequences = IECore.ls( baseDirectory, operands["minSequenceSize"].value )
+		sequenceInfos = IECore.lsSequenceInfo(
+			baseDirectory,
+			minSequenceSize = operands["minSequenceSize"].value,
+			maxDepth = operands["maxDepth"].value if operands["recurse"].value else 0,
+			followLinks = operands["followLinks"].value,
+			modificationTimes = operands["advanced"]["modificationTime"]["enabled"].value,
+		)
 
 		# If we've passed in a directory which isn't the current one it is convenient to get that included in the returned sequence names
 		relDir = os.path.normpath( baseDirectory ) != "."
 
 		if relDir :
-			for s in sequences :
-				s.fileName = os.path.join( baseDirectory, s.fileName )
-
-		if operands["recurse"].value :
-			# \todo Can safely use os.walk here after Python 2.6, which introduced the followlinks parameter
-			for root, dirs, files in IECore.SequenceLsOp.__walk( baseDirectory, topdown = True, followlinks = operands["followLinks"].value ) :
-				relRoot = root[len(baseDirectory)+1:]
-				if relRoot!="" :
-					depth = len( relRoot.split( "/" ) )
-				else :
-					depth = 0
-
-				if depth>=operands["maxDepth"].value :
-					dirs[:] = []
-
-				for d in dirs :
-					ss = IECore.ls( os.path.join( root, d ), operands["minSequenceSize"].value )
-					if ss :
-						for s in ss :
-
-							if relDir :
-								s.fileName = os.path.join( baseDirectory, relRoot, d, s.fileName )
-							else :
-								s.fileName = os.path.join( relRoot, d, s.fileName )
-							sequences.append( s )
-
+			for i in sequenceInfos :
+				i.sequence.fileName = os.path.join( baseDirectory, i.sequence.fileName )
 
 		# \todo This Op would benefit considerably from dynamic parameters
 		# NB. Ordering of filters could have considerable impact on execution time. The most expensive filters should be specified last.
@@ -258,17 +211,10 @@ class SequenceLsOp( IECore.Op ) :
 		if operands["type"].value != "any" :
 
 			if operands["type"].value == "files" :
-				fileTypeTest = os.path.isfile
+				matchType = lambda sequenceInfo : sequenceInfo.isFiles
 			else :
 				assert( operands["type"].value == "directories" )
-				fileTypeTest = os.path.isdir
-
-			def matchType( sequence ) :
-				for sequenceFile in sequence.fileNames() :
-					if not fileTypeTest( sequenceFile ) :
-						return False
-
-				return True
+				matchType = lambda sequenceInfo : sequenceInfo.isDirectories
 
 			filters.append( matchType )
 
@@ -277,17 +223,18 @@ class SequenceLsOp( IECore.Op ) :
 
 			extensions = set( ["." + e for e in operands["extensions"]] )
 
-			def matchExt( sequence ) :
-				return os.path.splitext( sequence.fileName )[1] in extensions
+			def matchExt( sequenceInfo ) :
+				return os.path.splitext( sequenceInfo.sequence.fileName )[1] in extensions
 
 			filters.append( matchExt )
 
 		# filter sequences which aren't contiguous
 		if operands["contiguousSequencesOnly"].value :
 
-			def isContiguous( sequence ):
+			def isContiguous( sequenceInfo ):
 
-				return len( sequence.frameList.asList() ) == max( sequence.frameList.asList() ) - min( sequence.frameList.asList() ) + 1
+				frames = sequenceInfo.sequence.frameList.asList()
+				return len( frames ) == max( frames ) - min( frames ) + 1
 
 			filters.append( isContiguous )
 
@@ -316,13 +263,12 @@ class SequenceLsOp( IECore.Op ) :
 
 			assert( matchFn )
 
-			def matchModificationTime( sequence ) :
+			def matchModificationTime( sequenceInfo ) :
 
 				# If any file in the sequence matches, we have a match.
-				for sequenceFile in sequence.fileNames() :
+				for modificationTime in sequenceInfo.modificationTimes :
 
-					st = os.stat( sequenceFile )
-					modifiedTime = datetime.datetime.fromtimestamp( st.st_mtime )
+					modifiedTime = datetime.datetime.fromtimestamp( modificationTime )
 					if matchFn( modifiedTime ) :
 						return True
 
@@ -330,22 +276,22 @@ class SequenceLsOp( IECore.Op ) :
 
 			filters.append( matchModificationTime )
 
-		def matchAllFilters( sequence ) :
+		def matchAllFilters( sequenceInfo ) :
 
 			for f in filters :
-				if not f( sequence ) : return False
+				if not f( sequenceInfo ) : return False
 
 			return True
 
-		def matchAnyFilter( sequence ) :
+		def matchAnyFilter( sequenceInfo ) :
 
 			for f in filters :
-				if f( sequence ) : return True
+				if f( sequenceInfo ) : return True
 
 			return False
 
 		# \todo Allow matching of any filter, optionally
-		sequences = [ s for s in sequences if matchAllFilters( s ) ]
+		sequences = [ i.sequence for i in sequenceInfos if matchAllFilters( i ) ]
 
 		# reformat the sequences into strings as requested
 
@@ -247,6 +247,16 @@ ObjectPool *CachedReader::objectPool() const
 	return m_data->m_cache.objectPool();
 }
 
+CacheStatistics CachedReader::statistics() const
+{
+	return m_data->m_cache.statistics();
+}
+
+void CachedReader::resetStatistics()
+{
+	m_data->m_cache.resetStatistics();
+}
+
 CachedReader *CachedReader::defaultCachedReader()
 {
 	static CachedReaderPtr c = nullptr;
@@ -50,8 +50,14 @@
 #include "boost/regex.hpp"
 #include "boost/version.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/mutex.h"
+#include "tbb/parallel_for.h"
+#include "tbb/task_group.h"
+
 #include <algorithm>
 #include <cassert>
+#include <unordered_map>
 
 #include <math.h>
 
@@ -205,6 +211,182 @@ void IECore::ls( const std::string &path, std::vector< FileSequencePtr > &sequen
 	}
 }
 
+//////////////////////////////////////////////////////////////////////////
+// lsSequenceInfo
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+class SequenceInfoWalk
+{
+
+	public :
+
+		SequenceInfoWalk( const boost::filesystem::path &root, size_t minSequenceSize, size_t maxDepth, bool followLinks, bool modificationTimes )
+			:	m_root( root ), m_minSequenceSize( minSequenceSize ), m_maxDepth( maxDepth ), m_followLinks( followLinks ), m_modificationTimes( modificationTimes )
+		{
+		}
+
+		void operator()( std::vector<FileSequenceInfo> &sequences )
+		{
+			walk( "", 0, true );
+			m_tasks.wait();
+
+			std::sort(
+				m_sequences.begin(), m_sequences.end(),
+				[]( const FileSequenceInfo &a, const FileSequenceInfo &b ) {
+					return a.sequence->getFileName() < b.sequence->getFileName();
+				}
+			);
+			sequences.swap( m_sequences );
+		}
+
+	private :
+
+		struct Entry
+		{
+			bool isFile;
+			bool isDirectory;
+		};
+
+		// Lists the sequences in a single directory, launching tasks to
+		// list its subdirectories in parallel.
+		void walk( const std::string &relativePath, size_t depth, bool recurse )
+		{
+			const boost::filesystem::path directory = m_root / relativePath;
+
+			boost::system::error_code ec;
+			boost::filesystem::directory_iterator it( directory, ec ), end;
+			if( ec )
+			{
+				// Unreadable directories are skipped, as for `os.walk()`.
+				return;
+			}
+
+			std::vector<std::string> names;
+			std::unordered_map<std::string, Entry> entries;
+			for( ; it != end; it.increment( ec ) )
+			{
+				if( ec )
+				{
+					break;
+				}
+
+				// Where the platform provides the file type in the directory
+				// entry, `symlink_status()` is cached and doesn't require a
+				// `stat()`. We only need to follow symbolic links.
+				boost::filesystem::file_status status = it->symlink_status( ec );
+				const bool isLink = boost::filesystem::is_symlink( status );
+				if( isLink )
+				{
+					status = it->status( ec );
+				}
+
+				const std::string name = it->path().PATH_TO_STRING;
+				names.push_back( name );
+				Entry &entry = entries[name];
+				entry.isFile = boost::filesystem::is_regular_file( status );
+				entry.isDirectory = boost::filesystem::is_directory( status );
+
+				if( entry.isDirectory && recurse && depth < m_maxDepth )
+				{
+					const std::string childPath = ( boost::filesystem::path( relativePath ) / name ).string();
+					const bool childRecurse = m_followLinks || !isLink;
+					m_tasks.run(
+						[this, childPath, depth, childRecurse] {
+							walk( childPath, depth + 1, childRecurse );
+						}
+					);
+				}
+			}
+
+			std::vector<FileSequencePtr> sequences;
+			findSequences( names, sequences, m_minSequenceSize );
+
+			std::vector<FileSequenceInfo> sequenceInfos;
+			sequenceInfos.reserve( sequences.size() );
+			for( const auto &sequence : sequences )
+			{
+				sequenceInfos.push_back( FileSequenceInfo() );
+				FileSequenceInfo &info = sequenceInfos.back();
+				info.sequence = sequence;
+
+				std::vector<std::string> fileNames;
+				sequence->fileNames( fileNames );
+				for( const auto &fileName : fileNames )
+				{
+					auto eIt = entries.find( fileName );
+					if( eIt != entries.end() )
+					{
+						info.isFiles = info.isFiles && eIt->second.isFile;
+						info.isDirectories = info.isDirectories && eIt->second.isDirectory;
+					}
+					else
+					{
+						const boost::filesystem::file_status status = boost::filesystem::status( directory / fileName, ec );
+						info.isFiles = info.isFiles && boost::filesystem::is_regular_file( status );
+						info.isDirectories = info.isDirectories && boost::filesystem::is_directory( status );
+					}
+				}
+
+				if( m_modificationTimes )
+				{
+					info.modificationTimes.resize( fileNames.size(), 0 );
+					tbb::parallel_for(
+						tbb::blocked_range<size_t>( 0, fileNames.size() ),
+						[&]( const tbb::blocked_range<size_t> &r ) {
+							boost::system::error_code mtimeError;
+							for( size_t i = r.begin(); i != r.end(); ++i )
+							{
+								info.modificationTimes[i] = boost::filesystem::last_write_time( directory / fileNames[i], mtimeError );
+							}
+						}
+					);
+				}
+
+				if( !relativePath.empty() )
+				{
+					sequence->setFileName( ( boost::filesystem::path( relativePath ) / sequence->getFileName() ).string() );
+				}
+			}
+
+			tbb::mutex::scoped_lock lock( m_sequencesMutex );
+			m_sequences.insert( m_sequences.end(), sequenceInfos.begin(), sequenceInfos.end() );
+		}
+
+		const boost::filesystem::path m_root;
+		const size_t m_minSequenceSize;
+		const size_t m_maxDepth;
+		const bool m_followLinks;
+		const bool m_modificationTimes;
+
+		tbb::task_group m_tasks;
+		tbb::mutex m_sequencesMutex;
+		std::vector<FileSequenceInfo> m_sequences;
+
+};
+
+} // namespace
+
+FileSequenceInfo::FileSequenceInfo()
+	:	isFiles( true ), isDirectories( true )
+{
+}
+
+void IECore::lsSequenceInfo( const std::string &path, std::vector<FileSequenceInfo> &sequences, size_t minSequenceSize, size_t maxDepth, bool followLinks, bool modificationTimes )
+{
+	sequences.clear();
+
+	if( !boost::filesystem::is_directory( path ) )
+	{
+		return;
+	}
+
+	SequenceInfoWalk walk( path, minSequenceSize, maxDepth, followLinks, modificationTimes );
+	walk( sequences );
+}
+
 void IECore::ls( const std::string &sequencePath, FileSequencePtr &sequence, size_t minSequenceSize )
 {
 	sequence = nullptr;
@@ -0,0 +1,626 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "IECore/FrozenPathMatcher.h"
+
+#include "IECore/Exception.h"
+#include "IECore/StringAlgo.h"
+
+#include <algorithm>
+#include <cstring>
+
+using namespace std;
+using namespace IECore;
+
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+InternedString g_ellipsis( "..." );
+InternedString g_namesEntry( "names" );
+InternedString g_childOffsetsEntry( "childOffsets" );
+InternedString g_flagsEntry( "flags" );
+
+enum Flags
+{
+	Terminator = 1,
+	Wildcarded = 2
+};
+
+// Orders siblings with plain names before wildcarded names, and then
+// alphabetically. This is equivalent to the ordering used by PathMatcher,
+// except that we use the string contents rather than the InternedString
+// address, so that the order is the same in every process.
+bool nameLess( unsigned char flags1, const InternedString &name1, unsigned char flags2, const InternedString &name2 )
+{
+	const unsigned char w1 = flags1 & Wildcarded;
+	const unsigned char w2 = flags2 & Wildcarded;
+	if( w1 != w2 )
+	{
+		return w1 < w2;
+	}
+	return name1 != name2 && strcmp( name1.c_str(), name2.c_str() ) < 0;
+}
+
+// Node used when building the storage for the result of an intersection.
+struct BuildNode
+{
+	InternedString name;
+	unsigned char flags;
+	std::vector<size_t> children;
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// Storage
+//////////////////////////////////////////////////////////////////////////
+
+struct FrozenPathMatcher::Storage
+{
+
+	// Nodes are stored in breadth-first order, starting with the root,
+	// such that the children of node `i` are the nodes in the range
+	// `[ childOffsets[i], childOffsets[i+1] )`.
+	std::vector<InternedString> names;
+	std::vector<unsigned int> childOffsets;
+	std::vector<unsigned char> flags;
+	size_t numPaths;
+
+	size_t numNodes() const
+	{
+		return names.size();
+	}
+
+	bool terminator( size_t node ) const
+	{
+		return flags[node] & Terminator;
+	}
+
+	size_t childrenBegin( size_t node ) const
+	{
+		return childOffsets[node];
+	}
+
+	size_t childrenEnd( size_t node ) const
+	{
+		return childOffsets[node+1];
+	}
+
+	// Returns the first wildcarded child of `node`, or `childrenEnd( node )`
+	// if there are none.
+	size_t wildcardsBegin( size_t node ) const
+	{
+		size_t b = childrenBegin( node );
+		size_t e = childrenEnd( node );
+		while( b < e )
+		{
+			const size_t m = b + ( e - b ) / 2;
+			if( flags[m] & Wildcarded )
+			{
+				e = m;
+			}
+			else
+			{
+				b = m + 1;
+			}
+		}
+		return b;
+	}
+
+	// Returns the index of the child with the specified name, or 0
+	// (which is never a valid child) if there is no such child.
+	size_t child( size_t node, const InternedString &name, unsigned char wildcarded ) const
+	{
+		size_t b = childrenBegin( node );
+		size_t e = childrenEnd( node );
+		while( b < e )
+		{
+			const size_t m = b + ( e - b ) / 2;
+			if( nameLess( flags[m], names[m], wildcarded, name ) )
+			{
+				b = m + 1;
+			}
+			else
+			{
+				e = m;
+			}
+		}
+
+		if( b < childrenEnd( node ) && names[b] == name && ( flags[b] & Wildcarded ) == wildcarded )
+		{
+			return b;
+		}
+		return 0;
+	}
+
+	void countPaths()
+	{
+		numPaths = std::count_if( flags.begin(), flags.end(), [] ( unsigned char f ) { return f & Terminator; } );
+	}
+
+	void matchWalk( size_t node, vector<InternedString>::const_iterator start, vector<InternedString>::const_iterator end, unsigned &result ) const
+	{
+		// See `PathMatcher::matchWalk()` for commentary.
+
+		if( start == end )
+		{
+			if( terminator( node ) )
+			{
+				result |= PathMatcher::ExactMatch;
+			}
+			if( childrenBegin( node ) != childrenEnd( node ) )
+			{
+				result |= PathMatcher::DescendantMatch;
+			}
+			if( size_t ellipsis = child( node, g_ellipsis, Wildcarded ) )
+			{
+				result |= PathMatcher::DescendantMatch;
+				if( terminator( ellipsis ) )
+				{
+					result |= PathMatcher::ExactMatch;
+				}
+			}
+			return;
+		}
+
+		if( terminator( node ) )
+		{
+			result |= PathMatcher::AncestorMatch;
+		}
+
+		if( size_t c = child( node, *start, 0 ) )
+		{
+			matchWalk( c, start + 1, end, result );
+			if( result == PathMatcher::EveryMatch )
+			{
+				return;
+			}
+		}
+
+		size_t ellipsis = 0;
+		for( size_t c = wildcardsBegin( node ), e = childrenEnd( node ); c < e; ++c )
+		{
+			if( names[c] == g_ellipsis )
+			{
+				ellipsis = c;
+				continue;
+			}
+
+			if( StringAlgo::match( start->c_str(), names[c].c_str() ) )
+			{
+				matchWalk( c, start + 1, end, result );
+				if( result == PathMatcher::EveryMatch )
+				{
+					return;
+				}
+			}
+		}
+
+		if( ellipsis )
+		{
+			result |= PathMatcher::DescendantMatch;
+			if( terminator( ellipsis ) )
+			{
+				result |= PathMatcher::ExactMatch;
+			}
+
+			for( auto newStart = start; newStart != end; ++newStart )
+			{
+				matchWalk( ellipsis, newStart, end, result );
+				if( result == PathMatcher::EveryMatch )
+				{
+					return;
+				}
+			}
+		}
+	}
+
+	// Adds the intersection of `node` and `otherNode` to `buildNodes`, returning
+	// the index of the new node, or -1 if the intersection is empty.
+	long intersectionWalk( size_t node, const Storage &other, size_t otherNode, std::vector<BuildNode> &buildNodes ) const
+	{
+		std::vector<size_t> children;
+
+		// The children of both nodes are sorted in the same order, so we can
+		// find the common children in a single pass.
+		size_t c = childrenBegin( node );
+		const size_t cEnd = childrenEnd( node );
+		size_t oc = other.childrenBegin( otherNode );
+		const size_t ocEnd = other.childrenEnd( otherNode );
+		while( c < cEnd && oc < ocEnd )
+		{
+			if( nameLess( flags[c], names[c], other.flags[oc], other.names[oc] ) )
+			{
+				++c;
+			}
+			else if( nameLess( other.flags[oc], other.names[oc], flags[c], names[c] ) )
+			{
+				++oc;
+			}
+			else
+			{
+				const long childIndex = intersectionWalk( c, other, oc, buildNodes );
+				if( childIndex >= 0 )
+				{
+					children.push_back( childIndex );
+				}
+				++c;
+				++oc;
+			}
+		}
+
+		const bool isTerminator = terminator( node ) && other.terminator( otherNode );
+		if( !isTerminator && children.empty() && node != 0 )
+		{
+			return -1;
+		}
+
+		buildNodes.push_back( { names[node], (unsigned char)( ( flags[node] & Wildcarded ) | ( isTerminator ? Terminator : 0 ) ), std::move( children ) } );
+		return buildNodes.size() - 1;
+	}
+
+};
+
+//////////////////////////////////////////////////////////////////////////
+// FrozenPathMatcher
+//////////////////////////////////////////////////////////////////////////
+
+FrozenPathMatcher::FrozenPathMatcher()
+	:	FrozenPathMatcher( PathMatcher() )
+{
+}
+
+FrozenPathMatcher::FrozenPathMatcher( const PathMatcher &paths )
+{
+	std::shared_ptr<Storage> storage = std::make_shared<Storage>();
+
+	// Breadth-first traversal of the node tree, with `nodes` doubling
+	// as the queue of nodes still to be visited.
+	std::vector<const PathMatcher::Node *> nodes;
+	nodes.push_back( paths.m_root.get() );
+	storage->names.push_back( InternedString() );
+	storage->flags.push_back( paths.m_root->terminator ? Terminator : 0 );
+
+	typedef std::pair<unsigned char, PathMatcher::Node::ConstChildMapIterator> Child;
+	std::vector<Child> children;
+	for( size_t i = 0; i < nodes.size(); ++i )
+	{
+		storage->childOffsets.push_back( nodes.size() );
+
+		children.clear();
+		for( auto it = nodes[i]->children.begin(), eIt = nodes[i]->children.end(); it != eIt; ++it )
+		{
+			const unsigned char flags = ( it->first.type == PathMatcher::Name::Wildcarded ? Wildcarded : 0 ) | ( it->second->terminator ? Terminator : 0 );
+			children.push_back( Child( flags, it ) );
+		}
+
+		std::sort(
+			children.begin(), children.end(),
+			[] ( const Child &a, const Child &b ) {
+				return nameLess( a.first, a.second->first.name, b.first, b.second->first.name );
+			}
+		);
+
+		for( const auto &child : children )
+		{
+			nodes.push_back( child.second->second.get() );
+			storage->names.push_back( child.second->first.name );
+			storage->flags.push_back( child.first );
+		}
+	}
+	storage->childOffsets.push_back( nodes.size() );
+
+	storage->countPaths();
+	m_storage = storage;
+}
+
+FrozenPathMatcher::FrozenPathMatcher( const ConstStoragePtr &storage )
+	:	m_storage( storage )
+{
+}
+
+PathMatcher FrozenPathMatcher::pathMatcher() const
+{
+	const Storage &s = *m_storage;
+
+	// Children always follow their parents, so we can build the
+	// tree bottom-up by visiting the nodes in reverse.
+	std::vector<PathMatcher::NodePtr> nodes( s.numNodes() );
+	for( size_t i = s.numNodes(); i-- > 0; )
+	{
+		const size_t childrenBegin = s.childrenBegin( i );
+		const size_t childrenEnd = s.childrenEnd( i );
+		if( i && childrenBegin == childrenEnd && s.terminator( i ) )
+		{
+			nodes[i] = PathMatcher::Node::leaf();
+			continue;
+		}
+
+		PathMatcher::NodePtr node = new PathMatcher::Node( s.terminator( i ) );
+		for( size_t c = childrenBegin; c < childrenEnd; ++c )
+		{
+			node->children.insert(
+				PathMatcher::Node::ChildMapValue(
+					PathMatcher::Name( s.names[c], s.flags[c] & Wildcarded ? PathMatcher::Name::Wildcarded : PathMatcher::Name::Plain ),
+					nodes[c]
+				)
+			);
+			nodes[c] = nullptr;
+		}
+		nodes[i] = node;
+	}
+
+	return PathMatcher( nodes[0] );
+}
+
+bool FrozenPathMatcher::isEmpty() const
+{
+	return m_storage->numNodes() == 1 && !m_storage->terminator( 0 );
+}
+
+size_t FrozenPathMatcher::size() const
+{
+	return m_storage->numPaths;
+}
+
+size_t FrozenPathMatcher::memoryUsage() const
+{
+	return
+		sizeof( Storage ) +
+		m_storage->names.capacity() * sizeof( InternedString ) +
+		m_storage->childOffsets.capacity() * sizeof( unsigned int ) +
+		m_storage->flags.capacity() * sizeof( unsigned char )
+	;
+}
+
+void FrozenPathMatcher::paths( std::vector<std::string> &paths ) const
+{
+	for( Iterator it = begin(), eIt = end(); it != eIt; ++it )
+	{
+		const std::vector<IECore::InternedString> &path = *it;
+		if( !path.size() )
+		{
+			paths.push_back( "/" );
+		}
+		else
+		{
+			string s;
+			for( const auto &x : path )
+			{
+				s += "/" + x.string();
+			}
+			paths.push_back( s );
+		}
+	}
+}
+
+unsigned FrozenPathMatcher::match( const std::string &path ) const
+{
+	std::vector<IECore::InternedString> tokenizedPath;
+	StringAlgo::tokenize( path, '/', tokenizedPath );
+	return match( tokenizedPath );
+}
+
+unsigned FrozenPathMatcher::match( const std::vector<IECore::InternedString> &path ) const
+{
+	unsigned result = PathMatcher::NoMatch;
+	m_storage->matchWalk( 0, path.begin(), path.end(), result );
+	return result;
+}
+
+FrozenPathMatcher FrozenPathMatcher::intersection( const FrozenPathMatcher &paths ) const
+{
+	std::vector<BuildNode> buildNodes;
+	const size_t root = m_storage->intersectionWalk( 0, *paths.m_storage, 0, buildNodes );
+
+	std::shared_ptr<Storage> storage = std::make_shared<Storage>();
+	storage->names.reserve( buildNodes.size() );
+	storage->flags.reserve( buildNodes.size() );
+	storage->childOffsets.reserve( buildNodes.size() + 1 );
+
+	// Lay out the nodes breadth-first, in the same way as the constructor.
+	std::vector<size_t> nodes;
+	nodes.reserve( buildNodes.size() );
+	nodes.push_back( root );
+	for( size_t i = 0; i < nodes.size(); ++i )
+	{
+		const BuildNode &buildNode = buildNodes[nodes[i]];
+		storage->names.push_back( buildNode.name );
+		storage->flags.push_back( buildNode.flags );
+		storage->childOffsets.push_back( nodes.size() );
+		nodes.insert( nodes.end(), buildNode.children.begin(), buildNode.children.end() );
+	}
+	storage->childOffsets.push_back( nodes.size() );
+
+	storage->countPaths();
+	return FrozenPathMatcher( storage );
+}
+
+bool FrozenPathMatcher::operator == ( const FrozenPathMatcher &other ) const
+{
+	if( m_storage == other.m_storage )
+	{
+		return true;
+	}
+
+	return
+		m_storage->names == other.m_storage->names &&
+		m_storage->childOffsets == other.m_storage->childOffsets &&
+		m_storage->flags == other.m_storage->flags
+	;
+}
+
+bool FrozenPathMatcher::operator != ( const FrozenPathMatcher &other ) const
+{
+	return !( *this == other );
+}
+
+void FrozenPathMatcher::save( IndexedIO *io, const IndexedIO::EntryID &name ) const
+{
+	IndexedIOPtr container = io->subdirectory( name, IndexedIO::CreateIfMissing );
+	container->write( g_namesEntry, m_storage->names.data(), m_storage->names.size() );
+	container->write( g_childOffsetsEntry, m_storage->childOffsets.data(), m_storage->childOffsets.size() );
+	container->write( g_flagsEntry, m_storage->flags.data(), m_storage->flags.size() );
+}
+
+FrozenPathMatcher FrozenPathMatcher::load( const IndexedIO *io, const IndexedIO::EntryID &name )
+{
+	ConstIndexedIOPtr container = io->subdirectory( name );
+
+	std::shared_ptr<Storage> storage = std::make_shared<Storage>();
+
+	storage->names.resize( container->entry( g_namesEntry ).arrayLength() );
+	InternedString *names = storage->names.data();
+	container->read( g_namesEntry, names, storage->names.size() );
+
+	storage->childOffsets.resize( container->entry( g_childOffsetsEntry ).arrayLength() );
+	unsigned int *childOffsets = storage->childOffsets.data();
+	container->read( g_childOffsetsEntry, childOffsets, storage->childOffsets.size() );
+
+	storage->flags.resize( container->entry( g_flagsEntry ).arrayLength() );
+	unsigned char *flags = storage->flags.data();
+	container->read( g_flagsEntry, flags, storage->flags.size() );
+
+	// Validate, so that a corrupt file can't cause out of bounds access.
+	const size_t numNodes = storage->names.size();
+	bool valid =
+		numNodes > 0 &&
+		storage->flags.size() == numNodes &&
+		storage->childOffsets.size() == numNodes + 1 &&
+		storage->childOffsets.front() == 1 &&
+		storage->childOffsets.back() == numNodes
+	;
+	for( size_t i = 1; valid && i < storage->childOffsets.size(); ++i )
+	{
+		valid = storage->childOffsets[i] >= storage->childOffsets[i-1] && storage->childOffsets[i-1] > i - 1;
+	}
+
+	if( !valid )
+	{
+		throw IOException( "FrozenPathMatcher::load : Invalid data in \"" + name.string() + "\"" );
+	}
+
+	storage->countPaths();
+	return FrozenPathMatcher( storage );
+}
+
+FrozenPathMatcher::Iterator FrozenPathMatcher::begin() const
+{
+	return Iterator( m_storage, /* atEnd = */ false );
+}
+
+FrozenPathMatcher::Iterator FrozenPathMatcher::end() const
+{
+	return Iterator( m_storage, /* atEnd = */ true );
+}
+
+//////////////////////////////////////////////////////////////////////////
+// Iterator
+//////////////////////////////////////////////////////////////////////////
+
+FrozenPathMatcher::Iterator::Iterator( const ConstStoragePtr &storage, bool atEnd )
+	:	m_storage( storage )
+{
+	if( !atEnd )
+	{
+		m_stack.push_back( std::make_pair( 0, 1 ) );
+		if( !m_storage->terminator( 0 ) )
+		{
+			increment();
+		}
+	}
+}
+
+void FrozenPathMatcher::Iterator::increment()
+{
+	do
+	{
+		incrementNode();
+	} while( !atEnd() && !m_storage->terminator( node() ) );
+}
+
+bool FrozenPathMatcher::Iterator::equal( const Iterator &other ) const
+{
+	return m_stack == other.m_stack;
+}
+
+const std::vector<IECore::InternedString> &FrozenPathMatcher::Iterator::dereference() const
+{
+	return m_path;
+}
+
+void FrozenPathMatcher::Iterator::incrementNode()
+{
+	const size_t n = node();
+	const size_t childrenBegin = m_storage->childrenBegin( n );
+	const size_t childrenEnd = m_storage->childrenEnd( n );
+	if( childrenBegin != childrenEnd )
+	{
+		// Descend to the first child.
+		m_stack.push_back( std::make_pair( childrenBegin, childrenEnd ) );
+		m_path.push_back( m_storage->names[childrenBegin] );
+		return;
+	}
+
+	// Move to the next sibling, ascending until we find one.
+	while( !m_stack.empty() )
+	{
+		std::pair<size_t, size_t> &level = m_stack.back();
+		if( ++level.first < level.second )
+		{
+			// The root has no siblings, so we must have a path here.
+			m_path.back() = m_storage->names[level.first];
+			return;
+		}
+		m_stack.pop_back();
+		if( !m_path.empty() )
+		{
+			m_path.pop_back();
+		}
+	}
+}
+
+bool FrozenPathMatcher::Iterator::atEnd() const
+{
+	return m_stack.empty();
+}
+
+size_t FrozenPathMatcher::Iterator::node() const
+{
+	return m_stack.back().first;
+}
@@ -37,8 +37,12 @@
 #include "IECore/Exception.h"
 
 #include "boost/filesystem/convenience.hpp"
+#include "boost/format.hpp"
+
+#include <algorithm>
 
 #include <iostream>
+#include <memory>
 
 #include <math.h>
 
@@ -58,6 +62,36 @@ static CreatorMap &creators()
 	return *g_createFns;
 }
 
+void validateRange( const IndexedIO::EntryID &name, unsigned long arrayLength, unsigned long offset, unsigned long count )
+{
+	if( offset > arrayLength || count > arrayLength - offset )
+	{
+		throw IOException(
+			boost::str(
+				boost::format( "IndexedIO::read : Range [%1%, %2%) is out of bounds for entry \"%3%\" of length %4%" ) %
+					offset % ( offset + count ) % name.value() % arrayLength
+			)
+		);
+	}
+}
+
+template<typename T>
+void readRange( const IndexedIO *io, const IndexedIO::EntryID &name, T *&x, unsigned long offset, unsigned long count )
+{
+	const unsigned long arrayLength = io->entry( name ).arrayLength();
+	validateRange( name, arrayLength, offset, count );
+
+	std::unique_ptr<T[]> array( new T[arrayLength] );
+	T *arrayPtr = array.get();
+	io->read( name, arrayPtr, arrayLength );
+
+	if( !x )
+	{
+		x = new T[count];
+	}
+	std::copy( arrayPtr + offset, arrayPtr + offset + count, x );
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -110,6 +144,71 @@ IndexedIO::~IndexedIO()
 {
 }
 
+void IndexedIO::read(const IndexedIO::EntryID &name, float *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, double *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, half *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, int *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, int64_t *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, uint64_t *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, unsigned int *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, char *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, unsigned char *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, short *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, unsigned short *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, std::string *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
+void IndexedIO::read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long offset, unsigned long count) const
+{
+	readRange( this, name, x, offset, count );
+}
+
 void IndexedIO::readable(const IndexedIO::EntryID &name) const
 {
 }
@@ -39,6 +39,7 @@
 #include "boost/format.hpp"
 #include "boost/tokenizer.hpp"
 
+#include <algorithm>
 #include <iostream>
 
 
@@ -229,12 +230,12 @@ struct Object::LoadContext::LoadedObjects : public std::map<IndexedIO::EntryIDLi
 };
 
 Object::LoadContext::LoadContext( ConstIndexedIOPtr ioInterface )
-	:	m_ioInterface( ioInterface ), m_loadedObjects( new LoadedObjects )
+	:	m_ioInterface( ioInterface ), m_loadedObjects( new LoadedObjects ), m_ranged( false ), m_offset( 0 ), m_count( 0 )
 {
 }
 
-Object::LoadContext::LoadContext( ConstIndexedIOPtr ioInterface, std::shared_ptr<LoadedObjects> loadedObjects )
-	:	m_ioInterface( ioInterface ), m_loadedObjects( loadedObjects )
+Object::LoadContext::LoadContext( ConstIndexedIOPtr ioInterface, std::shared_ptr<LoadedObjects> loadedObjects, bool ranged, size_t offset, size_t count )
+	:	m_ioInterface( ioInterface ), m_loadedObjects( loadedObjects ), m_ranged( ranged ), m_offset( offset ), m_count( count )
 {
 }
 
@@ -260,33 +261,52 @@ const IndexedIO *Object::LoadContext::rawContainer()
 	return m_ioInterface.get();
 }
 
+void Object::LoadContext::elementRange( size_t numElements, size_t &offset, size_t &count ) const
+{
+	if( !m_ranged )
+	{
+		offset = 0;
+		count = numElements;
+		return;
+	}
+
+	offset = std::min( m_offset, numElements );
+	count = std::min( m_count, numElements - offset );
+}
+
+void Object::LoadContext::referencePath( const IndexedIO *container, const IndexedIO::EntryID &name, IndexedIO::EntryIDList &pathParts )
+{
+	IndexedIO::Entry e = container->entry( name );
+	if ( e.dataType() == IndexedIO::InternedStringArray )
+	{
+		pathParts.resize( e.arrayLength() );
+		InternedString *p = &(pathParts[0]);
+		container->read( name, p, e.arrayLength() );
+	}
+	else
+	{
+		// for backward compatibility...
+		string path;
+		container->read( name, path );
+		typedef boost::tokenizer<boost::char_separator<char> > Tokenizer;
+		// \todo: this would have trouble if the name of the object contains slashes...
+		Tokenizer tokens(path, boost::char_separator<char>("/"));
+		Tokenizer::iterator t = tokens.begin();
+
+		for ( ; t != tokens.end(); t++ )
+		{
+			pathParts.push_back( *t );
+		}
+	}
+}
+
 ObjectPtr Object::LoadContext::loadObjectOrReference( const IndexedIO *container, const IndexedIO::EntryID &name )
 {
 	IndexedIO::Entry e = container->entry( name );
 	if( e.entryType()==IndexedIO::File )
 	{
 		IndexedIO::EntryIDList pathParts;
-		if ( e.dataType() == IndexedIO::InternedStringArray )
-		{
-			pathParts.resize( e.arrayLength() );
-			InternedString *p = &(pathParts[0]);
-			container->read( name, p, e.arrayLength() );
-		}
-		else
-		{
-			// for backward compatibility...
-			string path;
-			container->read( name, path );
-			typedef boost::tokenizer<boost::char_separator<char> > Tokenizer;
-			// \todo: this would have trouble if the name of the object contains slashes...
-			Tokenizer tokens(path, boost::char_separator<char>("/"));
-			Tokenizer::iterator t = tokens.begin();
-
-			for ( ; t != tokens.end(); t++ )
-			{
-				pathParts.push_back( *t );
-			}
-		}
+		referencePath( container, name, pathParts );
 		std::pair<LoadedObjects::iterator, bool> ret = m_loadedObjects->insert( std::pair<IndexedIO::EntryIDList, ObjectPtr>( pathParts, nullptr ) );
 		if ( ret.second )
 		{
@@ -314,16 +334,35 @@ ObjectPtr Object::LoadContext::loadObjectOrReference( const IndexedIO *container
 	}
 }
 
+ObjectPtr Object::LoadContext::loadObjectOrReference( const IndexedIO *container, const IndexedIO::EntryID &name, size_t offset, size_t count )
+{
+	// Ranged loads produce partial objects, so we neither reuse nor
+	// register objects in m_loadedObjects.
+	IndexedIO::Entry e = container->entry( name );
+	if( e.entryType()==IndexedIO::File )
+	{
+		IndexedIO::EntryIDList pathParts;
+		referencePath( container, name, pathParts );
+		ConstIndexedIOPtr ioObject = m_ioInterface->directory( pathParts );
+		return loadObject( ioObject.get(), true, offset, count );
+	}
+	else
+	{
+		ConstIndexedIOPtr ioObject = container->subdirectory( name );
+		return loadObject( ioObject.get(), true, offset, count );
+	}
+}
+
 // this function can only load concrete objects. it can't load references to
 // objects. path is relative to the root of m_ioInterface
-ObjectPtr Object::LoadContext::loadObject( const IndexedIO *container )
+ObjectPtr Object::LoadContext::loadObject( const IndexedIO *container, bool ranged, size_t offset, size_t count )
 {
 	ObjectPtr result = nullptr;
 	string type = "";
 	container->read( g_typeEntry, type );
 	ConstIndexedIOPtr dataIO = container->subdirectory( g_dataEntry );
 	result = create( type );
-	LoadContextPtr context = new LoadContext( dataIO, m_loadedObjects );
+	LoadContextPtr context = new LoadContext( dataIO, m_loadedObjects, ranged, offset, count );
 	result->load( context );
 	return result;
 }
@@ -52,6 +52,7 @@ struct ObjectPool::MemberData
 	}
 
 	LRUCache< MurmurHash, ConstObjectPtr > cache;
+	Detail::CacheStatisticsCounters statistics;
 
 	/// our getter always returns NULL
 	static ConstObjectPtr getter( const MurmurHash &h, size_t &cost )
@@ -76,7 +77,9 @@ ObjectPool::~ObjectPool()
 
 ConstObjectPtr ObjectPool::retrieve( const MurmurHash &hash ) const
 {
-	return m_data->cache.get(hash);
+	ConstObjectPtr result = m_data->cache.get(hash);
+	Detail::CacheStatisticsCounters::increment( result ? m_data->statistics.hits : m_data->statistics.misses );
+	return result;
 }
 
 ConstObjectPtr ObjectPool::store( const Object *obj, StoreMode mode )
@@ -137,6 +140,25 @@ size_t ObjectPool::memoryUsage() const
 	return m_data->cache.currentCost();
 }
 
+CacheStatistics ObjectPool::statistics() const
+{
+	// The hits and misses recorded by the LRUCache are meaningless,
+	// because our getter caches null objects. We count our own, and
+	// take the remaining statistics from the LRUCache.
+	CacheStatistics result = m_data->cache.statistics();
+	const CacheStatistics retrieveStatistics = m_data->statistics.statistics();
+	result.hits = retrieveStatistics.hits;
+	result.misses = retrieveStatistics.misses;
+	result.getterTime = 0;
+	return result;
+}
+
+void ObjectPool::resetStatistics()
+{
+	m_data->statistics.reset();
+	m_data->cache.resetStatistics();
+}
+
 ObjectPool *ObjectPool::defaultObjectPool()
 {
 	static ObjectPoolPtr c = nullptr;
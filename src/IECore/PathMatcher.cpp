@@ -39,11 +39,134 @@
 
 #include "IECore/StringAlgo.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+
 using namespace std;
 using namespace IECore;
 
 static IECore::InternedString g_ellipsis( "..." );
 
+namespace
+{
+
+// The n-ary set operations process branches in parallel until they
+// have visited this many levels with more than one child. Below
+// that there is plenty of parallelism already, and the overhead
+// of launching tasks for small subtrees would dominate. Identical
+// branches are detected by hashing at the first of these levels
+// only, since each hash covers all descendants.
+const int g_parallelDepth = 2;
+
+template<typename F>
+void forEachChild( size_t numChildren, bool parallel, F &&f )
+{
+	if( parallel && numChildren > 1 )
+	{
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numChildren ),
+			[&f]( const tbb::blocked_range<size_t> &r ) {
+				for( size_t i = r.begin(); i != r.end(); ++i )
+				{
+					f( i );
+				}
+			}
+		);
+	}
+	else
+	{
+		for( size_t i = 0; i < numChildren; ++i )
+		{
+			f( i );
+		}
+	}
+}
+
+template<typename Nodes>
+void removeDuplicates( Nodes &nodes )
+{
+	std::sort( nodes.begin(), nodes.end() );
+	nodes.erase( std::unique( nodes.begin(), nodes.end() ), nodes.end() );
+}
+
+// Removes nodes which are structurally identical to an earlier
+// node, as determined by comparing the result of `hash`. Hashing
+// visits every descendant, so we only hash nodes which can't be
+// told apart by their immediate properties.
+template<typename Nodes, typename HashFunction>
+void removeIdentical( Nodes &nodes, HashFunction hash )
+{
+	if( nodes.size() < 2 )
+	{
+		return;
+	}
+
+	std::vector<IECore::MurmurHash> hashes( nodes.size() );
+	std::vector<bool> hashed( nodes.size(), false );
+	Nodes unique;
+	for( size_t i = 0; i < nodes.size(); ++i )
+	{
+		bool identical = false;
+		for( size_t j = 0; j < i && !identical; ++j )
+		{
+			if(
+				nodes[j]->terminator != nodes[i]->terminator ||
+				nodes[j]->children.size() != nodes[i]->children.size()
+			)
+			{
+				continue;
+			}
+			for( size_t k : { i, j } )
+			{
+				if( !hashed[k] )
+				{
+					hashes[k] = hash( nodes[k] );
+					hashed[k] = true;
+				}
+			}
+			identical = hashes[i] == hashes[j];
+		}
+		if( !identical )
+		{
+			unique.push_back( nodes[i] );
+		}
+	}
+	nodes.swap( unique );
+}
+
+// Returns true if any of the nodes is structurally identical
+// to the first one.
+template<typename Nodes, typename HashFunction>
+bool firstIsRepeated( const Nodes &nodes, HashFunction hash )
+{
+	IECore::MurmurHash firstHash;
+	bool hashedFirst = false;
+	for( size_t i = 1; i < nodes.size(); ++i )
+	{
+		if(
+			nodes[i]->terminator != nodes[0]->terminator ||
+			nodes[i]->children.size() != nodes[0]->children.size()
+		)
+		{
+			continue;
+		}
+		if( !hashedFirst )
+		{
+			firstHash = hash( nodes[0] );
+			hashedFirst = true;
+		}
+		if( hash( nodes[i] ) == firstHash )
+		{
+			return true;
+		}
+	}
+	return false;
+}
+
+} // namespace
+
 //////////////////////////////////////////////////////////////////////////
 // Name implementation
 //////////////////////////////////////////////////////////////////////////
@@ -53,12 +176,12 @@ inline PathMatcher::Name::Name( IECore::InternedString name )
 {
 }
 
-inline PathMatcher::Name::Name( IECore::InternedString name, Type type )
+PathMatcher::Name::Name( IECore::InternedString name, Type type )
 	: name( name ), type( type )
 {
 }
 
-inline bool PathMatcher::Name::operator < ( const Name &other ) const
+bool PathMatcher::Name::operator < ( const Name &other ) const
 {
 	return type < other.type || ( ( type == other.type ) && name < other.name );
 }
@@ -195,6 +318,11 @@ size_t PathMatcher::size() const
 	return std::distance( Iterator( begin() ), Iterator( end() ) );
 }
 
+size_t PathMatcher::sizeEstimate( size_t maxLocations ) const
+{
+	return (size_t)( sizeEstimateWalk( m_root.get(), maxLocations ) + 0.5 );
+}
+
 void PathMatcher::paths( std::vector<std::string> &paths ) const
 {
 	for( Iterator it = begin(), eIt = end(); it != eIt; ++it )
@@ -438,18 +566,53 @@ bool PathMatcher::removePaths( const PathMatcher &paths )
 
 PathMatcher PathMatcher::intersection( const PathMatcher &paths ) const
 {
-	PathMatcher result = PathMatcher();
-	for( Iterator it = (*this).begin(); it != (*this).end(); ++it )
+	return intersectionOf( { *this, paths } );
+}
+
+PathMatcher PathMatcher::unionOf( const std::vector<PathMatcher> &matchers )
+{
+	ConstNodes nodes;
+	for( const auto &m : matchers )
 	{
-		RawIterator rit = paths.find( *it );
-		if( rit == paths.end() )
-		{
-			it.prune();
-		}
-		else if( rit.exactMatch() )
-		{
-			result.addPath( *it );
-		}
+		nodes.push_back( m.m_root.get() );
+	}
+
+	PathMatcher result;
+	if( NodePtr root = result.unionWalk( nodes, g_parallelDepth ) )
+	{
+		result.m_root = root;
+	}
+	return result;
+}
+
+PathMatcher PathMatcher::intersectionOf( const std::vector<PathMatcher> &matchers )
+{
+	ConstNodes nodes;
+	for( const auto &m : matchers )
+	{
+		nodes.push_back( m.m_root.get() );
+	}
+
+	PathMatcher result;
+	if( NodePtr root = result.intersectionWalk( nodes, g_parallelDepth ) )
+	{
+		result.m_root = root;
+	}
+	return result;
+}
+
+PathMatcher PathMatcher::differenceOf( const PathMatcher &paths, const std::vector<PathMatcher> &pathsToRemove )
+{
+	ConstNodes nodes = { paths.m_root.get() };
+	for( const auto &m : pathsToRemove )
+	{
+		nodes.push_back( m.m_root.get() );
+	}
+
+	PathMatcher result;
+	if( NodePtr root = result.differenceWalk( nodes, g_parallelDepth ) )
+	{
+		result.m_root = root;
 	}
 	return result;
 }
@@ -751,3 +914,325 @@ PathMatcher::NodePtr PathMatcher::removePathsWalk( Node *node, const Node *srcNo
 
 	return result;
 }
+
+PathMatcher::NodePtr PathMatcher::unionWalk( ConstNodes &nodes, int parallelDepth )
+{
+	// Unmodified nodes are shared between copies of a PathMatcher, so
+	// it is common for several inputs to provide the very same node.
+	removeDuplicates( nodes );
+	if( nodes.size() < 2 )
+	{
+		return nodes.empty() ? nullptr : const_cast<Node *>( nodes.front() );
+	}
+
+	if( !parallelDepth )
+	{
+		// Add all the other nodes into the one with the most children,
+		// which is likely to require the fewest additions. Lazy-copy-on-write
+		// ensures that the input nodes are copied rather than modified.
+		std::iter_swap(
+			nodes.begin(),
+			std::max_element(
+				nodes.begin(), nodes.end(),
+				[]( const Node *a, const Node *b ) { return a->children.size() < b->children.size(); }
+			)
+		);
+
+		NodePtr result = const_cast<Node *>( nodes.front() );
+		for( ConstNodes::const_iterator it = nodes.begin() + 1; it != nodes.end(); ++it )
+		{
+			bool added = false;
+			if( NodePtr newResult = addPathsWalk( result.get(), *it, /* shared = */ false, added ) )
+			{
+				result = newResult;
+			}
+		}
+		return result;
+	}
+
+	// Gather the children of all the nodes, grouped by name, and
+	// merge each group in parallel.
+
+	bool terminator = false;
+	std::vector<const Node::ChildMapValue *> children;
+	for( const Node *node : nodes )
+	{
+		terminator = terminator || node->terminator;
+		for( const auto &child : node->children )
+		{
+			children.push_back( &child );
+		}
+	}
+
+	std::stable_sort(
+		children.begin(), children.end(),
+		[]( const Node::ChildMapValue *a, const Node::ChildMapValue *b ) { return a->first < b->first; }
+	);
+
+	std::vector<std::pair<const Name *, ConstNodes>> groups;
+	for( const auto *child : children )
+	{
+		if( groups.empty() || *groups.back().first < child->first )
+		{
+			groups.push_back( { &child->first, ConstNodes() } );
+		}
+		groups.back().second.push_back( child->second.get() );
+	}
+
+	const bool parallel = groups.size() > 1;
+	std::vector<NodePtr> newChildren( groups.size() );
+	forEachChild(
+		groups.size(), parallel,
+		[&]( size_t i ) {
+			ConstNodes &group = groups[i].second;
+			if( parallel && parallelDepth == g_parallelDepth )
+			{
+				removeIdentical( group, &PathMatcher::hashWalk );
+			}
+			newChildren[i] = unionWalk( group, parallel ? parallelDepth - 1 : parallelDepth );
+		}
+	);
+
+	NodePtr result = new Node( terminator );
+	for( size_t i = 0; i < groups.size(); ++i )
+	{
+		result->children.insert( result->children.end(), Node::ChildMapValue( *groups[i].first, newChildren[i] ) );
+	}
+
+	return result;
+}
+
+PathMatcher::NodePtr PathMatcher::intersectionWalk( ConstNodes &nodes, int parallelDepth )
+{
+	removeDuplicates( nodes );
+	if( nodes.size() < 2 )
+	{
+		return nodes.empty() ? nullptr : const_cast<Node *>( nodes.front() );
+	}
+
+	// Only children of the node with the fewest children can
+	// possibly be in the result, so we look up each of those
+	// in all the other nodes.
+
+	bool terminator = true;
+	const Node *smallest = nodes.front();
+	for( const Node *node : nodes )
+	{
+		terminator = terminator && node->terminator;
+		if( node->children.size() < smallest->children.size() )
+		{
+			smallest = node;
+		}
+	}
+
+	std::vector<std::pair<const Name *, ConstNodes>> groups;
+	for( const auto &child : smallest->children )
+	{
+		ConstNodes group;
+		for( const Node *node : nodes )
+		{
+			const Node *c = node->child( child.first );
+			if( !c )
+			{
+				break;
+			}
+			group.push_back( c );
+		}
+		if( group.size() == nodes.size() )
+		{
+			groups.push_back( { &child.first, group } );
+		}
+	}
+
+	const bool parallel = parallelDepth > 0 && groups.size() > 1;
+	std::vector<NodePtr> newChildren( groups.size() );
+	forEachChild(
+		groups.size(), parallel,
+		[&]( size_t i ) {
+			ConstNodes &group = groups[i].second;
+			if( parallel && parallelDepth == g_parallelDepth )
+			{
+				removeIdentical( group, &PathMatcher::hashWalk );
+			}
+			newChildren[i] = intersectionWalk( group, parallel ? parallelDepth - 1 : parallelDepth );
+		}
+	);
+
+	NodePtr result = new Node( terminator );
+	for( size_t i = 0; i < groups.size(); ++i )
+	{
+		if( newChildren[i] )
+		{
+			result->children.insert( result->children.end(), Node::ChildMapValue( *groups[i].first, newChildren[i] ) );
+		}
+	}
+
+	if( result->children.empty() )
+	{
+		return terminator ? Node::leaf() : nullptr;
+	}
+
+	return result;
+}
+
+PathMatcher::NodePtr PathMatcher::differenceWalk( ConstNodes &nodes, int parallelDepth )
+{
+	const Node *node = nodes.front();
+
+	ConstNodes others;
+	for( ConstNodes::const_iterator it = nodes.begin() + 1; it != nodes.end(); ++it )
+	{
+		if( *it == node )
+		{
+			return nullptr;
+		}
+		others.push_back( *it );
+	}
+
+	removeDuplicates( others );
+	if( others.empty() )
+	{
+		return const_cast<Node *>( node );
+	}
+
+	NodePtr result = const_cast<Node *>( node );
+	if( !parallelDepth )
+	{
+		// Remove the other nodes one by one. Lazy-copy-on-write
+		// ensures that the input node is copied rather than modified.
+		for( const Node *other : others )
+		{
+			bool removed = false;
+			if( NodePtr newResult = removePathsWalk( result.get(), other, /* shared = */ false, removed ) )
+			{
+				result = newResult;
+			}
+		}
+	}
+	else
+	{
+		// Group each child with the corresponding children of the
+		// other nodes, and process each group in parallel.
+
+		bool terminator = node->terminator;
+		for( const Node *other : others )
+		{
+			terminator = terminator && !other->terminator;
+		}
+
+		std::vector<std::pair<const Name *, ConstNodes>> groups;
+		for( const auto &child : node->children )
+		{
+			ConstNodes group = { child.second.get() };
+			for( const Node *other : others )
+			{
+				if( const Node *c = other->child( child.first ) )
+				{
+					group.push_back( c );
+				}
+			}
+			if( group.size() > 1 )
+			{
+				groups.push_back( { &child.first, group } );
+			}
+		}
+
+		const bool parallel = groups.size() > 1;
+		std::vector<NodePtr> newChildren( groups.size() );
+		forEachChild(
+			groups.size(), parallel,
+			[&]( size_t i ) {
+				ConstNodes &group = groups[i].second;
+				if( parallel && parallelDepth == g_parallelDepth && firstIsRepeated( group, &PathMatcher::hashWalk ) )
+				{
+					// Everything is removed.
+					return;
+				}
+				newChildren[i] = differenceWalk( group, parallel ? parallelDepth - 1 : parallelDepth );
+			}
+		);
+
+		NodePtr newResult;
+		if( terminator != node->terminator )
+		{
+			writable( result.get(), newResult, /* shared = */ true )->terminator = terminator;
+		}
+
+		for( size_t i = 0; i < groups.size(); ++i )
+		{
+			if( newChildren[i].get() == groups[i].second.front() )
+			{
+				continue;
+			}
+			if( newChildren[i] )
+			{
+				writable( result.get(), newResult, /* shared = */ true )->children[*groups[i].first] = newChildren[i];
+			}
+			else
+			{
+				writable( result.get(), newResult, /* shared = */ true )->children.erase( *groups[i].first );
+			}
+		}
+
+		if( newResult )
+		{
+			result = newResult;
+		}
+	}
+
+	if( result->isEmpty() )
+	{
+		return nullptr;
+	}
+
+	return result;
+}
+
+IECore::MurmurHash PathMatcher::hashWalk( const Node *node )
+{
+	// Children are sorted by InternedString address, which is the same
+	// for all nodes within a process. Identical trees therefore have
+	// identical hashes, and we can hash the addresses rather than the
+	// strings themselves. But the hashes must not be stored or compared
+	// between processes.
+	MurmurHash h;
+	h.append( (unsigned char)node->terminator );
+	for( const auto &child : node->children )
+	{
+		h.append( (uint64_t)child.first.name.c_str() );
+		h.append( child.first.type );
+		h.append( hashWalk( child.second.get() ) );
+	}
+	return h;
+}
+
+double PathMatcher::sizeEstimateWalk( const Node *node, size_t budget )
+{
+	double result = node->terminator ? 1 : 0;
+	const size_t numChildren = node->children.size();
+	if( !numChildren )
+	{
+		return result;
+	}
+
+	if( !budget )
+	{
+		// Assume the children we can't visit are all leaves.
+		return result + numChildren;
+	}
+
+	// Visit as many children as the budget allows, sharing the remaining
+	// budget between them. Children are sorted by InternedString address
+	// rather than by name, so the first few are a reasonable sample.
+	const size_t numSamples = std::min( numChildren, budget );
+	const size_t childBudget = ( budget - numSamples ) / numSamples;
+
+	double sampled = 0;
+	size_t i = 0;
+	for( Node::ConstChildMapIterator it = node->children.begin(); i < numSamples; ++it, ++i )
+	{
+		sampled += sizeEstimateWalk( it->second.get(), childBudget );
+	}
+
+	return result + sampled * numChildren / numSamples;
+}
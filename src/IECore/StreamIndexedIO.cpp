@@ -45,6 +45,8 @@
 
 #include "blosc.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
 #include "tbb/spin_rw_mutex.h"
 
 #include "boost/format.hpp"
@@ -58,14 +60,18 @@
 
 #include <algorithm>
 #include <cassert>
+#include <cstring>
 #include <iostream>
 #include <list>
 #include <map>
+#include <memory>
 #include <set>
 
 #include <fcntl.h>
 #ifndef _MSC_VER
 	#include <unistd.h>
+	#include <sys/mman.h>
+	#include <sys/stat.h>
 #endif
 #include <stdint.h>
 
@@ -162,7 +168,12 @@ class StreamIndexedIO::PlatformReader
 	public:
 		virtual ~PlatformReader();
 		virtual bool read( char *buffer, size_t size, size_t pos ) = 0;
-		static std::unique_ptr<PlatformReader> create( const std::string &fileName );
+		/// Returns a pointer to 'size' bytes at 'pos' offset in the file, valid for the
+		/// lifetime of the reader, or nullptr if the reader can't provide direct access.
+		virtual const char *data( size_t size, size_t pos );
+		/// If memoryMapped is true then the file is mapped into memory and data() can be
+		/// used to access it without copying. Falls back to a regular reader if mapping fails.
+		static std::unique_ptr<PlatformReader> create( const std::string &fileName, bool memoryMapped = false );
 };
 
 #ifndef _MSC_VER
@@ -200,15 +211,103 @@ bool PosixPlatformReader::read( char *buffer, size_t size, size_t pos )
 	return (size_t) result == size;
 }
 
+/// Memory mapped Reader for Linux & OSX. The whole file is mapped read-only and shared,
+/// so that multiple processes reading the same file share the page cache rather than
+/// each holding private copies of the data.
+class MMapPlatformReader : public StreamIndexedIO::PlatformReader
+{
+	public:
+		~MMapPlatformReader();
+		MMapPlatformReader( const std::string &fileName );
+		bool read( char *buffer, size_t size, size_t pos ) override;
+		const char *data( size_t size, size_t pos ) override;
+		bool valid() const;
+	private:
+		char *m_data;
+		size_t m_size;
+};
+
+MMapPlatformReader::MMapPlatformReader( const std::string &fileName ) : m_data( nullptr ), m_size( 0 )
+{
+	int fileHandle = ::open( fileName.c_str(), O_RDONLY );
+	if( fileHandle < 0 )
+	{
+		return;
+	}
+
+	struct stat fileStat;
+	if( fstat( fileHandle, &fileStat ) == 0 && fileStat.st_size > 0 )
+	{
+		void *mapped = mmap( nullptr, fileStat.st_size, PROT_READ, MAP_SHARED, fileHandle, 0 );
+		if( mapped != MAP_FAILED )
+		{
+			m_data = static_cast<char *>( mapped );
+			m_size = fileStat.st_size;
+		}
+	}
+
+	// the mapping keeps its own reference to the file
+	::close( fileHandle );
+}
+
+MMapPlatformReader::~MMapPlatformReader()
+{
+	if( m_data )
+	{
+		munmap( m_data, m_size );
+	}
+}
+
+bool MMapPlatformReader::read( char *buffer, size_t size, size_t pos )
+{
+	const char *src = data( size, pos );
+	if( !src )
+	{
+		return false;
+	}
+
+	memcpy( buffer, src, size );
+	return true;
+}
+
+const char *MMapPlatformReader::data( size_t size, size_t pos )
+{
+	if( !m_data || pos > m_size || size > m_size - pos )
+	{
+		return nullptr;
+	}
+
+	return m_data + pos;
+}
+
+bool MMapPlatformReader::valid() const
+{
+	return m_data != nullptr;
+}
+
 #endif
 
 StreamIndexedIO::PlatformReader::~PlatformReader()
 {
 }
 
-std::unique_ptr<StreamIndexedIO::PlatformReader> StreamIndexedIO::PlatformReader::create(const std::string& fileName)
+const char *StreamIndexedIO::PlatformReader::data( size_t size, size_t pos )
+{
+	return nullptr;
+}
+
+std::unique_ptr<StreamIndexedIO::PlatformReader> StreamIndexedIO::PlatformReader::create(const std::string& fileName, bool memoryMapped)
 {
 #ifndef _MSC_VER
+	if( memoryMapped )
+	{
+		std::unique_ptr<MMapPlatformReader> m( new MMapPlatformReader( fileName ) );
+		if( m->valid() )
+		{
+			return std::unique_ptr<StreamIndexedIO::PlatformReader>( m.release() );
+		}
+	}
+
 	PlatformReader* p = new PosixPlatformReader(fileName);
 	return std::unique_ptr<StreamIndexedIO::PlatformReader>(p);
 #else
@@ -402,9 +501,31 @@ std::string getCompressor( int code )
 	return "unknown";
 }
 
+/// Default size of the independently compressed blocks written for data nodes.
+/// Small enough that large arrays are split into many blocks which can be
+/// compressed and decompressed concurrently, large enough that the compression
+/// ratio is essentially unaffected.
+const size_t defaultCompressedBlockSize = 4 * 1024 * 1024;
+
+/// The number of compressed blocks is stored as an unsigned short in the index.
+const size_t maxCompressedBlocks = std::numeric_limits<unsigned short>::max();
+
+/// Location of a single blosc compressed block within a buffer of
+/// consecutive blocks, and of its contents once decompressed.
+struct CompressedBlock
+{
+	size_t compressedOffset;
+	size_t compressedSize;
+	size_t decompressedOffset;
+	size_t decompressedSize;
+};
+
+typedef std::vector<CompressedBlock> CompressedBlocks;
+
 /// compress 'size' bytes at 'data' into 'outputBuffer'
 /// compressionLevel, compressor & threadCount are passed directly to blosc ( see blosc.h )
-/// if  'size' is greater than the max buffer blosc can handle we split into a number of independently compressed blocks.
+/// if  'size' is greater than 'maxBlockSize' ( or the max buffer blosc can handle ) we split into a number
+/// of independently compressed blocks, which are compressed in parallel.
 /// returns the number of compression blocks
 /// 'outputBuffer' contains the compressed block data and is resized in this function.
 /// 'maxBlockSize' is useful for testing the compression block size without using buffers greater than 2GB
@@ -419,113 +540,200 @@ size_t compress(
 	size_t minCompressedBlockSize = 1024U
 )
 {
-	size_t maxCompressedBlockSize = maxBlockSize ? maxBlockSize.get() : BLOSC_MAX_BUFFERSIZE;
+	size_t maxCompressedBlockSize = maxBlockSize ? std::min( maxBlockSize.get(), (size_t)BLOSC_MAX_BUFFERSIZE ) : BLOSC_MAX_BUFFERSIZE;
 
-	if( size < minCompressedBlockSize )
+	if( size < minCompressedBlockSize || !maxCompressedBlockSize )
 	{
 		return 0;
 	}
 
-	size_t bytesToCompress = size;
-	const char *currentBlockCompressed = data;
+	const size_t numBlocks = ( size + maxCompressedBlockSize - 1 ) / maxCompressedBlockSize;
 
-	size_t numBlocks = 0;
+	// Each block is compressed into its own slot of the output buffer, each big
+	// enough for the worst case. Once all blocks are done we compact the slots.
+	const size_t slotSize = maxCompressedBlockSize + BLOSC_MAX_OVERHEAD;
+	outputBuffer.resize( numBlocks > 1 ? numBlocks * slotSize : size + BLOSC_MAX_OVERHEAD );
 
-	/// this isn't enough space in some edge cases but is sufficient in the common case
-	/// and we check if we have enough size in the compression loop
-	outputBuffer.resize( size + BLOSC_MAX_OVERHEAD );
-	char *writePtr = outputBuffer.data();
-	size_t writerBufferBytes = outputBuffer.size();
+	// If we have several blocks then we parallelise over the blocks rather than
+	// asking blosc for threads of its own.
+	const int blockThreadCount = numBlocks > 1 ? 1 : threadCount;
 
-	size_t totalCompressedSize = 0;
+	std::vector<int> compressedSizes( numBlocks, -1 );
 
-	while ( bytesToCompress )
+	auto compressBlock = [&]( size_t block )
 	{
-		size_t currentBlockUncompressedSize = std::min( maxCompressedBlockSize, bytesToCompress );
-		size_t compressedBufferMaxSize = currentBlockUncompressedSize + BLOSC_MAX_OVERHEAD;
-		if( writerBufferBytes < compressedBufferMaxSize )
-		{
-			size_t additionalBytes = (size_t) ( compressedBufferMaxSize - writerBufferBytes );
-			outputBuffer.resize( outputBuffer.size() + additionalBytes );
-		}
+		const size_t blockOffset = block * maxCompressedBlockSize;
+		const size_t blockUncompressedSize = std::min( maxCompressedBlockSize, size - blockOffset );
 
-		int compressedSize = blosc_compress_ctx(
+		compressedSizes[block] = blosc_compress_ctx(
 			compressionLevel,
 			true,
 			4,
-			currentBlockUncompressedSize,
-			currentBlockCompressed,
-			writePtr,
-			compressedBufferMaxSize,
+			blockUncompressedSize,
+			data + blockOffset,
+			outputBuffer.data() + block * slotSize,
+			blockUncompressedSize + BLOSC_MAX_OVERHEAD,
 			compressor.c_str(),
 			0,
-			threadCount
+			blockThreadCount
 		);
+	};
+
+	if( numBlocks > 1 )
+	{
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numBlocks, 1 ),
+			[&]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t block = range.begin(); block != range.end(); ++block )
+				{
+					compressBlock( block );
+				}
+			},
+			taskGroupContext
+		);
+	}
+	else
+	{
+		compressBlock( 0 );
+	}
 
-		if ( compressedSize < 0 )
+	// Compact the blocks so they are stored consecutively. Each block only ever
+	// moves towards the start of the buffer, so this is safe to do in order.
+	size_t totalCompressedSize = 0;
+	for( size_t block = 0; block < numBlocks; ++block )
+	{
+		if( compressedSizes[block] < 0 )
 		{
 			outputBuffer.clear();
 			return 0;
 		}
 
-		writerBufferBytes -= compressedSize;
-		writePtr += compressedSize;
-
-		totalCompressedSize += compressedSize;
-
-		currentBlockCompressed += currentBlockUncompressedSize;
-		bytesToCompress -= currentBlockUncompressedSize;
-		numBlocks++;
+		const char *blockData = outputBuffer.data() + block * slotSize;
+		if( blockData != outputBuffer.data() + totalCompressedSize )
+		{
+			memmove( outputBuffer.data() + totalCompressedSize, blockData, compressedSizes[block] );
+		}
+		totalCompressedSize += compressedSizes[block];
 	}
 
-	// if we've compressed all the input then just set the
-	// output buffer
 	outputBuffer.resize( totalCompressedSize );
 
 	return numBlocks;
 }
 
-/// decompress a memory buffer which is formed by a number of blosc compressed blocks
-/// returns the number of compression blocks
-/// 'outputBuffer' contains the decompressed data and is resized in this function if not large enough.
-size_t decompress( const char *data, size_t size, std::vector<char> &outputBuffer, int threadCount )
+/// builds the table of blocks in a buffer of 'size' bytes formed by a number of blosc
+/// compressed blocks, using the blosc headers. The 'header' functor is called with the
+/// offset of each block and must return a pointer to at least BLOSC_MIN_HEADER_LENGTH
+/// bytes from that offset. If 'numBlocks' is given then only that many blocks are
+/// expected. Returns the total decompressed size.
+template<typename HeaderFn>
+size_t readCompressedBlocks( HeaderFn &&header, size_t size, CompressedBlocks &blocks, boost::optional<size_t> numBlocks = boost::optional<size_t>() )
 {
-	std::vector<std::pair<size_t, size_t>> blockSizes;
+	blocks.clear();
+	if( numBlocks )
+	{
+		blocks.reserve( numBlocks.get() );
+	}
+
 	size_t totalDecompressedSize = 0;
 	size_t compressedBytesRead = 0;
 
-	while( compressedBytesRead < size )
+	while( compressedBytesRead < size && ( !numBlocks || blocks.size() < numBlocks.get() ) )
 	{
+		if( size - compressedBytesRead < BLOSC_MIN_HEADER_LENGTH )
+		{
+			throw IECore::IOException( "StreamIndexedIO (decompress) - Corrupted compressed archive" );
+		}
+
 		size_t compressedNumBytes = 0, decompressedNumBytes = 0, blockSize = 0;
-		blosc_cbuffer_sizes( &data[compressedBytesRead], &decompressedNumBytes, &compressedNumBytes, &blockSize );
+		blosc_cbuffer_sizes( header( compressedBytesRead ), &decompressedNumBytes, &compressedNumBytes, &blockSize );
 
-		blockSizes.push_back( std::make_pair( compressedNumBytes, decompressedNumBytes ) );
+		if( !compressedNumBytes || compressedNumBytes > size - compressedBytesRead )
+		{
+			throw IECore::IOException( "StreamIndexedIO (decompress) - Corrupted compressed archive" );
+		}
+
+		blocks.push_back( { compressedBytesRead, compressedNumBytes, totalDecompressedSize, decompressedNumBytes } );
 		totalDecompressedSize += decompressedNumBytes;
 		compressedBytesRead += compressedNumBytes;
 	}
 
-	if( outputBuffer.size() < totalDecompressedSize )
-	{
-		std::vector<char> b ( totalDecompressedSize );
-		outputBuffer.swap( b );
-	}
+	return totalDecompressedSize;
+}
 
-	compressedBytesRead = 0;
-	size_t decompressedBytesWritten = 0;
-	for( const auto &blockSize : blockSizes )
+/// as above, for blocks which are already in memory.
+size_t readCompressedBlocks( const char *data, size_t size, CompressedBlocks &blocks, boost::optional<size_t> numBlocks = boost::optional<size_t>() )
+{
+	return readCompressedBlocks( [data]( size_t offset ) { return data + offset; }, size, blocks, numBlocks );
+}
+
+/// decompresses the blocks described by 'blocks' into 'outputBuffer', which must be large
+/// enough to hold the decompressed data. Multiple blocks are decompressed in parallel.
+void decompressBlocks( const char *data, const CompressedBlocks &blocks, char *outputBuffer, int threadCount )
+{
+	auto decompressBlock = [&]( const CompressedBlock &block, int blockThreadCount )
 	{
-		int bloscResult = blosc_decompress_ctx( &data[compressedBytesRead], &outputBuffer[decompressedBytesWritten], blockSize.second, threadCount );
+		int bloscResult = blosc_decompress_ctx( data + block.compressedOffset, outputBuffer + block.decompressedOffset, block.decompressedSize, blockThreadCount );
 
 		if( bloscResult <= 0 )
 		{
 			throw IECore::IOException( "StreamIndexedIO (decompress) - Corrupted compressed archive" );
 		}
+	};
 
-		compressedBytesRead += blockSize.first;
-		decompressedBytesWritten += blockSize.second;
+	if( blocks.size() > 1 )
+	{
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, blocks.size(), 1 ),
+			[&]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t i = range.begin(); i != range.end(); ++i )
+				{
+					decompressBlock( blocks[i], 1 );
+				}
+			},
+			taskGroupContext
+		);
+	}
+	else if( blocks.size() == 1 )
+	{
+		decompressBlock( blocks[0], threadCount );
 	}
+}
+
+/// decompress a memory buffer which is formed by a number of blosc compressed blocks
+/// returns the number of compression blocks
+/// 'outputBuffer' contains the decompressed data and is resized in this function if not large enough.
+size_t decompress( const char *data, size_t size, std::vector<char> &outputBuffer, int threadCount )
+{
+	CompressedBlocks blocks;
+	size_t totalDecompressedSize = readCompressedBlocks( data, size, blocks );
+
+	if( outputBuffer.size() < totalDecompressedSize )
+	{
+		std::vector<char> b ( totalDecompressedSize );
+		outputBuffer.swap( b );
+	}
+
+	decompressBlocks( data, blocks, outputBuffer.data(), threadCount );
 
-	return blockSizes.size();
+	return blocks.size();
+}
+
+void validateRange( const IndexedIO::EntryID &name, size_t arrayLength, size_t offset, size_t count )
+{
+	if( offset > arrayLength || count > arrayLength - offset )
+	{
+		throw IOException(
+			boost::str(
+				boost::format( "StreamIndexedIO::read : Range [%1%, %2%) is out of bounds for entry \"%3%\" of length %4%" ) %
+					offset % ( offset + count ) % name.value() % arrayLength
+			)
+		);
+	}
 }
 
 } // namespace
@@ -924,49 +1132,142 @@ class StreamIndexedIO::Reader
 
 		//! If an outputBuffer is supplied then it has to be large enough to store info.decompressedSize bytes of data
 		//! and if one isn't supplied then a suitably sized buffer is created and freed on destruction.
+		//! When the file is memory mapped and no outputBuffer is supplied, uncompressed blocks are not copied at all
+		//! and data() points directly into the mapped file.
 		Reader( StreamIndexedIO::StreamFile &f, const Node::Info &info, int threadCount = 1, char *outputBuffer = nullptr )
 			: m_data( nullptr ),
 			m_decompressedData( outputBuffer ),
+			m_mappedData( nullptr ),
 			m_size( info.size ),
 			m_decompressedSize( info.decompressedSize ),
 			m_ownDecompressedData( outputBuffer == nullptr )
 		{
-			if( m_ownDecompressedData )
-			{
-				m_decompressedData = new char[m_decompressedSize];
-			}
+			const char *mappedData = f.data( info.size, info.offset );
 
 			if( info.numCompressedBlocks > 0 )
 			{
-				m_data = new char[info.size];
-				f.read( m_data, info.size, info.offset );
-
-				const char* readPtr = m_data;
-				char* writePtr = m_decompressedData;
+				if( m_ownDecompressedData )
+				{
+					m_decompressedData = new char[m_decompressedSize];
+				}
 
-				size_t writeBufferSize = m_decompressedSize;
-				for ( size_t block = 0; block < info.numCompressedBlocks; ++block )
+				const char* readPtr = mappedData;
+				if( !readPtr )
 				{
-					/// read the blosc header so we can decompress this block
-					size_t compresedNumBytes = 0, decompressedNumBytes = 0, blockSize = 0;
-					blosc_cbuffer_sizes( readPtr, &decompressedNumBytes , &compresedNumBytes, &blockSize );
+					m_data = new char[info.size];
+					f.read( m_data, info.size, info.offset );
+					readPtr = m_data;
+				}
 
-					int bloscResult = blosc_decompress_ctx( readPtr, writePtr, decompressedNumBytes, threadCount );
+				CompressedBlocks blocks;
+				const size_t decompressedSize = readCompressedBlocks( readPtr, info.size, blocks, info.numCompressedBlocks );
+				if( blocks.size() != info.numCompressedBlocks || decompressedSize != m_decompressedSize )
+				{
+					throw IECore::IOException( "StreamIndexedIO::Reader - Corrupted compressed archive" );
+				}
 
-					if( bloscResult <= 0 )
-					{
-						throw IECore::IOException( "StreamIndexedIO::Reader - Corrupted compressed archive" );
-					}
+				decompressBlocks( readPtr, blocks, m_decompressedData, threadCount );
+			}
+			else if( mappedData && m_ownDecompressedData )
+			{
+				m_mappedData = mappedData;
+			}
+			else
+			{
+				if( m_ownDecompressedData )
+				{
+					m_decompressedData = new char[m_decompressedSize];
+				}
 
-					readPtr += compresedNumBytes;
-					writePtr += decompressedNumBytes;
-					writeBufferSize -= decompressedNumBytes;
+				if( mappedData )
+				{
+					memcpy( m_decompressedData, mappedData, info.size );
+				}
+				else
+				{
+					f.read( m_decompressedData, info.size, info.offset );
 				}
 			}
+		}
+
+		//! Reads 'size' bytes starting 'offset' bytes into the decompressed data block into outputBuffer.
+		//! Uncompressed blocks are read directly from the required part of the file. For compressed data
+		//! only the compressed blocks which overlap the range are read and decompressed.
+		static void readRange( StreamIndexedIO::StreamFile &f, const Node::Info &info, size_t offset, size_t size, char *outputBuffer, int threadCount = 1 )
+		{
+			if( !size )
+			{
+				return;
+			}
+
+			if( !info.numCompressedBlocks )
+			{
+				f.read( outputBuffer, size, info.offset + offset );
+				return;
+			}
+
+			const char *mappedData = f.data( info.size, info.offset );
+
+			CompressedBlocks blocks;
+			if( mappedData )
+			{
+				readCompressedBlocks( mappedData, info.size, blocks, info.numCompressedBlocks );
+			}
 			else
 			{
-				f.read( m_decompressedData, info.size, info.offset );
+				// read just the headers, rather than all of the compressed data
+				char header[BLOSC_MIN_HEADER_LENGTH];
+				readCompressedBlocks(
+					[&f, &info, &header]( size_t blockOffset ) -> const char *
+					{
+						f.read( header, BLOSC_MIN_HEADER_LENGTH, info.offset + blockOffset );
+						return header;
+					},
+					info.size, blocks, info.numCompressedBlocks
+				);
+			}
+
+			// find the blocks overlapping the range
+			auto first = std::upper_bound(
+				blocks.begin(), blocks.end(), offset,
+				[]( size_t o, const CompressedBlock &b ) { return o < b.decompressedOffset + b.decompressedSize; }
+			);
+			auto last = std::lower_bound(
+				first, blocks.end(), offset + size,
+				[]( const CompressedBlock &b, size_t o ) { return b.decompressedOffset < o; }
+			);
+
+			if( first == last || last[-1].decompressedOffset + last[-1].decompressedSize < offset + size )
+			{
+				throw IECore::IOException( "StreamIndexedIO::Reader - Range exceeds data block" );
+			}
+
+			// rebase the overlapping blocks so they describe a buffer containing just them
+			CompressedBlocks rangeBlocks( first, last );
+			const size_t compressedStart = first->compressedOffset;
+			const size_t decompressedStart = first->decompressedOffset;
+			for( auto &b : rangeBlocks )
+			{
+				b.compressedOffset -= compressedStart;
+				b.decompressedOffset -= decompressedStart;
+			}
+
+			const CompressedBlock &back = rangeBlocks.back();
+			const size_t compressedSize = back.compressedOffset + back.compressedSize;
+
+			std::unique_ptr<char[]> compressedBuffer;
+			const char *compressedData = mappedData ? mappedData + compressedStart : nullptr;
+			if( !compressedData )
+			{
+				compressedBuffer.reset( new char[compressedSize] );
+				f.read( compressedBuffer.get(), compressedSize, info.offset + compressedStart );
+				compressedData = compressedBuffer.get();
 			}
+
+			std::unique_ptr<char[]> decompressedBuffer( new char[back.decompressedOffset + back.decompressedSize] );
+			decompressBlocks( compressedData, rangeBlocks, decompressedBuffer.get(), threadCount );
+
+			memcpy( outputBuffer, decompressedBuffer.get() + offset - decompressedStart, size );
 		}
 
 		~Reader()
@@ -982,9 +1283,13 @@ class StreamIndexedIO::Reader
 			}
 		}
 
-		char *data() const
+		const char *data() const
 		{
-			if( m_decompressedData )
+			if( m_mappedData )
+			{
+				return m_mappedData;
+			}
+			else if( m_decompressedData )
 			{
 				return m_decompressedData;
 			}
@@ -1002,6 +1307,7 @@ class StreamIndexedIO::Reader
 	private:
 		char *m_data;
 		char *m_decompressedData;
+		const char *m_mappedData;
 		Imf::Int64 m_size;
 		Imf::Int64 m_decompressedSize;
 		bool m_ownDecompressedData;
@@ -2558,7 +2864,11 @@ StreamIndexedIO::Index::WriteInfo StreamIndexedIO::Index::writeUniqueDataCompres
 
 	if ( m_compressionLevel )
 	{
-		numBlocks = compress( data, size, compressedBuffer, m_compressionLevel, m_compressor, m_compressionThreadCount, m_maxCompressedBlockSize );
+		// make sure we never need more blocks than we can record in the index
+		size_t blockSize = m_maxCompressedBlockSize ? m_maxCompressedBlockSize.get() : defaultCompressedBlockSize;
+		blockSize = std::max( blockSize, ( size + maxCompressedBlocks - 1 ) / maxCompressedBlocks );
+
+		numBlocks = compress( data, size, compressedBuffer, m_compressionLevel, m_compressor, m_compressionThreadCount, blockSize );
 	}
 
 	//! if compression fails or produces a buffer larger than the original
@@ -2752,7 +3062,7 @@ IndexedIO::OpenMode StreamIndexedIO::StreamFile::openMode() const
 	return m_openmode;
 }
 
-void StreamIndexedIO::StreamFile::setInput( std::iostream *stream, bool emptyFile, const std::string& fileName )
+void StreamIndexedIO::StreamFile::setInput( std::iostream *stream, bool emptyFile, const std::string& fileName, bool memoryMapped )
 {
 	m_stream = stream;
 	if ( m_openmode & IndexedIO::Append && emptyFile )
@@ -2762,7 +3072,8 @@ void StreamIndexedIO::StreamFile::setInput( std::iostream *stream, bool emptyFil
 
 	if ( fileName != "" && getenv("IECORE_OFFSETREAD_DISABLED") == nullptr )
 	{
-		m_platformReader = PlatformReader::create( fileName );
+		// mapping is only safe when nothing can modify the file underneath us
+		m_platformReader = PlatformReader::create( fileName, memoryMapped && !( m_openmode & ( IndexedIO::Write | IndexedIO::Append ) ) );
 	}
 }
 
@@ -2823,6 +3134,15 @@ void StreamIndexedIO::StreamFile::read( char *buffer, size_t size, size_t pos )
 	}
 }
 
+const char *StreamIndexedIO::StreamFile::data( size_t size, size_t pos )
+{
+	if ( !m_platformReader )
+	{
+		return nullptr;
+	}
+	return m_platformReader->data( size, pos );
+}
+
 void StreamIndexedIO::StreamFile::seekg( size_t pos, std::ios_base::seekdir dir )
 {
 	m_stream->seekg( pos, dir );
@@ -3271,6 +3591,41 @@ void StreamIndexedIO::read(const IndexedIO::EntryID &name, InternedString *&x, u
 	delete [] ids;
 }
 
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, InternedString *&x, unsigned long offset, unsigned long count) const
+{
+	assert( m_node );
+	readable(name);
+
+	StreamIndexedIO::Node::Info nodeInfo;
+	if( !m_node->dataChildInfo( name, nodeInfo ) )
+	{
+		throw IOException( "StreamIndexedIO::read : Data entry not found '" + name.value() + "'" );
+	}
+
+	validateRange( name, nodeInfo.decompressedSize / sizeof( Imf::Int64 ), offset, count );
+
+	Imf::Int64 *ids = new Imf::Int64[count];
+	Reader::readRange( streamFile(), nodeInfo, offset * sizeof( Imf::Int64 ), count * sizeof( Imf::Int64 ), reinterpret_cast<char *>( ids ), m_node->m_idx->decompressionThreadCount() );
+
+	const StringCache &stringCache = m_node->m_idx->stringCache();
+	if (!x)
+	{
+		x = new InternedString[count];
+	}
+
+	for ( unsigned long i = 0; i < count; i++ )
+	{
+		x[i] = stringCache.findById( ids[i] );
+	}
+	delete [] ids;
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, std::string *&x, unsigned long offset, unsigned long count) const
+{
+	// strings are variable length, so we must read the whole array
+	IndexedIO::read( name, x, offset, count );
+}
+
 template<typename T>
 void StreamIndexedIO::write(const IndexedIO::EntryID &name, const T *x, unsigned long arrayLength)
 {
@@ -3379,6 +3734,47 @@ void StreamIndexedIO::rawRead(const IndexedIO::EntryID &name, T *&x, unsigned lo
 	Reader reader( streamFile(), nodeInfo, m_node->m_idx->decompressionThreadCount(), reinterpret_cast<char *>( x ) );
 }
 
+template<typename T>
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, T *&x, unsigned long offset, unsigned long count) const
+{
+	assert( m_node );
+	readable(name);
+
+	StreamIndexedIO::Node::Info nodeInfo;
+	if( !m_node->dataChildInfo( name, nodeInfo ) )
+	{
+		throw IOException( "StreamIndexedIO::read: Data entry not found '" + name.value() + "'" );
+	}
+
+	validateRange( name, nodeInfo.decompressedSize / sizeof( T ), offset, count );
+
+	std::vector<char> buffer( count * sizeof( T ) );
+	Reader::readRange( streamFile(), nodeInfo, offset * sizeof( T ), count * sizeof( T ), buffer.data(), m_node->m_idx->decompressionThreadCount() );
+	IndexedIO::DataFlattenTraits<T *>::unflatten( buffer.data(), x, count );
+}
+
+template<typename T>
+void StreamIndexedIO::rawRead(const IndexedIO::EntryID &name, T *&x, unsigned long offset, unsigned long count) const
+{
+	assert( m_node );
+	readable(name);
+
+	StreamIndexedIO::Node::Info nodeInfo;
+	if( !m_node->dataChildInfo( name, nodeInfo ) )
+	{
+		throw IOException( "StreamIndexedIO::rawRead: Data entry not found '" + name.value() + "'" );
+	}
+
+	validateRange( name, nodeInfo.decompressedSize / sizeof( T ), offset, count );
+
+	if (!x)
+	{
+		x = new T[count];
+	}
+
+	Reader::readRange( streamFile(), nodeInfo, offset * sizeof( T ), count * sizeof( T ), reinterpret_cast<char *>( x ), m_node->m_idx->decompressionThreadCount() );
+}
+
 template<typename T>
 void StreamIndexedIO::read(const IndexedIO::EntryID &name, T &x) const
 {
@@ -3607,6 +4003,61 @@ void StreamIndexedIO::read(const IndexedIO::EntryID &name, unsigned short *&x, u
 	READ<unsigned short>(name, x, arrayLength);
 }
 
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, float *&x, unsigned long offset, unsigned long count) const
+{
+	READ<float>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, double *&x, unsigned long offset, unsigned long count) const
+{
+	READ<double>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, half *&x, unsigned long offset, unsigned long count) const
+{
+	READ<half>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, int *&x, unsigned long offset, unsigned long count) const
+{
+	READ<int>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, int64_t *&x, unsigned long offset, unsigned long count) const
+{
+	READ<int64_t>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, uint64_t *&x, unsigned long offset, unsigned long count) const
+{
+	READ<uint64_t>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, unsigned int *&x, unsigned long offset, unsigned long count) const
+{
+	READ<unsigned int>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, char *&x, unsigned long offset, unsigned long count) const
+{
+	READ<char>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, unsigned char *&x, unsigned long offset, unsigned long count) const
+{
+	READ<unsigned char>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, short *&x, unsigned long offset, unsigned long count) const
+{
+	READ<short>(name, x, offset, count);
+}
+
+void StreamIndexedIO::read(const IndexedIO::EntryID &name, unsigned short *&x, unsigned long offset, unsigned long count) const
+{
+	READ<unsigned short>(name, x, offset, count);
+}
+
 void StreamIndexedIO::read(const IndexedIO::EntryID &name, float &x) const
 {
 	READ<float>(name, x);
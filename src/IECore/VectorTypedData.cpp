@@ -46,6 +46,34 @@ using namespace IECore;
 static IndexedIO::EntryID g_valueEntry("value");
 static IndexedIO::EntryID g_sizeEntry("size");
 
+// Loads the value entry written by save(), honouring any element range
+// requested via LoadContext::load().
+template<size_t N, typename T>
+static void loadValue( T *data, Object::LoadContext *context, const IndexedIO *container )
+{
+	IndexedIO::Entry e = container->entry( g_valueEntry );
+	const size_t numElements = e.arrayLength() / N;
+	size_t offset, count;
+	context->elementRange( numElements, offset, count );
+
+	data->writable().resize( count );
+	if( !count )
+	{
+		return;
+	}
+
+	typename T::BaseType *p = data->baseWritable();
+	assert( p );
+	if( count == numElements )
+	{
+		container->read( g_valueEntry, p, e.arrayLength() );
+	}
+	else
+	{
+		container->read( g_valueEntry, p, offset * N, count * N );
+	}
+}
+
 #define IE_CORE_DEFINEVECTORTYPEDDATAMEMUSAGESPECIALISATION( TNAME )										\
 	template<>																								\
 	void TNAME::memoryUsage( Object::MemoryAccumulator &accumulator ) const			\
@@ -99,27 +127,13 @@ static IndexedIO::EntryID g_sizeEntry("size");
 		try																							\
 		{																							\
 			const IndexedIO *container = context->rawContainer();									\
-			IndexedIO::Entry e = container->entry( g_valueEntry );									\
-			writable().resize( e.arrayLength() / N );												\
-			if ( e.arrayLength() ) 																	\
-			{ 																						\
-				TNAME::BaseType *p = baseWritable(); 												\
-				assert( p ) ; 																		\
-				container->read( g_valueEntry, p, e.arrayLength() ); 								\
-			} 																						\
+			loadValue<N>( this, context.get(), container );													\
 		}																							\
 		catch( ... )																				\
 		{																							\
 			unsigned int v = 0;																		\
 			ConstIndexedIOPtr container = context->container( FALLBACKNAME::staticTypeName(), v );				\
-			IndexedIO::Entry e = container->entry( g_valueEntry );									\
-			writable().resize( e.arrayLength() / N );												\
-			if ( e.arrayLength() ) 																	\
-			{ 																						\
-				TNAME::BaseType *p = baseWritable(); 												\
-				assert( p ) ; 																		\
-				container->read( g_valueEntry, p, e.arrayLength() ); 								\
-			} 																						\
+			loadValue<N>( this, context.get(), container.get() );													\
 		}																							\
 	}
 
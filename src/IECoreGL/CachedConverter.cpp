@@ -64,8 +64,8 @@ struct CacheGetterKey
 	{
 	}
 
-	CacheGetterKey( const IECore::Object *o )
-		: object( o ), hash( o->hash() )
+	CacheGetterKey( const IECore::Object *o, IECore::ConstRunTimeTypedPtr p = nullptr )
+		: object( o ), hash( o->hash() ), previous( p )
 	{
 	}
 
@@ -81,6 +81,8 @@ struct CacheGetterKey
 
 	const IECore::Object *object;
 	const IECore::MurmurHash hash;
+	// Previous conversion to be passed to `ToGLConverter::update()`.
+	IECore::ConstRunTimeTypedPtr previous;
 
 };
 
@@ -107,7 +109,7 @@ struct CachedConverter::MemberData
 				)
 			);
 		}
-		return converter->convert();
+		return converter->update( key.previous );
 	}
 
 	void removalCallback( const IECore::MurmurHash &key, const IECore::RunTimeTypedPtr &value )
@@ -135,6 +137,23 @@ IECore::ConstRunTimeTypedPtr CachedConverter::convert( const IECore::Object *obj
 	return m_data->cache.get( CacheGetterKey( object ) );
 }
 
+IECore::ConstRunTimeTypedPtr CachedConverter::convert( const IECore::Object *object, const IECore::Object *previous )
+{
+	CacheGetterKey key( object );
+	if( previous && !m_data->cache.cached( key.hash ) )
+	{
+		CacheGetterKey previousKey( previous );
+		if( m_data->cache.cached( previousKey.hash ) )
+		{
+			// `previous` could be evicted before we get it, in which case
+			// it will be converted again. That is unlikely, and wasteful
+			// rather than incorrect, so we don't guard against it.
+			key.previous = m_data->cache.get( previousKey );
+		}
+	}
+	return m_data->cache.get( key );
+}
+
 size_t CachedConverter::getMaxMemory() const
 {
 	return m_data->cache.getMaxCost();
@@ -34,10 +34,13 @@
 
 #include "IECoreGL/MeshPrimitive.h"
 
+#include "IECoreGL/Buffer.h"
+#include "IECoreGL/CachedConverter.h"
 #include "IECoreGL/GL.h"
 #include "IECoreGL/State.h"
 
 #include "IECore/DespatchTypedData.h"
+#include "IECore/Exception.h"
 
 #include "OpenEXR/ImathMath.h"
 
@@ -61,9 +64,16 @@ class MeshPrimitive::MemberData : public IECore::RefCounted
 		{
 		}
 
+		MemberData( IECore::ConstUIntVectorDataPtr vertexIds ) : numTriangles( vertexIds->readable().size() / 3 ), vertexIds( vertexIds )
+		{
+		}
+
 		unsigned numTriangles;
 		Imath::Box3f bound;
 
+		IECore::ConstUIntVectorDataPtr vertexIds;
+		mutable IECoreGL::ConstBufferPtr vertexIdsBuffer;
+
 };
 
 //////////////////////////////////////////////////////////////////////////
@@ -77,10 +87,20 @@ MeshPrimitive::MeshPrimitive( unsigned numTriangles )
 {
 }
 
+MeshPrimitive::MeshPrimitive( IECore::ConstUIntVectorDataPtr vertexIds )
+	:	m_memberData( new MemberData( vertexIds ) )
+{
+}
+
 MeshPrimitive::~MeshPrimitive()
 {
 }
 
+const IECore::UIntVectorData *MeshPrimitive::vertexIds() const
+{
+	return m_memberData->vertexIds.get();
+}
+
 void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECoreScene::PrimitiveVariable &primVar )
 {
 	if( name == "P" )
@@ -98,6 +118,23 @@ void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECoreS
 		}
 	}
 
+	if( m_memberData->vertexIds )
+	{
+		if ( primVar.interpolation==IECoreScene::PrimitiveVariable::Vertex || primVar.interpolation==IECoreScene::PrimitiveVariable::Varying )
+		{
+			addVertexAttribute( name, primVar.expandedData() );
+		}
+		else if ( primVar.interpolation==IECoreScene::PrimitiveVariable::Constant )
+		{
+			addUniformAttribute( name, primVar.expandedData() );
+		}
+		else if ( primVar.interpolation==IECoreScene::PrimitiveVariable::FaceVarying )
+		{
+			throw IECore::Exception( "IECoreGL::MeshPrimitive : Invalid interpolation for \"" + name + "\". Must be Vertex, Varying or Constant." );
+		}
+		return;
+	}
+
 	if ( primVar.interpolation==IECoreScene::PrimitiveVariable::FaceVarying )
 	{
 		addVertexAttribute( name, primVar.expandedData() );
@@ -114,7 +151,22 @@ void MeshPrimitive::addPrimitiveVariable( const std::string &name, const IECoreS
 
 void MeshPrimitive::renderInstances( size_t numInstances ) const
 {
-	glDrawArraysInstancedARB( GL_TRIANGLES, 0, m_memberData->numTriangles * 3, numInstances );
+	if( !m_memberData->vertexIds )
+	{
+		glDrawArraysInstancedARB( GL_TRIANGLES, 0, m_memberData->numTriangles * 3, numInstances );
+		return;
+	}
+
+	if( !m_memberData->vertexIdsBuffer )
+	{
+		// we don't build the actual buffer until now, because in the constructor we're not guaranteed
+		// a valid GL context.
+		CachedConverterPtr cachedConverter = CachedConverter::defaultCachedConverter();
+		m_memberData->vertexIdsBuffer = IECore::runTimeCast<const Buffer>( cachedConverter->convert( m_memberData->vertexIds.get() ) );
+	}
+
+	Buffer::ScopedBinding indexBinding( *(m_memberData->vertexIdsBuffer), GL_ELEMENT_ARRAY_BUFFER );
+	glDrawElementsInstancedARB( GL_TRIANGLES, m_memberData->vertexIds->readable().size(), GL_UNSIGNED_INT, nullptr, numInstances );
 }
 
 Imath::Box3f MeshPrimitive::bound() const
@@ -380,6 +380,39 @@ void Primitive::addVertexAttribute( const std::string &name, IECore::ConstDataPt
 	m_vertexAttributes[name] = data->copy();
 }
 
+void Primitive::setTopologyHash( const IECore::MurmurHash &hash )
+{
+	m_topologyHash = hash;
+}
+
+const IECore::MurmurHash &Primitive::getTopologyHash() const
+{
+	return m_topologyHash;
+}
+
+void Primitive::setPrimitiveVariableHash( const std::string &name, const IECore::MurmurHash &hash )
+{
+	m_primitiveVariableHashes[name] = hash;
+}
+
+IECore::MurmurHash Primitive::getPrimitiveVariableHash( const std::string &name ) const
+{
+	HashMap::const_iterator it = m_primitiveVariableHashes.find( name );
+	return it != m_primitiveVariableHashes.end() ? it->second : IECore::MurmurHash();
+}
+
+IECore::ConstDataPtr Primitive::getPrimitiveVariableData( const std::string &name ) const
+{
+	AttributeMap::const_iterator it = m_vertexAttributes.find( name );
+	if( it != m_vertexAttributes.end() )
+	{
+		return it->second;
+	}
+
+	it = m_uniformAttributes.find( name );
+	return it != m_uniformAttributes.end() ? it->second : nullptr;
+}
+
 bool Primitive::depthSortRequested( const State * state ) const
 {
 	return state->get<Primitive::TransparencySort>()->value() &&
@@ -34,6 +34,8 @@
 
 #include "IECoreGL/ToGLConverter.h"
 
+#include "IECoreGL/Primitive.h"
+
 #include "IECore/CompoundParameter.h"
 #include "IECore/ObjectParameter.h"
 
@@ -57,6 +59,62 @@ IECore::RunTimeTypedPtr ToGLConverter::convert()
 	return doConversion( srcParameter()->getValue(), operands );
 }
 
+IECore::RunTimeTypedPtr ToGLConverter::update( IECore::ConstRunTimeTypedPtr previous )
+{
+	ConstCompoundObjectPtr operands = parameters()->getTypedValidatedValue<CompoundObject>();
+	return doUpdate( previous, srcParameter()->getValue(), operands );
+}
+
+IECore::RunTimeTypedPtr ToGLConverter::doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
+{
+	return doConversion( src, operands );
+}
+
+IECore::MurmurHash ToGLConverter::primitiveVariableHash( const IECoreScene::PrimitiveVariable &primitiveVariable )
+{
+	IECore::MurmurHash h;
+	h.append( static_cast<int>( primitiveVariable.interpolation ) );
+	if( primitiveVariable.data )
+	{
+		primitiveVariable.data->hash( h );
+	}
+	if( primitiveVariable.indices )
+	{
+		primitiveVariable.indices->hash( h );
+	}
+	return h;
+}
+
+bool ToGLConverter::reusePrimitiveVariable( const Primitive *previous, Primitive *result, const std::string &name, IECoreScene::PrimitiveVariable::Interpolation interpolation, const IECore::MurmurHash &hash )
+{
+	if(
+		!previous ||
+		previous->getTopologyHash() != result->getTopologyHash() ||
+		previous->getPrimitiveVariableHash( name ) != hash
+	)
+	{
+		return false;
+	}
+
+	ConstDataPtr data = previous->getPrimitiveVariableData( name );
+	if( !data )
+	{
+		return false;
+	}
+
+	// The converted data is always either expanded per-vertex data, or
+	// uniform data for a Constant primitive variable.
+	result->addPrimitiveVariable(
+		name,
+		IECoreScene::PrimitiveVariable(
+			interpolation == IECoreScene::PrimitiveVariable::Constant ? IECoreScene::PrimitiveVariable::Constant : IECoreScene::PrimitiveVariable::Vertex,
+			boost::const_pointer_cast<Data>( data )
+		)
+	);
+	result->setPrimitiveVariableHash( name, hash );
+	return true;
+}
+
 ToGLConverterPtr ToGLConverter::create( IECore::ConstObjectPtr object, IECore::TypeId resultType )
 {
 	Registrations &r = registrations();
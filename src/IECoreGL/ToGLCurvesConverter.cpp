@@ -104,6 +104,11 @@ class ToGLCurvesConverter::ToVertexConverter
 };
 
 IECore::RunTimeTypedPtr ToGLCurvesConverter::doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
+{
+	return doUpdate( nullptr, src, operands );
+}
+
+IECore::RunTimeTypedPtr ToGLCurvesConverter::doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
 {
 	IECoreScene::CurvesPrimitive::ConstPtr curves = boost::static_pointer_cast<const IECoreScene::CurvesPrimitive>( src ); // safe because the parameter validated it for us
 
@@ -127,6 +132,12 @@ IECore::RunTimeTypedPtr ToGLCurvesConverter::doConversion( IECore::ConstObjectPt
 
 	CurvesPrimitive::Ptr result = new CurvesPrimitive( curves->basis(), curves->periodic(), curves->verticesPerCurve(), width );
 
+	IECore::MurmurHash topologyHash;
+	curves->topologyHash( topologyHash );
+	result->setTopologyHash( topologyHash );
+
+	const CurvesPrimitive *previousCurves = IECore::runTimeCast<const CurvesPrimitive>( previous.get() );
+
 	for ( IECoreScene::PrimitiveVariableMap::const_iterator pIt = curves->variables.begin(); pIt != curves->variables.end(); ++pIt )
 	{
 		if( !pIt->second.data )
@@ -135,9 +146,16 @@ IECore::RunTimeTypedPtr ToGLCurvesConverter::doConversion( IECore::ConstObjectPt
 			continue;
 		}
 
+		const IECore::MurmurHash hash = primitiveVariableHash( pIt->second );
+		if( reusePrimitiveVariable( previousCurves, result.get(), pIt->first, pIt->second.interpolation, hash ) )
+		{
+			continue;
+		}
+
 		if( pIt->second.interpolation == IECoreScene::PrimitiveVariable::Vertex || pIt->second.interpolation == IECoreScene::PrimitiveVariable::Constant )
 		{
 			result->addPrimitiveVariable( pIt->first, pIt->second );
+			result->setPrimitiveVariableHash( pIt->first, hash );
 		}
 		else if( pIt->second.interpolation == IECoreScene::PrimitiveVariable::Uniform )
 		{
@@ -149,6 +167,7 @@ IECore::RunTimeTypedPtr ToGLCurvesConverter::doConversion( IECore::ConstObjectPt
 			if( newData )
 			{
 				result->addPrimitiveVariable( pIt->first, IECoreScene::PrimitiveVariable( IECoreScene::PrimitiveVariable::Vertex, newData ) );
+				result->setPrimitiveVariableHash( pIt->first, hash );
 			}
 		}
 	}
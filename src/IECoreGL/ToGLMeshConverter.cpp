@@ -36,21 +36,98 @@
 
 #include "IECoreGL/MeshPrimitive.h"
 
-#include "IECoreScene/FaceVaryingPromotionOp.h"
 #include "IECoreScene/MeshAlgo.h"
-#include "IECoreScene/MeshNormalsOp.h"
 #include "IECoreScene/MeshPrimitive.h"
+#include "IECoreScene/private/MeshTopology.h"
+#include "IECoreScene/private/PrimitiveVariableAlgos.h"
 
-#include "IECore/DespatchTypedData.h"
+#include "IECore/DataAlgo.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/SimpleTypedData.h"
 
 #include "boost/format.hpp"
 
 #include <cassert>
+#include <memory>
 
 using namespace IECoreGL;
 
+//////////////////////////////////////////////////////////////////////////
+// Internal utilities
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+/// Compares the values of a primitive variable at two element indices.
+class ValueComparator
+{
+
+	public :
+
+		virtual ~ValueComparator()
+		{
+		}
+
+		virtual bool equal( int a, int b ) const = 0;
+
+};
+
+typedef std::unique_ptr<ValueComparator> ValueComparatorPtr;
+
+template<typename T>
+class TypedValueComparator : public ValueComparator
+{
+
+	public :
+
+		TypedValueComparator( const std::vector<T> &data, const std::vector<int> *indices )
+			:	m_view( data, indices )
+		{
+		}
+
+		bool equal( int a, int b ) const override
+		{
+			return m_view[a] == m_view[b];
+		}
+
+	private :
+
+		IECoreScene::PrimitiveVariable::IndexedView<T> m_view;
+
+};
+
+struct ValueComparatorCreator
+{
+
+	ValueComparatorCreator( const IECore::IntVectorData *indices )
+		:	m_indices( indices ? &indices->readable() : nullptr )
+	{
+	}
+
+	template<typename T, template<typename> class V>
+	ValueComparatorPtr operator()( const V<std::vector<T> > *data )
+	{
+		return ValueComparatorPtr( new TypedValueComparator<T>( data->readable(), m_indices ) );
+	}
+
+	ValueComparatorPtr operator()( const IECore::Data *data )
+	{
+		throw IECore::Exception(
+			boost::str( boost::format( "Unexpected Data: %1%" ) % ( data ? data->typeName() : std::string( "nullptr" ) ) )
+		);
+	}
+
+	const std::vector<int> *m_indices;
+
+};
+
+} // namespace
+
+//////////////////////////////////////////////////////////////////////////
+// ToGLMeshConverter
+//////////////////////////////////////////////////////////////////////////
+
 IE_CORE_DEFINERUNTIMETYPED( ToGLMeshConverter );
 
 ToGLConverter::ConverterDescription<ToGLMeshConverter> ToGLMeshConverter::g_description;
@@ -67,46 +144,268 @@ ToGLMeshConverter::~ToGLMeshConverter()
 
 IECore::RunTimeTypedPtr ToGLMeshConverter::doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
 {
-	IECoreScene::MeshPrimitivePtr mesh = boost::static_pointer_cast<IECoreScene::MeshPrimitive>( src->copy() ); // safe because the parameter validated it for us
+	return doUpdate( nullptr, src, operands );
+}
+
+IECore::RunTimeTypedPtr ToGLMeshConverter::doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
+{
+	IECoreScene::ConstMeshPrimitivePtr mesh = boost::static_pointer_cast<const IECoreScene::MeshPrimitive>( src ); // safe because the parameter validated it for us
 
 	if( !mesh->variableData<IECore::V3fVectorData>( "P", IECoreScene::PrimitiveVariable::Vertex ) )
 	{
 		throw IECore::Exception( "Must specify primitive variable \"P\", of type V3fVectorData and interpolation type Vertex." );
 	}
 
-	if( mesh->variables.find( "N" )==mesh->variables.end() )
+	// Take a shallow copy of the primitive variables, so we can add normals
+	// without copying the mesh, and hash them so we can tell which are
+	// unchanged since the previous conversion.
+
+	IECoreScene::PrimitiveVariableMap variables;
+	std::map<std::string, IECore::MurmurHash> hashes;
+	for( IECoreScene::PrimitiveVariableMap::const_iterator pIt = mesh->variables.begin(); pIt != mesh->variables.end(); ++pIt )
 	{
-		// the mesh has no normals - we need to explicitly add some. if it's a polygon
-		// mesh (interpolation==linear) then we add per-face normals for a faceted look
-		// and if it's a subdivision mesh we add smooth per-vertex normals.
-		IECoreScene::MeshNormalsOpPtr normalOp = new IECoreScene::MeshNormalsOp();
-		normalOp->inputParameter()->setValue( mesh );
-		normalOp->copyParameter()->setTypedValue( false );
-		normalOp->interpolationParameter()->setNumericValue(
-			mesh->interpolation() == "linear" ? IECoreScene::PrimitiveVariable::Uniform : IECoreScene::PrimitiveVariable::Vertex
-		);
-		normalOp->operate();
+		if( !pIt->second.data )
+		{
+			IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "No data given for primvar \"%s\"" ) % pIt->first );
+		}
+		else if( !mesh->isPrimitiveVariableValid( pIt->second ) )
+		{
+			IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "Invalid primvar \"%s\"" ) % pIt->first );
+		}
+		else
+		{
+			variables.insert( *pIt );
+			hashes[pIt->first] = primitiveVariableHash( pIt->second );
+		}
 	}
 
-	mesh = IECoreScene::MeshAlgo::triangulate( mesh.get() );
+	// if the mesh has no normals we need to explicitly add some. if it's a polygon
+	// mesh (interpolation==linear) then we add per-face normals for a faceted look
+	// and if it's a subdivision mesh we add smooth per-vertex normals.
+	const bool calculateNormals = variables.find( "N" ) == variables.end();
+	const IECoreScene::PrimitiveVariable::Interpolation normalsInterpolation =
+		mesh->interpolation() == "linear" ? IECoreScene::PrimitiveVariable::Uniform : IECoreScene::PrimitiveVariable::Vertex
+	;
+
+	// Find the face-vertex and face used by each triangle corner. Meshes which are
+	// already triangulated are used as they are, and otherwise we use the triangulation
+	// cached for the topology, which matches `MeshAlgo::triangulate()`.
+
+	const std::vector<int> &vertexIds = mesh->vertexIds()->readable();
+	const std::vector<int> *triangleFaceVertices = nullptr;
+	const std::vector<int> *triangleFaces = nullptr;
+	IECoreScene::ConstMeshTopologyPtr topology;
+	if( mesh->numFaces() == 0 || mesh->minVerticesPerFace() != 3 || mesh->maxVerticesPerFace() != 3 )
+	{
+		topology = IECoreScene::MeshTopology::get( mesh.get() );
+		triangleFaceVertices = &topology->triangleFaceVertices();
+		triangleFaces = &topology->triangleFaces();
+	}
+
+	const size_t numCorners = triangleFaceVertices ? triangleFaceVertices->size() : vertexIds.size();
+	auto faceVertex = [triangleFaceVertices] ( size_t corner ) -> int {
+		return triangleFaceVertices ? (*triangleFaceVertices)[corner] : static_cast<int>( corner );
+	};
+	auto face = [triangleFaces] ( size_t corner ) -> int {
+		return triangleFaces ? (*triangleFaces)[corner / 3] : static_cast<int>( corner / 3 );
+	};
+
+	// Weld the corners of the triangles into a compact set of GL vertices.
+	// Corners share a GL vertex if they use the same mesh vertex and have
+	// identical values for all FaceVarying and Uniform primitive variables.
+	// Calculated face normals are compared by face rather than by value, so
+	// that the welding doesn't depend on "P", and can be reused by update()
+	// while the mesh deforms.
 
-	IECoreScene::FaceVaryingPromotionOpPtr faceVaryingOp = new IECoreScene::FaceVaryingPromotionOp;
-	faceVaryingOp->inputParameter()->setValue( mesh );
-	faceVaryingOp->copyParameter()->setTypedValue( false );
-	faceVaryingOp->operate();
+	const bool weldFaces = calculateNormals && normalsInterpolation == IECoreScene::PrimitiveVariable::Uniform;
 
-	MeshPrimitivePtr glMesh = new MeshPrimitive( mesh->numFaces() );
+	IECore::MurmurHash topologyHash;
+	mesh->topologyHash( topologyHash );
+	topologyHash.append( static_cast<uint64_t>( mesh->variableSize( IECoreScene::PrimitiveVariable::Vertex ) ) );
+	topologyHash.append( weldFaces );
 
-	for ( IECoreScene::PrimitiveVariableMap::iterator pIt = mesh->variables.begin(); pIt != mesh->variables.end(); ++pIt )
+	std::vector<ValueComparatorPtr> faceVaryingComparators;
+	std::vector<ValueComparatorPtr> uniformComparators;
+	for( IECoreScene::PrimitiveVariableMap::const_iterator pIt = variables.begin(); pIt != variables.end(); ++pIt )
 	{
-		if( pIt->second.data )
+		if( pIt->second.interpolation == IECoreScene::PrimitiveVariable::FaceVarying )
 		{
-			glMesh->addPrimitiveVariable( pIt->first, pIt->second );
+			ValueComparatorCreator creator( pIt->second.indices.get() );
+			faceVaryingComparators.push_back( IECore::dispatch( pIt->second.data.get(), creator ) );
+		}
+		else if( pIt->second.interpolation == IECoreScene::PrimitiveVariable::Uniform )
+		{
+			ValueComparatorCreator creator( pIt->second.indices.get() );
+			uniformComparators.push_back( IECore::dispatch( pIt->second.data.get(), creator ) );
 		}
 		else
 		{
-			IECore::msg( IECore::Msg::Warning, "ToGLMeshConverter", boost::format( "No data given for primvar \"%s\"" ) % pIt->first );
+			continue;
+		}
+		topologyHash.append( pIt->first );
+		topologyHash.append( hashes[pIt->first] );
+	}
+
+	const MeshPrimitive *previousMesh = IECore::runTimeCast<const MeshPrimitive>( previous.get() );
+	if( previousMesh && ( !previousMesh->vertexIds() || previousMesh->getTopologyHash() != topologyHash ) )
+	{
+		// The GL vertices differ, so nothing can be reused.
+		previousMesh = nullptr;
+	}
+
+	IECore::ConstUIntVectorDataPtr glVertexIdsData;
+	// The first corner welded into each GL vertex.
+	std::vector<size_t> glVertexCorners;
+
+	if( previousMesh )
+	{
+		// The welding is unchanged, so we can share the vertex ids. GL vertices
+		// are numbered in the order they are first used, so the first corner of
+		// each can be found in a single pass.
+		glVertexIdsData = previousMesh->vertexIds();
+		const std::vector<unsigned int> &glVertexIds = glVertexIdsData->readable();
+		for( size_t corner = 0; corner < glVertexIds.size(); ++corner )
+		{
+			if( glVertexIds[corner] == glVertexCorners.size() )
+			{
+				glVertexCorners.push_back( corner );
+			}
+		}
+	}
+	else
+	{
+		auto weldable = [&] ( size_t corner0, size_t corner1 ) {
+			if( weldFaces && face( corner0 ) != face( corner1 ) )
+			{
+				return false;
+			}
+			for( const auto &c : faceVaryingComparators )
+			{
+				if( !c->equal( faceVertex( corner0 ), faceVertex( corner1 ) ) )
+				{
+					return false;
+				}
+			}
+			for( const auto &c : uniformComparators )
+			{
+				if( !c->equal( face( corner0 ), face( corner1 ) ) )
+				{
+					return false;
+				}
+			}
+			return true;
+		};
+
+		IECore::UIntVectorDataPtr weldedVertexIdsData = new IECore::UIntVectorData;
+		std::vector<unsigned int> &glVertexIds = weldedVertexIdsData->writable();
+		glVertexIds.resize( numCorners );
+
+		// For each mesh vertex, the first GL vertex welded from it, with
+		// the remainder forming a linked list via `nextGLVertex`.
+		std::vector<int> firstGLVertex( mesh->variableSize( IECoreScene::PrimitiveVariable::Vertex ), -1 );
+		std::vector<int> nextGLVertex;
+
+		for( size_t corner = 0; corner < numCorners; ++corner )
+		{
+			const int vertex = vertexIds[faceVertex( corner )];
+
+			int glVertex = firstGLVertex[vertex];
+			int previousGLVertex = -1;
+			while( glVertex != -1 && !weldable( glVertexCorners[glVertex], corner ) )
+			{
+				previousGLVertex = glVertex;
+				glVertex = nextGLVertex[glVertex];
+			}
+
+			if( glVertex == -1 )
+			{
+				glVertex = glVertexCorners.size();
+				glVertexCorners.push_back( corner );
+				nextGLVertex.push_back( -1 );
+				if( previousGLVertex == -1 )
+				{
+					firstGLVertex[vertex] = glVertex;
+				}
+				else
+				{
+					nextGLVertex[previousGLVertex] = glVertex;
+				}
+			}
+
+			glVertexIds[corner] = glVertex;
+		}
+
+		glVertexIdsData = weldedVertexIdsData;
+	}
+
+	MeshPrimitivePtr glMesh = new MeshPrimitive( glVertexIdsData );
+	glMesh->setTopologyHash( topologyHash );
+
+	if( calculateNormals )
+	{
+		IECore::MurmurHash normalsHash = hashes["P"];
+		normalsHash.append( "calculateNormals" );
+		normalsHash.append( static_cast<int>( normalsInterpolation ) );
+		if( !reusePrimitiveVariable( previousMesh, glMesh.get(), "N", normalsInterpolation, normalsHash ) )
+		{
+			variables["N"] = IECoreScene::MeshAlgo::calculateNormals( mesh.get(), normalsInterpolation );
+			hashes["N"] = normalsHash;
+		}
+	}
+
+	// Gather the primitive variables for each GL vertex.
+
+	std::vector<int> vertexElements, faceVaryingElements, uniformElements;
+	vertexElements.reserve( glVertexCorners.size() );
+	faceVaryingElements.reserve( glVertexCorners.size() );
+	uniformElements.reserve( glVertexCorners.size() );
+	for( size_t corner : glVertexCorners )
+	{
+		faceVaryingElements.push_back( faceVertex( corner ) );
+		vertexElements.push_back( vertexIds[faceVaryingElements.back()] );
+		uniformElements.push_back( face( corner ) );
+	}
+
+	for( IECoreScene::PrimitiveVariableMap::const_iterator pIt = variables.begin(); pIt != variables.end(); ++pIt )
+	{
+		const IECore::MurmurHash &hash = hashes[pIt->first];
+		if( reusePrimitiveVariable( previousMesh, glMesh.get(), pIt->first, pIt->second.interpolation, hash ) )
+		{
+			continue;
+		}
+
+		const std::vector<int> *elements = nullptr;
+		switch( pIt->second.interpolation )
+		{
+			case IECoreScene::PrimitiveVariable::Vertex :
+			case IECoreScene::PrimitiveVariable::Varying :
+				elements = &vertexElements;
+				break;
+			case IECoreScene::PrimitiveVariable::FaceVarying :
+				elements = &faceVaryingElements;
+				break;
+			case IECoreScene::PrimitiveVariable::Uniform :
+				elements = &uniformElements;
+				break;
+			default :
+				break;
+		}
+
+		if( elements )
+		{
+			IECoreScene::PrimitiveVariableAlgos::GatherFunctor gatherFunctor( *elements );
+			gatherFunctor.setIndices( pIt->second.indices.get() );
+			IECoreScene::PrimitiveVariableAlgos::IndexedData gathered = IECore::dispatch( pIt->second.data.get(), gatherFunctor );
+			glMesh->addPrimitiveVariable(
+				pIt->first,
+				IECoreScene::PrimitiveVariable( IECoreScene::PrimitiveVariable::Vertex, gathered.data, gathered.indices )
+			);
+		}
+		else
+		{
+			glMesh->addPrimitiveVariable( pIt->first, pIt->second );
 		}
+		glMesh->setPrimitiveVariableHash( pIt->first, hash );
 	}
 
 	return glMesh;
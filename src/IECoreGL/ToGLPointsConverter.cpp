@@ -59,6 +59,11 @@ ToGLPointsConverter::~ToGLPointsConverter()
 }
 
 IECore::RunTimeTypedPtr ToGLPointsConverter::doConversion( IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
+{
+	return doUpdate( nullptr, src, operands );
+}
+
+IECore::RunTimeTypedPtr ToGLPointsConverter::doUpdate( IECore::ConstRunTimeTypedPtr previous, IECore::ConstObjectPtr src, IECore::ConstCompoundObjectPtr operands ) const
 {
 	IECoreScene::PointsPrimitive::ConstPtr pointsPrim = boost::static_pointer_cast<const IECoreScene::PointsPrimitive>( src ); // safe because the parameter validated it for us
 
@@ -101,6 +106,12 @@ IECore::RunTimeTypedPtr ToGLPointsConverter::doConversion( IECore::ConstObjectPt
 
 	PointsPrimitive::Ptr result = new PointsPrimitive( type );
 
+	IECore::MurmurHash topologyHash;
+	pointsPrim->topologyHash( topologyHash );
+	result->setTopologyHash( topologyHash );
+
+	const PointsPrimitive *previousPoints = IECore::runTimeCast<const PointsPrimitive>( previous.get() );
+
 	for ( IECoreScene::PrimitiveVariableMap::const_iterator pIt = pointsPrim->variables.begin(); pIt != pointsPrim->variables.end(); ++pIt )
 	{
 		if( pIt->first == "type" )
@@ -110,7 +121,12 @@ IECore::RunTimeTypedPtr ToGLPointsConverter::doConversion( IECore::ConstObjectPt
 
 		if ( pIt->second.data )
 		{
-			result->addPrimitiveVariable( pIt->first, pIt->second );
+			const IECore::MurmurHash hash = primitiveVariableHash( pIt->second );
+			if( !reusePrimitiveVariable( previousPoints, result.get(), pIt->first, pIt->second.interpolation, hash ) )
+			{
+				result->addPrimitiveVariable( pIt->first, pIt->second );
+				result->setPrimitiveVariableHash( pIt->first, hash );
+			}
 		}
 		else
 		{
@@ -53,6 +53,12 @@ IECore::RunTimeTypedPtr convert( CachedConverter &c, IECore::ObjectPtr o )
 	return boost::const_pointer_cast<IECore::RunTimeTyped>( c.convert( o.get() ) );
 }
 
+IECore::RunTimeTypedPtr convertWithPrevious( CachedConverter &c, IECore::ObjectPtr o, IECore::ObjectPtr previous )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	return boost::const_pointer_cast<IECore::RunTimeTyped>( c.convert( o.get(), previous.get() ) );
+}
+
 void clearUnused( CachedConverter &c )
 {
 	IECorePython::ScopedGILRelease gilRelease;
@@ -66,6 +72,7 @@ void IECoreGL::bindCachedConverter()
 	IECorePython::RefCountedClass<CachedConverter, IECore::RefCounted>( "CachedConverter" )
 		.def( init<size_t>() )
 		.def( "convert", &convert )
+		.def( "convert", &convertWithPrevious )
 		.def( "getMaxMemory", &CachedConverter::getMaxMemory )
 		.def( "setMaxMemory", &CachedConverter::setMaxMemory )
 		.def( "clearUnused", &clearUnused )
@@ -45,9 +45,18 @@ using namespace boost::python;
 namespace IECoreGL
 {
 
+static IECore::UIntVectorDataPtr vertexIds( const MeshPrimitive &p )
+{
+	const IECore::UIntVectorData *v = p.vertexIds();
+	return v ? v->copy() : nullptr;
+}
+
 void bindMeshPrimitive()
 {
 	IECorePython::RunTimeTypedClass<MeshPrimitive>()
+		.def( init<unsigned>() )
+		.def( init<IECore::ConstUIntVectorDataPtr>() )
+		.def( "vertexIds", &vertexIds )
 	;
 }
 
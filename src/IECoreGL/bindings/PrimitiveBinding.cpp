@@ -48,10 +48,21 @@ using namespace boost::python;
 namespace IECoreGL
 {
 
+static IECore::DataPtr getPrimitiveVariableData( const Primitive &p, const std::string &name )
+{
+	IECore::ConstDataPtr d = p.getPrimitiveVariableData( name );
+	return d ? d->copy() : nullptr;
+}
+
 void bindPrimitive()
 {
 	scope s = IECorePython::RunTimeTypedClass<Primitive>()
 		.def( "addPrimitiveVariable", &Primitive::addPrimitiveVariable )
+		.def( "setTopologyHash", &Primitive::setTopologyHash )
+		.def( "getTopologyHash", &Primitive::getTopologyHash, return_value_policy<copy_const_reference>() )
+		.def( "setPrimitiveVariableHash", &Primitive::setPrimitiveVariableHash )
+		.def( "getPrimitiveVariableHash", &Primitive::getPrimitiveVariableHash )
+		.def( "getPrimitiveVariableData", &getPrimitiveVariableData )
 	;
 	bindTypedStateComponent< Primitive::DrawBound >( "DrawBound" );
 	bindTypedStateComponent< Primitive::DrawWireframe >( "DrawWireframe" );
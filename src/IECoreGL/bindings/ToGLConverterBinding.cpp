@@ -50,6 +50,7 @@ void bindToGLConverter()
 {
 	IECorePython::RunTimeTypedClass<ToGLConverter>()
 		.def( "convert", &ToGLConverter::convert )
+		.def( "update", &ToGLConverter::update )
 		.def( "create", &ToGLConverter::create,
 			(
 				boost::python::arg_( "object" ),
@@ -41,13 +41,29 @@
 #include "boost/asio.hpp"
 
 #include "IECoreImage/Private/DisplayDriverServerHeader.h"
+#include "IECoreImage/Private/DisplayDriverSharedMemory.h"
 
 #include "IECore/MemoryIndexedIO.h"
+#include "IECore/MessageHandler.h"
 #include "IECore/SimpleTypedData.h"
+#include "IECore/VectorTypedData.h"
+
+#include "OpenEXR/half.h"
+
+#include "blosc.h"
 
 #include "boost/array.hpp"
 #include "boost/bind.hpp"
 
+#include "tbb/concurrent_queue.h"
+#include "tbb/mutex.h"
+#include "tbb/tbb_thread.h"
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+
 using namespace std;
 using boost::asio::ip::tcp;
 using namespace boost;
@@ -59,12 +75,14 @@ class ClientDisplayDriver::PrivateData : public RefCounted
 {
 	public :
 		PrivateData() :
-		m_service(), m_host(""), m_port(""), m_scanLineOrderOnly(false), m_acceptsRepeatedData(false), m_socket( m_service )
+		m_service(), m_host(""), m_port(""), m_scanLineOrderOnly(false), m_acceptsRepeatedData(false), m_socket( m_service ),
+		m_transport( 0 ), m_batchSize( 0 ), m_batch( new CharVectorData ), m_queueSize( 0 )
 		{
 		}
 
 		~PrivateData() override
 		{
+			stopSendThread();
 			m_socket.close();
 		}
 
@@ -74,8 +92,184 @@ class ClientDisplayDriver::PrivateData : public RefCounted
 		bool m_scanLineOrderOnly;
 		bool m_acceptsRepeatedData;
 		boost::asio::ip::tcp::socket m_socket;
+
+		// Transport negotiated with the server, as a combination of
+		// DisplayDriverServerHeader::TransportFlags.
+		int m_transport;
+
+		// Buckets are accumulated in m_batch until it reaches m_batchSize bytes.
+		size_t m_batchSize;
+		CharVectorDataPtr m_batch;
+		tbb::mutex m_batchMutex;
+
+		// When m_queueSize is non-zero, messages are sent by m_sendThread,
+		// and up to m_queueSize messages may be waiting to be sent.
+		struct Message
+		{
+			DisplayDriverServerHeader::MessageType type;
+			ConstCharVectorDataPtr data;
+		};
+
+		size_t m_queueSize;
+		tbb::concurrent_bounded_queue<Message> m_queue;
+		tbb::tbb_thread m_sendThread;
+		tbb::mutex m_sendErrorMutex;
+		std::string m_sendError;
+
+		// Used to send batches to servers on the same host.
+		std::unique_ptr<DisplayDriverSharedMemory> m_sharedMemory;
+
+		void writeMessage( DisplayDriverServerHeader::MessageType type, const std::vector<char> &data )
+		{
+			if( type == DisplayDriverServerHeader::imageDataBatch && m_sharedMemory && data.size() <= m_sharedMemory->capacity() )
+			{
+				const uint64_t location[2] = { m_sharedMemory->write( data.data(), data.size() ), data.size() };
+				DisplayDriverServerHeader header( DisplayDriverServerHeader::imageDataShared, sizeof( location ) );
+				boost::array<boost::asio::const_buffer, 2> buffers = { {
+					boost::asio::buffer( header.buffer(), header.headerLength ),
+					boost::asio::buffer( location, sizeof( location ) )
+				} };
+				boost::asio::write( m_socket, buffers );
+				return;
+			}
+
+			const std::vector<char> *payload = &data;
+			std::vector<char> compressed;
+			if( type == DisplayDriverServerHeader::imageDataBatch && ( m_transport & DisplayDriverServerHeader::CompressedData ) )
+			{
+				compressed.resize( data.size() + BLOSC_MAX_OVERHEAD );
+				const int compressedSize = blosc_compress_ctx(
+					1, BLOSC_SHUFFLE, m_transport & DisplayDriverServerHeader::HalfData ? sizeof( half ) : sizeof( float ),
+					data.size(), data.data(), compressed.data(), compressed.size(),
+					"lz4", 0, 1
+				);
+				if( compressedSize <= 0 )
+				{
+					throw Exception( "Failed to compress image data." );
+				}
+				compressed.resize( compressedSize );
+				payload = &compressed;
+			}
+
+			DisplayDriverServerHeader header( type, payload->size() );
+			boost::array<boost::asio::const_buffer, 2> buffers = { {
+				boost::asio::buffer( header.buffer(), header.headerLength ),
+				boost::asio::buffer( payload->data(), payload->size() )
+			} };
+			boost::asio::write( m_socket, buffers );
+		}
+
+		void sendMessage( DisplayDriverServerHeader::MessageType type, ConstCharVectorDataPtr data )
+		{
+			if( !m_queueSize )
+			{
+				writeMessage( type, data->readable() );
+				return;
+			}
+
+			throwSendError();
+			if( !m_sendThread.joinable() )
+			{
+				m_queue.set_capacity( m_queueSize );
+				tbb::tbb_thread newThread( boost::bind( &PrivateData::sendThread, this ) );
+				m_sendThread.swap( newThread );
+			}
+			// Blocks when the queue is full, limiting the memory used
+			// when the renderer is producing data faster than we can send it.
+			m_queue.push( Message{ type, data } );
+		}
+
+		void sendThread()
+		{
+			Message message;
+			while( true )
+			{
+				m_queue.pop( message );
+				if( !message.data )
+				{
+					return;
+				}
+
+				tbb::mutex::scoped_lock lock( m_sendErrorMutex );
+				if( !m_sendError.empty() )
+				{
+					// Keep draining the queue so that pushes never block
+					// indefinitely, but don't send anything more.
+					continue;
+				}
+				lock.release();
+
+				try
+				{
+					writeMessage( message.type, message.data->readable() );
+				}
+				catch( const std::exception &e )
+				{
+					lock.acquire( m_sendErrorMutex );
+					m_sendError = e.what();
+				}
+			}
+		}
+
+		// Waits for all queued messages to be sent.
+		void stopSendThread()
+		{
+			if( m_sendThread.joinable() )
+			{
+				m_queue.push( Message{ DisplayDriverServerHeader::imageData, nullptr } );
+				m_sendThread.join();
+			}
+		}
+
+		void throwSendError()
+		{
+			tbb::mutex::scoped_lock lock( m_sendErrorMutex );
+			if( !m_sendError.empty() )
+			{
+				throw Exception( "Could not send data to remote display driver server : " + m_sendError );
+			}
+		}
+
+		// Must be called with m_batchMutex locked.
+		void flushBatch()
+		{
+			if( m_batch->readable().empty() )
+			{
+				return;
+			}
+			CharVectorDataPtr batch = m_batch;
+			m_batch = new CharVectorData;
+			m_batch->writable().reserve( m_batchSize + m_batchSize / 4 );
+			sendMessage( DisplayDriverServerHeader::imageDataBatch, batch );
+		}
+
 };
 
+namespace
+{
+
+int intParameter( const CompoundData *parameters, const char *name, int defaultValue )
+{
+	const IntData *d = parameters->member<IntData>( name );
+	return d ? d->readable() : defaultValue;
+}
+
+bool boolParameter( const CompoundData *parameters, const char *name, bool defaultValue )
+{
+	const BoolData *d = parameters->member<BoolData>( name );
+	return d ? d->readable() : defaultValue;
+}
+
+template<typename T>
+void appendValue( std::vector<char> &buffer, const T &value )
+{
+	const size_t offset = buffer.size();
+	buffer.resize( offset + sizeof( T ) );
+	memcpy( &buffer[offset], &value, sizeof( T ) );
+}
+
+} // namespace
+
 IE_CORE_DEFINERUNTIMETYPED( ClientDisplayDriver );
 
 const DisplayDriver::DisplayDriverDescription<ClientDisplayDriver> ClientDisplayDriver::g_description;
@@ -119,12 +313,55 @@ ClientDisplayDriver::ClientDisplayDriver( const Imath::Box2i &displayWindow, con
 	IECore::CompoundDataPtr tmpParameters = parameters->copy();
 	tmpParameters->writable()[ "clientPID" ] = new IntData( getpid() );
 
+	int requestedTransport = 0;
+	const int batchSize = intParameter( parameters.get(), "displayTransportBatchSize", 0 );
+	if( batchSize > 0 )
+	{
+		requestedTransport |= DisplayDriverServerHeader::BatchedData;
+		m_data->m_batchSize = batchSize;
+	}
+	if( boolParameter( parameters.get(), "displayTransportHalf", false ) )
+	{
+		requestedTransport |= DisplayDriverServerHeader::BatchedData | DisplayDriverServerHeader::HalfData;
+	}
+	if( boolParameter( parameters.get(), "displayTransportCompression", false ) )
+	{
+		requestedTransport |= DisplayDriverServerHeader::BatchedData | DisplayDriverServerHeader::CompressedData;
+	}
+	m_data->m_queueSize = std::max( 0, intParameter( parameters.get(), "displayTransportQueueSize", 0 ) );
+
+	const int sharedMemorySize = intParameter( parameters.get(), "displayTransportSharedMemorySize", 0 );
+	if( sharedMemorySize > 0 )
+	{
+		try
+		{
+			m_data->m_sharedMemory.reset( new DisplayDriverSharedMemory( sharedMemorySize ) );
+			requestedTransport |= DisplayDriverServerHeader::BatchedData | DisplayDriverServerHeader::SharedMemoryData;
+		}
+		catch( const std::exception &e )
+		{
+			msg( Msg::Warning, "ClientDisplayDriver", e.what() );
+		}
+	}
+
 	// build the data block
 	io = new MemoryIndexedIO( ConstCharVectorDataPtr(), IndexedIO::rootPath, IndexedIO::Exclusive | IndexedIO::Write );
 	displayWindowData->Object::save( io, "displayWindow" );
 	dataWindowData->Object::save( io, "dataWindow" );
 	channelNamesData->Object::save( io, "channelNames" );
 	tmpParameters->Object::save( io, "parameters" );
+	if( requestedTransport )
+	{
+		// Only included when needed, so that we remain compatible
+		// with servers which predate transport negotiation.
+		IntDataPtr transportData = new IntData( requestedTransport );
+		transportData->Object::save( io, "transport" );
+		if( m_data->m_sharedMemory )
+		{
+			StringDataPtr sharedMemoryName = new StringData( m_data->m_sharedMemory->name() );
+			sharedMemoryName->Object::save( io, "sharedMemoryName" );
+		}
+	}
 	buf = io->buffer();
 
 	size_t dataSize = buf->readable().size();
@@ -144,6 +381,29 @@ ClientDisplayDriver::ClientDisplayDriver( const Imath::Box2i &displayWindow, con
 		throw Exception( "Invalid returned acceptsRepeatedData from display driver server!" );
 	}
 	m_data->m_socket.receive( boost::asio::buffer( &m_data->m_acceptsRepeatedData, sizeof(m_data->m_acceptsRepeatedData) ) );
+
+	if( requestedTransport )
+	{
+		int32_t acceptedTransport = 0;
+		if ( receiveHeader( DisplayDriverServerHeader::imageOpen ) != sizeof(acceptedTransport) )
+		{
+			throw Exception( "Invalid returned transport from display driver server!" );
+		}
+		m_data->m_socket.receive( boost::asio::buffer( &acceptedTransport, sizeof(acceptedTransport) ) );
+		m_data->m_transport = acceptedTransport & requestedTransport;
+
+		if( m_data->m_sharedMemory )
+		{
+			// Either the server has the segment open or it never will,
+			// so we can remove the name now. This ensures the memory
+			// is freed even if we don't exit cleanly.
+			m_data->m_sharedMemory->unlink();
+			if( !( m_data->m_transport & DisplayDriverServerHeader::SharedMemoryData ) )
+			{
+				m_data->m_sharedMemory.reset();
+			}
+		}
+	}
 }
 
 ClientDisplayDriver::~ClientDisplayDriver()
@@ -202,19 +462,66 @@ size_t ClientDisplayDriver::receiveHeader( int msg )
 
 void ClientDisplayDriver::imageData( const Box2i &box, const float *data, size_t dataSize )
 {
-	sendHeader( DisplayDriverServerHeader::imageData, sizeof( box ) + dataSize * sizeof( float ) );
+	if( !( m_data->m_transport & DisplayDriverServerHeader::BatchedData ) )
+	{
+		if( !m_data->m_queueSize )
+		{
+			sendHeader( DisplayDriverServerHeader::imageData, sizeof( box ) + dataSize * sizeof( float ) );
+
+			boost::array<boost::asio::const_buffer, 2> buffers = { {
+				boost::asio::buffer( &box, sizeof( box ) ),
+				boost::asio::buffer( data, dataSize * sizeof( float ) )
+			} };
+			boost::asio::write( m_data->m_socket, buffers );
+			return;
+		}
 
-	boost::array<boost::asio::const_buffer, 2> buffers = { {
-		boost::asio::buffer( &box, sizeof( box ) ),
-		boost::asio::buffer( data, dataSize * sizeof( float ) )
-	} };
-	boost::asio::write( m_data->m_socket, buffers );
+		// Copy the data so we can return before it has been sent.
+		CharVectorDataPtr message = new CharVectorData;
+		std::vector<char> &buffer = message->writable();
+		buffer.reserve( sizeof( box ) + dataSize * sizeof( float ) );
+		appendValue( buffer, box );
+		buffer.insert( buffer.end(), reinterpret_cast<const char *>( data ), reinterpret_cast<const char *>( data + dataSize ) );
+		m_data->sendMessage( DisplayDriverServerHeader::imageData, message );
+		return;
+	}
+
+	tbb::mutex::scoped_lock lock( m_data->m_batchMutex );
+
+	std::vector<char> &buffer = m_data->m_batch->writable();
+	appendValue( buffer, box );
+	appendValue( buffer, (uint32_t)dataSize );
+	if( m_data->m_transport & DisplayDriverServerHeader::HalfData )
+	{
+		const size_t offset = buffer.size();
+		buffer.resize( offset + dataSize * sizeof( half ) );
+		half *h = reinterpret_cast<half *>( &buffer[offset] );
+		for( size_t i = 0; i < dataSize; ++i )
+		{
+			h[i] = data[i];
+		}
+	}
+	else
+	{
+		buffer.insert( buffer.end(), reinterpret_cast<const char *>( data ), reinterpret_cast<const char *>( data + dataSize ) );
+	}
+
+	if( buffer.size() >= m_data->m_batchSize )
+	{
+		m_data->flushBatch();
+	}
 }
 
 void ClientDisplayDriver::imageClose()
 {
+	{
+		tbb::mutex::scoped_lock lock( m_data->m_batchMutex );
+		m_data->flushBatch();
+	}
+	m_data->stopSendThread();
+	m_data->throwSendError();
+
 	sendHeader( DisplayDriverServerHeader::imageClose, 0 );
 	receiveHeader( DisplayDriverServerHeader::imageClose );
 	m_data->m_socket.close();
 }
-
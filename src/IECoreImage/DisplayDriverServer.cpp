@@ -40,15 +40,25 @@
 #include "boost/asio.hpp"
 
 #include "IECoreImage/Private/DisplayDriverServerHeader.h"
+#include "IECoreImage/Private/DisplayDriverSharedMemory.h"
 
 #include "IECore/MemoryIndexedIO.h"
 #include "IECore/MessageHandler.h"
 #include "IECore/SimpleTypedData.h"
 
+#include "OpenEXR/half.h"
+
+#include "blosc.h"
+
 #include "boost/bind.hpp"
 
 #include "tbb/tbb_thread.h"
 
+#include <algorithm>
+#include <cstring>
+#include <memory>
+#include <vector>
+
 #include <fcntl.h>
 #ifndef _MSC_VER
 #include <unistd.h>
@@ -76,6 +86,10 @@ class DisplayDriverServer::Session : public RefCounted
 		void handleReadHeader( const boost::system::error_code& error );
 		void handleReadOpenParameters( const boost::system::error_code& error );
 		void handleReadDataParameters( const boost::system::error_code& error );
+		void handleReadDataBatch( const boost::system::error_code& error );
+		void handleReadDataShared( const boost::system::error_code& error );
+		void processBatch( const char *data, size_t size );
+		void readNextHeader();
 		void sendResult( DisplayDriverServerHeader::MessageType msg, size_t dataSize );
 		void sendException( const char *message );
 
@@ -84,6 +98,12 @@ class DisplayDriverServer::Session : public RefCounted
 		DisplayDriverPtr m_displayDriver;
 		DisplayDriverServerHeader m_header;
 		CharVectorDataPtr m_buffer;
+		// Transport negotiated with the client, as a combination of
+		// DisplayDriverServerHeader::TransportFlags.
+		int m_transport;
+		std::vector<char> m_decompressedBuffer;
+		std::vector<float> m_floatBuffer;
+		std::unique_ptr<DisplayDriverSharedMemory> m_sharedMemory;
 };
 
 class DisplayDriverServer::PrivateData : public RefCounted
@@ -95,14 +115,13 @@ class DisplayDriverServer::PrivateData : public RefCounted
 		boost::asio::ip::tcp::endpoint m_endpoint;
 		boost::asio::io_service m_service;
 		boost::asio::ip::tcp::acceptor m_acceptor;
-		tbb::tbb_thread m_thread;
+		std::vector<std::unique_ptr<tbb::tbb_thread>> m_threads;
 
 		PrivateData( int portNumber ) :
 			m_success(false),
 			m_endpoint(tcp::v4(), portNumber),
 			m_service(),
-			m_acceptor( m_service ),
-			m_thread()
+			m_acceptor( m_service )
 		{
 			m_acceptor.open(  m_endpoint.protocol() );
 			m_acceptor.set_option( boost::asio::ip::tcp::acceptor::reuse_address(true));
@@ -117,7 +136,10 @@ class DisplayDriverServer::PrivateData : public RefCounted
 			{
 				m_acceptor.cancel();
 				m_acceptor.close();
-				m_thread.join();
+				for( auto &thread : m_threads )
+				{
+					thread->join();
+				}
 			}
 		}
 
@@ -135,7 +157,7 @@ static void fixSocketFlags( int socketDesc )
 #endif
 }
 
-DisplayDriverServer::DisplayDriverServer( int portNumber ) :
+DisplayDriverServer::DisplayDriverServer( int portNumber, int numThreads ) :
 		m_data( nullptr )
 {
 	m_data = new DisplayDriverServer::PrivateData( portNumber );
@@ -145,8 +167,18 @@ DisplayDriverServer::DisplayDriverServer( int portNumber ) :
 			boost::bind( &DisplayDriverServer::handleAccept, this, newSession,
 			boost::asio::placeholders::error));
 	fixSocketFlags( m_data->m_acceptor.native_handle() );
-	tbb::tbb_thread newThread( boost::bind(&DisplayDriverServer::serverThread, this) );
-	m_data->m_thread.swap( newThread );
+
+	if( numThreads <= 0 )
+	{
+		numThreads = std::max( 1u, tbb::tbb_thread::hardware_concurrency() );
+	}
+	// Each session only ever has one outstanding operation, so its
+	// handlers are serialised even when the service is run by several
+	// threads, while separate sessions are processed concurrently.
+	for( int i = 0; i < numThreads; ++i )
+	{
+		m_data->m_threads.emplace_back( new tbb::tbb_thread( boost::bind(&DisplayDriverServer::serverThread, this) ) );
+	}
 }
 
 DisplayDriverServer::~DisplayDriverServer()
@@ -188,7 +220,7 @@ void DisplayDriverServer::handleAccept( DisplayDriverServer::SessionPtr session,
  */
 
 DisplayDriverServer::Session::Session( boost::asio::io_service& io_service ) :
-	m_socket( io_service ), m_displayDriver(nullptr), m_buffer( new CharVectorData( ) )
+	m_socket( io_service ), m_displayDriver(nullptr), m_buffer( new CharVectorData( ) ), m_transport( 0 )
 {
 }
 
@@ -253,6 +285,20 @@ void DisplayDriverServer::Session::handleReadHeader( const boost::system::error_
 				boost::asio::placeholders::error));
 		break;
 
+	case DisplayDriverServerHeader::imageDataBatch:
+		boost::asio::async_read( m_socket,
+				boost::asio::buffer( &data[0], bytesAhead ),
+				boost::bind(&DisplayDriverServer::Session::handleReadDataBatch, SessionPtr(this),
+				boost::asio::placeholders::error));
+		break;
+
+	case DisplayDriverServerHeader::imageDataShared:
+		boost::asio::async_read( m_socket,
+				boost::asio::buffer( &data[0], bytesAhead ),
+				boost::bind(&DisplayDriverServer::Session::handleReadDataShared, SessionPtr(this),
+				boost::asio::placeholders::error));
+		break;
+
 	case DisplayDriverServerHeader::imageClose:
 		if ( m_displayDriver )
 		{
@@ -306,6 +352,7 @@ void DisplayDriverServer::Session::handleReadOpenParameters( const boost::system
 	CompoundDataPtr parameters;
 	bool scanLineOrder = false;
 	bool acceptsRepeatedData = false;
+	bool negotiateTransport = false;
 
 	// handle imageOpen parameters.
 	try
@@ -315,6 +362,29 @@ void DisplayDriverServer::Session::handleReadOpenParameters( const boost::system
 		dataWindow = boost::static_pointer_cast<Box2iData>( Object::load( io, "dataWindow" ) );
 		channelNames = boost::static_pointer_cast<StringVectorData>( Object::load( io, "channelNames" ) );
 		parameters = boost::static_pointer_cast<CompoundData>( Object::load( io, "parameters" ) );
+		if( io->hasEntry( "transport" ) )
+		{
+			// Clients only send this when they want to use a transport
+			// other than the default, and expect a reply if they do.
+			IntDataPtr transport = boost::static_pointer_cast<IntData>( Object::load( io, "transport" ) );
+			m_transport = transport->readable() & DisplayDriverServerHeader::AllTransportFlags;
+			negotiateTransport = true;
+
+			if( m_transport & DisplayDriverServerHeader::SharedMemoryData )
+			{
+				// Fails if the client is on another host, in which case
+				// the client falls back to sending data via the socket.
+				try
+				{
+					ConstStringDataPtr sharedMemoryName = boost::static_pointer_cast<StringData>( Object::load( io, "sharedMemoryName" ) );
+					m_sharedMemory.reset( new DisplayDriverSharedMemory( sharedMemoryName->readable() ) );
+				}
+				catch( const std::exception & )
+				{
+					m_transport &= ~DisplayDriverServerHeader::SharedMemoryData;
+				}
+			}
+		}
 
 		const StringData *displayType = parameters->member<StringData>( "remoteDisplayType", true /* throw if missing */ );
 
@@ -341,6 +411,13 @@ void DisplayDriverServer::Session::handleReadOpenParameters( const boost::system
 		sendResult( DisplayDriverServerHeader::imageOpen, sizeof(acceptsRepeatedData) );
 		m_socket.send( boost::asio::buffer( &acceptsRepeatedData, sizeof(acceptsRepeatedData) ) );
 
+		if( negotiateTransport )
+		{
+			const int32_t transport = m_transport;
+			sendResult( DisplayDriverServerHeader::imageOpen, sizeof(transport) );
+			m_socket.send( boost::asio::buffer( &transport, sizeof(transport) ) );
+		}
+
 		// prepare for getting imageData packages
 		boost::asio::async_read( m_socket,
 			boost::asio::buffer( m_header.buffer(), m_header.headerLength),
@@ -405,6 +482,145 @@ void DisplayDriverServer::Session::handleReadDataParameters( const boost::system
 	}
 }
 
+void DisplayDriverServer::Session::handleReadDataBatch( const boost::system::error_code& error )
+{
+	if (error)
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataBatch", error.message().c_str() );
+		m_socket.close();
+		return;
+	}
+
+	if (! m_displayDriver )
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataBatch", "No display drivers!" );
+		m_socket.close();
+		return;
+	}
+
+	try
+	{
+		const std::vector<char> *batch = &m_buffer->readable();
+		if( m_transport & DisplayDriverServerHeader::CompressedData )
+		{
+			size_t decompressedSize = 0, compressedSize = 0, blockSize = 0;
+			blosc_cbuffer_sizes( batch->data(), &decompressedSize, &compressedSize, &blockSize );
+			if( compressedSize != batch->size() )
+			{
+				throw Exception( "Invalid compressed image data." );
+			}
+			m_decompressedBuffer.resize( decompressedSize );
+			if( blosc_decompress_ctx( batch->data(), m_decompressedBuffer.data(), decompressedSize, 1 ) < 0 )
+			{
+				throw Exception( "Failed to decompress image data." );
+			}
+			batch = &m_decompressedBuffer;
+		}
+
+		processBatch( batch->data(), batch->size() );
+
+		readNextHeader();
+	}
+	catch( std::exception &e )
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataBatch", e.what() );
+		m_socket.close();
+		return;
+	}
+}
+
+void DisplayDriverServer::Session::handleReadDataShared( const boost::system::error_code& error )
+{
+	if (error)
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataShared", error.message().c_str() );
+		m_socket.close();
+		return;
+	}
+
+	if (! m_displayDriver || ! m_sharedMemory )
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataShared", "No display driver or shared memory!" );
+		m_socket.close();
+		return;
+	}
+
+	try
+	{
+		if( m_buffer->readable().size() != 2 * sizeof( uint64_t ) )
+		{
+			throw Exception( "Invalid shared memory location." );
+		}
+		uint64_t location[2];
+		memcpy( location, &m_buffer->readable()[0], sizeof( location ) );
+
+		processBatch( m_sharedMemory->data( location[0], location[1] ), location[1] );
+		m_sharedMemory->release( location[0] + location[1] );
+
+		readNextHeader();
+	}
+	catch( std::exception &e )
+	{
+		msg( Msg::Error, "DisplayDriverServer::Session::handleReadDataShared", e.what() );
+		m_socket.close();
+		return;
+	}
+}
+
+void DisplayDriverServer::Session::processBatch( const char *data, size_t size )
+{
+	const bool halfData = m_transport & DisplayDriverServerHeader::HalfData;
+	const size_t valueSize = halfData ? sizeof( half ) : sizeof( float );
+
+	const char *current = data;
+	const char *end = current + size;
+	while( current < end )
+	{
+		Imath::Box2i box;
+		uint32_t dataSize;
+		if( end - current < (ptrdiff_t)( sizeof( box ) + sizeof( dataSize ) ) )
+		{
+			throw Exception( "Truncated image data." );
+		}
+		memcpy( &box, current, sizeof( box ) );
+		current += sizeof( box );
+		memcpy( &dataSize, current, sizeof( dataSize ) );
+		current += sizeof( dataSize );
+		if( (size_t)( end - current ) < dataSize * valueSize )
+		{
+			throw Exception( "Truncated image data." );
+		}
+
+		m_floatBuffer.resize( dataSize );
+		if( halfData )
+		{
+			const half *h = reinterpret_cast<const half *>( current );
+			for( size_t i = 0; i < dataSize; ++i )
+			{
+				m_floatBuffer[i] = h[i];
+			}
+		}
+		else
+		{
+			memcpy( m_floatBuffer.data(), current, dataSize * sizeof( float ) );
+		}
+		current += dataSize * valueSize;
+
+		m_displayDriver->imageData( box, m_floatBuffer.data(), dataSize );
+	}
+}
+
+void DisplayDriverServer::Session::readNextHeader()
+{
+	boost::asio::async_read( m_socket,
+		boost::asio::buffer( m_header.buffer(), m_header.headerLength),
+		boost::bind(
+			&DisplayDriverServer::Session::handleReadHeader, SessionPtr(this),
+			boost::asio::placeholders::error
+		)
+	);
+}
+
 void DisplayDriverServer::Session::sendResult( DisplayDriverServerHeader::MessageType msg, size_t dataSize )
 {
 	DisplayDriverServerHeader header( msg, dataSize );
@@ -72,7 +72,9 @@ bool DisplayDriverServerHeader::valid()
 		( m_header[orderMessageType] != imageOpen &&
 			m_header[orderMessageType] != imageData &&
 			m_header[orderMessageType] != imageClose &&
-			m_header[orderMessageType] != exception ) )
+			m_header[orderMessageType] != exception &&
+			m_header[orderMessageType] != imageDataBatch &&
+			m_header[orderMessageType] != imageDataShared ) )
 	{
 		return false;
 	}
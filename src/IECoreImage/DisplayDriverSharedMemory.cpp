@@ -0,0 +1,256 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+#include "IECoreImage/Private/DisplayDriverSharedMemory.h"
+
+#include "IECore/Exception.h"
+
+#include "boost/format.hpp"
+
+#include "tbb/tbb_thread.h"
+#include "tbb/tick_count.h"
+
+#include <cerrno>
+#include <cstring>
+
+#ifndef _MSC_VER
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+using namespace IECore;
+using namespace IECoreImage;
+
+namespace
+{
+
+std::string errorString( const std::string &what, const std::string &name )
+{
+	return boost::str( boost::format( "DisplayDriverSharedMemory : %s \"%s\" (%s)" ) % what % name % strerror( errno ) );
+}
+
+} // namespace
+
+#ifndef _MSC_VER
+
+DisplayDriverSharedMemory::DisplayDriverSharedMemory( size_t capacity )
+	:	m_owner( true ), m_mappedSize( 0 ), m_memory( nullptr ), m_produced( 0 )
+{
+	// Keep all positions suitably aligned for the data types we store.
+	capacity = ( ( capacity + g_headerSize - 1 ) / g_headerSize ) * g_headerSize;
+	m_mappedSize = g_headerSize + capacity;
+
+	static std::atomic<int> g_count( 0 );
+	m_name = boost::str( boost::format( "/cortexDisplayDriver-%d-%d" ) % getpid() % g_count++ );
+
+	int fd = shm_open( m_name.c_str(), O_RDWR | O_CREAT | O_EXCL, S_IRUSR | S_IWUSR );
+	if( fd < 0 )
+	{
+		throw IOException( errorString( "Unable to create", m_name ) );
+	}
+
+	if( ftruncate( fd, m_mappedSize ) != 0 )
+	{
+		close( fd );
+		shm_unlink( m_name.c_str() );
+		throw IOException( errorString( "Unable to resize", m_name ) );
+	}
+
+	m_memory = mmap( nullptr, m_mappedSize, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0 );
+	close( fd );
+	if( m_memory == MAP_FAILED )
+	{
+		m_memory = nullptr;
+		shm_unlink( m_name.c_str() );
+		throw IOException( errorString( "Unable to map", m_name ) );
+	}
+
+	Header *h = new( m_memory ) Header;
+	h->consumed = 0;
+	h->capacity = capacity;
+}
+
+DisplayDriverSharedMemory::DisplayDriverSharedMemory( const std::string &name )
+	:	m_name( name ), m_owner( false ), m_mappedSize( 0 ), m_memory( nullptr ), m_produced( 0 )
+{
+	int fd = shm_open( m_name.c_str(), O_RDWR, 0 );
+	if( fd < 0 )
+	{
+		throw IOException( errorString( "Unable to open", m_name ) );
+	}
+
+	struct stat s;
+	if( fstat( fd, &s ) != 0 || (size_t)s.st_size <= g_headerSize )
+	{
+		close( fd );
+		throw IOException( errorString( "Invalid size for", m_name ) );
+	}
+	m_mappedSize = s.st_size;
+
+	m_memory = mmap( nullptr, m_mappedSize, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0 );
+	close( fd );
+	if( m_memory == MAP_FAILED )
+	{
+		m_memory = nullptr;
+		throw IOException( errorString( "Unable to map", m_name ) );
+	}
+
+	if( header()->capacity != m_mappedSize - g_headerSize )
+	{
+		munmap( m_memory, m_mappedSize );
+		m_memory = nullptr;
+		throw IOException( "DisplayDriverSharedMemory : Invalid header for \"" + m_name + "\"" );
+	}
+}
+
+DisplayDriverSharedMemory::~DisplayDriverSharedMemory()
+{
+	if( m_memory )
+	{
+		munmap( m_memory, m_mappedSize );
+	}
+	if( m_owner )
+	{
+		unlink();
+	}
+}
+
+void DisplayDriverSharedMemory::unlink()
+{
+	if( !m_name.empty() )
+	{
+		shm_unlink( m_name.c_str() );
+	}
+	m_owner = false;
+}
+
+#else
+
+DisplayDriverSharedMemory::DisplayDriverSharedMemory( size_t capacity )
+{
+	throw NotImplementedException( "DisplayDriverSharedMemory is not supported on this platform" );
+}
+
+DisplayDriverSharedMemory::DisplayDriverSharedMemory( const std::string &name )
+{
+	throw NotImplementedException( "DisplayDriverSharedMemory is not supported on this platform" );
+}
+
+DisplayDriverSharedMemory::~DisplayDriverSharedMemory()
+{
+}
+
+void DisplayDriverSharedMemory::unlink()
+{
+}
+
+#endif
+
+const std::string &DisplayDriverSharedMemory::name() const
+{
+	return m_name;
+}
+
+size_t DisplayDriverSharedMemory::capacity() const
+{
+	return header()->capacity;
+}
+
+uint64_t DisplayDriverSharedMemory::write( const void *data, size_t size, double timeout )
+{
+	const uint64_t capacity = header()->capacity;
+	if( size > capacity )
+	{
+		throw InvalidArgumentException( "DisplayDriverSharedMemory : Data too large for buffer" );
+	}
+
+	// Don't split data across the end of the buffer - skip
+	// to the start instead.
+	uint64_t position = m_produced;
+	const uint64_t offset = position % capacity;
+	if( offset + size > capacity )
+	{
+		position += capacity - offset;
+	}
+	const uint64_t end = position + size;
+
+	// Wait for the consumer to release enough space.
+	if( end - header()->consumed.load( std::memory_order_acquire ) > capacity )
+	{
+		const tbb::tick_count startTime = tbb::tick_count::now();
+		while( end - header()->consumed.load( std::memory_order_acquire ) > capacity )
+		{
+			if( ( tbb::tick_count::now() - startTime ).seconds() > timeout )
+			{
+				throw IOException( "DisplayDriverSharedMemory : Timed out waiting for consumer" );
+			}
+			tbb::this_tbb_thread::sleep( tbb::tick_count::interval_t( 0.0005 ) );
+		}
+	}
+
+	memcpy( buffer() + position % capacity, data, size );
+	std::atomic_thread_fence( std::memory_order_release );
+
+	m_produced = end;
+	return position;
+}
+
+const char *DisplayDriverSharedMemory::data( uint64_t position, size_t size ) const
+{
+	const uint64_t capacity = header()->capacity;
+	const uint64_t offset = position % capacity;
+	if( size > capacity || offset + size > capacity )
+	{
+		throw IOException( "DisplayDriverSharedMemory : Invalid data range" );
+	}
+	std::atomic_thread_fence( std::memory_order_acquire );
+	return buffer() + offset;
+}
+
+void DisplayDriverSharedMemory::release( uint64_t position )
+{
+	header()->consumed.store( position, std::memory_order_release );
+}
+
+DisplayDriverSharedMemory::Header *DisplayDriverSharedMemory::header() const
+{
+	return static_cast<Header *>( m_memory );
+}
+
+char *DisplayDriverSharedMemory::buffer() const
+{
+	return static_cast<char *>( m_memory ) + g_headerSize;
+}
@@ -36,7 +36,11 @@
 
 #include "boost/algorithm/string/predicate.hpp"
 
+#include "tbb/blocked_range.h"
 #include "tbb/mutex.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
 
 using namespace std;
 using namespace boost;
@@ -52,6 +56,72 @@ typedef std::map<std::string, ConstImagePrimitivePtr> ImagePool;
 static ImagePool g_pool;
 static tbb::mutex g_poolMutex;
 
+namespace
+{
+
+// Number of pixels deinterleaved at a time when there are many channels.
+// This is small enough for the source pixels to remain in cache while
+// each channel is written in turn, so that all writes are sequential.
+const int g_tileWidth = 64;
+
+// Buckets with more values than this are split across threads.
+const size_t g_parallelThreshold = 64 * 1024;
+
+template<int N>
+void deinterleaveRow( const float *source, float * const *channels, size_t targetOffset, int width )
+{
+	float *targets[N];
+	for( int c = 0; c < N; ++c )
+	{
+		targets[c] = channels[c] + targetOffset;
+	}
+
+	for( int x = 0; x < width; ++x )
+	{
+		for( int c = 0; c < N; ++c )
+		{
+			targets[c][x] = source[x * N + c];
+		}
+	}
+}
+
+void deinterleaveRow( const float *source, float * const *channels, size_t numChannels, size_t targetOffset, int width )
+{
+	switch( numChannels )
+	{
+		case 1 :
+			std::copy( source, source + width, channels[0] + targetOffset );
+			return;
+		case 2 :
+			deinterleaveRow<2>( source, channels, targetOffset, width );
+			return;
+		case 3 :
+			deinterleaveRow<3>( source, channels, targetOffset, width );
+			return;
+		case 4 :
+			deinterleaveRow<4>( source, channels, targetOffset, width );
+			return;
+		default :
+			break;
+	}
+
+	for( int tileX = 0; tileX < width; tileX += g_tileWidth )
+	{
+		const int tileEnd = std::min( width, tileX + g_tileWidth );
+		for( size_t c = 0; c < numChannels; ++c )
+		{
+			float *target = channels[c] + targetOffset;
+			const float *channelSource = source + c;
+			for( int x = tileX; x < tileEnd; ++x )
+			{
+				target[x] = channelSource[x * numChannels];
+			}
+		}
+	}
+}
+
+} // namespace
+
 ImageDisplayDriver::ImageDisplayDriver( const Box2i &displayWindow, const Box2i &dataWindow, const vector<string> &channelNames, ConstCompoundDataPtr parameters ) :
 		DisplayDriver( displayWindow, dataWindow, channelNames, parameters ),
 		m_image( new ImagePrimitive( dataWindow, displayWindow ) )
@@ -114,33 +184,47 @@ void ImageDisplayDriver::imageData( const Box2i &box, const float *data, size_t
 		throw Exception("Invalid dataSize value.");
 	}
 
-	int channelId, targetX, targetY, sourceWidth, sourceHeight, targetWidth;
-	sourceWidth = box.max.x - box.min.x + 1;
-	sourceHeight = box.max.y - box.min.y + 1;
-	targetWidth = dataWindow.max.x - dataWindow.min.x + 1;
-	channelId = 0;
-	targetX = box.min.x - dataWindow.min.x;
-	targetY = box.min.y - dataWindow.min.y;
+	const int sourceWidth = box.max.x - box.min.x + 1;
+	const int sourceHeight = box.max.y - box.min.y + 1;
+	const int targetWidth = dataWindow.max.x - dataWindow.min.x + 1;
+	const int targetX = box.min.x - dataWindow.min.x;
+	const int targetY = box.min.y - dataWindow.min.y;
 
-	for( const auto &name : channelNames() )
+	if( !pixelSize )
 	{
-		vector< float > &target = boost::static_pointer_cast< FloatVectorData >( m_image->channels[name] )->writable();
-		vector< float >::iterator targetIt;
-		const float *sourceIt = data+channelId;
-		targetIt = target.begin()+targetWidth*targetY+targetX;
+		return;
+	}
 
-		for ( int y = 0; y < sourceHeight; y++ )
+	// We call writable() for each bucket rather than storing the pointers,
+	// in case the data has since been shared with a copy of the image. We
+	// must lock while doing so because buckets may be written concurrently.
+	std::vector<float *> channels;
+	channels.reserve( pixelSize );
+	{
+		tbb::mutex::scoped_lock lock( m_channelsMutex );
+		for( const auto &name : channelNames() )
 		{
-			for ( int x = 0; x < sourceWidth; x++ )
-			{
-				*targetIt = *sourceIt;
-				sourceIt += pixelSize;
-				targetIt++;
-			}
-			targetIt += targetWidth - sourceWidth;
+			channels.push_back( boost::static_pointer_cast< FloatVectorData >( m_image->channels[name] )->writable().data() );
 		}
+	}
 
-		++channelId;
+	auto deinterleaveRows = [&]( const tbb::blocked_range<int> &range ) {
+		for( int y = range.begin(); y != range.end(); ++y )
+		{
+			deinterleaveRow(
+				data + (size_t)y * sourceWidth * pixelSize, channels.data(), pixelSize,
+				(size_t)( targetY + y ) * targetWidth + targetX, sourceWidth
+			);
+		}
+	};
+
+	if( dataSize > g_parallelThreshold )
+	{
+		tbb::parallel_for( tbb::blocked_range<int>( 0, sourceHeight ), deinterleaveRows );
+	}
+	else
+	{
+		deinterleaveRows( tbb::blocked_range<int>( 0, sourceHeight ) );
 	}
 }
 
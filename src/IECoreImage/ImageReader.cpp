@@ -107,6 +107,10 @@ ImageInputPtr openImageInput( const std::string &fileName )
 
 #endif
 
+// Height of the blocks returned by `ImageReader::blocks()` for
+// scanline images.
+const int g_scanlineBlockHeight = 64;
+
 } // namespace
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -303,7 +307,54 @@ class ImageReader::Implementation
 			return m_linearColorSpace;
 		}
 
+		std::vector<Imath::Box2i> blocks( const Imath::Box2i &region )
+		{
+			open( /* throwOnFailure */ true );
+
+			// The spec from the cache has tiling based on the cache settings,
+			// so we ask for the native spec instead. This may not be available
+			// for miplevels which are generated automatically.
+			const ImageSpec *spec = m_cache->imagespec( m_inputFileName, 0, miplevel(), /* native = */ true );
+			if( !spec )
+			{
+				spec = m_cache->imagespec( m_inputFileName, 0, miplevel() );
+			}
+
+			std::vector<Imath::Box2i> result;
+			const Imath::Box2i readRegion = boxIntersection( region, dataWindow() );
+			if( readRegion.isEmpty() )
+			{
+				return result;
+			}
+
+			const int blockWidth = spec->tile_width ? spec->tile_width : spec->width;
+			const int blockHeight = spec->tile_height ? spec->tile_height : g_scanlineBlockHeight;
+
+			// Tiles are aligned to the origin of the data window.
+			const int firstX = spec->x + ( ( readRegion.min.x - spec->x ) / blockWidth ) * blockWidth;
+			const int firstY = spec->y + ( ( readRegion.min.y - spec->y ) / blockHeight ) * blockHeight;
+			for( int y = firstY; y <= readRegion.max.y; y += blockHeight )
+			{
+				for( int x = firstX; x <= readRegion.max.x; x += blockWidth )
+				{
+					result.push_back(
+						boxIntersection(
+							Imath::Box2i( Imath::V2i( x, y ), Imath::V2i( x + blockWidth - 1, y + blockHeight - 1 ) ),
+							readRegion
+						)
+					);
+				}
+			}
+
+			return result;
+		}
+
 		DataPtr readChannel( const std::string &name, bool raw )
+		{
+			return readChannel( name, raw, dataWindow() );
+		}
+
+		DataPtr readChannel( const std::string &name, bool raw, const Imath::Box2i &region )
 		{
 			open( /* throwOnFailure */ true );
 
@@ -323,39 +374,39 @@ class ImageReader::Implementation
 				{
 					case TypeDesc::UCHAR :
 					{
-						return readTypedChannel<unsigned char>( channelIndex, spec->format );
+						return readTypedChannel<unsigned char>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::CHAR :
 					{
-						return readTypedChannel<char>( channelIndex, spec->format );
+						return readTypedChannel<char>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::USHORT :
 					{
-						return readTypedChannel<unsigned short>( channelIndex, spec->format );
+						return readTypedChannel<unsigned short>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::SHORT :
 					{
-						return readTypedChannel<short>( channelIndex, spec->format );
+						return readTypedChannel<short>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::UINT :
 					{
-						return readTypedChannel<unsigned int>( channelIndex, spec->format );
+						return readTypedChannel<unsigned int>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::INT :
 					{
-						return readTypedChannel<int>( channelIndex, spec->format );
+						return readTypedChannel<int>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::HALF :
 					{
-						return readTypedChannel<half>( channelIndex, spec->format );
+						return readTypedChannel<half>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::FLOAT :
 					{
-						return readTypedChannel<float>( channelIndex, spec->format );
+						return readTypedChannel<float>( channelIndex, spec->format, region );
 					}
 					case TypeDesc::DOUBLE :
 					{
-						return readTypedChannel<double>( channelIndex, spec->format );
+						return readTypedChannel<double>( channelIndex, spec->format, region );
 					}
 					default :
 					{
@@ -365,14 +416,14 @@ class ImageReader::Implementation
 			}
 			else
 			{
-				return readTypedChannel<float>( channelIndex, TypeDesc::FLOAT );
+				return readTypedChannel<float>( channelIndex, TypeDesc::FLOAT, region );
 			}
 		}
 
 	private :
 
 		template<class T>
-		DataPtr readTypedChannel( size_t channelIndex, TypeDesc dataType )
+		DataPtr readTypedChannel( size_t channelIndex, TypeDesc dataType, const Imath::Box2i &region )
 		{
 			typedef TypedData<vector<T> > DataType;
 			typename DataType::Ptr data = new DataType;
@@ -381,12 +432,13 @@ class ImageReader::Implementation
 
 			const ImageSpec *spec = m_cache->imagespec( m_inputFileName, 0, miplevel() );
 
-			data->writable().resize( spec->width * spec->height );
+			const Imath::V2i size = region.size() + Imath::V2i( 1 );
+			data->writable().resize( size.x * size.y );
 			status = m_cache->get_pixels(
 				m_inputFileName,
 				0, miplevel(), // subimage, miplevel
-				spec->x, spec->width + spec->x,
-				spec->y, spec->height + spec->y,
+				region.min.x, region.max.x + 1,
+				region.min.y, region.max.y + 1,
 				0, 1, // z begin, z end
 				channelIndex, channelIndex + 1,
 				/* format */ dataType,
@@ -548,9 +600,19 @@ ImageReader::ImageReader() :
 		0
 	);
 
+	m_regionOfInterestParameter = new Box2iParameter(
+		"regionOfInterest",
+		"Specifies the region of the image to load. Only pixels inside both this region "
+		"and the data window of the file are loaded, and the data window of the result is "
+		"set accordingly. If the region is empty (the default value) then the entire data "
+		"window is loaded.",
+		Box2i()
+	);
+
 	parameters()->addParameter( m_channelNamesParameter );
 	parameters()->addParameter( m_rawChannelsParameter );
 	parameters()->addParameter( m_miplevelParameter );
+	parameters()->addParameter( m_regionOfInterestParameter );
 }
 
 ImageReader::ImageReader( const string &fileName ) : ImageReader()
@@ -591,14 +653,50 @@ ObjectPtr ImageReader::doOperation( const CompoundObject *operands )
 {
 	bool rawChannels = operands->member< BoolData >( "rawChannels" )->readable();
 
-	ImagePrimitivePtr image = new ImagePrimitive( dataWindow(), displayWindow() );
+	Box2i region = dataWindow();
+	const Box2i &regionOfInterest = operands->member<Box2iData>( "regionOfInterest" )->readable();
+	if( !regionOfInterest.isEmpty() )
+	{
+		region = boxIntersection( region, regionOfInterest );
+		if( region.isEmpty() )
+		{
+			throw InvalidArgumentException( "ImageReader : Region of interest does not intersect the data window" );
+		}
+	}
+
+	ImagePrimitivePtr image = readRegionInternal( region, rawChannels );
+
+	m_implementation->updateMetadata( image->blindData() );
+
+	return image;
+}
+
+std::vector<Imath::Box2i> ImageReader::blocks( const Imath::Box2i &region )
+{
+	return m_implementation->blocks( region.isEmpty() ? dataWindow() : region );
+}
+
+ImagePrimitivePtr ImageReader::readRegion( const Imath::Box2i &region )
+{
+	return readRegionInternal( region, rawChannelsParameter()->getTypedValue() );
+}
+
+ImagePrimitivePtr ImageReader::readRegionInternal( const Imath::Box2i &region, bool rawChannels )
+{
+	const Box2i dw = dataWindow();
+	if( region.isEmpty() || boxIntersection( region, dw ) != region )
+	{
+		throw InvalidArgumentException( "ImageReader : Region must be non-empty and inside the data window" );
+	}
+
+	ImagePrimitivePtr image = new ImagePrimitive( region, displayWindow() );
 
 	vector<string> channelNames;
 	channelsToRead( channelNames );
 
 	for( size_t ci = 0, cend = channelNames.size(); ci != cend; ++ci )
 	{
-		DataPtr d = m_implementation->readChannel( channelNames[ci], rawChannels );
+		DataPtr d = m_implementation->readChannel( channelNames[ci], rawChannels, region );
 		assert( d  );
 		assert( rawChannels || d->typeId()==FloatVectorDataTypeId );
 
@@ -612,8 +710,6 @@ ObjectPtr ImageReader::doOperation( const CompoundObject *operands )
 		ColorAlgo::transformImage( image.get(), m_implementation->currentColorSpace(), m_implementation->linearColorSpace() );
 	}
 
-	m_implementation->updateMetadata( image->blindData() );
-
 	return image;
 }
 
@@ -687,6 +783,16 @@ const IntParameter *ImageReader::mipLevelParameter() const
 	return m_miplevelParameter.get();
 }
 
+Box2iParameter *ImageReader::regionOfInterestParameter()
+{
+	return m_regionOfInterestParameter.get();
+}
+
+const Box2iParameter *ImageReader::regionOfInterestParameter() const
+{
+	return m_regionOfInterestParameter.get();
+}
+
 CompoundObjectPtr ImageReader::readHeader()
 {
 	std::vector<std::string> cn;
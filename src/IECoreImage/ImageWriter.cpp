@@ -39,12 +39,11 @@
 #include "IECoreImage/OpenImageIOAlgo.h"
 
 #include "IECore/CompoundParameter.h"
-#include "IECore/DataInterleaveOp.h"
 #include "IECore/DespatchTypedData.h"
 #include "IECore/Exception.h"
 #include "IECore/FileNameParameter.h"
 #include "IECore/MessageHandler.h"
-#include "IECore/ObjectVector.h"
+#include "IECore/NumericParameter.h"
 #include "IECore/TypedParameter.h"
 #include "IECore/Version.h"
 
@@ -60,6 +59,10 @@
 #include "boost/static_assert.hpp"
 #include "boost/type_traits.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_invoke.h"
+
 #ifndef _MSC_VER
 #include <sys/utsname.h>
 #endif
@@ -240,6 +243,11 @@ void setImageSpecFormatOptions( const CompoundObject *operands, ImageSpec *spec,
 		spec->attribute( "compression", compression->readable() );
 	}
 
+	if( const IntData *tileSize = settings->member<const IntData>( "tileSize" ) )
+	{
+		spec->tile_width = spec->tile_height = std::max( tileSize->readable(), 0 );
+	}
+
 	if( fileFormatName == "jpeg" )
 	{
 		spec->attribute( "CompressionQuality", settings->member<const IntData>( "quality" )->readable() );
@@ -259,6 +267,79 @@ void setImageSpecFormatOptions( const CompoundObject *operands, ImageSpec *spec,
 	}
 }
 
+// Number of scanlines interleaved and written at a time when
+// writing untiled images.
+const int g_scanlineBlockHeight = 64;
+
+// Interleaves rows [yBegin, yEnd) of the image described by `spec` into
+// `buffer`, filling pixels outside the data window with zeroes. Since we
+// only copy values, we use an unsigned integer type of the appropriate
+// size rather than the actual type of the channels.
+template<typename T>
+void interleaveTyped( const std::vector<const void *> &channels, const Box2i &dataWindow, const ImageSpec &spec, int yBegin, int yEnd, unsigned char *buffer )
+{
+	const size_t numChannels = channels.size();
+	const size_t rowSize = (size_t)spec.width * numChannels;
+	const size_t dataWidth = dataWindow.size().x + 1;
+
+	// The range of x values which lie within both the file and the data window.
+	const int xBegin = std::max( spec.x, dataWindow.min.x );
+	const int xEnd = std::min( spec.x + spec.width, dataWindow.max.x + 1 );
+
+	tbb::parallel_for(
+		tbb::blocked_range<int>( yBegin, yEnd ),
+		[&]( const tbb::blocked_range<int> &range )
+		{
+			for( int y = range.begin(); y != range.end(); ++y )
+			{
+				T *row = reinterpret_cast<T *>( buffer ) + ( y - yBegin ) * rowSize;
+				const int imageY = spec.y + y;
+				if( imageY < dataWindow.min.y || imageY > dataWindow.max.y || xBegin >= xEnd )
+				{
+					std::fill( row, row + rowSize, T( 0 ) );
+					continue;
+				}
+
+				std::fill( row, row + ( xBegin - spec.x ) * numChannels, T( 0 ) );
+				std::fill( row + ( xEnd - spec.x ) * numChannels, row + rowSize, T( 0 ) );
+
+				const size_t offset = ( imageY - dataWindow.min.y ) * dataWidth + ( xBegin - dataWindow.min.x );
+				for( size_t c = 0; c < numChannels; ++c )
+				{
+					const T *src = static_cast<const T *>( channels[c] ) + offset;
+					T *dst = row + ( xBegin - spec.x ) * numChannels + c;
+					for( int x = xBegin; x < xEnd; ++x )
+					{
+						*dst = *src++;
+						dst += numChannels;
+					}
+				}
+			}
+		}
+	);
+}
+
+void interleave( const std::vector<const void *> &channels, size_t elementSize, const Box2i &dataWindow, const ImageSpec &spec, int yBegin, int yEnd, unsigned char *buffer )
+{
+	switch( elementSize )
+	{
+		case 1 :
+			interleaveTyped<uint8_t>( channels, dataWindow, spec, yBegin, yEnd, buffer );
+			break;
+		case 2 :
+			interleaveTyped<uint16_t>( channels, dataWindow, spec, yBegin, yEnd, buffer );
+			break;
+		case 4 :
+			interleaveTyped<uint32_t>( channels, dataWindow, spec, yBegin, yEnd, buffer );
+			break;
+		case 8 :
+			interleaveTyped<uint64_t>( channels, dataWindow, spec, yBegin, yEnd, buffer );
+			break;
+		default :
+			throw IECore::Exception( boost::str( boost::format( "IECoreImage::ImageWriter : Unsupported element size %d" ) % elementSize ) );
+	}
+}
+
 } // namespace
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -318,6 +399,15 @@ ImageWriter::ImageWriter()
 		)
 	);
 
+	exrSettings->addParameter(
+		new IntParameter(
+			"tileSize",
+			"The width and height of the tiles used to store the image. A value of 0 stores the image as scanlines.",
+			0,
+			0
+		)
+	);
+
 	CompoundParameterPtr dpxSettings = new CompoundParameter( "dpx", "dpx specific settings" );
 	m_formatSettingsParameter->addParameter( dpxSettings );
 	dpxSettings->addParameter(
@@ -368,6 +458,15 @@ ImageWriter::ImageWriter()
 		)
 	);
 
+	tifSettings->addParameter(
+		new IntParameter(
+			"tileSize",
+			"The width and height of the tiles used to store the image. A value of 0 stores the image as scanlines.",
+			0,
+			0
+		)
+	);
+
 	CompoundParameterPtr jpgSettings = new CompoundParameter( "jpeg", "jpeg specific settings" );
 	m_formatSettingsParameter->addParameter( jpgSettings );
 	jpgSettings->addParameter(
@@ -528,6 +627,10 @@ void ImageWriter::doWrite( const CompoundObject *operands )
 	metadataToImageSpecAttributes( metadata.get(), &spec );
 
 	setImageSpecFormatOptions( operands->member<const CompoundObject>( "formatSettings" ), &spec, out->format_name() );
+	if( spec.tile_width && !out->supports( "tiles" ) )
+	{
+		spec.tile_width = spec.tile_height = 0;
+	}
 
 	// Add common attribs to the spec
 	spec.attribute( "Software", "Cortex " + IECore::versionString() );
@@ -614,81 +717,77 @@ void ImageWriter::doWrite( const CompoundObject *operands )
 
 	const auto &channelMap = ( correctedImage ) ? correctedImage->channels : image->channels;
 
-	DataInterleaveOpPtr op = new DataInterleaveOp();
-	op->targetTypeParameter()->setNumericValue( firstChannelData->typeId() );
-	auto &vectors = static_cast<ObjectVector *>( op->dataParameter()->getValue() )->members();
-	vectors.reserve( (size_t)spec.nchannels );
+	std::vector<const void *> channelData;
+	channelData.reserve( channels.size() );
+	OIIO::TypeDesc format;
 	for( const auto &channel : channels )
 	{
-		vectors.push_back( channelMap.find( channel )->second );
+		const Data *data = channelMap.find( channel )->second.get();
+		const OpenImageIOAlgo::DataView dataView( data );
+		if( dataView.type == TypeDesc::UNKNOWN || dataView.type.aggregate != TypeDesc::SCALAR )
+		{
+			throw IECore::Exception( boost::str( boost::format( "IECoreImage::ImageWriter : Failed to write \"%s\". Unsupported dataType %s." ) % fileName() % data->typeName() ) );
+		}
+		format = TypeDesc( (TypeDesc::BASETYPE)dataView.type.basetype );
+		channelData.push_back( dataView.data );
 	}
 
-	DataPtr buffer = static_pointer_cast<Data>( op->operate() );
-	const OpenImageIOAlgo::DataView dataView( buffer.get() );
-	if( dataView.type == TypeDesc::UNKNOWN )
-	{
-		throw IECore::Exception( boost::str( boost::format( "IECoreImage::ImageWriter : Failed to write \"%s\". Unsupported dataType %s." ) % fileName() % buffer->typeName() ) );
-	}
+	// We interleave the channels a block of scanlines (or a row of tiles) at a
+	// time, so we never need more than two blocks of interleaved data. Each block
+	// is interleaved in parallel, and concurrently with the writing of the previous
+	// block.
 
-	const unsigned char *rawBuffer = (const unsigned char *)dataView.data;
-	size_t stride = spec.nchannels * spec.width * dataView.type.elementsize();
+	const bool tiled = spec.tile_width > 0 && spec.tile_height > 0;
+	const int blockHeight = tiled ? spec.tile_height : g_scanlineBlockHeight;
+	const size_t elementSize = format.size();
+	const size_t blockSize = (size_t)spec.width * std::min( blockHeight, spec.height ) * spec.nchannels * elementSize;
 
-	IECore::UCharVectorDataPtr scanLineData = new IECore::UCharVectorData();
-	std::vector<unsigned char>& scanLineBuffer = scanLineData->writable();
-	scanLineBuffer.resize(stride);
+	std::vector<unsigned char> buffers[2];
+	buffers[0].resize( blockSize );
+	if( spec.height > blockHeight )
+	{
+		buffers[1].resize( blockSize );
+	}
 
-	auto getScanLine = [&rawBuffer, &spec, &stride, &dataWindow, &dataView, validDisplayWindow, &scanLineBuffer](int y) -> const unsigned char*
+	auto writeBlock = [&]( int yBegin, int yEnd, const unsigned char *data )
 	{
-		if ( validDisplayWindow )
+		bool status;
+		if( tiled )
 		{
-			return &rawBuffer[stride * y];
+			status = out->write_tiles(
+				spec.x, spec.x + spec.width,
+				spec.y + yBegin, spec.y + yEnd,
+				spec.z, spec.z + std::max( spec.depth, 1 ),
+				format, data
+			);
 		}
 		else
 		{
-			memset( &scanLineBuffer[0], 0, stride );
-
-			// ensure the dataWindow is inside the image display window
-			int clampedXStart = std::max( dataWindow.min.x, 0 );
-			int clampedWidth = std::min( dataWindow.size().x + 1, (spec.width - clampedXStart) );
-
-			size_t dataWindowStride = ( dataWindow.size().x + 1) * spec.nchannels * dataView.type.elementsize();
-			size_t bytesToCopy = clampedWidth  * spec.nchannels * dataView.type.elementsize();
+			status = out->write_scanlines( spec.y + yBegin, spec.y + yEnd, /* z */ 0, format, data );
+		}
 
-			if( y < dataWindow.min.y )
-			{
-				return &scanLineBuffer[0];
-			}
-			else if( y > dataWindow.max.y )
-			{
-				return &scanLineBuffer[0];
-			}
-			else
-			{
-				if ( clampedWidth > 0 )
-				{
-					memcpy(
-						&scanLineBuffer[clampedXStart * spec.nchannels * dataView.type.elementsize()],
-						&rawBuffer[dataWindowStride * ( y - dataWindow.min.y )],
-						bytesToCopy
-					);
-				}
-				return &scanLineBuffer[0];
-			}
+		if( !status )
+		{
+			throw IECore::Exception( boost::str( boost::format( "IECoreImage::ImageWriter : Failed to write \"%s\", error = %s" ) % fileName() % out->geterror() ) );
 		}
 	};
 
-	for( int y = 0; y < spec.height; ++y )
+	interleave( channelData, elementSize, dataWindow, spec, 0, std::min( blockHeight, spec.height ), buffers[0].data() );
+	for( int y = 0, i = 0; y < spec.height; y += blockHeight, ++i )
 	{
-		bool status = out->write_scanline(
-			/* y */ spec.y + y,
-			/* z */ 0,
-			/* format */ dataView.type,
-			/* data */ getScanLine( y )
-		);
-
-		if( !status )
+		const int yEnd = std::min( y + blockHeight, spec.height );
+		const unsigned char *current = buffers[i % 2].data();
+		if( yEnd < spec.height )
 		{
-			throw IECore::Exception( boost::str( boost::format( "IECoreImage::ImageWriter : Failed to write \"%s\", error = %s" ) % fileName() % out->geterror() ) );
+			unsigned char *next = buffers[( i + 1 ) % 2].data();
+			tbb::parallel_invoke(
+				[&] { writeBlock( y, yEnd, current ); },
+				[&] { interleave( channelData, elementSize, dataWindow, spec, yEnd, std::min( yEnd + blockHeight, spec.height ), next ); }
+			);
+		}
+		else
+		{
+			writeBlock( y, yEnd, current );
 		}
 	}
 
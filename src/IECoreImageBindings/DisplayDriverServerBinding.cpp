@@ -54,7 +54,7 @@ void bindDisplayDriverServer()
 	using boost::python::arg;
 
 	RunTimeTypedClass<DisplayDriverServer>()
-		.def( init< int >( ( arg( "portNumber" ) = 0 ) ) )
+		.def( init< int, int >( ( arg( "portNumber" ) = 0, arg( "numThreads" ) = 1 ) ) )
 		.def( "portNumber", &DisplayDriverServer::portNumber )
 	;
 
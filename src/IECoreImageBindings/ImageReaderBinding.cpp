@@ -37,6 +37,7 @@
 #include "IECore/VectorTypedData.h"
 #include "IECorePython/ReaderBinding.h"
 
+#include "IECoreImage/ImagePrimitive.h"
 #include "IECoreImage/ImageReader.h"
 #include "IECoreImageBindings/ImageReaderBinding.h"
 
@@ -57,6 +58,16 @@ static StringVectorDataPtr channelNames( ImageReader &that )
 	return result;
 }
 
+static list blocks( ImageReader &that, const Imath::Box2i &region )
+{
+	list result;
+	for( const auto &b : that.blocks( region ) )
+	{
+		result.append( b );
+	}
+	return result;
+}
+
 } // namespace
 
 namespace IECoreImageBindings
@@ -74,6 +85,8 @@ void bindImageReader()
 		.def( "dataWindow", &ImageReader::dataWindow )
 		.def( "displayWindow", &ImageReader::displayWindow )
 		.def( "readChannel", (DataPtr (ImageReader::*)( const std::string &, bool ))&ImageReader::readChannel, ( arg_("name"), arg_( "raw" ) = false ) )
+		.def( "blocks", &blocks, ( arg_( "region" ) = Imath::Box2i() ) )
+		.def( "readRegion", (ImagePrimitivePtr (ImageReader::*)( const Imath::Box2i & ))&ImageReader::readRegion )
 	;
 
 }
@@ -78,6 +78,8 @@ void bindCachedReader()
 		.add_property( "searchPath", make_function( &CachedReader::getSearchPath, return_value_policy<copy_const_reference>() ), &CachedReader::setSearchPath )
 		.def( "defaultCachedReader", &CachedReader::defaultCachedReader, return_value_policy<CastToIntrusivePtr>() ).staticmethod( "defaultCachedReader" )
 		.def( "objectPool", &CachedReader::objectPool, return_value_policy<CastToIntrusivePtr>() )
+		.def( "statistics", &CachedReader::statistics )
+		.def( "resetStatistics", &CachedReader::resetStatistics )
 	;
 }
 
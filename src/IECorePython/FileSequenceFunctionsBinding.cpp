@@ -37,6 +37,7 @@
 #include "IECorePython/FileSequenceFunctionsBinding.h"
 
 #include "IECorePython/IECoreBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
 #include "IECore/Exception.h"
 #include "IECore/FileSequence.h"
@@ -108,6 +109,37 @@ struct FileSequenceFunctionsHelper
 		return object();
 	}
 
+	static list lsSequenceInfo( const std::string &path, size_t minSequenceSize, size_t maxDepth, bool followLinks, bool modificationTimes )
+	{
+		std::vector<FileSequenceInfo> sequences;
+		{
+			IECorePython::ScopedGILRelease gilRelease;
+			IECore::lsSequenceInfo( path, sequences, minSequenceSize, maxDepth, followLinks, modificationTimes );
+		}
+
+		list result;
+		for( const auto &s : sequences )
+		{
+			result.append( s );
+		}
+		return result;
+	}
+
+	static FileSequencePtr sequenceInfoSequence( const FileSequenceInfo &info )
+	{
+		return info.sequence;
+	}
+
+	static list sequenceInfoModificationTimes( const FileSequenceInfo &info )
+	{
+		list result;
+		for( const auto &t : info.modificationTimes )
+		{
+			result.append( (long)t );
+		}
+		return result;
+	}
+
 	static FrameListPtr frameListFromList( list l )
 	{
 		std::vector< FrameList::Frame > frameList;
@@ -132,6 +164,21 @@ void bindFileSequenceFunctions()
 	def( "findSequences", &FileSequenceFunctionsHelper::findSequences, ( arg_("namesList"), arg_( "minSequenceSize" ) = 2 ) );
 	def( "ls", &FileSequenceFunctionsHelper::ls, ( arg_("path"), arg_( "minSequenceSize" ) = 2 ) );
 	def( "frameListFromList", &FileSequenceFunctionsHelper::frameListFromList );
+
+	class_<FileSequenceInfo>( "FileSequenceInfo", no_init )
+		.add_property( "sequence", &FileSequenceFunctionsHelper::sequenceInfoSequence )
+		.def_readonly( "isFiles", &FileSequenceInfo::isFiles )
+		.def_readonly( "isDirectories", &FileSequenceInfo::isDirectories )
+		.add_property( "modificationTimes", &FileSequenceFunctionsHelper::sequenceInfoModificationTimes )
+	;
+
+	def(
+		"lsSequenceInfo", &FileSequenceFunctionsHelper::lsSequenceInfo,
+		(
+			arg_( "path" ), arg_( "minSequenceSize" ) = 2, arg_( "maxDepth" ) = 0,
+			arg_( "followLinks" ) = false, arg_( "modificationTimes" ) = false
+		)
+	);
 }
 
 }
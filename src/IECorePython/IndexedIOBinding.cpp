@@ -256,6 +256,56 @@ struct IndexedIOHelper
 		}
 	}
 
+	template<typename T>
+	static typename TypedData< std::vector<T> >::Ptr readArrayRange(IndexedIOPtr p, const IndexedIO::EntryID &name, unsigned long offset, unsigned long count)
+	{
+		typename TypedData<std::vector<T> >::Ptr x = new TypedData<std::vector<T> > ();
+		x->writable().resize( count );
+		T *data = x->writable().data();
+		p->read(name, data, offset, count);
+
+		return x;
+	}
+
+	static object readRange(IndexedIOPtr p, const IndexedIO::EntryID &name, unsigned long offset, unsigned long count)
+	{
+		assert(p);
+
+		IndexedIO::Entry entry = p->entry(name);
+
+		switch( entry.dataType() )
+		{
+			case IndexedIO::StringArray:
+				return object( readArrayRange<std::string>(p, name, offset, count) );
+			case IndexedIO::FloatArray:
+				return object( readArrayRange<float>(p, name, offset, count) );
+			case IndexedIO::DoubleArray:
+				return object( readArrayRange<double>(p, name, offset, count) );
+			case IndexedIO::IntArray:
+				return object( readArrayRange<int>(p, name, offset, count) );
+			case IndexedIO::LongArray:
+				return object( readArrayRange<int>(p, name, offset, count) );
+			case IndexedIO::UIntArray:
+				return object( readArrayRange<unsigned int>(p, name, offset, count) );
+			case IndexedIO::CharArray:
+				return object( readArrayRange<char>(p, name, offset, count) );
+			case IndexedIO::UCharArray:
+				return object( readArrayRange<unsigned char>(p, name, offset, count) );
+			case IndexedIO::ShortArray:
+				return object( readArrayRange<short>(p, name, offset, count) );
+			case IndexedIO::UShortArray:
+				return object( readArrayRange<unsigned short>(p, name, offset, count) );
+			case IndexedIO::Int64Array:
+				return object( readArrayRange<int64_t>(p, name, offset, count) );
+			case IndexedIO::UInt64Array:
+				return object( readArrayRange<uint64_t>(p, name, offset, count) );
+			case IndexedIO::InternedStringArray:
+				return object( readArrayRange<InternedString>(p, name, offset, count) );
+			default:
+				throw IOException( "IndexedIO.read : Entry \"" + name.value() + "\" is not an array" );
+		}
+	}
+
 	static std::string readString(IndexedIOPtr p, const IndexedIO::EntryID &name)
 	{
 		assert(p);
@@ -402,6 +452,7 @@ void bindIndexedIOBase()
 		.def("write", writeUShort)
 #endif
 		.def("read", &IndexedIOHelper::read)
+		.def("read", &IndexedIOHelper::readRange, ( arg("self"), arg("name"), arg("offset"), arg("count") ) )
 		.def("create", &IndexedIOHelper::create, (arg("path"), arg("root"), arg("mode"), arg("options") = object() ) )
 		.def("create", &IndexedIOHelper::createAtRoot, (arg("path"), arg("mode"), arg("options") = object() ) ).staticmethod("create")
 		.def("supportedExtensions", &IndexedIOHelper::supportedExtensions ).staticmethod("supportedExtensions")
@@ -323,6 +323,8 @@ void IECorePython::bindLRUCache()
 		.def( "get", &PythonLRUCache::get )
 		.def( "set", &PythonLRUCache::set )
 		.def( "cached", &PythonLRUCache::cached )
+		.def( "statistics", &PythonLRUCache::statistics )
+		.def( "resetStatistics", &PythonLRUCache::resetStatistics )
 	;
 
 	/// \todo If we create an IECoreTest module, move these into it.
@@ -95,6 +95,8 @@ void bindObjectPool()
 		.def( "memoryUsage", &ObjectPool::memoryUsage )
 		.def( "getMaxMemoryUsage", &ObjectPool::getMaxMemoryUsage)
 		.def( "setMaxMemoryUsage", &ObjectPool::setMaxMemoryUsage )
+		.def( "statistics", &ObjectPool::statistics )
+		.def( "resetStatistics", &ObjectPool::resetStatistics )
 		.def( "defaultObjectPool", &ObjectPool::defaultObjectPool, return_value_policy<CastToIntrusivePtr>() )
 		.staticmethod( "defaultObjectPool" )
 	;
@@ -40,7 +40,9 @@
 #include "IECorePython/PathMatcherBinding.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
 
+#include "IECore/FrozenPathMatcher.h"
 #include "IECore/PathMatcher.h"
 #include "IECore/PathMatcherData.h"
 #include "IECore/VectorTypedData.h"
@@ -293,7 +295,8 @@ PathMatcher *constructFromVectorData( IECore::ConstStringVectorDataPtr paths )
 	return new PathMatcher( paths->readable().begin(), paths->readable().end() );
 }
 
-boost::python::list paths( const PathMatcher &p )
+template<typename T>
+boost::python::list paths( const T &p )
 {
 	std::vector<std::string> paths;
 	p.paths( paths );
@@ -305,6 +308,34 @@ boost::python::list paths( const PathMatcher &p )
 	return result;
 }
 
+std::vector<PathMatcher> matchers( object oMatchers )
+{
+	std::vector<PathMatcher> result;
+	boost::python::container_utils::extend_container( result, oMatchers );
+	return result;
+}
+
+PathMatcher unionOf( object oMatchers )
+{
+	const std::vector<PathMatcher> m = matchers( oMatchers );
+	IECorePython::ScopedGILRelease gilRelease;
+	return PathMatcher::unionOf( m );
+}
+
+PathMatcher intersectionOf( object oMatchers )
+{
+	const std::vector<PathMatcher> m = matchers( oMatchers );
+	IECorePython::ScopedGILRelease gilRelease;
+	return PathMatcher::intersectionOf( m );
+}
+
+PathMatcher differenceOf( const PathMatcher &paths, object oPathsToRemove )
+{
+	const std::vector<PathMatcher> m = matchers( oPathsToRemove );
+	IECorePython::ScopedGILRelease gilRelease;
+	return PathMatcher::differenceOf( paths, m );
+}
+
 std::string pathMatcherRepr( object p )
 {
 	std::string paths = extract<std::string>( p.attr( "paths" )().attr( "__repr__" )() );
@@ -338,6 +369,23 @@ void IECorePython::bindPathMatcher()
 		.def( "__repr__", &pathMatcherDataRepr )
 	;
 
+	class_<FrozenPathMatcher>( "FrozenPathMatcher" )
+		.def( init<>() )
+		.def( init<const PathMatcher &>() )
+		.def( "pathMatcher", &FrozenPathMatcher::pathMatcher )
+		.def( "isEmpty", &FrozenPathMatcher::isEmpty )
+		.def( "size", &FrozenPathMatcher::size )
+		.def( "memoryUsage", &FrozenPathMatcher::memoryUsage )
+		.def( "paths", &paths<FrozenPathMatcher> )
+		.def( "match", (unsigned (FrozenPathMatcher::*)( const std::vector<IECore::InternedString> & ) const)&FrozenPathMatcher::match )
+		.def( "match", (unsigned (FrozenPathMatcher::*)( const std::string & ) const)&FrozenPathMatcher::match )
+		.def( "intersection", &FrozenPathMatcher::intersection )
+		.def( "save", &FrozenPathMatcher::save )
+		.def( "load", &FrozenPathMatcher::load ).staticmethod( "load" )
+		.def( self == self )
+		.def( self != self )
+	;
+
 	scope s = class_<PathMatcher>( "PathMatcher" )
 		.def( "__init__", make_constructor( constructFromObject ) )
 		.def( "__init__", make_constructor( constructFromVectorData ) )
@@ -351,6 +399,9 @@ void IECorePython::bindPathMatcher()
 		.def( "addPaths", (bool (PathMatcher::*)( const PathMatcher &, const std::vector<IECore::InternedString> & ))&PathMatcher::addPaths )
 		.def( "removePaths", &PathMatcher::removePaths )
 		.def( "intersection", (PathMatcher ( PathMatcher::*)( const PathMatcher & ) const)&PathMatcher::intersection )
+		.def( "unionOf", &unionOf ).staticmethod( "unionOf" )
+		.def( "intersectionOf", &intersectionOf ).staticmethod( "intersectionOf" )
+		.def( "differenceOf", &differenceOf ).staticmethod( "differenceOf" )
 		.def( "prune", (bool (PathMatcher::*)( const std::vector<IECore::InternedString> & ))&PathMatcher::prune )
 		.def( "prune", (bool (PathMatcher::*)( const std::string & ))&PathMatcher::prune )
 		.def( "subTree", (PathMatcher ( PathMatcher::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::subTree )
@@ -358,7 +409,8 @@ void IECorePython::bindPathMatcher()
 		.def( "clear", &PathMatcher::clear )
 		.def( "isEmpty", &PathMatcher::isEmpty )
 		.def( "size", &PathMatcher::size )
-		.def( "paths", &paths )
+		.def( "sizeEstimate", &PathMatcher::sizeEstimate, ( arg( "maxLocations" ) = 1000 ) )
+		.def( "paths", &paths<PathMatcher> )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::vector<IECore::InternedString> & ) const)&PathMatcher::match )
 		.def( "match", (unsigned (PathMatcher ::*)( const std::string & ) const)&PathMatcher::match )
 		.def( "__repr__", &pathMatcherRepr )
@@ -154,6 +154,7 @@
 #include "IECorePython/StringAlgoBinding.h"
 #include "IECorePython/PathMatcherBinding.h"
 #include "IECorePython/CancellerBinding.h"
+#include "IECorePython/CacheStatisticsBinding.h"
 #include "IECorePython/IndexedIOAlgoBinding.h"
 
 #include "IECore/IECore.h"
@@ -298,6 +299,7 @@ BOOST_PYTHON_MODULE(_IECore)
 	bindStringAlgo();
 	bindPathMatcher();
 	bindCanceller();
+	bindCacheStatistics();
 	bindIndexedIOAlgo();
 	bindTBB();
 
@@ -35,6 +35,7 @@
 
 #include "IECoreScene/CurvesAlgo.h"
 #include "IECoreScene/private/PrimitiveAlgoUtils.h"
+#include "IECoreScene/private/PrimitiveVariableAlgos.h"
 
 #include "IECore/DataAlgo.h"
 #include "IECore/DespatchTypedData.h"
@@ -47,6 +48,115 @@ using namespace IECoreScene;
 using namespace Imath;
 
 
+namespace
+{
+
+/// Builds the CurvesPrimitive containing a subset of the curves of another.
+/// Per-curve offsets are computed once up front, so that building each subset
+/// only costs time proportional to the size of that subset.
+class CurvesSegmentBuilder
+{
+
+	public :
+
+		CurvesSegmentBuilder( const CurvesPrimitive *curves )
+			:	m_curves( curves )
+		{
+			for( const auto &pv : curves->variables )
+			{
+				if( !curves->isPrimitiveVariableValid( pv.second ) )
+				{
+					throw InvalidArgumentException(
+						boost::str( boost::format( "CurvesAlgo::segment cannot process invalid primitive variable \"%s\"" ) % pv.first )
+					);
+				}
+			}
+
+			const std::vector<int> &verticesPerCurve = curves->verticesPerCurve()->readable();
+			m_vertexOffsets.reserve( verticesPerCurve.size() );
+			m_varyingOffsets.reserve( verticesPerCurve.size() );
+			int vertexOffset = 0;
+			int varyingOffset = 0;
+			for( size_t c = 0; c < verticesPerCurve.size(); ++c )
+			{
+				m_vertexOffsets.push_back( vertexOffset );
+				m_varyingOffsets.push_back( varyingOffset );
+				vertexOffset += verticesPerCurve[c];
+				varyingOffset += curves->numSegments( c ) + 1;
+			}
+		}
+
+		CurvesPrimitivePtr operator()( const std::vector<int> &curveIndices ) const
+		{
+			const std::vector<int> &inVerticesPerCurve = m_curves->verticesPerCurve()->readable();
+
+			IntVectorDataPtr verticesPerCurveData = new IntVectorData;
+			std::vector<int> &verticesPerCurve = verticesPerCurveData->writable();
+			verticesPerCurve.reserve( curveIndices.size() );
+
+			std::vector<int> vertices;
+			std::vector<int> varying;
+			for( int c : curveIndices )
+			{
+				const int numVerts = inVerticesPerCurve[c];
+				verticesPerCurve.push_back( numVerts );
+				for( int v = 0; v < numVerts; ++v )
+				{
+					vertices.push_back( m_vertexOffsets[c] + v );
+				}
+
+				const int numVarying = m_curves->numSegments( c ) + 1;
+				for( int v = 0; v < numVarying; ++v )
+				{
+					varying.push_back( m_varyingOffsets[c] + v );
+				}
+			}
+
+			CurvesPrimitivePtr result = new CurvesPrimitive( verticesPerCurveData, m_curves->basis(), m_curves->periodic() );
+
+			PrimitiveVariableAlgos::GatherFunctor uniformFunctor( curveIndices );
+			PrimitiveVariableAlgos::GatherFunctor vertexFunctor( vertices );
+			PrimitiveVariableAlgos::GatherFunctor varyingFunctor( varying );
+
+			for( const auto &pv : m_curves->variables )
+			{
+				PrimitiveVariableAlgos::GatherFunctor *functor = nullptr;
+				switch( pv.second.interpolation )
+				{
+					case PrimitiveVariable::Uniform :
+						functor = &uniformFunctor;
+						break;
+					case PrimitiveVariable::Vertex :
+						functor = &vertexFunctor;
+						break;
+					case PrimitiveVariable::Varying :
+					case PrimitiveVariable::FaceVarying :
+						functor = &varyingFunctor;
+						break;
+					case PrimitiveVariable::Constant :
+					case PrimitiveVariable::Invalid :
+						result->variables[pv.first] = pv.second;
+						continue;
+				}
+
+				functor->setIndices( pv.second.indices.get() );
+				PrimitiveVariableAlgos::IndexedData outputData = dispatch( pv.second.data.get(), *functor );
+				result->variables[pv.first] = PrimitiveVariable( pv.second.interpolation, outputData.data, outputData.indices );
+			}
+
+			return result;
+		}
+
+	private :
+
+		const CurvesPrimitive *m_curves;
+		std::vector<int> m_vertexOffsets;
+		std::vector<int> m_varyingOffsets;
+
+};
+
+} // namespace
+
 std::vector<CurvesPrimitivePtr> IECoreScene::CurvesAlgo::segment( const CurvesPrimitive *curves, const PrimitiveVariable &primitiveVariable, const IECore::Data *segmentValues )
 {
 
@@ -72,9 +182,9 @@ std::vector<CurvesPrimitivePtr> IECoreScene::CurvesAlgo::segment( const CurvesPr
 	}
 
 
-	auto f = CurvesAlgo::deleteCurves;
+	CurvesSegmentBuilder builder( curves );
 
-	IECoreScene::Detail::TaskSegmenter<IECoreScene::CurvesPrimitive, decltype(f) > segmenter( curves, const_cast<IECore::Data*> ( segmentValues ), primitiveVariableName, f );
+	IECoreScene::Detail::TaskSegmenter<IECoreScene::CurvesPrimitive, CurvesSegmentBuilder> segmenter( curves, const_cast<IECore::Data*> ( segmentValues ), primitiveVariableName, builder );
 
 	return dispatch( primitiveVariable.data.get(), segmenter );
 }
@@ -42,6 +42,10 @@
 
 #include "boost/foreach.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_invoke.h"
+
 #include <set>
 using namespace IECore;
 using namespace IECoreScene;
@@ -901,19 +905,39 @@ IECore::PathMatcher LinkedScene::readSet( const SceneInterface::Name &name, bool
 
 	if ( includeDescendantSets )
 	{
-		// todo only copy if we need to
-		IECore::PathMatcher result = m_mainScene->readSet( name );
-
 		const PathMatcher links = runTimeCast<const LinkedScene>( scene( SceneInterface::rootPath ) )->linkLocations();
+		std::vector<SceneInterface::Path> linkPaths;
 		for( PathMatcher::Iterator it = links.begin(); it != links.end(); ++it )
 		{
-			SceneInterface::Path p;
-			path( p );
-			std::string strPath;
-			SceneInterface::pathToString( *it, strPath );
-			IECore::PathMatcher linkedSceneSet = scene( *it, SceneInterface::ThrowIfMissing )->readSet( name );
+			linkPaths.push_back( *it );
+		}
 
-			result.addPaths( linkedSceneSet, *it );
+		// Read the sets from the main scene and each of the linked scenes in parallel,
+		// and then merge them.
+
+		IECore::PathMatcher result;
+		std::vector<IECore::PathMatcher> linkedSceneSets( linkPaths.size() );
+		tbb::parallel_invoke(
+			[&] {
+				result = m_mainScene->readSet( name );
+			},
+			[&] {
+				tbb::parallel_for(
+					tbb::blocked_range<size_t>( 0, linkPaths.size() ),
+					[&]( const tbb::blocked_range<size_t> &range )
+					{
+						for( size_t i = range.begin(); i != range.end(); ++i )
+						{
+							linkedSceneSets[i] = scene( linkPaths[i], SceneInterface::ThrowIfMissing )->readSet( name );
+						}
+					}
+				);
+			}
+		);
+
+		for( size_t i = 0; i < linkPaths.size(); ++i )
+		{
+			result.addPaths( linkedSceneSets[i], linkPaths[i] );
 		}
 		return result;
 	}
@@ -1075,6 +1099,22 @@ PrimitiveVariableMap LinkedScene::readObjectPrimitiveVariables( const std::vecto
 	}
 }
 
+PrimitiveVariableMap LinkedScene::readObjectPrimitiveVariablesRange( const std::vector<InternedString> &primVarNames, double time, size_t offset, size_t count ) const
+{
+	if ( m_linkedScene )
+	{
+		if ( m_timeRemapped )
+		{
+			time = remappedLinkTime( time );
+		}
+		return m_linkedScene->readObjectPrimitiveVariablesRange( primVarNames, time, offset, count );
+	}
+	else
+	{
+		return m_mainScene->readObjectPrimitiveVariablesRange( primVarNames, time, offset, count );
+	}
+}
+
 void LinkedScene::writeObject( const Object *object, double time )
 {
 	if ( m_readOnly )
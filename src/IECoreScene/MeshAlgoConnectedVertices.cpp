@@ -33,6 +33,12 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/private/MeshTopology.h"
+
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
 
 using namespace std;
 using namespace IECore;
@@ -44,44 +50,84 @@ pair<IntVectorDataPtr, IntVectorDataPtr> MeshAlgo::connectedVertices( const Mesh
 	const vector<int> &numVerticesPerFace = mesh->verticesPerFace()->readable();
 	const vector<int> &vertexIds = mesh->vertexIds()->readable();
 
-	vector< set<int> > neighbors( numVertices );
+	// find the face-vertices referencing each vertex, so that the neighbors
+	// of each vertex can be gathered independently and in parallel.
+	ConstMeshTopologyPtr topology = MeshTopology::get( mesh );
+	const vector<int> &faceOffsets = topology->faceVertexOffsets();
+	const vector<int> &faces = topology->faceVertexFaces();
+	const vector<int> &vertexOffsets = topology->vertexFaceVertexOffsets();
+	const vector<int> &vertexFaceVertices = topology->vertexFaceVertices();
 
-	int currentVertOffset = 0;
-	for ( auto &vertsPerFace : numVerticesPerFace )
+	// the neighbors of a vertex are the previous and next vertices of
+	// each face-vertex referencing it, sorted and without duplicates.
+	auto gatherNeighbors = [&]( size_t vertex, vector<int> &neighbors )
 	{
-		for ( int i = 0; i < vertsPerFace; ++i)
+		neighbors.clear();
+		if( vertex + 1 >= vertexOffsets.size() )
 		{
-			const int &faceVert = vertexIds[ currentVertOffset + i ];
-			const int &faceVertNext = vertexIds[ currentVertOffset + ( i + 1 ) % vertsPerFace ];
-			neighbors[ faceVert ].insert( faceVertNext );
-			neighbors[ faceVertNext ].insert( faceVert );
+			// not referenced by the topology
+			return;
 		}
-		currentVertOffset += vertsPerFace;
-	}
 
-	int neighborCount = 0;
-	for ( auto &n : neighbors )
-	{
-		neighborCount += n.size();
-	}
+		for( int i = vertexOffsets[vertex]; i < vertexOffsets[vertex + 1]; ++i )
+		{
+			const int faceVertex = vertexFaceVertices[i];
+			const int face = faces[faceVertex];
+			const int faceOffset = faceOffsets[face];
+			const int vertsPerFace = numVerticesPerFace[face];
+			const int faceVertexIndex = faceVertex - faceOffset;
+			neighbors.push_back( vertexIds[ faceOffset + ( faceVertexIndex + 1 ) % vertsPerFace ] );
+			neighbors.push_back( vertexIds[ faceOffset + ( faceVertexIndex + vertsPerFace - 1 ) % vertsPerFace ] );
+		}
+		sort( neighbors.begin(), neighbors.end() );
+		neighbors.erase( unique( neighbors.begin(), neighbors.end() ), neighbors.end() );
+	};
 
 	IntVectorDataPtr offsets = new IntVectorData();
 	IntVectorDataPtr neighborList = new IntVectorData();
 	vector<int> &offsetsW = offsets->writable();
 	vector<int> &neighborListW = neighborList->writable();
 
-	neighborListW.resize( neighborCount, -1 );
-	offsetsW.resize( neighbors.size(), -1 );
+	offsetsW.resize( numVertices, -1 );
 
-	int ix = 0;
-	for ( size_t i = 0; i < neighbors.size(); ++i )
-	{
-		for ( auto &n : neighbors[ i ] )
+	// count the neighbors of each vertex
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numVertices ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			neighborListW[ ix++ ] = n;
-		}
-		offsetsW[ i ] = ix;
+			vector<int> neighbors;
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				gatherNeighbors( i, neighbors );
+				offsetsW[ i ] = neighbors.size();
+			}
+		},
+		taskGroupContext
+	);
+
+	int neighborCount = 0;
+	for( auto &o : offsetsW )
+	{
+		neighborCount += o;
+		o = neighborCount;
 	}
 
+	// and fill them in
+	neighborListW.resize( neighborCount, -1 );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numVertices ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			vector<int> neighbors;
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				gatherNeighbors( i, neighbors );
+				copy( neighbors.begin(), neighbors.end(), neighborListW.begin() + ( i > 0 ? offsetsW[ i - 1 ] : 0 ) );
+			}
+		},
+		taskGroupContext
+	);
+
 	return pair<IntVectorDataPtr, IntVectorDataPtr>( neighborList, offsets );
 }
@@ -34,6 +34,7 @@
 
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/PolygonIterator.h"
+#include "IECoreScene/private/MeshTopology.h"
 
 #include "IECore/PolygonAlgo.h"
 
@@ -42,6 +43,11 @@
 #include "boost/iterator/zip_iterator.hpp"
 #include "boost/tuple/tuple.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -65,52 +71,65 @@ PrimitiveVariable MeshAlgo::calculateNormals( const MeshPrimitive *mesh, Primiti
 	auto &normals = normalsData->writable();
 
 	const auto &verticesPerFace = mesh->verticesPerFace()->readable();
-	if( interpolation == PrimitiveVariable::Uniform )
-	{
-		normals.reserve( verticesPerFace.size() );
-	}
-	else
-	{
-		normals.resize( points.size(), Imath::V3f( 0 ) );
-	}
-
 	const auto &vertIds = mesh->vertexIds()->readable();
-	const int *vertId = &(vertIds[0]);
-	for( auto numVerts : verticesPerFace )
-	{
-		// calculate the face normal. note that this method is very naive, and doesn't
-		// cope with colinear vertices or concave faces - we could use polygonNormal() from
-		// PolygonAlgo.h to deal with that, but currently we'd prefer to avoid the overhead.
-		const V3f &p0 = points[*vertId];
-		const V3f &p1 = points[*(vertId+1)];
-		const V3f &p2 = points[*(vertId+2)];
+	ConstMeshTopologyPtr topology = MeshTopology::get( mesh );
+	const std::vector<int> &faceOffsets = topology->faceVertexOffsets();
 
-		V3f normal = ( p2 - p1 ).cross( p0 - p1 );
-		normal.normalize();
+	// calculate the face normals in parallel, directly into the result if
+	// we're computing uniform normals.
+	std::vector<V3f> vertexFaceNormals;
+	std::vector<V3f> &faceNormals = interpolation == PrimitiveVariable::Uniform ? normals : vertexFaceNormals;
+	faceNormals.resize( verticesPerFace.size() );
 
-		if( interpolation == PrimitiveVariable::Uniform )
-		{
-			normals.push_back( normal );
-			vertId += numVerts;
-		}
-		else
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, verticesPerFace.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			// accumulate the face normal onto each of the vertices for this face.
-			for( int i=0; i < numVerts; ++i )
+			for( size_t f = range.begin(); f != range.end(); ++f )
 			{
-				normals[*vertId] += normal;
-				++vertId;
+				// calculate the face normal. note that this method is very naive, and doesn't
+				// cope with colinear vertices or concave faces - we could use polygonNormal() from
+				// PolygonAlgo.h to deal with that, but currently we'd prefer to avoid the overhead.
+				const int *vertId = &(vertIds[faceOffsets[f]]);
+				const V3f &p0 = points[*vertId];
+				const V3f &p1 = points[*(vertId+1)];
+				const V3f &p2 = points[*(vertId+2)];
+
+				V3f normal = ( p2 - p1 ).cross( p0 - p1 );
+				normal.normalize();
+				faceNormals[f] = normal;
 			}
-		}
-	}
+		},
+		taskGroupContext
+	);
 
-	// normalize each of the vertex normals
 	if( interpolation == PrimitiveVariable::Vertex )
 	{
-		for( Imath::V3f &n : normals )
-		{
-			n.normalize();
-		}
+		// gather the face normals onto each vertex in parallel. faces are visited
+		// in ascending order, so the results are identical to accumulating them
+		// serially, and no synchronisation is needed.
+		const std::vector<int> &faces = topology->faceVertexFaces();
+		const std::vector<int> &vertexOffsets = topology->vertexFaceVertexOffsets();
+		const std::vector<int> &vertexFaceVertices = topology->vertexFaceVertices();
+
+		normals.resize( points.size(), Imath::V3f( 0 ) );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, std::min( points.size(), vertexOffsets.size() - 1 ) ),
+			[&]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t v = range.begin(); v != range.end(); ++v )
+				{
+					V3f n( 0 );
+					for( int i = vertexOffsets[v]; i < vertexOffsets[v+1]; ++i )
+					{
+						n += faceNormals[faces[vertexFaceVertices[i]]];
+					}
+					normals[v] = n.normalize();
+				}
+			},
+			taskGroupContext
+		);
 	}
 
 	return PrimitiveVariable( interpolation, normalsData );
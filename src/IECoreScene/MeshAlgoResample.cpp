@@ -34,12 +34,16 @@
 
 #include "IECoreScene/FaceVaryingPromotionOp.h"
 #include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/private/MeshTopology.h"
 #include "IECoreScene/private/PrimitiveAlgoUtils.h"
 #include "IECoreScene/private/PrimitiveVariableAlgos.h"
 
 #include "IECore/DataAlgo.h"
 #include "IECore/DespatchTypedData.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -108,28 +112,31 @@ struct MeshUniformToVertex
 		typename From::ValueType &trg = result->writable();
 		const typename From::ValueType &src = data->readable();
 
+		// gather the values of the faces using each vertex
+		ConstMeshTopologyPtr topology = MeshTopology::get( m_mesh );
+		const std::vector<int> &faces = topology->faceVertexFaces();
+		const std::vector<int> &offsets = topology->vertexFaceVertexOffsets();
+		const std::vector<int> &faceVertices = topology->vertexFaceVertices();
+
 		size_t numVerts = m_mesh->variableSize( PrimitiveVariable::Vertex );
-		std::vector<int> count( numVerts, 0 );
 		trg.resize( numVerts, typename From::ValueType::value_type( 0.0f ) );
 
-		typename From::ValueType::const_iterator srcIt = src.begin();
-		std::vector<int>::const_iterator vId = m_mesh->vertexIds()->readable().begin();
-		const std::vector<int> &verticesPerFace = m_mesh->verticesPerFace()->readable();
-		for( std::vector<int>::const_iterator it = verticesPerFace.begin(); it < verticesPerFace.end(); ++it, ++srcIt )
-		{
-			for( int j = 0; j < *it; ++j, ++vId )
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numVerts ),
+			[&]( const tbb::blocked_range<size_t> &range )
 			{
-				trg[ *vId ] += *srcIt;
-				++count[ *vId ];
-			}
-		}
-
-		std::vector<int>::const_iterator cIt = count.begin();
-		typename From::ValueType::iterator trgIt = trg.begin(), trgEnd = trg.end();
-		for( trgIt = trg.begin(); trgIt != trgEnd ; ++trgIt, ++cIt )
-		{
-			*trgIt /= *cIt;
-		}
+				for( size_t v = range.begin(); v != range.end(); ++v )
+				{
+					for( int i = offsets[v]; i < offsets[v+1]; ++i )
+					{
+						trg[v] += src[ faces[ faceVertices[i] ] ];
+					}
+					trg[v] /= offsets[v+1] - offsets[v];
+				}
+			},
+			taskGroupContext
+		);
 
 		IECoreScene::PrimitiveVariableAlgos::GeometricInterpretationCopier<From> copier;
 		copier( data, result.get() );
@@ -154,26 +161,30 @@ struct MeshFaceVaryingToVertex
 		typename From::ValueType &trg = result->writable();
 		const typename From::ValueType &src = data->readable();
 
+		// gather the values of the face-vertices using each vertex
+		ConstMeshTopologyPtr topology = MeshTopology::get( m_mesh );
+		const std::vector<int> &offsets = topology->vertexFaceVertexOffsets();
+		const std::vector<int> &faceVertices = topology->vertexFaceVertices();
+
 		size_t numVerts = m_mesh->variableSize( PrimitiveVariable::Vertex );
-		std::vector<int> count( numVerts, 0 );
 		trg.resize( numVerts, typename From::ValueType::value_type( 0.0f ) );
 
-		const std::vector<int>& vertexIds = m_mesh->vertexIds()->readable();
-		std::vector<int>::const_iterator vertexIdIt = vertexIds.begin();
-		typename From::ValueType::const_iterator srcIt = src.begin(), srcEnd = src.end();
-
-		for( ; srcIt != srcEnd ; ++srcIt, ++vertexIdIt )
-		{
-			trg[ *vertexIdIt ] += *srcIt;
-			++count[ *vertexIdIt ];
-		}
-
-		std::vector<int>::const_iterator cIt = count.begin();
-		typename From::ValueType::iterator trgIt = trg.begin(), trgEnd = trg.end();
-		for( trgIt = trg.begin(); trgIt != trgEnd ; ++trgIt, ++cIt )
-		{
-			*trgIt /= *cIt;
-		}
+		tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, numVerts ),
+			[&]( const tbb::blocked_range<size_t> &range )
+			{
+				for( size_t v = range.begin(); v != range.end(); ++v )
+				{
+					for( int i = offsets[v]; i < offsets[v+1]; ++i )
+					{
+						trg[v] += src[ faceVertices[i] ];
+					}
+					trg[v] /= offsets[v+1] - offsets[v];
+				}
+			},
+			taskGroupContext
+		);
 
 		IECoreScene::PrimitiveVariableAlgos::GeometricInterpretationCopier<From> copier;
 		copier( data, result.get() );
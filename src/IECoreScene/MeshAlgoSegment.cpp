@@ -40,12 +40,222 @@
 
 #include "IECoreScene/MeshAlgo.h"
 #include "IECoreScene/private/PrimitiveAlgoUtils.h"
+#include "IECoreScene/private/PrimitiveVariableAlgos.h"
 
+#include <algorithm>
 
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
 
+namespace
+{
+
+/// Builds the mesh containing a subset of the faces of another mesh. Per-face
+/// offsets are computed once up front, so that building each subset only costs
+/// time proportional to the size of that subset.
+class MeshSegmentBuilder
+{
+
+	public :
+
+		MeshSegmentBuilder( const MeshPrimitive *mesh )
+			:	m_mesh( mesh )
+		{
+			for( const auto &pv : mesh->variables )
+			{
+				if( !mesh->isPrimitiveVariableValid( pv.second ) )
+				{
+					throw InvalidArgumentException(
+						boost::str( boost::format( "MeshAlgo::segment cannot process invalid primitive variable \"%s\"" ) % pv.first )
+					);
+				}
+			}
+
+			const std::vector<int> &verticesPerFace = mesh->verticesPerFace()->readable();
+			m_faceOffsets.reserve( verticesPerFace.size() );
+			int offset = 0;
+			for( int numVerts : verticesPerFace )
+			{
+				m_faceOffsets.push_back( offset );
+				offset += numVerts;
+			}
+		}
+
+		MeshPrimitivePtr operator()( const std::vector<int> &faces ) const
+		{
+			const std::vector<int> &inVerticesPerFace = m_mesh->verticesPerFace()->readable();
+			const std::vector<int> &inVertexIds = m_mesh->vertexIds()->readable();
+
+			IntVectorDataPtr verticesPerFaceData = new IntVectorData;
+			std::vector<int> &verticesPerFace = verticesPerFaceData->writable();
+			verticesPerFace.reserve( faces.size() );
+
+			std::vector<int> faceVertices;
+			for( int f : faces )
+			{
+				const int numVerts = inVerticesPerFace[f];
+				verticesPerFace.push_back( numVerts );
+				for( int v = 0; v < numVerts; ++v )
+				{
+					faceVertices.push_back( m_faceOffsets[f] + v );
+				}
+			}
+
+			// Vertices are kept in their original order, matching `deleteFaces()`.
+
+			std::vector<int> vertices;
+			vertices.reserve( faceVertices.size() );
+			for( int i : faceVertices )
+			{
+				vertices.push_back( inVertexIds[i] );
+			}
+			std::sort( vertices.begin(), vertices.end() );
+			vertices.erase( std::unique( vertices.begin(), vertices.end() ), vertices.end() );
+
+			IntVectorDataPtr vertexIdsData = new IntVectorData;
+			std::vector<int> &vertexIds = vertexIdsData->writable();
+			vertexIds.reserve( faceVertices.size() );
+			for( int i : faceVertices )
+			{
+				vertexIds.push_back( remap( vertices, inVertexIds[i] ) );
+			}
+
+			MeshPrimitivePtr result = new MeshPrimitive( verticesPerFaceData, vertexIdsData, m_mesh->interpolation() );
+
+			segmentCorners( result.get(), vertices );
+			segmentCreases( result.get(), vertices );
+
+			PrimitiveVariableAlgos::GatherFunctor uniformFunctor( faces );
+			PrimitiveVariableAlgos::GatherFunctor vertexFunctor( vertices );
+			PrimitiveVariableAlgos::GatherFunctor faceVaryingFunctor( faceVertices );
+
+			for( const auto &pv : m_mesh->variables )
+			{
+				PrimitiveVariableAlgos::GatherFunctor *functor = nullptr;
+				switch( pv.second.interpolation )
+				{
+					case PrimitiveVariable::Uniform :
+						functor = &uniformFunctor;
+						break;
+					case PrimitiveVariable::Vertex :
+					case PrimitiveVariable::Varying :
+						functor = &vertexFunctor;
+						break;
+					case PrimitiveVariable::FaceVarying :
+						functor = &faceVaryingFunctor;
+						break;
+					case PrimitiveVariable::Constant :
+					case PrimitiveVariable::Invalid :
+						result->variables[pv.first] = pv.second;
+						continue;
+				}
+
+				functor->setIndices( pv.second.indices.get() );
+				PrimitiveVariableAlgos::IndexedData outputData = dispatch( pv.second.data.get(), *functor );
+				result->variables[pv.first] = PrimitiveVariable( pv.second.interpolation, outputData.data, outputData.indices );
+			}
+
+			return result;
+		}
+
+	private :
+
+		// Returns the index of `vertex` in the sorted `vertices`, or -1 if it
+		// is not present.
+		static int remap( const std::vector<int> &vertices, int vertex )
+		{
+			auto it = std::lower_bound( vertices.begin(), vertices.end(), vertex );
+			if( it == vertices.end() || *it != vertex )
+			{
+				return -1;
+			}
+			return it - vertices.begin();
+		}
+
+		void segmentCorners( MeshPrimitive *out, const std::vector<int> &vertices ) const
+		{
+			const auto &ids = m_mesh->cornerIds()->readable();
+			if( ids.empty() )
+			{
+				return;
+			}
+
+			const auto &sharpnesses = m_mesh->cornerSharpnesses()->readable();
+
+			IntVectorDataPtr outIdData = new IntVectorData;
+			auto &outIds = outIdData->writable();
+
+			FloatVectorDataPtr outSharpnessData = new FloatVectorData;
+			auto &outSharpnesses = outSharpnessData->writable();
+
+			for( size_t i = 0; i < ids.size(); ++i )
+			{
+				int id = remap( vertices, ids[i] );
+				if( id != -1 )
+				{
+					outIds.push_back( id );
+					outSharpnesses.push_back( sharpnesses[i] );
+				}
+			}
+
+			out->setCorners( outIdData.get(), outSharpnessData.get() );
+		}
+
+		void segmentCreases( MeshPrimitive *out, const std::vector<int> &vertices ) const
+		{
+			const auto &lengths = m_mesh->creaseLengths()->readable();
+			if( lengths.empty() )
+			{
+				return;
+			}
+
+			const auto &ids = m_mesh->creaseIds()->readable();
+			const auto &sharpnesses = m_mesh->creaseSharpnesses()->readable();
+
+			IntVectorDataPtr outLengthData = new IntVectorData;
+			auto &outLengths = outLengthData->writable();
+
+			IntVectorDataPtr outIdData = new IntVectorData;
+			auto &outIds = outIdData->writable();
+
+			FloatVectorDataPtr outSharpnessData = new FloatVectorData;
+			auto &outSharpnesses = outSharpnessData->writable();
+
+			int creaseIdOffset = 0;
+			for( size_t i = 0; i < lengths.size(); ++i )
+			{
+				int outLength = 0;
+				for( int j = 0; j < lengths[i]; ++j )
+				{
+					// As in `deleteFaces()`, this may keep creases for edges
+					// whose faces are not part of the segment.
+					int id = remap( vertices, ids[creaseIdOffset + j] );
+					if( id != -1 )
+					{
+						outIds.push_back( id );
+						++outLength;
+					}
+				}
+
+				if( outLength > 0 )
+				{
+					outLengths.push_back( outLength );
+					outSharpnesses.push_back( sharpnesses[i] );
+				}
+
+				creaseIdOffset += lengths[i];
+			}
+
+			out->setCreases( outLengthData.get(), outIdData.get(), outSharpnessData.get() );
+		}
+
+		const MeshPrimitive *m_mesh;
+		std::vector<int> m_faceOffsets;
+
+};
+
+} // namespace
 
 std::vector<MeshPrimitivePtr> IECoreScene::MeshAlgo::segment( const MeshPrimitive *mesh, const PrimitiveVariable &primitiveVariable, const IECore::Data *segmentValues )
 {
@@ -71,9 +281,9 @@ std::vector<MeshPrimitivePtr> IECoreScene::MeshAlgo::segment( const MeshPrimitiv
 		throw IECore::InvalidArgumentException( "IECoreScene::MeshAlgo::segment : Primitive variable not found on Mesh Primitive " );
 	}
 
-	auto f = MeshAlgo::deleteFaces;
+	MeshSegmentBuilder builder( mesh );
 
-	IECoreScene::Detail::TaskSegmenter<IECoreScene::MeshPrimitive, decltype(f) > taskSegmenter( mesh, const_cast<IECore::Data*> (segmentValues), primitiveVariableName, f );
+	IECoreScene::Detail::TaskSegmenter<IECoreScene::MeshPrimitive, MeshSegmentBuilder> taskSegmenter( mesh, const_cast<IECore::Data*> (segmentValues), primitiveVariableName, builder );
 
 	return dispatch( primitiveVariable.data.get(), taskSegmenter );
 }
@@ -33,8 +33,14 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/private/MeshTopology.h"
+#include "IECoreScene/private/PrimitiveAlgoUtils.h"
+
 #include "IECore/DataAlgo.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace Imath;
 using namespace IECore;
 using namespace IECoreScene;
@@ -163,87 +169,115 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 
 	std::vector<V3f> uTangents( numUVs, V3f( 0 ) );
 	std::vector<V3f> vTangents( numUVs, V3f( 0 ) );
-	std::vector<V3f> normals( numUVs, V3f( 0 ) );
 
-	size_t vertStart = 0;
-	for( size_t faceIndex = 0; faceIndex < vertsPerFace.size(); faceIndex++ )
+	ConstMeshTopologyPtr topology = MeshTopology::get( mesh );
+	const std::vector<int> &faceOffsets = topology->faceVertexOffsets();
+	const std::vector<int> &faces = topology->faceVertexFaces();
+
+	// find the face-vertices sharing each uv, so that we can gather
+	// rather than accumulate, allowing each uv to be processed in parallel.
+	// for unindexed vertex uvs this is just the vertex adjacency of the mesh.
+	std::vector<int> invertedUVOffsets;
+	std::vector<int> invertedUVFaceVertices;
+	const std::vector<int> *uvOffsets = &invertedUVOffsets;
+	const std::vector<int> *uvFaceVertices = &invertedUVFaceVertices;
+	if( uvIndices == &vertIds && numUVs + 1 == topology->vertexFaceVertexOffsets().size() )
 	{
-		for ( size_t faceVertIndex = 0; faceVertIndex < (size_t)vertsPerFace[faceIndex]; ++faceVertIndex)
-		{
-			// indices into the facevarying data for this *triangle*
-			size_t fvi0 = vertStart + faceVertIndex;
-			size_t fvi1 = vertStart + (faceVertIndex + 1) % vertsPerFace[faceIndex];
-			size_t fvi2 = vertStart + (faceVertIndex + 2) % vertsPerFace[faceIndex];
-
-			assert( fvi0 < vertIds.size() );
-			assert( fvi0 < uvIndexedView.size() );
-
-			assert( fvi1 < vertIds.size() );
-			assert( fvi1 < uvIndexedView.size() );
-
-			assert( fvi2 < vertIds.size() );
-			assert( fvi2 < uvIndexedView.size() );
-
-			// positions for each vertex of this face
-			const V3f &p0 = points[vertIds[fvi0]];
-			const V3f &p1 = points[vertIds[fvi1]];
-			const V3f &p2 = points[vertIds[fvi2]];
-
-			// uv coordinates for each vertex of this face
-			const V2f &uv0 = uvIndexedView[fvi0];
-			const V2f &uv1 = uvIndexedView[fvi1];
-			const V2f &uv2 = uvIndexedView[fvi2];
-
-			Basis basis;
-			calculcateBasis( p0, p1, p2, uv0, uv1, uv2, basis );
-
-			// and accumulate them into the computation so far
-			uTangents[uvIndexedView.index(fvi0)] += basis.tangent;
-			vTangents[uvIndexedView.index(fvi0)] += basis.bitangent;
-			normals[uvIndexedView.index(fvi0)] += basis.normal;
-		}
-
-		vertStart += vertsPerFace[faceIndex];
+		uvOffsets = &topology->vertexFaceVertexOffsets();
+		uvFaceVertices = &topology->vertexFaceVertices();
 	}
-
-	// normalize and orthogonalize everything
-	for( size_t i = 0; i < uTangents.size(); i++ )
+	else if( uvIndices )
 	{
-		normals[i].normalize();
-
-		uTangents[i].normalize();
-		vTangents[i].normalize();
-
-		// Make uTangent/vTangent orthogonal to normal
-		uTangents[i] -= normals[i] * uTangents[i].dot( normals[i] );
-		vTangents[i] -= normals[i] * vTangents[i].dot( normals[i] );
-
-		uTangents[i].normalize();
-		vTangents[i].normalize();
-
-		if( orthoTangents )
-		{
-			vTangents[i] -= uTangents[i] * vTangents[i].dot( uTangents[i] );
-			vTangents[i].normalize();
-		}
+		IECoreScene::Detail::invertIndices( *uvIndices, numUVs, invertedUVOffsets, invertedUVFaceVertices );
+	}
 
-		// Ensure we have set of basis vectors (n, uT, vT) with the correct handedness.
-		if ( !leftHanded )
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, numUVs ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			if( uTangents[i].cross( vTangents[i] ).dot( normals[i] ) < 0.0f )
+			for( size_t i = range.begin(); i != range.end(); ++i )
 			{
-				uTangents[i] *= -1.0f;
+				V3f normal( 0 );
+
+				const size_t begin = uvIndices ? (*uvOffsets)[i] : i;
+				const size_t end = uvIndices ? (*uvOffsets)[i+1] : std::min( i + 1, vertIds.size() );
+				for( size_t j = begin; j < end; ++j )
+				{
+					// indices into the facevarying data for this *triangle*
+					const size_t fvi0 = uvIndices ? (*uvFaceVertices)[j] : j;
+					const int face = faces[fvi0];
+					const size_t vertStart = faceOffsets[face];
+					const size_t faceVertIndex = fvi0 - vertStart;
+					const size_t fvi1 = vertStart + (faceVertIndex + 1) % vertsPerFace[face];
+					const size_t fvi2 = vertStart + (faceVertIndex + 2) % vertsPerFace[face];
+
+					assert( fvi0 < vertIds.size() );
+					assert( fvi0 < uvIndexedView.size() );
+
+					assert( fvi1 < vertIds.size() );
+					assert( fvi1 < uvIndexedView.size() );
+
+					assert( fvi2 < vertIds.size() );
+					assert( fvi2 < uvIndexedView.size() );
+
+					// positions for each vertex of this face
+					const V3f &p0 = points[vertIds[fvi0]];
+					const V3f &p1 = points[vertIds[fvi1]];
+					const V3f &p2 = points[vertIds[fvi2]];
+
+					// uv coordinates for each vertex of this face
+					const V2f &uv0 = uvIndexedView[fvi0];
+					const V2f &uv1 = uvIndexedView[fvi1];
+					const V2f &uv2 = uvIndexedView[fvi2];
+
+					Basis basis;
+					calculcateBasis( p0, p1, p2, uv0, uv1, uv2, basis );
+
+					// and accumulate them into the computation so far
+					uTangents[i] += basis.tangent;
+					vTangents[i] += basis.bitangent;
+					normal += basis.normal;
+				}
+
+				// normalize and orthogonalize everything
+				normal.normalize();
+
+				uTangents[i].normalize();
+				vTangents[i].normalize();
+
+				// Make uTangent/vTangent orthogonal to normal
+				uTangents[i] -= normal * uTangents[i].dot( normal );
+				vTangents[i] -= normal * vTangents[i].dot( normal );
+
+				uTangents[i].normalize();
+				vTangents[i].normalize();
+
+				if( orthoTangents )
+				{
+					vTangents[i] -= uTangents[i] * vTangents[i].dot( uTangents[i] );
+					vTangents[i].normalize();
+				}
+
+				// Ensure we have set of basis vectors (n, uT, vT) with the correct handedness.
+				if ( !leftHanded )
+				{
+					if( uTangents[i].cross( vTangents[i] ).dot( normal ) < 0.0f )
+					{
+						uTangents[i] *= -1.0f;
+					}
+				}
+				else
+				{
+					if( uTangents[i].cross( vTangents[i] ).dot( normal ) > 0.0f )
+					{
+						uTangents[i] *= -1.0f;
+					}
+				}
 			}
-		}
-		else
-		{
-			if( uTangents[i].cross( vTangents[i] ).dot( normals[i] ) > 0.0f )
-			{
-				uTangents[i] *= -1.0f;
-			}
-		}
-
-	}
+		},
+		taskGroupContext
+	);
 
 	// convert the tangents back to facevarying data and add that to the mesh
 	V3fVectorDataPtr fvUD = new V3fVectorData( uTangents );
@@ -309,37 +343,58 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 
 	// calculate centroids
 	// TODO: generalize this to MeshAlgo::calculateCentroid
-	size_t vertStart = 0;
+	ConstMeshTopologyPtr topology = MeshTopology::get( mesh );
+	const std::vector<int> &faceOffsets = topology->faceVertexOffsets();
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, vertsPerFace.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			for( size_t faceIndex = range.begin(); faceIndex != range.end(); ++faceIndex )
+			{
+				for ( size_t faceVertIndex = 0; faceVertIndex < (size_t)vertsPerFace[faceIndex]; ++faceVertIndex)
+				{
+					centroids[faceIndex] += points[vertIds[faceOffsets[faceIndex] + faceVertIndex]];
+				}
+				centroids[faceIndex] /= vertsPerFace[faceIndex];
+			}
+		},
+		taskGroupContext
+	);
+
+	// each vertex uses the centroid of the last face it belongs to
 	for( size_t faceIndex = 0; faceIndex < vertsPerFace.size(); ++faceIndex )
 	{
 		for ( size_t faceVertIndex = 0; faceVertIndex < (size_t)vertsPerFace[faceIndex]; ++faceVertIndex)
 		{
-			size_t fvi0 = vertStart + faceVertIndex;
-			centroids[faceIndex] += points[vertIds[fvi0]];
-			faceIdPerVert[vertIds[fvi0]] = faceIndex;
+			faceIdPerVert[vertIds[faceOffsets[faceIndex] + faceVertIndex]] = faceIndex;
 		}
-		centroids[faceIndex] /= vertsPerFace[faceIndex];
-
-		vertStart += vertsPerFace[faceIndex];
 	}
 
 	// calculate per vertex tangents from centroids
-	for ( size_t i = 0; i < (size_t)points.size(); ++i )
-	{
-		tangents[i] = ( centroids[faceIdPerVert[i]] - points[i] ).normalized();
-		biTangents[i] = normals[i].cross( tangents[i] ).normalized();
-		if ( orthoTangents )
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, points.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			if ( leftHanded )
-			{
-				tangents[i] = normals[i].cross( biTangents[i] ).normalized();
-			}
-			else
+			for( size_t i = range.begin(); i != range.end(); ++i )
 			{
-				tangents[i] = biTangents[i].cross( normals[i] ).normalized();
+				tangents[i] = ( centroids[faceIdPerVert[i]] - points[i] ).normalized();
+				biTangents[i] = normals[i].cross( tangents[i] ).normalized();
+				if ( orthoTangents )
+				{
+					if ( leftHanded )
+					{
+						tangents[i] = normals[i].cross( biTangents[i] ).normalized();
+					}
+					else
+					{
+						tangents[i] = biTangents[i].cross( normals[i] ).normalized();
+					}
+				}
 			}
-		}
-	}
+		},
+		taskGroupContext
+	);
 
 	// construct the primvars
 	V3fVectorDataPtr tangentsDataPtr = new V3fVectorData( tangents );
@@ -396,24 +451,32 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 	auto &offsetsR = offsets->readable();
 
 	// calculate tangents from first neighbor and biTangents as orthogonal vectors
-	for ( unsigned int i = 0; i < points.size(); ++i )
-	{
-		int firstNeighborIndex = i > 0 ? offsetsR[i - 1] : 0;
-		const V3f &firstNeighbor = points[neighborListR[firstNeighborIndex]];
-		tangents[i] = ( firstNeighbor - points[i] ).normalized();
-		biTangents[i] = normals[i].cross( tangents[i] ).normalized();
-		if ( orthoTangents )
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, points.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			if ( leftHanded )
+			for( size_t i = range.begin(); i != range.end(); ++i )
 			{
-				tangents[i] = normals[i].cross( biTangents[i] ).normalized();
+				int firstNeighborIndex = i > 0 ? offsetsR[i - 1] : 0;
+				const V3f &firstNeighbor = points[neighborListR[firstNeighborIndex]];
+				tangents[i] = ( firstNeighbor - points[i] ).normalized();
+				biTangents[i] = normals[i].cross( tangents[i] ).normalized();
+				if ( orthoTangents )
+				{
+					if ( leftHanded )
+					{
+						tangents[i] = normals[i].cross( biTangents[i] ).normalized();
+					}
+					else
+					{
+						tangents[i] = biTangents[i].cross( normals[i] ).normalized();
+					}
+				}
 			}
-			else
-			{
-				tangents[i] = biTangents[i].cross( normals[i] ).normalized();
-			}
-		}
-	}
+		},
+		taskGroupContext
+	);
 
 	// construct the primvars
 	V3fVectorDataPtr tangentsDataPtr = new V3fVectorData( tangents );
@@ -470,27 +533,35 @@ std::pair<PrimitiveVariable, PrimitiveVariable> IECoreScene::MeshAlgo::calculate
 	auto &offsetsR = offsets->readable();
 
 	// calculate tangents from first neighbor and biTangents as orthogonal vectors
-	for ( unsigned int i = 0; i < points.size(); ++i )
-	{
-		int firstNeighborIndex = i > 0 ? offsetsR[i - 1] : 0;
-		int lastIndex =  offsetsR[i] > firstNeighborIndex ? firstNeighborIndex + 1 : firstNeighborIndex;  // if we only have one neighbor use the edge, else the next neighbor
-
-		const V3f &firstNeighbor = points[neighborListR[firstNeighborIndex]];
-		const V3f &secondNeighbor = points[neighborListR[lastIndex]];
-		tangents[i] = ( ( firstNeighbor + (secondNeighbor - firstNeighbor ) * 0.5 ) - points[i] ).normalized();
-		biTangents[i] = normals[i].cross( tangents[i] ).normalized();
-		if ( orthoTangents )
+	tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, points.size() ),
+		[&]( const tbb::blocked_range<size_t> &range )
 		{
-			if ( leftHanded )
-			{
-				tangents[i] = normals[i].cross( biTangents[i] ).normalized();
-			}
-			else
+			for( size_t i = range.begin(); i != range.end(); ++i )
 			{
-				tangents[i] = biTangents[i].cross( normals[i] ).normalized();
+				int firstNeighborIndex = i > 0 ? offsetsR[i - 1] : 0;
+				int lastIndex =  offsetsR[i] > firstNeighborIndex ? firstNeighborIndex + 1 : firstNeighborIndex;  // if we only have one neighbor use the edge, else the next neighbor
+
+				const V3f &firstNeighbor = points[neighborListR[firstNeighborIndex]];
+				const V3f &secondNeighbor = points[neighborListR[lastIndex]];
+				tangents[i] = ( ( firstNeighbor + (secondNeighbor - firstNeighbor ) * 0.5 ) - points[i] ).normalized();
+				biTangents[i] = normals[i].cross( tangents[i] ).normalized();
+				if ( orthoTangents )
+				{
+					if ( leftHanded )
+					{
+						tangents[i] = normals[i].cross( biTangents[i] ).normalized();
+					}
+					else
+					{
+						tangents[i] = biTangents[i].cross( normals[i] ).normalized();
+					}
+				}
 			}
-		}
-	}
+		},
+		taskGroupContext
+	);
 
 	// construct the primvars
 	V3fVectorDataPtr tangentsDataPtr = new V3fVectorData( tangents );
@@ -33,6 +33,7 @@
 //////////////////////////////////////////////////////////////////////////
 
 #include "IECoreScene/MeshAlgo.h"
+#include "IECoreScene/private/MeshTopology.h"
 
 #include "IECore/DataAlgo.h"
 #include "IECore/DespatchTypedData.h"
@@ -117,6 +118,16 @@ struct TriangulateFn
 
 		const typename T::ValueType &pReadable = p->readable();
 
+		if( !m_throwExceptions )
+		{
+			// Without the validity checks, the triangulation depends only
+			// on the topology, so can be shared between meshes.
+			ConstMeshTopologyPtr topology = MeshTopology::get( m_mesh );
+			m_mesh->setTopologyUnchecked( topology->triangleVerticesPerFace(), topology->triangleVertexIds(), pReadable.size(), m_mesh->interpolation() );
+			remapPrimitiveVariables( topology->triangleFaceVertices(), topology->triangleFaces() );
+			return;
+		}
+
 		MeshPrimitivePtr meshCopy = m_mesh->copy();
 
 		ConstIntVectorDataPtr verticesPerFace = m_mesh->verticesPerFace();
@@ -268,8 +279,13 @@ struct TriangulateFn
 
 		m_mesh->setTopologyUnchecked( newVerticesPerFace, newVertexIds, pReadable.size(), m_mesh->interpolation() );
 
-		/// Rebuild all the facevarying primvars, using the list of indices into the old data we created above.
 		assert( faceVaryingIndices.size() == newVertexIds->readable().size() );
+		remapPrimitiveVariables( faceVaryingIndices, uniformIndices );
+	}
+
+	/// Rebuild all the facevarying and uniform primvars, using lists of indices into the old data.
+	void remapPrimitiveVariables( const std::vector<int> &faceVaryingIndices, const std::vector<int> &uniformIndices )
+	{
 		TriangleDataRemap varyingRemap( faceVaryingIndices );
 		TriangleDataRemap uniformRemap( uniformIndices );
 		for( PrimitiveVariableMap::iterator it = m_mesh->variables.begin(); it != m_mesh->variables.end(); ++it )
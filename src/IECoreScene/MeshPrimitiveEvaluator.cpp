@@ -41,6 +41,7 @@
 #include "IECore/Export.h"
 #include "IECore/SimpleTypedData.h"
 #include "IECore/TriangleAlgo.h"
+#include "IECore/VectorTypedData.h"
 
 IECORE_PUSH_DEFAULT_VISIBILITY
 #include "OpenEXR/ImathMatrix.h"
@@ -49,7 +50,15 @@ IECORE_POP_DEFAULT_VISIBILITY
 #include "OpenEXR/ImathBoxAlgo.h"
 #include "OpenEXR/ImathLineAlgo.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/cache_aligned_allocator.h"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_invoke.h"
+
+#include <algorithm>
 #include <cassert>
+#include <cstdint>
+#include <memory>
 
 using namespace IECore;
 using namespace IECoreScene;
@@ -59,6 +68,88 @@ IE_CORE_DEFINERUNTIMETYPED( MeshPrimitiveEvaluator );
 
 static PrimitiveEvaluator::Description< MeshPrimitiveEvaluator > g_registraar = PrimitiveEvaluator::Description< MeshPrimitiveEvaluator >();
 
+namespace
+{
+
+// Runs `query( index, result )` in parallel for each index in the range
+// [0, size), gathering the results into arrays.
+template<typename Query>
+CompoundDataPtr batchQuery( size_t size, bool haveUVs, Query &&query )
+{
+	IntVectorDataPtr triangleIndexData = new IntVectorData;
+	std::vector<int> &triangleIndices = triangleIndexData->writable();
+	triangleIndices.resize( size );
+
+	V3fVectorDataPtr barycentricData = new V3fVectorData;
+	std::vector<V3f> &barycentrics = barycentricData->writable();
+	barycentrics.resize( size );
+
+	V3fVectorDataPtr pData = new V3fVectorData( std::vector<V3f>(), GeometricData::Point );
+	std::vector<V3f> &points = pData->writable();
+	points.resize( size );
+
+	V3fVectorDataPtr nData = new V3fVectorData( std::vector<V3f>(), GeometricData::Normal );
+	std::vector<V3f> &normals = nData->writable();
+	normals.resize( size );
+
+	V2fVectorDataPtr uvData = nullptr;
+	std::vector<V2f> *uvs = nullptr;
+	if( haveUVs )
+	{
+		uvData = new V2fVectorData( std::vector<V2f>(), GeometricData::UV );
+		uvs = &uvData->writable();
+		uvs->resize( size );
+	}
+
+	tbb::parallel_for(
+		tbb::blocked_range<size_t>( 0, size ),
+		[&]( const tbb::blocked_range<size_t> &range )
+		{
+			MeshPrimitiveEvaluator::Result result;
+			for( size_t i = range.begin(); i != range.end(); ++i )
+			{
+				if( query( i, &result ) )
+				{
+					triangleIndices[i] = result.triangleIndex();
+					barycentrics[i] = result.barycentricCoordinates();
+					points[i] = result.point();
+					normals[i] = result.normal();
+					if( uvs )
+					{
+						(*uvs)[i] = result.uv();
+					}
+				}
+				else
+				{
+					triangleIndices[i] = -1;
+					barycentrics[i] = V3f( 0 );
+					points[i] = V3f( 0 );
+					normals[i] = V3f( 0 );
+					if( uvs )
+					{
+						(*uvs)[i] = V2f( 0 );
+					}
+				}
+			}
+		}
+	);
+
+	CompoundDataPtr resultData = new CompoundData;
+	CompoundDataMap &results = resultData->writable();
+	results["triangleIndex"] = triangleIndexData;
+	results["barycentricCoordinates"] = barycentricData;
+	results["P"] = pData;
+	results["N"] = nData;
+	if( uvData )
+	{
+		results["uv"] = uvData;
+	}
+
+	return resultData;
+}
+
+} // namespace
+
 MeshPrimitiveEvaluator::Result::Result()
 {
 }
@@ -211,7 +302,320 @@ const V3i &MeshPrimitiveEvaluator::Result::vertexIds() const
 	return m_vertexIds;
 }
 
-MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh ) : m_uvTree(nullptr), m_haveMassProperties( false ), m_haveSurfaceArea( false ), m_haveAverageNormals( false )
+//////////////////////////////////////////////////////////////////////////
+// BVH
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+const size_t g_bvhNumBins = 16;
+const size_t g_bvhMaxLeafSize = 8;
+// Cost of traversing a node, relative to the cost of testing a triangle.
+const float g_bvhTraversalCost = 1.0f;
+// Ranges larger than this are split in parallel.
+const size_t g_bvhParallelThreshold = 4096;
+// Beyond this depth we use median splits, which halve the number of
+// triangles at each level and so keep the tree shallow.
+const size_t g_bvhMaxSAHDepth = 64;
+// Nodes at this depth are always leaves. The traversals use fixed size
+// stacks, which hold at most one entry per level plus the root.
+const size_t g_bvhMaxDepth = 120;
+const size_t g_bvhMaxStackSize = 128;
+static_assert( g_bvhMaxDepth + 1 <= g_bvhMaxStackSize, "BVH traversal stack too small for maximum depth" );
+// Median splits reduce any range of 32 bit indices to a single triangle within
+// 32 levels, so the depth cap never forces large leaves.
+static_assert( g_bvhMaxSAHDepth + 32 < g_bvhMaxDepth, "BVH maximum depth too small for median splits of 32 bit indices" );
+
+float boxSurfaceArea( const Box3f &b )
+{
+	if( b.isEmpty() )
+	{
+		return 0.0f;
+	}
+	const V3f s = b.size();
+	return 2.0f * ( s.x * s.y + s.y * s.z + s.z * s.x );
+}
+
+size_t bvhBin( float centroid, float min, float scale )
+{
+	return std::min( g_bvhNumBins - 1, (size_t)std::max( 0.0f, ( centroid - min ) * scale ) );
+}
+
+// Slab test, returning the distance along the ray at which it enters the box.
+bool rayBoxIntersection( const Box3f &box, const V3f &origin, const V3f &inverseDirection, float maxDistance, float &distance )
+{
+	float tNear = 0.0f;
+	float tFar = maxDistance;
+	for( int axis = 0; axis < 3; ++axis )
+	{
+		float t0 = ( box.min[axis] - origin[axis] ) * inverseDirection[axis];
+		float t1 = ( box.max[axis] - origin[axis] ) * inverseDirection[axis];
+		if( t0 > t1 )
+		{
+			std::swap( t0, t1 );
+		}
+		// Be conservative, so that rounding error doesn't cause us to miss
+		// triangles lying on the boundaries of the box.
+		t1 *= 1.0f + 6.0f * limits<float>::epsilon();
+		tNear = t0 > tNear ? t0 : tNear;
+		tFar = t1 < tFar ? t1 : tFar;
+		if( tNear > tFar )
+		{
+			return false;
+		}
+	}
+	distance = tNear;
+	return true;
+}
+
+} // namespace
+
+/// A bounding volume hierarchy built over the triangle bounds using the surface
+/// area heuristic. The nodes are stored in depth first order in a single array,
+/// so that the first child of an internal node immediately follows it.
+class MeshPrimitiveEvaluator::BVH
+{
+
+	public :
+
+		/// 32 bytes, so that nodes never straddle cache lines.
+		struct Node
+		{
+			Box3f bound;
+			/// For leaves, the index of the first triangle in `indices()`.
+			/// For internal nodes, the index of the second child.
+			uint32_t offset;
+			/// The number of triangles in a leaf, or 0 for internal nodes.
+			uint16_t count;
+			/// The axis on which an internal node was split.
+			uint8_t axis;
+			uint8_t padding;
+
+			bool isLeaf() const
+			{
+				return count;
+			}
+		};
+
+		typedef std::vector<Node, tbb::cache_aligned_allocator<Node> > NodeVector;
+
+		BVH( const TriangleBoundVector &triangles )
+		{
+			m_indices.resize( triangles.size() );
+			std::vector<V3f> centroids( triangles.size() );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, triangles.size() ),
+				[&triangles, &centroids, this]( const tbb::blocked_range<size_t> &range )
+				{
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						m_indices[i] = i;
+						centroids[i] = triangles[i].center();
+					}
+				}
+			);
+
+			std::unique_ptr<BuildNode> root = build( 0, triangles.size(), 0, triangles, centroids );
+			m_nodes.reserve( root->numNodes );
+			flatten( root.get() );
+		}
+
+		const NodeVector &nodes() const
+		{
+			return m_nodes;
+		}
+
+		/// The triangle indices referenced by the leaf nodes.
+		const std::vector<uint32_t> &indices() const
+		{
+			return m_indices;
+		}
+
+	private :
+
+		// Temporary tree used during construction, which allows
+		// the subtrees to be built in parallel before being flattened.
+		struct BuildNode
+		{
+			Box3f bound;
+			size_t begin;
+			size_t end;
+			int axis;
+			size_t numNodes;
+			std::unique_ptr<BuildNode> children[2];
+		};
+
+		std::unique_ptr<BuildNode> build( size_t begin, size_t end, size_t depth, const TriangleBoundVector &triangles, const std::vector<V3f> &centroids )
+		{
+			std::unique_ptr<BuildNode> node( new BuildNode );
+			node->begin = begin;
+			node->end = end;
+			node->axis = 0;
+			node->numNodes = 1;
+
+			Box3f centroidBound;
+			for( size_t i = begin; i < end; ++i )
+			{
+				node->bound.extendBy( triangles[m_indices[i]] );
+				centroidBound.extendBy( centroids[m_indices[i]] );
+			}
+
+			const size_t count = end - begin;
+			if( count <= 2 || depth >= g_bvhMaxDepth )
+			{
+				return node;
+			}
+
+			const V3f centroidExtent = centroidBound.size();
+
+			// Find the best split using the binned surface area heuristic.
+
+			int bestAxis = -1;
+			size_t bestBin = 0;
+			float bestCost = limits<float>::max();
+			const float nodeArea = boxSurfaceArea( node->bound );
+			if( depth < g_bvhMaxSAHDepth && nodeArea > 0.0f )
+			{
+				for( int axis = 0; axis < 3; ++axis )
+				{
+					if( centroidExtent[axis] <= 0.0f )
+					{
+						continue;
+					}
+
+					const float scale = g_bvhNumBins / centroidExtent[axis];
+					Box3f binBounds[g_bvhNumBins];
+					size_t binCounts[g_bvhNumBins] = { 0 };
+					for( size_t i = begin; i < end; ++i )
+					{
+						const size_t bin = bvhBin( centroids[m_indices[i]][axis], centroidBound.min[axis], scale );
+						binCounts[bin]++;
+						binBounds[bin].extendBy( triangles[m_indices[i]] );
+					}
+
+					float rightAreas[g_bvhNumBins];
+					size_t rightCounts[g_bvhNumBins];
+					Box3f accumulatedBound;
+					size_t accumulatedCount = 0;
+					for( size_t bin = g_bvhNumBins - 1; bin > 0; --bin )
+					{
+						accumulatedBound.extendBy( binBounds[bin] );
+						accumulatedCount += binCounts[bin];
+						rightAreas[bin] = boxSurfaceArea( accumulatedBound );
+						rightCounts[bin] = accumulatedCount;
+					}
+
+					accumulatedBound.makeEmpty();
+					accumulatedCount = 0;
+					for( size_t bin = 0; bin < g_bvhNumBins - 1; ++bin )
+					{
+						accumulatedBound.extendBy( binBounds[bin] );
+						accumulatedCount += binCounts[bin];
+						if( !accumulatedCount || accumulatedCount == count )
+						{
+							continue;
+						}
+						const float cost = g_bvhTraversalCost + ( boxSurfaceArea( accumulatedBound ) * accumulatedCount + rightAreas[bin+1] * rightCounts[bin+1] ) / nodeArea;
+						if( cost < bestCost )
+						{
+							bestCost = cost;
+							bestAxis = axis;
+							bestBin = bin;
+						}
+					}
+				}
+
+				if( count <= g_bvhMaxLeafSize && (float)count <= bestCost )
+				{
+					return node;
+				}
+			}
+
+			size_t mid = begin;
+			if( bestAxis >= 0 )
+			{
+				const float scale = g_bvhNumBins / centroidExtent[bestAxis];
+				const float min = centroidBound.min[bestAxis];
+				mid = std::partition(
+					m_indices.begin() + begin, m_indices.begin() + end,
+					[&centroids, bestAxis, bestBin, min, scale]( uint32_t i ) {
+						return bvhBin( centroids[i][bestAxis], min, scale ) <= bestBin;
+					}
+				) - m_indices.begin();
+				node->axis = bestAxis;
+			}
+
+			if( mid == begin || mid == end )
+			{
+				// No useful SAH split, so split at the median of the
+				// longest axis instead.
+				int axis = 0;
+				if( centroidExtent[1] > centroidExtent[axis] )
+				{
+					axis = 1;
+				}
+				if( centroidExtent[2] > centroidExtent[axis] )
+				{
+					axis = 2;
+				}
+				mid = begin + count / 2;
+				std::nth_element(
+					m_indices.begin() + begin, m_indices.begin() + mid, m_indices.begin() + end,
+					[&centroids, axis]( uint32_t a, uint32_t b ) {
+						return centroids[a][axis] < centroids[b][axis];
+					}
+				);
+				node->axis = axis;
+			}
+
+			if( count > g_bvhParallelThreshold )
+			{
+				tbb::parallel_invoke(
+					[&] { node->children[0] = build( begin, mid, depth + 1, triangles, centroids ); },
+					[&] { node->children[1] = build( mid, end, depth + 1, triangles, centroids ); }
+				);
+			}
+			else
+			{
+				node->children[0] = build( begin, mid, depth + 1, triangles, centroids );
+				node->children[1] = build( mid, end, depth + 1, triangles, centroids );
+			}
+
+			node->numNodes = 1 + node->children[0]->numNodes + node->children[1]->numNodes;
+			return node;
+		}
+
+		size_t flatten( const BuildNode *buildNode )
+		{
+			const size_t index = m_nodes.size();
+			m_nodes.push_back( Node() );
+			m_nodes[index].bound = buildNode->bound;
+			m_nodes[index].axis = buildNode->axis;
+			m_nodes[index].padding = 0;
+
+			if( !buildNode->children[0] )
+			{
+				m_nodes[index].offset = buildNode->begin;
+				m_nodes[index].count = buildNode->end - buildNode->begin;
+			}
+			else
+			{
+				m_nodes[index].count = 0;
+				flatten( buildNode->children[0].get() );
+				const size_t secondChild = flatten( buildNode->children[1].get() );
+				m_nodes[index].offset = secondChild;
+			}
+
+			return index;
+		}
+
+		NodeVector m_nodes;
+		std::vector<uint32_t> m_indices;
+
+};
+
+MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh, AccelerationStructure accelerationStructure ) : m_accelerationStructure( accelerationStructure ), m_tree( nullptr ), m_bvh( nullptr ), m_uvTree(nullptr), m_haveMassProperties( false ), m_haveSurfaceArea( false ), m_haveAverageNormals( false )
 {
 	if (! mesh )
 	{
@@ -294,7 +698,17 @@ MeshPrimitiveEvaluator::MeshPrimitiveEvaluator( ConstMeshPrimitivePtr mesh ) : m
 		}
 	}
 
-	m_tree = new TriangleBoundTree( m_triangles.begin(), m_triangles.end() );
+	if( m_accelerationStructure == BoundingVolumeHierarchy )
+	{
+		if( m_triangles.size() )
+		{
+			m_bvh = new BVH( m_triangles );
+		}
+	}
+	else
+	{
+		m_tree = new TriangleBoundTree( m_triangles.begin(), m_triangles.end() );
+	}
 
 	if( m_uv.interpolation != PrimitiveVariable::Invalid )
 	{
@@ -316,11 +730,12 @@ PrimitiveEvaluatorPtr MeshPrimitiveEvaluator::create( ConstPrimitivePtr primitiv
 
 MeshPrimitiveEvaluator::~MeshPrimitiveEvaluator()
 {
-	assert( m_tree );
-
 	delete m_tree;
 	m_tree = nullptr;
 
+	delete m_bvh;
+	m_bvh = nullptr;
+
 	delete m_uvTree;
 	m_uvTree = nullptr;
 }
@@ -335,6 +750,11 @@ MeshPrimitive::ConstPtr MeshPrimitiveEvaluator::mesh() const
 	return m_mesh;
 }
 
+MeshPrimitiveEvaluator::AccelerationStructure MeshPrimitiveEvaluator::accelerationStructure() const
+{
+	return m_accelerationStructure;
+}
+
 float MeshPrimitiveEvaluator::volume() const
 {
 	if ( !m_haveMassProperties )
@@ -766,13 +1186,19 @@ bool MeshPrimitiveEvaluator::closestPoint( const V3f &p, PrimitiveEvaluator::Res
 		return false;
 	}
 
-	assert( m_tree );
-
 	Result *mr = static_cast<Result *>( result );
 
 	float maxDistSqrd = limits<float>::max();
 
-	closestPointWalk( m_tree->rootIndex(), p, maxDistSqrd, mr );
+	if( m_bvh )
+	{
+		closestPointBVH( p, maxDistSqrd, mr );
+	}
+	else
+	{
+		assert( m_tree );
+		closestPointWalk( m_tree->rootIndex(), p, maxDistSqrd, mr );
+	}
 
 	return true;
 }
@@ -802,8 +1228,6 @@ bool MeshPrimitiveEvaluator::intersectionPoint( const Imath::V3f &origin, const
 		return false;
 	}
 
-	assert( m_tree );
-
 	Result *mr = static_cast<Result *>( result );
 
 	float maxDistSqrd = maxDistance * maxDistance;
@@ -812,6 +1236,13 @@ bool MeshPrimitiveEvaluator::intersectionPoint( const Imath::V3f &origin, const
 	ray.pos = origin;
 	ray.dir = direction.normalized();
 
+	if( m_bvh )
+	{
+		return intersectionPointBVH( ray, maxDistSqrd, mr );
+	}
+
+	assert( m_tree );
+
 	bool hit = false;
 
 	intersectionPointWalk( m_tree->rootIndex(), ray, maxDistSqrd, mr, hit );
@@ -828,19 +1259,51 @@ int MeshPrimitiveEvaluator::intersectionPoints( const Imath::V3f &origin, const
 		return 0;
 	}
 
-	assert( m_tree );
-
 	float maxDistSqrd = maxDistance * maxDistance;
 
 	Imath::Line3f ray;
 	ray.pos = origin;
 	ray.dir = direction.normalized();
 
-	intersectionPointsWalk( m_tree->rootIndex(), ray, maxDistSqrd, results );
+	if( m_bvh )
+	{
+		intersectionPointsBVH( ray, maxDistSqrd, results );
+	}
+	else
+	{
+		assert( m_tree );
+		intersectionPointsWalk( m_tree->rootIndex(), ray, maxDistSqrd, results );
+	}
 
 	return results.size();
 }
 
+CompoundDataPtr MeshPrimitiveEvaluator::closestPoints( const std::vector<Imath::V3f> &points ) const
+{
+	return batchQuery(
+		points.size(), m_uv.interpolation != PrimitiveVariable::Invalid,
+		[this, &points]( size_t i, Result *result ) {
+			return closestPoint( points[i], result );
+		}
+	);
+}
+
+CompoundDataPtr MeshPrimitiveEvaluator::nearestIntersectionPoints( const std::vector<Imath::V3f> &origins, const std::vector<Imath::V3f> &directions, float maxDistance ) const
+{
+	if( directions.size() != origins.size() && directions.size() != 1 )
+	{
+		throw InvalidArgumentException( "MeshPrimitiveEvaluator::nearestIntersectionPoints : Expected one direction, or one direction per origin" );
+	}
+
+	const size_t directionStride = directions.size() == 1 ? 0 : 1;
+	return batchQuery(
+		origins.size(), m_uv.interpolation != PrimitiveVariable::Invalid,
+		[this, &origins, &directions, directionStride, maxDistance]( size_t i, Result *result ) {
+			return intersectionPoint( origins[i], directions[i * directionStride], result, maxDistance );
+		}
+	);
+}
+
 bool MeshPrimitiveEvaluator::barycentricPosition( unsigned int triangleIndex, const Imath::V3f &barycentricCoordinates, PrimitiveEvaluator::Result *result ) const
 {
 	if( triangleIndex >= m_triangles.size() )
@@ -883,42 +1346,7 @@ void MeshPrimitiveEvaluator::closestPointWalk( TriangleBoundTree::NodeIndex node
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			V3f bary;
-			float dSqrd = triangleClosestBarycentric(
-				m_verts->readable()[vertexIds[0]],
-				m_verts->readable()[vertexIds[1]],
-				m_verts->readable()[vertexIds[2]],
-				p,
-				bary );
-
-			if (dSqrd < closestDistanceSqrd)
-			{
-				closestDistanceSqrd = dSqrd;
-
-				result->m_bary = bary;
-				result->m_vertexIds = vertexIds;
-				result->m_triangleIdx = triangleIndex;
-
-				if( m_uv.interpolation != PrimitiveVariable::Invalid )
-				{
-					result->m_uv = result->vec2PrimVar( m_uv );
-				}
-
-				const Imath::V3f &p0 = m_verts->readable()[vertexIds[0]];
-				const Imath::V3f &p1 = m_verts->readable()[vertexIds[1]];
-				const Imath::V3f &p2 = m_verts->readable()[vertexIds[2]];
-
-				result->m_p = trianglePoint( p0, p1, p2, result->m_bary );
-
-				result->m_n = triangleNormal( p0, p1, p2 );
-			}
+			closestPointTriangle( triangleIndex, p, closestDistanceSqrd, result );
 		}
 	}
 	else
@@ -1044,44 +1472,10 @@ bool MeshPrimitiveEvaluator::intersectionPointWalk( TriangleBoundTree::NodeIndex
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			const Imath::V3f &p0 = m_verts->readable()[ vertexIds[0] ];
-			const Imath::V3f &p1 = m_verts->readable()[ vertexIds[1] ];
-			const Imath::V3f &p2 = m_verts->readable()[ vertexIds[2] ];
-
-			V3f hitPoint, bary;
-			bool front;
-
-			if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+			if( intersectionPointTriangle( triangleIndex, ray, maxDistSqrd, result ) )
 			{
-				float dSqrd = vecDistance2( hitPoint, ray.pos );
-
-				if (dSqrd < maxDistSqrd)
-				{
-					maxDistSqrd = dSqrd;
-
-					result->m_bary = bary;
-					result->m_vertexIds = vertexIds;
-					result->m_triangleIdx = triangleIndex;
-
-					result->m_p = hitPoint;
-
-					if( m_uv.interpolation != PrimitiveVariable::Invalid )
-					{
-						result->m_uv = result->vec2PrimVar( m_uv );
-					}
-
-					result->m_n = triangleNormal( p0, p1, p2 );
-
-					intersects = true;
-					hit = true;
-				}
+				intersects = true;
+				hit = true;
 			}
 		}
 
@@ -1200,44 +1594,7 @@ void MeshPrimitiveEvaluator::intersectionPointsWalk( TriangleBoundTree::NodeInde
 		for( TriangleBoundTree::Iterator *perm = node.permFirst(); perm!=permLast; perm++ )
 		{
 			size_t triangleIndex = *perm - m_triangles.begin(); // triangle index is just the distance of the triangle from the beginning of the vector
-			size_t vertIdOffset = triangleIndex * 3;
-			Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
-
-			assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
-			assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
-
-			const Imath::V3f &p0 =  m_verts->readable()[ vertexIds[0] ];
-			const Imath::V3f &p1 =  m_verts->readable()[ vertexIds[1] ];
-			const Imath::V3f &p2 =  m_verts->readable()[ vertexIds[2] ];
-
-			V3f hitPoint, bary;
-			bool front;
-
-			if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
-			{
-				float dSqrd = vecDistance2( hitPoint, ray.pos );
-
-				if (dSqrd < maxDistSqrd)
-				{
-					ResultPtr result = new Result();
-
-					result->m_bary = bary;
-					result->m_vertexIds = vertexIds;
-					result->m_triangleIdx = triangleIndex;
-
-					result->m_p = hitPoint;
-
-					if ( m_uv.interpolation != PrimitiveVariable::Invalid )
-					{
-						result->m_uv = result->vec2PrimVar( m_uv );
-					}
-
-					result->m_n = triangleNormal( p0, p1, p2 );
-
-					results.push_back( result );
-				}
-			}
+			intersectionPointsTriangle( triangleIndex, ray, maxDistSqrd, results );
 		}
 	}
 	else
@@ -1272,6 +1629,289 @@ void MeshPrimitiveEvaluator::intersectionPointsWalk( TriangleBoundTree::NodeInde
 	}
 }
 
+void MeshPrimitiveEvaluator::closestPointTriangle( size_t triangleIndex, const V3f &p, float &closestDistanceSqrd, Result *result ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	const Imath::V3f &p0 = m_verts->readable()[vertexIds[0]];
+	const Imath::V3f &p1 = m_verts->readable()[vertexIds[1]];
+	const Imath::V3f &p2 = m_verts->readable()[vertexIds[2]];
+
+	V3f bary;
+	float dSqrd = triangleClosestBarycentric( p0, p1, p2, p, bary );
+
+	if (dSqrd < closestDistanceSqrd)
+	{
+		closestDistanceSqrd = dSqrd;
+
+		result->m_bary = bary;
+		result->m_vertexIds = vertexIds;
+		result->m_triangleIdx = triangleIndex;
+
+		if( m_uv.interpolation != PrimitiveVariable::Invalid )
+		{
+			result->m_uv = result->vec2PrimVar( m_uv );
+		}
+
+		result->m_p = trianglePoint( p0, p1, p2, result->m_bary );
+
+		result->m_n = triangleNormal( p0, p1, p2 );
+	}
+}
+
+bool MeshPrimitiveEvaluator::intersectionPointTriangle( size_t triangleIndex, const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	const Imath::V3f &p0 = m_verts->readable()[ vertexIds[0] ];
+	const Imath::V3f &p1 = m_verts->readable()[ vertexIds[1] ];
+	const Imath::V3f &p2 = m_verts->readable()[ vertexIds[2] ];
+
+	V3f hitPoint, bary;
+	bool front;
+
+	if ( !triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+	{
+		return false;
+	}
+
+	float dSqrd = vecDistance2( hitPoint, ray.pos );
+	if( dSqrd >= maxDistSqrd )
+	{
+		return false;
+	}
+
+	maxDistSqrd = dSqrd;
+
+	result->m_bary = bary;
+	result->m_vertexIds = vertexIds;
+	result->m_triangleIdx = triangleIndex;
+
+	result->m_p = hitPoint;
+
+	if( m_uv.interpolation != PrimitiveVariable::Invalid )
+	{
+		result->m_uv = result->vec2PrimVar( m_uv );
+	}
+
+	result->m_n = triangleNormal( p0, p1, p2 );
+
+	return true;
+}
+
+void MeshPrimitiveEvaluator::intersectionPointsTriangle( size_t triangleIndex, const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const
+{
+	size_t vertIdOffset = triangleIndex * 3;
+	Imath::V3i vertexIds( (*m_meshVertexIds)[vertIdOffset], (*m_meshVertexIds)[vertIdOffset+1], (*m_meshVertexIds)[vertIdOffset+2] );
+
+	assert( vertexIds[0] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[1] < (int)( m_verts->readable().size() ) );
+	assert( vertexIds[2] < (int)( m_verts->readable().size() ) );
+
+	const Imath::V3f &p0 =  m_verts->readable()[ vertexIds[0] ];
+	const Imath::V3f &p1 =  m_verts->readable()[ vertexIds[1] ];
+	const Imath::V3f &p2 =  m_verts->readable()[ vertexIds[2] ];
+
+	V3f hitPoint, bary;
+	bool front;
+
+	if ( triangleRayIntersection( p0, p1, p2, ray.pos, ray.dir, hitPoint, bary, front ) )
+	{
+		float dSqrd = vecDistance2( hitPoint, ray.pos );
+
+		if (dSqrd < maxDistSqrd)
+		{
+			ResultPtr result = new Result();
+
+			result->m_bary = bary;
+			result->m_vertexIds = vertexIds;
+			result->m_triangleIdx = triangleIndex;
+
+			result->m_p = hitPoint;
+
+			if ( m_uv.interpolation != PrimitiveVariable::Invalid )
+			{
+				result->m_uv = result->vec2PrimVar( m_uv );
+			}
+
+			result->m_n = triangleNormal( p0, p1, p2 );
+
+			results.push_back( result );
+		}
+	}
+}
+
+void MeshPrimitiveEvaluator::closestPointBVH( const V3f &p, float &closestDistanceSqrd, Result *result ) const
+{
+	const BVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &indices = m_bvh->indices();
+
+	// Stack of nodes still to be visited, along with the squared
+	// distance to their bounds.
+	std::pair<uint32_t, float> stack[g_bvhMaxStackSize];
+	size_t stackSize = 0;
+	stack[stackSize++] = std::make_pair( 0u, 0.0f );
+
+	while( stackSize )
+	{
+		const std::pair<uint32_t, float> entry = stack[--stackSize];
+		if( entry.second >= closestDistanceSqrd )
+		{
+			continue;
+		}
+
+		const BVH::Node &node = nodes[entry.first];
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				closestPointTriangle( indices[i], p, closestDistanceSqrd, result );
+			}
+			continue;
+		}
+
+		uint32_t nearChild = entry.first + 1;
+		uint32_t farChild = node.offset;
+		float nearDistSqrd = ( closestPointInBox( p, nodes[nearChild].bound ) - p ).length2();
+		float farDistSqrd = ( closestPointInBox( p, nodes[farChild].bound ) - p ).length2();
+		if( farDistSqrd < nearDistSqrd )
+		{
+			std::swap( nearChild, farChild );
+			std::swap( nearDistSqrd, farDistSqrd );
+		}
+
+		// Push the farChild child first, so that the nearChild one is visited
+		// first and shrinks the search radius as early as possible.
+		if( farDistSqrd < closestDistanceSqrd )
+		{
+			assert( stackSize < g_bvhMaxStackSize );
+			stack[stackSize++] = std::make_pair( farChild, farDistSqrd );
+		}
+		if( nearDistSqrd < closestDistanceSqrd )
+		{
+			assert( stackSize < g_bvhMaxStackSize );
+			stack[stackSize++] = std::make_pair( nearChild, nearDistSqrd );
+		}
+	}
+}
+
+bool MeshPrimitiveEvaluator::intersectionPointBVH( const Imath::Line3f &ray, float &maxDistSqrd, Result *result ) const
+{
+	const BVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &indices = m_bvh->indices();
+
+	const V3f inverseDirection( 1.0f / ray.dir.x, 1.0f / ray.dir.y, 1.0f / ray.dir.z );
+	float maxDist = sqrtf( maxDistSqrd );
+
+	bool hit = false;
+
+	std::pair<uint32_t, float> stack[g_bvhMaxStackSize];
+	size_t stackSize = 0;
+
+	float rootDistance;
+	if( !rayBoxIntersection( nodes[0].bound, ray.pos, inverseDirection, maxDist, rootDistance ) )
+	{
+		return false;
+	}
+	stack[stackSize++] = std::make_pair( 0u, rootDistance );
+
+	while( stackSize )
+	{
+		const std::pair<uint32_t, float> entry = stack[--stackSize];
+		if( entry.second > maxDist )
+		{
+			continue;
+		}
+
+		const BVH::Node &node = nodes[entry.first];
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				if( intersectionPointTriangle( indices[i], ray, maxDistSqrd, result ) )
+				{
+					hit = true;
+					maxDist = sqrtf( maxDistSqrd );
+				}
+			}
+			continue;
+		}
+
+		uint32_t nearChild = entry.first + 1;
+		uint32_t farChild = node.offset;
+		float nearDist, farDist;
+		bool nearHit = rayBoxIntersection( nodes[nearChild].bound, ray.pos, inverseDirection, maxDist, nearDist );
+		bool farHit = rayBoxIntersection( nodes[farChild].bound, ray.pos, inverseDirection, maxDist, farDist );
+		if( farHit && ( !nearHit || farDist < nearDist ) )
+		{
+			std::swap( nearChild, farChild );
+			std::swap( nearDist, farDist );
+			std::swap( nearHit, farHit );
+		}
+
+		if( farHit )
+		{
+			assert( stackSize < g_bvhMaxStackSize );
+			stack[stackSize++] = std::make_pair( farChild, farDist );
+		}
+		if( nearHit )
+		{
+			assert( stackSize < g_bvhMaxStackSize );
+			stack[stackSize++] = std::make_pair( nearChild, nearDist );
+		}
+	}
+
+	return hit;
+}
+
+void MeshPrimitiveEvaluator::intersectionPointsBVH( const Imath::Line3f &ray, float maxDistSqrd, std::vector<PrimitiveEvaluator::ResultPtr> &results ) const
+{
+	const BVH::NodeVector &nodes = m_bvh->nodes();
+	const std::vector<uint32_t> &indices = m_bvh->indices();
+
+	const V3f inverseDirection( 1.0f / ray.dir.x, 1.0f / ray.dir.y, 1.0f / ray.dir.z );
+	const float maxDist = sqrtf( maxDistSqrd );
+
+	uint32_t stack[g_bvhMaxStackSize];
+	size_t stackSize = 0;
+	stack[stackSize++] = 0;
+
+	while( stackSize )
+	{
+		const uint32_t nodeIndex = stack[--stackSize];
+		const BVH::Node &node = nodes[nodeIndex];
+
+		float distance;
+		if( !rayBoxIntersection( node.bound, ray.pos, inverseDirection, maxDist, distance ) )
+		{
+			continue;
+		}
+
+		if( node.isLeaf() )
+		{
+			for( uint32_t i = node.offset, e = node.offset + node.count; i < e; ++i )
+			{
+				intersectionPointsTriangle( indices[i], ray, maxDistSqrd, results );
+			}
+			continue;
+		}
+
+		assert( stackSize + 2 <= g_bvhMaxStackSize );
+		stack[stackSize++] = node.offset;
+		stack[stackSize++] = nodeIndex + 1;
+	}
+}
+
 const Imath::Box2f MeshPrimitiveEvaluator::uvBound() const
 {
 	if( !m_uvTree )
@@ -1288,6 +1928,13 @@ const MeshPrimitiveEvaluator::TriangleBoundVector *MeshPrimitiveEvaluator::trian
 
 const MeshPrimitiveEvaluator::TriangleBoundTree *MeshPrimitiveEvaluator::triangleBoundTree() const
 {
+	TreeMutex::scoped_lock lock( m_treeMutex );
+	if( !m_tree )
+	{
+		// The tree type requires non-const iterators, but never modifies the bounds.
+		TriangleBoundVector &triangles = const_cast<TriangleBoundVector &>( m_triangles );
+		m_tree = new TriangleBoundTree( triangles.begin(), triangles.end() );
+	}
 	return m_tree;
 }
 
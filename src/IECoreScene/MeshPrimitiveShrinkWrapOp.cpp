@@ -47,6 +47,9 @@
 
 #include "boost/format.hpp"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 using namespace IECore;
 using namespace IECoreScene;
 using namespace Imath;
@@ -216,22 +219,15 @@ struct MeshPrimitiveShrinkWrapOp::ShrinkWrapFn
 		MeshPrimitivePtr triangulatedSourcePrimitive = MeshAlgo::triangulate( runTimeCast<MeshPrimitive>( m_sourceMesh.get() ), m_tolerance, true );
 
 		PrimitiveEvaluatorPtr sourceEvaluator = nullptr;
-		PrimitiveEvaluator::ResultPtr sourceResult = nullptr;
 
 		if ( m_method == Normal )
 		{
 			sourceEvaluator = PrimitiveEvaluator::create( triangulatedSourcePrimitive );
 			assert( sourceEvaluator );
-			sourceResult = sourceEvaluator->createResult();
-			assert( sourceResult );
 		}
 
 		PrimitiveEvaluatorPtr targetEvaluator = PrimitiveEvaluator::create( m_targetMesh );
 		assert( targetEvaluator );
-		PrimitiveEvaluator::ResultPtr insideResult = targetEvaluator->createResult();
-		PrimitiveEvaluator::ResultPtr outsideResult = targetEvaluator->createResult();
-		assert( insideResult );
-		assert( outsideResult );
 
 		PrimitiveVariableMap::const_iterator it = triangulatedSourcePrimitive->variables.find( "N" );
 		if (it == m_sourceMesh->variables.end())
@@ -241,89 +237,107 @@ struct MeshPrimitiveShrinkWrapOp::ShrinkWrapFn
 
 		const PrimitiveVariable &nPrimVar = it->second;
 
-		typename T::ValueType::size_type vertexId = 0;
-		for ( typename T::ValueType::iterator pit = vertices.begin(); pit != vertices.end(); ++pit, ++vertexId )
+		// The evaluators support concurrent queries provided that each
+		// thread uses its own results, so we process the vertices in parallel.
+		tbb::parallel_for(
+			tbb::blocked_range<size_t>( 0, vertices.size() ),
+			[&]( const tbb::blocked_range<size_t> &range )
+			{
+				PrimitiveEvaluator::ResultPtr sourceResult = sourceEvaluator ? sourceEvaluator->createResult() : nullptr;
+				PrimitiveEvaluator::ResultPtr insideResult = targetEvaluator->createResult();
+				PrimitiveEvaluator::ResultPtr outsideResult = targetEvaluator->createResult();
+				for( size_t vertexId = range.begin(); vertexId != range.end(); ++vertexId )
+				{
+					shrinkWrapVertex( vertices[vertexId], vertexId, directionVerticesData, nPrimVar, sourceEvaluator.get(), sourceResult.get(), targetEvaluator.get(), insideResult.get(), outsideResult.get() );
+				}
+			}
+		);
+	}
+
+	template<typename Vec, typename T>
+	void shrinkWrapVertex(
+		Vec &vertexPosition, size_t vertexId, const T *directionVerticesData, const PrimitiveVariable &nPrimVar,
+		const PrimitiveEvaluator *sourceEvaluator, PrimitiveEvaluator::Result *sourceResult,
+		const PrimitiveEvaluator *targetEvaluator, PrimitiveEvaluator::Result *insideResult, PrimitiveEvaluator::Result *outsideResult
+	) const
+	{
+		Vec rayDirection;
+
+		if ( m_method == Normal )
 		{
-			Vec &vertexPosition = *pit;
+			assert( sourceEvaluator );
+			assert( sourceResult );
+			sourceEvaluator->closestPoint( vertexPosition, sourceResult );
+			rayDirection = sourceResult->vectorPrimVar( nPrimVar ).normalized();
+		}
+		else if ( m_method == XAxis )
+		{
+			rayDirection = Vec( 1.0, 0.0, 0.0 );
+		}
+		else if ( m_method == YAxis )
+		{
+			rayDirection = Vec( 0.0, 1.0, 0.0 );
+		}
+		else if ( m_method == ZAxis )
+		{
+			rayDirection = Vec( 0.0, 0.0, 1.0 );
+		}
+		else
+		{
+			assert( m_method == DirectionMesh );
+			assert( directionVerticesData );
+			assert( vertexId < directionVerticesData->readable().size() );
 
-			Vec rayDirection;
+			rayDirection = ( directionVerticesData->readable()[ vertexId ] - vertexPosition ).normalized();
+		}
 
-			if ( m_method == Normal )
-			{
-				assert( sourceEvaluator );
-				assert( sourceResult );
-				sourceEvaluator->closestPoint( vertexPosition, sourceResult.get() );
-				rayDirection = sourceResult->vectorPrimVar( nPrimVar ).normalized();
-			}
-			else if ( m_method == XAxis )
-			{
-				rayDirection = Vec( 1.0, 0.0, 0.0 );
-			}
-			else if ( m_method == YAxis )
+		bool hit = false;
+
+		if ( m_direction == Inside )
+		{
+			hit = targetEvaluator->intersectionPoint( vertexPosition, -rayDirection, insideResult );
+			if ( hit )
 			{
-				rayDirection = Vec( 0.0, 1.0, 0.0 );
+				vertexPosition = insideResult->point();
 			}
-			else if ( m_method == ZAxis )
+		}
+		else if ( m_direction == Outside )
+		{
+			hit = targetEvaluator->intersectionPoint( vertexPosition, rayDirection, outsideResult );
+			if ( hit )
 			{
-				rayDirection = Vec( 0.0, 0.0, 1.0 );
-			}
-			else
-			{
-				assert( m_method == DirectionMesh );
-				assert( directionVerticesData );
-				assert( vertexId < directionVerticesData->readable().size() );
-
-				rayDirection = ( directionVerticesData->readable()[ vertexId ] - vertexPosition ).normalized();
+				vertexPosition = outsideResult->point();
 			}
+		}
+		else
+		{
+			assert( m_direction == Both );
 
-			bool hit = false;
+			bool insideHit  = targetEvaluator->intersectionPoint( vertexPosition, -rayDirection, insideResult  );
+			bool outsideHit = targetEvaluator->intersectionPoint( vertexPosition,  rayDirection, outsideResult );
 
-			if ( m_direction == Inside )
+			/// Choose the closest, or the only, intersection
+			if ( insideHit && outsideHit )
 			{
-				hit = targetEvaluator->intersectionPoint( vertexPosition, -rayDirection, insideResult.get() );
-				if ( hit )
+				typename Vec::BaseType insideDist  = vecDistance2( vertexPosition, Vec( insideResult->point()  ) );
+				typename Vec::BaseType outsideDist = vecDistance2( vertexPosition, Vec( outsideResult->point() ) );
+
+				if ( insideDist < outsideDist )
 				{
 					vertexPosition = insideResult->point();
 				}
-			}
-			else if ( m_direction == Outside )
-			{
-				hit = targetEvaluator->intersectionPoint( vertexPosition, rayDirection, outsideResult.get() );
-				if ( hit )
+				else
 				{
 					vertexPosition = outsideResult->point();
 				}
 			}
-			else
+			else if ( insideHit )
 			{
-				assert( m_direction == Both );
-
-				bool insideHit  = targetEvaluator->intersectionPoint( vertexPosition, -rayDirection, insideResult.get()  );
-				bool outsideHit = targetEvaluator->intersectionPoint( vertexPosition,  rayDirection, outsideResult.get() );
-
-				/// Choose the closest, or the only, intersection
-				if ( insideHit && outsideHit )
-				{
-					typename Vec::BaseType insideDist  = vecDistance2( vertexPosition, Vec( insideResult->point()  ) );
-					typename Vec::BaseType outsideDist = vecDistance2( vertexPosition, Vec( outsideResult->point() ) );
-
-					if ( insideDist < outsideDist )
-					{
-						vertexPosition = insideResult->point();
-					}
-					else
-					{
-						vertexPosition = outsideResult->point();
-					}
-				}
-				else if ( insideHit )
-				{
-					vertexPosition = insideResult->point();
-				}
-				else if ( outsideHit )
-				{
-					vertexPosition = outsideResult->point();
-				}
+				vertexPosition = insideResult->point();
+			}
+			else if ( outsideHit )
+			{
+				vertexPosition = outsideResult->point();
 			}
 		}
 	}
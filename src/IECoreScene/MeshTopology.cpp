@@ -0,0 +1,265 @@
+//////////////////////////////////////////////////////////////////////////
+//
+//  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+//
+//  Redistribution and use in source and binary forms, with or without
+//  modification, are permitted provided that the following conditions are
+//  met:
+//
+//     * Redistributions of source code must retain the above copyright
+//       notice, this list of conditions and the following disclaimer.
+//
+//     * Redistributions in binary form must reproduce the above copyright
+//       notice, this list of conditions and the following disclaimer in the
+//       documentation and/or other materials provided with the distribution.
+//
+//     * Neither the name of Image Engine Design nor the names of any
+//       other contributors to this software may be used to endorse or
+//       promote products derived from this software without specific prior
+//       written permission.
+//
+//  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+//  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+//  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+//  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+//  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+//  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+//  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+//  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+//  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+//  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+//  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+//////////////////////////////////////////////////////////////////////////
+
+
+#include "IECoreScene/private/MeshTopology.h"
+
+#include "IECoreScene/private/PrimitiveAlgoUtils.h"
+
+#include "IECore/LRUCache.h"
+
+#include "boost/lexical_cast.hpp"
+
+#include <cstdlib>
+
+using namespace IECore;
+using namespace IECoreScene;
+
+//////////////////////////////////////////////////////////////////////////
+// Cache
+//////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+struct CacheGetterKey
+{
+
+	CacheGetterKey()
+		:	mesh( nullptr )
+	{
+	}
+
+	CacheGetterKey( const MeshPrimitive *m )
+		:	mesh( m )
+	{
+		mesh->topologyHash( hash );
+		// The vertex adjacency depends on the number of vertices, which
+		// isn't necessarily implied by the topology arrays.
+		hash.append( (uint64_t)mesh->variableSize( PrimitiveVariable::Vertex ) );
+	}
+
+	operator const MurmurHash & () const
+	{
+		return hash;
+	}
+
+	const MeshPrimitive *mesh;
+	MurmurHash hash;
+
+};
+
+size_t defaultMemoryLimit()
+{
+	const char *m = getenv( "IECORESCENE_MESHTOPOLOGY_MEMORY" );
+	const size_t mb = m ? boost::lexical_cast<size_t>( m ) : 100;
+	return mb * 1024 * 1024;
+}
+
+} // namespace
+
+struct MeshTopology::Cache
+{
+
+	typedef LRUCache<MurmurHash, ConstMeshTopologyPtr, LRUCachePolicy::Parallel, CacheGetterKey> LRU;
+
+	static ConstMeshTopologyPtr getter( const CacheGetterKey &key, size_t &cost )
+	{
+		ConstMeshTopologyPtr result = new MeshTopology( key.mesh );
+		cost = result->memoryUsage();
+		return result;
+	}
+
+	static LRU &instance()
+	{
+		static LRU *g_cache = new LRU( getter, defaultMemoryLimit() );
+		return *g_cache;
+	}
+
+};
+
+ConstMeshTopologyPtr MeshTopology::get( const MeshPrimitive *mesh )
+{
+	return Cache::instance().get( CacheGetterKey( mesh ) );
+}
+
+size_t MeshTopology::getMemoryLimit()
+{
+	return Cache::instance().getMaxCost();
+}
+
+void MeshTopology::setMemoryLimit( size_t bytes )
+{
+	Cache::instance().setMaxCost( bytes );
+}
+
+void MeshTopology::clear()
+{
+	Cache::instance().clear();
+}
+
+//////////////////////////////////////////////////////////////////////////
+// MeshTopology
+//////////////////////////////////////////////////////////////////////////
+
+MeshTopology::MeshTopology( const MeshPrimitive *mesh )
+	:	m_verticesPerFace( mesh->verticesPerFace()->copy() ),
+		m_vertexIds( mesh->vertexIds()->copy() ),
+		m_numVertices( mesh->variableSize( PrimitiveVariable::Vertex ) )
+{
+}
+
+MeshTopology::~MeshTopology()
+{
+}
+
+size_t MeshTopology::memoryUsage() const
+{
+	const size_t numFaces = m_verticesPerFace->readable().size();
+	const size_t numFaceVertices = m_vertexIds->readable().size();
+
+	// Each face produces at most one triangle per face-vertex, and
+	// the triangulation stores 8 ints per triangle.
+	const size_t numInts =
+		numFaces + numFaceVertices + // topology
+		numFaces + numFaceVertices + // face offsets and face-vertex faces
+		m_numVertices + 1 + numFaceVertices + // vertex adjacency
+		8 * ( numFaceVertices + numFaces ) // triangulation
+	;
+
+	return sizeof( MeshTopology ) + numInts * sizeof( int );
+}
+
+const std::vector<int> &MeshTopology::faceVertexOffsets() const
+{
+	std::call_once(
+		m_faceVertexOffsetsFlag,
+		[this] {
+			m_faceVertexOffsets = Detail::faceVertexOffsets( m_verticesPerFace->readable() );
+		}
+	);
+	return m_faceVertexOffsets;
+}
+
+const std::vector<int> &MeshTopology::faceVertexFaces() const
+{
+	std::call_once(
+		m_faceVertexFacesFlag,
+		[this] {
+			m_faceVertexFaces = Detail::faceVertexFaces( m_verticesPerFace->readable(), faceVertexOffsets(), m_vertexIds->readable().size() );
+		}
+	);
+	return m_faceVertexFaces;
+}
+
+const std::vector<int> &MeshTopology::vertexFaceVertexOffsets() const
+{
+	std::call_once(
+		m_vertexFaceVerticesFlag,
+		[this] {
+			Detail::invertIndices( m_vertexIds->readable(), m_numVertices, m_vertexFaceVertexOffsets, m_vertexFaceVertices );
+		}
+	);
+	return m_vertexFaceVertexOffsets;
+}
+
+const std::vector<int> &MeshTopology::vertexFaceVertices() const
+{
+	vertexFaceVertexOffsets();
+	return m_vertexFaceVertices;
+}
+
+IECore::ConstIntVectorDataPtr MeshTopology::triangleVerticesPerFace() const
+{
+	triangleFaceVertices();
+	return m_triangleVerticesPerFace;
+}
+
+IECore::ConstIntVectorDataPtr MeshTopology::triangleVertexIds() const
+{
+	triangleFaceVertices();
+	return m_triangleVertexIds;
+}
+
+const std::vector<int> &MeshTopology::triangleFaceVertices() const
+{
+	std::call_once(
+		m_triangulationFlag,
+		[this] {
+			const std::vector<int> &verticesPerFace = m_verticesPerFace->readable();
+			const std::vector<int> &vertexIds = m_vertexIds->readable();
+
+			m_triangleVerticesPerFace = new IntVectorData;
+			m_triangleVertexIds = new IntVectorData;
+			std::vector<int> &triangleVerticesPerFace = m_triangleVerticesPerFace->writable();
+			std::vector<int> &triangleVertexIds = m_triangleVertexIds->writable();
+
+			triangleVerticesPerFace.reserve( verticesPerFace.size() );
+			triangleVertexIds.reserve( vertexIds.size() );
+			m_triangleFaceVertices.reserve( vertexIds.size() );
+			m_triangleFaces.reserve( verticesPerFace.size() );
+
+			// A simple triangle fan, matching `MeshAlgo::triangulate()`.
+			int faceVertexIdStart = 0;
+			for( size_t faceIdx = 0; faceIdx < verticesPerFace.size(); ++faceIdx )
+			{
+				const int numFaceVerts = verticesPerFace[faceIdx];
+				const int numTriangles = numFaceVerts > 3 ? numFaceVerts - 2 : 1;
+				for( int i = 1; i <= numTriangles; ++i )
+				{
+					const int i0 = faceVertexIdStart;
+					const int i1 = faceVertexIdStart + ( numFaceVerts > 3 ? i % numFaceVerts : 1 );
+					const int i2 = faceVertexIdStart + ( numFaceVerts > 3 ? ( i + 1 ) % numFaceVerts : 2 );
+
+					triangleVerticesPerFace.push_back( 3 );
+					for( int fv : { i0, i1, i2 } )
+					{
+						triangleVertexIds.push_back( vertexIds[fv] );
+						m_triangleFaceVertices.push_back( fv );
+					}
+					m_triangleFaces.push_back( faceIdx );
+				}
+
+				faceVertexIdStart += numFaceVerts;
+			}
+		}
+	);
+	return m_triangleFaceVertices;
+}
+
+const std::vector<int> &MeshTopology::triangleFaces() const
+{
+	triangleFaceVertices();
+	return m_triangleFaces;
+}
@@ -34,6 +34,7 @@
 
 #include "IECoreScene/PointsAlgo.h"
 #include "IECoreScene/private/PrimitiveAlgoUtils.h"
+#include "IECoreScene/private/PrimitiveVariableAlgos.h"
 
 #include "IECore/DataAlgo.h"
 #include "IECore/DespatchTypedData.h"
@@ -46,6 +47,71 @@ using namespace IECoreScene;
 using namespace Imath;
 
 
+namespace
+{
+
+/// Builds the PointsPrimitive containing a subset of the points of another.
+class PointsSegmentBuilder
+{
+
+	public :
+
+		PointsSegmentBuilder( const PointsPrimitive *points )
+			:	m_points( points )
+		{
+			for( const auto &pv : points->variables )
+			{
+				if( isGathered( pv.second ) && !points->isPrimitiveVariableValid( pv.second ) )
+				{
+					throw InvalidArgumentException(
+						boost::str( boost::format( "PointsAlgo::segment cannot process invalid primitive variable \"%s\"" ) % pv.first )
+					);
+				}
+			}
+		}
+
+		PointsPrimitivePtr operator()( const std::vector<int> &pointIndices ) const
+		{
+			PointsPrimitivePtr result = new PointsPrimitive( pointIndices.size() );
+
+			PrimitiveVariableAlgos::GatherFunctor functor( pointIndices );
+			for( const auto &pv : m_points->variables )
+			{
+				if( !isGathered( pv.second ) )
+				{
+					result->variables[pv.first] = pv.second;
+					continue;
+				}
+
+				functor.setIndices( pv.second.indices.get() );
+				PrimitiveVariableAlgos::IndexedData outputData = dispatch( pv.second.data.get(), functor );
+				result->variables[pv.first] = PrimitiveVariable( pv.second.interpolation, outputData.data, outputData.indices );
+			}
+
+			return result;
+		}
+
+	private :
+
+		static bool isGathered( const PrimitiveVariable &primitiveVariable )
+		{
+			switch( primitiveVariable.interpolation )
+			{
+				case PrimitiveVariable::Vertex :
+				case PrimitiveVariable::Varying :
+				case PrimitiveVariable::FaceVarying :
+					return true;
+				default :
+					return false;
+			}
+		}
+
+		const PointsPrimitive *m_points;
+
+};
+
+} // namespace
+
 std::vector<PointsPrimitivePtr> IECoreScene::PointsAlgo::segment(
 	const PointsPrimitive *points,
 	const PrimitiveVariable &primitiveVariable,
@@ -73,8 +139,8 @@ std::vector<PointsPrimitivePtr> IECoreScene::PointsAlgo::segment(
 		throw IECore::InvalidArgumentException( "IECoreScene::PointsAlgo::segment : Primitive variable not found on Points Primitive" );
 	}
 
-	auto f = PointsAlgo::deletePoints;
-	IECoreScene::Detail::TaskSegmenter<IECoreScene::PointsPrimitive, decltype(f) > segmenter( points, const_cast<IECore::Data*> (segmentValues), primitiveVariableName, f);
+	PointsSegmentBuilder builder( points );
+	IECoreScene::Detail::TaskSegmenter<IECoreScene::PointsPrimitive, PointsSegmentBuilder> segmenter( points, const_cast<IECore::Data*> (segmentValues), primitiveVariableName, builder );
 
 	return dispatch( primitiveVariable.data.get(), segmenter );
 }
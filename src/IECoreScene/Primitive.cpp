@@ -377,6 +377,16 @@ void Primitive::load( IECore::Object::LoadContextPtr context )
 }
 
 PrimitiveVariableMap Primitive::loadPrimitiveVariables( const IndexedIO *ioInterface, const IndexedIO::EntryID &name, const IndexedIO::EntryIDList &primVarNames )
+{
+	return loadPrimitiveVariablesInternal( ioInterface, name, primVarNames, false, 0, 0 );
+}
+
+PrimitiveVariableMap Primitive::loadPrimitiveVariables( const IndexedIO *ioInterface, const IndexedIO::EntryID &name, const IndexedIO::EntryIDList &primVarNames, size_t offset, size_t count )
+{
+	return loadPrimitiveVariablesInternal( ioInterface, name, primVarNames, true, offset, count );
+}
+
+PrimitiveVariableMap Primitive::loadPrimitiveVariablesInternal( const IndexedIO *ioInterface, const IndexedIO::EntryID &name, const IndexedIO::EntryIDList &primVarNames, bool ranged, size_t offset, size_t count )
 {
 	IECore::Object::LoadContextPtr context = new Object::LoadContext( ioInterface->subdirectory( name )->subdirectory( g_dataEntry ) );
 
@@ -412,13 +422,29 @@ PrimitiveVariableMap Primitive::loadPrimitiveVariables( const IndexedIO *ioInter
 		ioPrimVar->read( g_interpolationEntry, i );
 
 		IntVectorDataPtr indices = nullptr;
-		if( ioPrimVar->hasEntry( g_indicesEntry ) )
+		DataPtr data = nullptr;
+		if( !ranged || i == PrimitiveVariable::Constant )
 		{
-			indices = context->load<IntVectorData>( ioPrimVar.get(), g_indicesEntry );
+			if( ioPrimVar->hasEntry( g_indicesEntry ) )
+			{
+				indices = context->load<IntVectorData>( ioPrimVar.get(), g_indicesEntry );
+			}
+			data = context->load<Data>( ioPrimVar.get(), g_dataEntry );
+		}
+		else if( ioPrimVar->hasEntry( g_indicesEntry ) )
+		{
+			// the indices describe the elements, but may reference
+			// any of the data, so it must be loaded in full.
+			indices = context->load<IntVectorData>( ioPrimVar.get(), g_indicesEntry, offset, count );
+			data = context->load<Data>( ioPrimVar.get(), g_dataEntry );
+		}
+		else
+		{
+			data = context->load<Data>( ioPrimVar.get(), g_dataEntry, offset, count );
 		}
 
 		variables.insert(
-			PrimitiveVariableMap::value_type( name, PrimitiveVariable( (PrimitiveVariable::Interpolation)i, context->load<Data>( ioPrimVar.get(), g_dataEntry ), indices ) )
+			PrimitiveVariableMap::value_type( name, PrimitiveVariable( (PrimitiveVariable::Interpolation)i, data, indices ) )
 		);
 	}
 
@@ -37,10 +37,13 @@
 #include "TagSetAlgo.h"
 
 #include "IECoreScene/Primitive.h"
+#include "IECoreScene/SceneAlgo.h"
 #include "IECoreScene/ShaderNetworkAlgo.h"
 #include "IECoreScene/SharedSceneInterfaces.h"
 #include "IECoreScene/VisibleRenderable.h"
 
+#include "IECore/Canceller.h"
+#include "IECore/CompoundData.h"
 #include "IECore/ComputationCache.h"
 #include "IECore/FileIndexedIO.h"
 #include "IECore/HeaderGenerator.h"
@@ -52,9 +55,15 @@
 
 #include "OpenEXR/ImathBoxAlgo.h"
 
+#include "boost/lexical_cast.hpp"
 #include "boost/tuple/tuple.hpp"
 
+#include "tbb/blocked_range.h"
 #include "tbb/concurrent_hash_map.h"
+#include "tbb/mutex.h"
+#include "tbb/parallel_for.h"
+
+#include <algorithm>
 
 using namespace IECore;
 using namespace IECoreScene;
@@ -88,6 +97,7 @@ static InternedString ancestorTagsEntry("ancestorTags");
 static InternedString descendentTagsEntry("descendentTags");
 static InternedString setsEntry("sets");
 static InternedString childSetsEntry("childSets");
+static InternedString setIndexEntry("setIndex");
 
 const SceneInterface::Name &SceneCache::animatedObjectTopologyAttribute = InternedString( "sceneInterface:animatedObjectTopology" );
 const SceneInterface::Name &SceneCache::animatedObjectPrimVarsAttribute = InternedString( "sceneInterface:animatedObjectPrimVars" );
@@ -323,7 +333,7 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 
 		IE_CORE_DECLAREPTR( ReaderImplementation )
 
-		ReaderImplementation( IndexedIOPtr io, SceneCache::Implementation *parent = nullptr) : SceneCache::Implementation( io ), m_parent(static_cast< ReaderImplementation* >( parent )), m_sharedData(nullptr), m_boundSampleTimes(nullptr), m_transformSampleTimes(nullptr), m_objectSampleTimes(nullptr)
+		ReaderImplementation( IndexedIOPtr io, SceneCache::Implementation *parent = nullptr, const CompoundData *options = nullptr ) : SceneCache::Implementation( io ), m_parent(static_cast< ReaderImplementation* >( parent )), m_sharedData(nullptr), m_boundSampleTimes(nullptr), m_transformSampleTimes(nullptr), m_objectSampleTimes(nullptr)
 		{
 			if ( m_parent )
 			{
@@ -333,7 +343,7 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 			else
 			{
 				// only the root instance allocate the map.
-				m_sharedData = new SharedData;
+				m_sharedData = new SharedData( options );
 			}
 		}
 
@@ -593,22 +603,43 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 		}
 
 		PrimitiveVariableMap readObjectPrimitiveVariables( const std::vector<InternedString> &primVarNames, double time ) const
+		{
+			return readObjectPrimitiveVariablesInterpolated(
+				time,
+				[&primVarNames]( const IndexedIO *objectIO, size_t sample ) {
+					return Primitive::loadPrimitiveVariables( objectIO, sampleEntry( sample ), primVarNames );
+				}
+			);
+		}
+
+		PrimitiveVariableMap readObjectPrimitiveVariablesRange( const std::vector<InternedString> &primVarNames, double time, size_t offset, size_t count ) const
+		{
+			return readObjectPrimitiveVariablesInterpolated(
+				time,
+				[&primVarNames, offset, count]( const IndexedIO *objectIO, size_t sample ) {
+					return Primitive::loadPrimitiveVariables( objectIO, sampleEntry( sample ), primVarNames, offset, count );
+				}
+			);
+		}
+
+		template<typename LoadFn>
+		PrimitiveVariableMap readObjectPrimitiveVariablesInterpolated( double time, LoadFn &&load ) const
 		{
 			size_t sample1, sample2;
 			double x = objectSampleInterval( time, sample1, sample2 );
 
+			IndexedIOPtr objectIO = m_indexedIO->subdirectory( objectEntry );
 			if ( x == 0 )
 			{
-				return readObjectPrimitiveVariablesAtSample(m_indexedIO, primVarNames, sample1);
+				return load( objectIO.get(), sample1 );
 			}
 			if ( x == 1 )
 			{
-				return readObjectPrimitiveVariablesAtSample(m_indexedIO, primVarNames, sample2);
+				return load( objectIO.get(), sample2 );
 			}
 
-			IndexedIOPtr objectIO = m_indexedIO->subdirectory( objectEntry );
-			PrimitiveVariableMap map1 = Primitive::loadPrimitiveVariables( objectIO.get(), sampleEntry(sample1), primVarNames );
-			PrimitiveVariableMap map2 = Primitive::loadPrimitiveVariables( objectIO.get(), sampleEntry(sample2), primVarNames );
+			PrimitiveVariableMap map1 = load( objectIO.get(), sample1 );
+			PrimitiveVariableMap map2 = load( objectIO.get(), sample2 );
 
 			for ( PrimitiveVariableMap::iterator it1 = map1.begin(); it1 != map1.end(); it1++ )
 			{
@@ -772,43 +803,77 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 
 		PathMatcher readSet( const Name &name, bool includeDescendantSets) const
 		{
-			SceneInterface::Path prefix;
-			PathMatcher pathMatcher;
-			recurseReadSet( prefix, name, pathMatcher, includeDescendantSets );
+			// The index contains the sets defined at all locations, so it
+			// can only be used for queries which include the whole hierarchy.
+			if( includeDescendantSets && !m_parent )
+			{
+				if( ConstPathMatcherDataPtr indexedSet = readIndexedSet( setsEntry, name ) )
+				{
+					return indexedSet->readable();
+				}
+			}
 
-			return pathMatcher;
+			return recurseReadSet( name, includeDescendantSets );
 		}
 
-		void recurseReadSet( const SceneInterface::Path &prefix, const Name &name, IECore::PathMatcher &pathMatcher, bool includeDescendantSets ) const
+		/// Returns all the locations in the file tagged with `name`, relative
+		/// to this location, or null if the file has no set index.
+		ConstPathMatcherDataPtr readIndexedTag( const Name &name ) const
 		{
-			if( PathMatcherDataPtr pathMatcherData = readLocalSet( name ) )
+			ConstPathMatcherDataPtr tagged = readIndexedSet( tagsEntry, name );
+			if( !tagged || !m_parent )
 			{
-				pathMatcher.addPaths( pathMatcherData->readable(), prefix );
+				return tagged;
 			}
 
+			SceneInterface::Path p;
+			path( p );
+			return new PathMatcherData( tagged->readable().subTree( p ) );
+		}
+
+		/// Returns the set defined at this location, merged with the sets of all
+		/// descendant locations if `includeDescendantSets` is true. Child subtrees
+		/// are read in parallel.
+		PathMatcher recurseReadSet( const Name &name, bool includeDescendantSets ) const
+		{
+			PathMatcher pathMatcher = readLocalSet( name )->readable();
+
 			if ( !includeDescendantSets )
 			{
-				return;
+				return pathMatcher;
 			}
 
-			NameList children;
-			childNames( children );
-
-			SceneInterface::Path childPrefix = prefix;
-			childPrefix.resize( prefix.size() + 1 );
-
 			NameList childSets = readChildSets();
 
 			// todo need to replace this linear scan with something with faster query performance
-			if( std::find( childSets.begin(), childSets.end(), name ) != childSets.end() )
+			if( std::find( childSets.begin(), childSets.end(), name ) == childSets.end() )
 			{
-				for( InternedString &childName : children )
+				return pathMatcher;
+			}
+
+			NameList children;
+			childNames( children );
+
+			std::vector<PathMatcher> childPathMatchers( children.size() );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, children.size() ),
+				[&]( const tbb::blocked_range<size_t> &range )
 				{
-					*childPrefix.rbegin() = childName;
-					child( childName, SceneInterface::ThrowIfMissing )->recurseReadSet( childPrefix, name, pathMatcher, includeDescendantSets );
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						childPathMatchers[i] = child( children[i], SceneInterface::ThrowIfMissing )->recurseReadSet( name, includeDescendantSets );
+					}
 				}
+			);
+
+			SceneInterface::Path childPrefix( 1 );
+			for( size_t i = 0; i < children.size(); ++i )
+			{
+				childPrefix.back() = children[i];
+				pathMatcher.addPaths( childPathMatchers[i], childPrefix );
 			}
 
+			return pathMatcher;
 		}
 
 		NameList setNames( bool includeDescendantSets ) const
@@ -831,8 +896,75 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 			return NameList( setNames.begin(), std::unique( setNames.begin(), setNames.end() ) );
 		}
 
+		void prefetch( const PathMatcher &paths, const std::vector<double> &times, unsigned int flags, const Canceller *canceller ) const
+		{
+			SceneInterface::Path path;
+			recursePrefetch( path, paths, times, flags, canceller );
+		}
+
+		SceneCache::ReadCacheStatistics readCacheStatistics() const
+		{
+			SceneCache::ReadCacheStatistics result;
+			result.object = m_sharedData->objectCache->statistics();
+			result.transform = m_sharedData->transformCache->statistics();
+			result.attribute = m_sharedData->attributeCache->statistics();
+			return result;
+		}
+
+		void resetReadCacheStatistics()
+		{
+			m_sharedData->objectCache->resetStatistics();
+			m_sharedData->transformCache->resetStatistics();
+			m_sharedData->attributeCache->resetStatistics();
+		}
+
 	private :
 
+		/// Reads an entry from the set index written at the root of the file,
+		/// where `kind` is either `setsEntry` or `tagsEntry`. Returns null if the
+		/// file has no index, and empty data if the index doesn't contain `name`.
+		ConstPathMatcherDataPtr readIndexedSet( const InternedString &kind, const Name &name ) const
+		{
+			tbb::mutex::scoped_lock lock( m_sharedData->setIndexMutex );
+
+			if( m_sharedData->setIndexState == SharedData::SetIndexUnknown )
+			{
+				const ReaderImplementation *root = this;
+				while( root->m_parent )
+				{
+					root = root->m_parent.get();
+				}
+				m_sharedData->setIndexIO = root->m_indexedIO->subdirectory( setIndexEntry, IndexedIO::NullIfMissing );
+				m_sharedData->setIndexState = m_sharedData->setIndexIO ? SharedData::SetIndexPresent : SharedData::SetIndexMissing;
+			}
+
+			if( m_sharedData->setIndexState == SharedData::SetIndexMissing )
+			{
+				return nullptr;
+			}
+
+			const SharedData::SetIndexKey key( kind, name );
+			auto it = m_sharedData->setIndex.find( key );
+			if( it != m_sharedData->setIndex.end() )
+			{
+				return it->second;
+			}
+
+			ConstPathMatcherDataPtr result;
+			ConstIndexedIOPtr kindIO = m_sharedData->setIndexIO->subdirectory( kind, IndexedIO::NullIfMissing );
+			if( kindIO && kindIO->hasEntry( name ) )
+			{
+				result = runTimeCast<const PathMatcherData>( Object::load( kindIO, name ) );
+			}
+			if( !result )
+			{
+				result = new PathMatcherData();
+			}
+
+			m_sharedData->setIndex[key] = result;
+			return result;
+		}
+
 		/// read a set set explicitly defined at this location
 		PathMatcherDataPtr readLocalSet( const Name &name ) const
 		{
@@ -851,6 +983,109 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 			return new PathMatcherData();
 		}
 
+		void recursePrefetch( const SceneInterface::Path &path, const PathMatcher &paths, const std::vector<double> &times, unsigned int flags, const Canceller *canceller ) const
+		{
+			Canceller::check( canceller );
+
+			const unsigned match = paths.match( path );
+			if( match & PathMatcher::ExactMatch )
+			{
+				prefetchLocation( times, flags, canceller );
+			}
+
+			if( !( match & PathMatcher::DescendantMatch ) )
+			{
+				return;
+			}
+
+			NameList children;
+			childNames( children );
+
+			tbb::task_group_context taskGroupContext( tbb::task_group_context::isolated );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, children.size() ),
+				[&]( const tbb::blocked_range<size_t> &r )
+				{
+					SceneInterface::Path childPath = path;
+					childPath.push_back( InternedString() );
+					for( size_t i = r.begin(); i != r.end(); ++i )
+					{
+						childPath.back() = children[i];
+						child( children[i], SceneInterface::ThrowIfMissing )->recursePrefetch( childPath, paths, times, flags, canceller );
+					}
+				},
+				taskGroupContext
+			);
+		}
+
+		void prefetchLocation( const std::vector<double> &times, unsigned int flags, const Canceller *canceller ) const
+		{
+			if( flags & SceneAlgo::Bounds && m_indexedIO->hasEntry( boundEntry ) )
+			{
+				for( size_t sample : samplesAtTimes( boundSampleTimes(), times ) )
+				{
+					Canceller::check( canceller );
+					readBoundAtSample( sample );
+				}
+			}
+
+			if( flags & SceneAlgo::Transforms && m_indexedIO->hasEntry( transformEntry ) )
+			{
+				for( size_t sample : samplesAtTimes( transformSampleTimes(), times ) )
+				{
+					Canceller::check( canceller );
+					readTransformAtSample( sample );
+				}
+			}
+
+			if( flags & SceneAlgo::Attributes )
+			{
+				NameList attributes;
+				attributeNames( attributes );
+				for( const auto &attribute : attributes )
+				{
+					for( size_t sample : samplesAtTimes( attributeSampleTimes( attribute ), times ) )
+					{
+						Canceller::check( canceller );
+						readAttributeAtSample( attribute, sample );
+					}
+				}
+			}
+
+			if( flags & SceneAlgo::Objects && hasObject() )
+			{
+				for( size_t sample : samplesAtTimes( objectSampleTimes(), times ) )
+				{
+					Canceller::check( canceller );
+					readObjectAtSample( sample );
+				}
+			}
+		}
+
+		/// Returns the unique indices of the samples required to
+		/// interpolate values at all of the given times.
+		static std::vector<size_t> samplesAtTimes( const SampleTimes &sampleTimes, const std::vector<double> &times )
+		{
+			std::vector<size_t> samples;
+			for( double time : times )
+			{
+				size_t floorIndex, ceilIndex;
+				double x = sampleInterval( sampleTimes, time, floorIndex, ceilIndex );
+				if( x < 1 )
+				{
+					samples.push_back( floorIndex );
+				}
+				if( x > 0 )
+				{
+					samples.push_back( ceilIndex );
+				}
+			}
+
+			std::sort( samples.begin(), samples.end() );
+			samples.erase( std::unique( samples.begin(), samples.end() ), samples.end() );
+			return samples;
+		}
+
 		// \todo Consider using concurrent_vector for constant access time.
 		typedef tbb::concurrent_hash_map< uint64_t, SampleTimes > SampleTimesMap;
 		typedef std::map< IndexedIO::EntryID, const SampleTimes* > AttributeSamplesMap;
@@ -867,10 +1102,14 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 		{
 			public :
 
-				SharedData() :
-					objectCache( new SimpleCache( doReadObjectAtSample, simpleHash,  10000 )  ),
-					attributeCache( new AttributeCache( doReadAttributeAtSample, attributeHash, 1000) ),
-					transformCache( new SimpleCache(  doReadTransformAtSample, simpleHash, 1000) )
+				/// The caches are bounded by the memory used by the cached objects, and by default
+				/// store them in ObjectPools shared by all readers. The "objectCacheMemory",
+				/// "attributeCacheMemory" and "transformCacheMemory" options (UInt64Data, in bytes)
+				/// may be used to give a file its own pools instead.
+				SharedData( const CompoundData *options ) :
+					objectCache( createCache<SimpleCache>( doReadObjectAtSample, simpleHash, options, "objectCacheMemory", objectPool() ) ),
+					attributeCache( createCache<AttributeCache>( doReadAttributeAtSample, attributeHash, options, "attributeCacheMemory", attributePool() ) ),
+					transformCache( createCache<SimpleCache>( doReadTransformAtSample, simpleHash, options, "transformCacheMemory", transformPool() ) )
 				{
 				}
 
@@ -932,12 +1171,74 @@ class SceneCache::ReaderImplementation : public SceneCache::Implementation
 
 				// \todo Consider adding "ReaderImplementation *rootScene" to optimize the scene() calls.
 				SampleTimesMap sampleTimesMap;
+
+				/// Lazily loaded contents of the set index.
+				enum SetIndexState
+				{
+					SetIndexUnknown,
+					SetIndexPresent,
+					SetIndexMissing
+				};
+				typedef std::pair<InternedString, InternedString> SetIndexKey;
+
+				tbb::mutex setIndexMutex;
+				SetIndexState setIndexState = SetIndexUnknown;
+				ConstIndexedIOPtr setIndexIO;
+				std::map<SetIndexKey, ConstPathMatcherDataPtr> setIndex;
 				SimpleCache::Ptr objectCache;
 				AttributeCache::Ptr attributeCache;
 				SimpleCache::Ptr transformCache;
 
 			private :
 
+			// The computation caches only map computation hashes to object hashes, so
+			// they are cheap compared to the objects themselves. We size them generously
+			// so that entries are evicted only by the memory limits of the ObjectPools,
+			// assuming a minimum memory usage per cached object.
+			static size_t maxComputations( size_t maxMemory )
+			{
+				return std::max<size_t>( maxMemory / 256, 1000 );
+			}
+
+			static size_t cacheMemory( const char *envVar, size_t defaultMegabytes )
+			{
+				const char *m = getenv( envVar );
+				size_t mi = m ? boost::lexical_cast<size_t>( m ) : defaultMegabytes;
+				return 1024 * 1024 * mi;
+			}
+
+			static ObjectPool *objectPool()
+			{
+				static ObjectPoolPtr p = new ObjectPool( cacheMemory( "IECORESCENE_SCENECACHE_OBJECT_MEMORY", 500 ) );
+				return p.get();
+			}
+
+			static ObjectPool *attributePool()
+			{
+				static ObjectPoolPtr p = new ObjectPool( cacheMemory( "IECORESCENE_SCENECACHE_ATTRIBUTE_MEMORY", 50 ) );
+				return p.get();
+			}
+
+			static ObjectPool *transformPool()
+			{
+				static ObjectPoolPtr p = new ObjectPool( cacheMemory( "IECORESCENE_SCENECACHE_TRANSFORM_MEMORY", 50 ) );
+				return p.get();
+			}
+
+			template<typename Cache>
+			static typename Cache::Ptr createCache( typename Cache::ComputeFn computeFn, typename Cache::HashFn hashFn, const CompoundData *options, const char *optionName, ObjectPool *defaultPool )
+			{
+				ObjectPoolPtr pool = defaultPool;
+				if( options )
+				{
+					if( const UInt64Data *maxMemory = options->member<UInt64Data>( optionName, false ) )
+					{
+						pool = new ObjectPool( maxMemory->readable() );
+					}
+				}
+				return new Cache( computeFn, hashFn, maxComputations( pool->getMaxMemoryUsage() ), pool );
+			}
+
 			// utility function that copies all the values from the rhs dictionary to the lhs.
 			template< typename T >
 			static void mergeMaps ( T& lhs, const T& rhs)
@@ -1178,17 +1479,21 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 
 		IE_CORE_DECLAREPTR( WriterImplementation )
 
-		WriterImplementation( IndexedIOPtr io, Implementation *parent = nullptr) : SceneCache::Implementation( io ), m_parent(static_cast< WriterImplementation* >( parent ))
+		WriterImplementation( IndexedIOPtr io, Implementation *parent = nullptr, const CompoundData *options = nullptr ) : SceneCache::Implementation( io ), m_parent(static_cast< WriterImplementation* >( parent ))
 		{
 			if ( m_parent )
 			{
 				// use same map from the root
 				m_sampleTimesMap = m_parent->m_sampleTimesMap;
+				m_setIndex = m_parent->m_setIndex;
 			}
 			else
 			{
 				// only the root instance allocate the map.
 				m_sampleTimesMap = new SampleTimesMap;
+
+				const BoolData *setIndex = options ? options->member<BoolData>( "setIndex" ) : nullptr;
+				m_setIndex = ( !setIndex || setIndex->readable() ) ? new SetIndex : nullptr;
 			}
 		}
 
@@ -1474,6 +1779,13 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 
 			IndexedIOPtr setsIO = m_indexedIO->subdirectory( setsEntry, IndexedIO::CreateIfMissing );
 			setData->Object::save( setsIO, name );
+
+			if( m_setIndex )
+			{
+				// Added to the index during flush(), so that only the last
+				// set written with each name is included.
+				m_localSets[name] = set;
+			}
 		}
 
 		WriterImplementationPtr child( const Name &name, MissingBehaviour missingBehaviour )
@@ -1969,6 +2281,30 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				m_parent->writeChildSets( setNames );
 			}
 
+			if( m_setIndex )
+			{
+				SceneInterface::Path p;
+				path( p );
+
+				NameList tags;
+				readTags( tags, SceneInterface::LocalTag );
+				for( const auto &tag : tags )
+				{
+					m_setIndex->tags[tag].addPath( p );
+				}
+
+				for( const auto &set : m_localSets )
+				{
+					m_setIndex->sets[set.first].addPaths( set.second, p );
+				}
+				m_localSets.clear();
+
+				if( !m_parent )
+				{
+					writeSetIndex();
+				}
+			}
+
 			// deallocate children since we now computed everything from them anyways...
 			m_children.clear();
 
@@ -1977,6 +2313,7 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				// we are at the root...
 				// deallocate samples map stored in the root object.
 				delete m_sampleTimesMap;
+				delete m_setIndex;
 				// and make sure the cache does not contain this file, forcing it to reload it.
 				if ( m_indexedIO->typeId() == FileIndexedIOTypeId )
 				{
@@ -1984,6 +2321,26 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 				}
 			}
 			m_sampleTimesMap = nullptr;
+			m_setIndex = nullptr;
+		}
+
+		void writeSetIndex()
+		{
+			IndexedIOPtr indexIO = m_indexedIO->subdirectory( setIndexEntry, IndexedIO::CreateIfMissing );
+
+			IndexedIOPtr setsIO = indexIO->subdirectory( setsEntry, IndexedIO::CreateIfMissing );
+			for( const auto &set : m_setIndex->sets )
+			{
+				PathMatcherDataPtr setData = new PathMatcherData( set.second );
+				setData->Object::save( setsIO, set.first );
+			}
+
+			IndexedIOPtr tagsIO = indexIO->subdirectory( tagsEntry, IndexedIO::CreateIfMissing );
+			for( const auto &tag : m_setIndex->tags )
+			{
+				PathMatcherDataPtr tagData = new PathMatcherData( tag.second );
+				tagData->Object::save( tagsIO, tag.first );
+			}
 		}
 
 
@@ -2153,6 +2510,18 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 		typedef std::map< SceneCache::Name, SampleTimes > AttributeSamplesMap;
 
 		SampleTimesMap *m_sampleTimesMap;
+
+		// Accumulates the absolute paths of all sets and tags, so they
+		// can be written to the index at the root. Allocated by the
+		// root and shared with all children.
+		struct SetIndex
+		{
+			std::map<SceneCache::Name, PathMatcher> sets;
+			std::map<SceneCache::Name, PathMatcher> tags;
+		};
+		SetIndex *m_setIndex;
+		std::map<SceneCache::Name, PathMatcher> m_localSets;
+
 		SampleTimes m_boundSampleTimes;		// implicit or explicit bound sample times
 		SampleTimes m_transformSampleTimes;
 		AttributeSamplesMap m_attributeSampleTimes;
@@ -2175,13 +2544,13 @@ class SceneCache::WriterImplementation : public SceneCache::Implementation
 // SceneCache
 //////////////////////////////////////////////////////////////////////////
 
-SceneCache::SceneCache( const std::string &fileName, IndexedIO::OpenMode mode )
+SceneCache::SceneCache( const std::string &fileName, IndexedIO::OpenMode mode, const CompoundData *options )
 {
 	if( mode & IndexedIO::Append )
 	{
 		throw InvalidArgumentException( "Append mode not supported" );
 	}
-	IndexedIOPtr indexedIO = IndexedIO::create( fileName, IndexedIO::rootPath, mode );
+	IndexedIOPtr indexedIO = IndexedIO::create( fileName, IndexedIO::rootPath, mode, options );
 
 	if( indexedIO->openMode() & IndexedIO::Write )
 	{
@@ -2190,12 +2559,12 @@ SceneCache::SceneCache( const std::string &fileName, IndexedIO::OpenMode mode )
 		indexedIO->subdirectory( sampleTimesEntry, IndexedIO::CreateIfMissing );
 		indexedIO = indexedIO->subdirectory( rootEntry, IndexedIO::CreateIfMissing );
 		indexedIO->removeAll();
-		m_implementation = new WriterImplementation( indexedIO );
+		m_implementation = new WriterImplementation( indexedIO, nullptr, options );
 	}
 	else
 	{
 		indexedIO = indexedIO->subdirectory( rootEntry );
-		m_implementation = new ReaderImplementation( indexedIO );
+		m_implementation = new ReaderImplementation( indexedIO, nullptr, options );
 	}
 }
 
@@ -2435,7 +2804,14 @@ IECore::PathMatcher SceneCache::readSet( const Name &name, bool includeDescendan
 	PathMatcher set;
 
 	// read the old style tags and convert to a set
-	Private::loadSetWalk( this, name, set, SceneInterface::Path() );
+	if( ConstPathMatcherDataPtr tagged = reader->readIndexedTag( name ) )
+	{
+		set.addPaths( tagged->readable() );
+	}
+	else
+	{
+		set.addPaths( Private::loadSetWalk( this, name ) );
+	}
 
 	// load the new sets
 	set.addPaths( reader->readSet( name, includeDescendantSets ) );
@@ -2505,6 +2881,37 @@ PrimitiveVariableMap SceneCache::readObjectPrimitiveVariables( const std::vector
 	return reader->readObjectPrimitiveVariables( primVarNames, time );
 }
 
+void SceneCache::prefetch( const PathMatcher &paths, int startFrame, int endFrame, float frameRate, unsigned int flags, const Canceller *canceller ) const
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+
+	std::vector<double> times;
+	for( int f = startFrame; f <= endFrame; ++f )
+	{
+		times.push_back( f / frameRate );
+	}
+
+	reader->prefetch( paths, times, flags, canceller );
+}
+
+SceneCache::ReadCacheStatistics SceneCache::readCacheStatistics() const
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+	return reader->readCacheStatistics();
+}
+
+void SceneCache::resetReadCacheStatistics()
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+	reader->resetReadCacheStatistics();
+}
+
+PrimitiveVariableMap SceneCache::readObjectPrimitiveVariablesRange( const std::vector<InternedString> &primVarNames, double time, size_t offset, size_t count ) const
+{
+	ReaderImplementation *reader = ReaderImplementation::reader( m_implementation.get() );
+	return reader->readObjectPrimitiveVariablesRange( primVarNames, time, offset, count );
+}
+
 void SceneCache::writeObject( const Object *object, double time )
 {
 	WriterImplementation *writer = WriterImplementation::writer( m_implementation.get() );
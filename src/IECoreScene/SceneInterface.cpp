@@ -34,15 +34,59 @@
 
 #include "IECoreScene/SceneInterface.h"
 
+#include "IECoreScene/private/PrimitiveVariableAlgos.h"
+
+#include "IECore/DataAlgo.h"
+#include "IECore/TypeTraits.h"
+
 #include "boost/filesystem/convenience.hpp"
 #include "boost/tokenizer.hpp"
 #include "boost/algorithm/string.hpp"
 
+#include <algorithm>
+
 using namespace IECore;
 using namespace IECoreScene;
 
 IE_CORE_DEFINERUNTIMETYPEDDESCRIPTION( SceneInterface )
 
+namespace
+{
+
+struct SliceVectorData
+{
+	SliceVectorData( size_t offset, size_t count )
+		:	m_offset( offset ), m_count( count )
+	{
+	}
+
+	template<typename T>
+	DataPtr operator()( const T *data, typename std::enable_if<TypeTraits::IsVectorTypedData<T>::value>::type *enabler = nullptr ) const
+	{
+		const auto &readable = data->readable();
+		const size_t offset = std::min( m_offset, readable.size() );
+		const size_t count = std::min( m_count, readable.size() - offset );
+
+		typename T::Ptr result = new T;
+		result->writable().assign( readable.begin() + offset, readable.begin() + offset + count );
+
+		IECoreScene::PrimitiveVariableAlgos::GeometricInterpretationCopier<T> copier;
+		copier( data, result.get() );
+
+		return result;
+	}
+
+	DataPtr operator()( const Data *data ) const
+	{
+		return nullptr;
+	}
+
+	size_t m_offset;
+	size_t m_count;
+};
+
+} // namespace
+
 const SceneInterface::Name &SceneInterface::rootName = IndexedIO::rootName;
 const SceneInterface::Path &SceneInterface::rootPath = IndexedIO::rootPath;
 const SceneInterface::Name &SceneInterface::visibilityName( "scene:visible" );
@@ -129,6 +173,30 @@ void SceneInterface::hashSet( const Name& setName, IECore::MurmurHash &h ) const
 	h.append( typeId() );
 }
 
+PrimitiveVariableMap SceneInterface::readObjectPrimitiveVariablesRange( const std::vector<IECore::InternedString> &primVarNames, double time, size_t offset, size_t count ) const
+{
+	PrimitiveVariableMap variables = readObjectPrimitiveVariables( primVarNames, time );
+	const SliceVectorData slicer( offset, count );
+	for( auto &it : variables )
+	{
+		PrimitiveVariable &variable = it.second;
+		if( variable.interpolation == PrimitiveVariable::Constant )
+		{
+			continue;
+		}
+
+		if( variable.indices )
+		{
+			variable.indices = runTimeCast<IntVectorData>( dispatch( variable.indices.get(), slicer ) );
+		}
+		else if( DataPtr sliced = dispatch( variable.data.get(), slicer ) )
+		{
+			variable.data = sliced;
+		}
+	}
+	return variables;
+}
+
 bool SceneInterface::hasBound() const
 {
 	return true;
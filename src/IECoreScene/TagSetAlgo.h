@@ -37,15 +37,21 @@
 
 #include "IECoreScene/SceneInterface.h"
 
+#include "tbb/blocked_range.h"
+#include "tbb/parallel_for.h"
+
 namespace IECoreScene
 {
 	namespace Private
 	{
-		void loadSetWalk( const IECoreScene::SceneInterface *scene, const IECore::InternedString &setName, IECore::PathMatcher &set, const SceneInterface::Path &path )
+		/// Returns the locations tagged with `setName`, relative to `scene`.
+		/// Child subtrees are visited in parallel.
+		IECore::PathMatcher loadSetWalk( const IECoreScene::SceneInterface *scene, const IECore::InternedString &setName )
 		{
+			IECore::PathMatcher set;
 			if( scene->hasTag( setName, SceneInterface::LocalTag ) )
 			{
-				set.addPath( path );
+				set.addPath( SceneInterface::Path() );
 			}
 
 			// Figure out if we need to recurse by querying descendant tags to see if they include
@@ -53,21 +59,40 @@ namespace IECoreScene
 
 			if( !scene->hasTag( setName, SceneInterface::DescendantTag ) )
 			{
-				return;
+				return set;
 			}
 
-			// Recurse to the children.
+			// Recurse to the children, and merge their sets into ours.
 
 			SceneInterface::NameList childNames;
 			scene->childNames( childNames );
-			SceneInterface::Path childPath( path );
-			childPath.push_back( IECore::InternedString() ); // room for the child name
-			for( SceneInterface::NameList::const_iterator it = childNames.begin(), eIt = childNames.end(); it != eIt; ++it )
+
+			std::vector<IECore::PathMatcher> childSets( childNames.size() );
+			tbb::parallel_for(
+				tbb::blocked_range<size_t>( 0, childNames.size() ),
+				[&]( const tbb::blocked_range<size_t> &range )
+				{
+					for( size_t i = range.begin(); i != range.end(); ++i )
+					{
+						ConstSceneInterfacePtr child = scene->child( childNames[i] );
+						childSets[i] = loadSetWalk( child.get(), setName );
+					}
+				}
+			);
+
+			SceneInterface::Path childPrefix( 1 );
+			for( size_t i = 0; i < childNames.size(); ++i )
 			{
-				ConstSceneInterfacePtr child = scene->child( *it );
-				childPath.back() = *it;
-				loadSetWalk( child.get(), setName, set, childPath );
+				childPrefix.back() = childNames[i];
+				set.addPaths( childSets[i], childPrefix );
 			}
+
+			return set;
+		}
+
+		void loadSetWalk( const IECoreScene::SceneInterface *scene, const IECore::InternedString &setName, IECore::PathMatcher &set, const SceneInterface::Path &path )
+		{
+			set.addPaths( loadSetWalk( scene, setName ), path );
 		}
 	} // private
 
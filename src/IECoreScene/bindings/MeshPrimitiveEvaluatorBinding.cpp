@@ -40,6 +40,9 @@
 
 #include "IECorePython/RefCountedBinding.h"
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "IECore/VectorTypedData.h"
 
 using namespace IECore;
 using namespace IECoreScene;
@@ -56,17 +59,37 @@ static bool barycentricPosition( const MeshPrimitiveEvaluator &e, unsigned int t
 	return e.barycentricPosition( t, b, r );
 }
 
+static CompoundDataPtr closestPoints( const MeshPrimitiveEvaluator &e, const V3fVectorData *points )
+{
+	ScopedGILRelease gilRelease;
+	return e.closestPoints( points->readable() );
+}
+
+static CompoundDataPtr nearestIntersectionPoints( const MeshPrimitiveEvaluator &e, const V3fVectorData *origins, const V3fVectorData *directions, float maxDistance )
+{
+	ScopedGILRelease gilRelease;
+	return e.nearestIntersectionPoints( origins->readable(), directions->readable(), maxDistance );
+}
+
 void bindMeshPrimitiveEvaluator()
 {
 	object m = RunTimeTypedClass<MeshPrimitiveEvaluator>()
-		.def( init< MeshPrimitivePtr > () )
+		.def( init< MeshPrimitivePtr, optional<MeshPrimitiveEvaluator::AccelerationStructure> >( ( arg( "mesh" ), arg( "accelerationStructure" ) = MeshPrimitiveEvaluator::KDTree ) ) )
+		.def( "accelerationStructure", &MeshPrimitiveEvaluator::accelerationStructure )
 		.def( "barycentricPosition", &barycentricPosition )
 		.def( "uvBound", &MeshPrimitiveEvaluator::uvBound )
+		.def( "closestPoints", &closestPoints, ( arg( "self" ), arg( "points" ) ) )
+		.def( "nearestIntersectionPoints", &nearestIntersectionPoints, ( arg( "self" ), arg( "origins" ), arg( "directions" ), arg( "maxDistance" ) = Imath::limits<float>::max() ) )
 	;
 
 	{
 		scope ms( m );
 
+		enum_<MeshPrimitiveEvaluator::AccelerationStructure>( "AccelerationStructure" )
+			.value( "KDTree", MeshPrimitiveEvaluator::KDTree )
+			.value( "BoundingVolumeHierarchy", MeshPrimitiveEvaluator::BoundingVolumeHierarchy )
+		;
+
 		RefCountedClass<MeshPrimitiveEvaluator::Result, PrimitiveEvaluator::Result>( "Result" )
 			.def( "triangleIndex", &MeshPrimitiveEvaluator::Result::triangleIndex )
 			.def( "barycentricCoordinates", &MeshPrimitiveEvaluator::Result::barycentricCoordinates, return_value_policy<copy_const_reference>() )
@@ -42,6 +42,11 @@
 #include "IECoreScene/SharedSceneInterfaces.h"
 
 #include "IECorePython/RunTimeTypedBinding.h"
+#include "IECorePython/ScopedGILRelease.h"
+
+#include "IECoreScene/SceneAlgo.h"
+
+#include "IECore/CompoundData.h"
 
 #include "tbb/tbb.h"
 
@@ -58,9 +63,9 @@ using namespace IECoreScene;
 namespace
 {
 
-SceneCachePtr constructor( const std::string &fileName, IndexedIO::OpenMode mode )
+SceneCachePtr constructor( const std::string &fileName, IndexedIO::OpenMode mode, const CompoundData *options )
 {
-	return new SceneCache( fileName, mode );
+	return new SceneCache( fileName, mode, options );
 }
 
 SceneCachePtr constructor2( IECore::IndexedIOPtr indexedIO )
@@ -68,6 +73,12 @@ SceneCachePtr constructor2( IECore::IndexedIOPtr indexedIO )
 	return new SceneCache( indexedIO );
 }
 
+void prefetch( const SceneCache &scene, const PathMatcher &paths, int startFrame, int endFrame, float frameRate, unsigned int flags, const Canceller *canceller )
+{
+	IECorePython::ScopedGILRelease gilRelease;
+	scene.prefetch( paths, startFrame, endFrame, frameRate, flags, canceller );
+}
+
 } // namespace
 
 //////////////////////////////////////////////////////////////////////////
@@ -166,9 +177,18 @@ namespace IECoreSceneModule
 
 void bindSceneCache()
 {
-	RunTimeTypedClass<SceneCache>()
-		.def( "__init__", make_constructor( &constructor ), "Opens a scene file for read or write." )
+	scope s = RunTimeTypedClass<SceneCache>()
+		.def( "__init__", make_constructor( &constructor, default_call_policies(), ( arg( "fileName" ), arg( "mode" ), arg( "options" ) = object() ) ), "Opens a scene file for read or write." )
 		.def( "__init__", make_constructor( &constructor2 ), "Opens a scene from a previously opened file handle." )
+		.def( "prefetch", &prefetch, ( arg( "self" ), arg( "paths" ), arg( "startFrame" ), arg( "endFrame" ), arg( "frameRate" ), arg( "flags" ) = (unsigned int)SceneAlgo::All, arg( "canceller" ) = object() ) )
+		.def( "readCacheStatistics", &SceneCache::readCacheStatistics )
+		.def( "resetReadCacheStatistics", &SceneCache::resetReadCacheStatistics )
+	;
+
+	class_<SceneCache::ReadCacheStatistics>( "ReadCacheStatistics" )
+		.def_readonly( "object", &SceneCache::ReadCacheStatistics::object )
+		.def_readonly( "transform", &SceneCache::ReadCacheStatistics::transform )
+		.def_readonly( "attribute", &SceneCache::ReadCacheStatistics::attribute )
 	;
 
 	def( "testSceneCacheParallelAttributeRead", &testSceneCacheParallelAttributeRead );
@@ -141,6 +141,20 @@ static dict readObjectPrimitiveVariables( const SceneInterface &m, list varNameL
 	return result;
 }
 
+static dict readObjectPrimitiveVariablesRange( const SceneInterface &m, list varNameList, double time, size_t offset, size_t count )
+{
+	SceneInterface::NameList v;
+	container_utils::extend_container( v, varNameList );
+
+	PrimitiveVariableMap varMap = m.readObjectPrimitiveVariablesRange( v, time, offset, count );
+	dict result;
+	for( PrimitiveVariableMap::const_iterator it = varMap.begin(); it != varMap.end(); it++ )
+	{
+		result[it->first] = it->second;
+	}
+	return result;
+}
+
 list readTags( const SceneInterface &m, int filter )
 {
 	SceneInterface::NameList tags;
@@ -275,6 +289,7 @@ void bindSceneInterface()
 		.def( "readSet", &SceneInterface::readSet, ( arg_("name"), arg_( "includeDescendantSets" ) = true ) )
 		.def( "readObject", &readObject )
 		.def( "readObjectPrimitiveVariables", &readObjectPrimitiveVariables )
+		.def( "readObjectPrimitiveVariablesRange", &readObjectPrimitiveVariablesRange )
 		.def( "writeObject", &SceneInterface::writeObject )
 		.def( "hasObject", &SceneInterface::hasObject )
 		.def( "hasChild", &SceneInterface::hasChild )
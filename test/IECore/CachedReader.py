@@ -180,6 +180,27 @@ class CachedReaderTest( unittest.TestCase ) :
 		r.searchPath = IECore.SearchPath( "./test/IECore/data/cachedReaderPath2" )
 		self.assertTrue( r.cached( "file.cob" ) )
 
+	def testStatistics( self ) :
+
+		r = IECore.CachedReader( IECore.SearchPath( "./" ), IECore.ObjectPool( 100 * 1024 * 1024 ) )
+
+		r.read( "test/IECore/data/cobFiles/compoundData.cob" )
+		s = r.statistics()
+		self.assertEqual( s.misses, 1 )
+		self.assertEqual( s.hits, 0 )
+		self.assertGreater( s.getterTime, 0 )
+
+		r.read( "test/IECore/data/cobFiles/compoundData.cob" )
+		s = r.statistics()
+		self.assertEqual( s.misses, 1 )
+		self.assertEqual( s.hits, 1 )
+
+		r.resetStatistics()
+		s = r.statistics()
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.getterTime, 0 )
+
 	def testDefault( self ) :
 
 		os.environ["IECORE_CACHEDREADER_PATHS"] = os.pathsep.join( [ "a", "test", "path" ] )
@@ -32,6 +32,10 @@
 #
 ##########################################################################
 
+import os
+import time
+import shutil
+import tempfile
 import unittest
 import IECore
 
@@ -104,5 +108,52 @@ class TestClassLoader( unittest.TestCase ) :
 		s.paths = [ "a", "b", "c" ]
 		self.assertEqual( l.searchPath(), IECore.SearchPath( "test/IECore/ops" ) )
 
+	def testIndex( self ) :
+
+		indexDirectory = os.path.join( self.__tempDir, "index" )
+		opsDirectory = os.path.join( self.__tempDir, "ops" )
+		shutil.copytree( "test/IECore/ops", opsDirectory )
+
+		l = IECore.ClassLoader( IECore.SearchPath( opsDirectory ), indexDirectory )
+		c = l.classNames()
+		self.assertEqual( c, IECore.ClassLoader( IECore.SearchPath( "test/IECore/ops" ) ).classNames() )
+		self.assertEqual( len( os.listdir( indexDirectory ) ), 1 )
+
+		# a new loader should get the same results from the index
+
+		l2 = IECore.ClassLoader( IECore.SearchPath( opsDirectory + "/" ), indexDirectory )
+		self.assertEqual( l2.classNames(), c )
+		self.assertEqual( l2.versions( "maths/multiply" ), [ 1, 2 ] )
+
+		# and modified directories should be rescanned
+
+		time.sleep( 1 )
+		shutil.copy(
+			os.path.join( opsDirectory, "maths", "multiply", "multiply-2.py" ),
+			os.path.join( opsDirectory, "maths", "multiply", "multiply-3.py" ),
+		)
+		os.makedirs( os.path.join( opsDirectory, "maths", "multiplyAgain" ) )
+		shutil.copy(
+			os.path.join( opsDirectory, "maths", "multiply", "multiply-2.py" ),
+			os.path.join( opsDirectory, "maths", "multiplyAgain", "multiplyAgain-1.py" ),
+		)
+
+		self.assertEqual( l.versions( "maths/multiply" ), [ 1, 2 ] )
+		l.refresh()
+		self.assertEqual( l.versions( "maths/multiply" ), [ 1, 2, 3 ] )
+		self.assertEqual( l.classNames( "maths/*" ), [ "maths/multiply", "maths/multiplyAgain" ] )
+
+		l3 = IECore.ClassLoader( IECore.SearchPath( opsDirectory ), indexDirectory )
+		self.assertEqual( l3.classNames(), l.classNames() )
+		self.assertEqual( l3.versions( "maths/multiply" ), [ 1, 2, 3 ] )
+
+	def setUp( self ) :
+
+		self.__tempDir = tempfile.mkdtemp()
+
+	def tearDown( self ) :
+
+		shutil.rmtree( self.__tempDir )
+
 if __name__ == "__main__":
         unittest.main()
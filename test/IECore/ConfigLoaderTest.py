@@ -33,6 +33,8 @@
 ##########################################################################
 
 import os
+import shutil
+import tempfile
 import unittest
 
 import IECore
@@ -253,6 +255,73 @@ class ConfigLoaderTest( unittest.TestCase ) :
 
 		)
 
+	def testNonRecursive( self ) :
+
+		path = os.path.dirname( __file__ ) + "/config/nonRecursive"
+
+		config = {}
+		IECore.loadConfig( IECore.SearchPath( path ), contextDict = { "config" : config }, recursive = False )
+		self.assertEqual( config, { "topLevelRan" : True } )
+
+		IECore.loadConfig( IECore.SearchPath( path ), contextDict = { "config" : config }, subdirectory = "subdirectory", recursive = False )
+		self.assertEqual( config, { "topLevelRan" : True, "subdirectoryRan" : True } )
+
+		config = {}
+		IECore.loadConfig( IECore.SearchPath( path ), contextDict = { "config" : config } )
+		self.assertEqual( config, { "topLevelRan" : True, "subdirectoryRan" : True } )
+
+	def testCompiledCodeCache( self ) :
+
+		cacheDirectory = tempfile.mkdtemp()
+		configDirectory = tempfile.mkdtemp()
+		self.addCleanup( shutil.rmtree, cacheDirectory )
+		self.addCleanup( shutil.rmtree, configDirectory )
+
+		os.environ["IECORE_CONFIG_CACHE_PATH"] = cacheDirectory
+		self.addCleanup( os.environ.pop, "IECORE_CONFIG_CACHE_PATH" )
+
+		configFileName = os.path.join( configDirectory, "config.py" )
+		with open( configFileName, "w" ) as f :
+			f.write( "config['a'] = 1\n" )
+
+		config = {}
+		IECore.loadConfig( IECore.SearchPath( configDirectory ), contextDict = { "config" : config } )
+		self.assertEqual( config["a"], 1 )
+		self.assertEqual( len( os.listdir( cacheDirectory ) ), 1 )
+
+		config = {}
+		IECore.loadConfig( IECore.SearchPath( configDirectory ), contextDict = { "config" : config } )
+		self.assertEqual( config["a"], 1 )
+
+		# modifying the file must invalidate the cache
+
+		with open( configFileName, "w" ) as f :
+			f.write( "config['a'] = 20\n" )
+		os.utime( configFileName, ( 0, 0 ) )
+
+		config = {}
+		IECore.loadConfig( IECore.SearchPath( configDirectory ), contextDict = { "config" : config } )
+		self.assertEqual( config["a"], 20 )
+
+	def testTimings( self ) :
+
+		os.environ["IECORE_CONFIG_TIMINGS"] = "1"
+		self.addCleanup( os.environ.pop, "IECORE_CONFIG_TIMINGS" )
+
+		config = {}
+		m = IECore.CapturingMessageHandler()
+		with m :
+			IECore.loadConfig(
+				IECore.SearchPath( os.path.dirname( __file__ ) + "/config/orderDir" ),
+				contextDict = { "config" : config },
+			)
+
+		infos = [ msg for msg in m.messages if msg.level == IECore.Msg.Level.Info ]
+		self.assertEqual( len( infos ), 1 )
+		self.assertTrue( "Loaded 2 files" in infos[0].message )
+		self.assertTrue( "a.py" in infos[0].message )
+		self.assertTrue( "b.py" in infos[0].message )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -458,6 +458,58 @@ class testLs( unittest.TestCase ) :
 		l = IECore.ls( "test/sequences/lsTest/a.###.tif" )
 		self.assertFalse( l )
 
+	def testLsSequenceInfo( self ) :
+
+		self.tearDown()
+		os.system( "mkdir -p test/sequences/lsTest/sub/deeper" )
+
+		sequences = [
+			IECore.FileSequence( "a.####.tif", IECore.FrameRange( 1, 10 ) ),
+			IECore.FileSequence( "sub/b.#.exr", IECore.FrameRange( 5, 8 ) ),
+			IECore.FileSequence( "sub/deeper/c.##.tif", IECore.FrameRange( 1, 3 ) ),
+		]
+		for sequence in sequences :
+			for f in sequence.fileNames() :
+				os.system( "touch 'test/sequences/lsTest/" + f + "'" )
+
+		for i in range( 1, 3 ) :
+			os.mkdir( "test/sequences/lsTest/sub/d.{0}".format( i ) )
+
+		# Not recursive
+
+		l = IECore.lsSequenceInfo( "test/sequences/lsTest" )
+		self.assertEqual( [ i.sequence for i in l ], sequences[:1] )
+		self.assertTrue( l[0].isFiles )
+		self.assertFalse( l[0].isDirectories )
+		self.assertEqual( l[0].modificationTimes, [] )
+
+		# Limited depth
+
+		l = IECore.lsSequenceInfo( "test/sequences/lsTest", maxDepth = 1 )
+		self.assertEqual(
+			[ i.sequence for i in l ],
+			sequences[:2] + [ IECore.FileSequence( "sub/d.#", IECore.FrameRange( 1, 2 ) ) ]
+		)
+		self.assertFalse( l[2].isFiles )
+		self.assertTrue( l[2].isDirectories )
+
+		# Recursive, with modification times
+
+		l = IECore.lsSequenceInfo( "test/sequences/lsTest", maxDepth = 10, modificationTimes = True )
+		self.assertEqual( len( l ), 4 )
+		self.assertEqual( l[3].sequence, sequences[2] )
+		for i in l :
+			self.assertEqual( len( i.modificationTimes ), len( i.sequence.fileNames() ) )
+			for f, t in zip( i.sequence.fileNames(), i.modificationTimes ) :
+				self.assertEqual( t, int( os.stat( os.path.join( "test/sequences/lsTest", f ) ).st_mtime ) )
+
+		# Minimum length
+
+		l = IECore.lsSequenceInfo( "test/sequences/lsTest", minSequenceSize = 4, maxDepth = 10 )
+		self.assertEqual( [ i.sequence for i in l ], sequences[:2] )
+
+		self.assertEqual( IECore.lsSequenceInfo( "test/sequences/nonExistent" ), [] )
+
 	def tearDown( self ) :
 
 		if os.path.exists( "test/sequences" ) :
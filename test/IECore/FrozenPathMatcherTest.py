@@ -0,0 +1,169 @@
+##########################################################################
+#
+#  Copyright (c) 2020, Image Engine Design Inc. All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are
+#  met:
+#
+#      * Redistributions of source code must retain the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer.
+#
+#      * Redistributions in binary form must reproduce the above
+#        copyright notice, this list of conditions and the following
+#        disclaimer in the documentation and/or other materials provided with
+#        the distribution.
+#
+#      * Neither the name of John Haddon nor the names of
+#        any other contributors to this software may be used to endorse or
+#        promote products derived from this software without specific prior
+#        written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+#  IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+#  THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+#  PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+#  CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#  EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#  PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#  PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#  LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#  NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import unittest
+
+import IECore
+
+class FrozenPathMatcherTest( unittest.TestCase ) :
+
+	def __paths( self ) :
+
+		return [
+			"/a",
+			"/a/b/c",
+			"/a/d",
+			"/e/f",
+			"/e/f/g/h",
+			"/i/*/j",
+			"/k/.../l",
+		]
+
+	def testConstruct( self ) :
+
+		f = IECore.FrozenPathMatcher()
+		self.assertTrue( f.isEmpty() )
+		self.assertEqual( f.size(), 0 )
+		self.assertEqual( f.paths(), [] )
+		self.assertEqual( f.pathMatcher(), IECore.PathMatcher() )
+
+		m = IECore.PathMatcher( self.__paths() )
+		f = IECore.FrozenPathMatcher( m )
+		self.assertFalse( f.isEmpty() )
+		self.assertEqual( f.size(), m.size() )
+		self.assertEqual( set( f.paths() ), set( m.paths() ) )
+		self.assertEqual( f.pathMatcher(), m )
+		self.assertGreater( f.memoryUsage(), 0 )
+
+	def testRootPath( self ) :
+
+		m = IECore.PathMatcher( [ "/" ] )
+		f = IECore.FrozenPathMatcher( m )
+		self.assertEqual( f.size(), 1 )
+		self.assertEqual( f.paths(), [ "/" ] )
+		self.assertEqual( f.pathMatcher(), m )
+		self.assertEqual( f.match( "/" ), IECore.PathMatcher.Result.ExactMatch )
+
+	def testMatch( self ) :
+
+		m = IECore.PathMatcher( self.__paths() )
+		f = IECore.FrozenPathMatcher( m )
+
+		for path in [
+			"/", "/a", "/a/b", "/a/b/c", "/a/b/c/d", "/a/d", "/a/x",
+			"/e", "/e/f/g", "/e/f/g/h/i", "/i/x/j", "/i/x/y", "/i/x/j/k",
+			"/k", "/k/l", "/k/x/y/l", "/k/x/y/z", "/z",
+		] :
+			self.assertEqual( f.match( path ), m.match( path ), path )
+			self.assertEqual( f.match( IECore.InternedStringVectorData( path.split( "/" )[1:] if path != "/" else [] ) ), m.match( path ) )
+
+	def testIntersection( self ) :
+
+		m1 = IECore.PathMatcher( [ "/a", "/a/b", "/c/d", "/e/f/g", "/h" ] )
+		m2 = IECore.PathMatcher( [ "/a/b", "/c", "/c/d", "/e/f/g", "/e/f/g/h" ] )
+
+		f = IECore.FrozenPathMatcher( m1 ).intersection( IECore.FrozenPathMatcher( m2 ) )
+		self.assertEqual( f.pathMatcher(), m1.intersection( m2 ) )
+		self.assertEqual( f.size(), 3 )
+
+		self.assertTrue( IECore.FrozenPathMatcher( m1 ).intersection( IECore.FrozenPathMatcher() ).isEmpty() )
+
+	def testEquality( self ) :
+
+		f1 = IECore.FrozenPathMatcher( IECore.PathMatcher( [ "/a", "/b/c" ] ) )
+		f2 = IECore.FrozenPathMatcher( IECore.PathMatcher( [ "/b/c", "/a" ] ) )
+		f3 = IECore.FrozenPathMatcher( IECore.PathMatcher( [ "/a", "/b" ] ) )
+
+		self.assertEqual( f1, f2 )
+		self.assertNotEqual( f1, f3 )
+		self.assertNotEqual( f1, IECore.FrozenPathMatcher() )
+
+	def testSaveAndLoad( self ) :
+
+		m = IECore.PathMatcher( self.__paths() )
+		f = IECore.FrozenPathMatcher( m )
+
+		io = IECore.IndexedIO.create( os.path.join( "test", "IECore", "frozenPathMatcher.fio" ), [], IECore.IndexedIO.OpenMode.Write )
+		f.save( io, "paths" )
+		IECore.FrozenPathMatcher().save( io, "empty" )
+		del io
+
+		io = IECore.IndexedIO.create( os.path.join( "test", "IECore", "frozenPathMatcher.fio" ), [], IECore.IndexedIO.OpenMode.Read )
+		f2 = IECore.FrozenPathMatcher.load( io, "paths" )
+		self.assertEqual( f2, f )
+		self.assertEqual( f2.pathMatcher(), m )
+		self.assertEqual( f2.size(), m.size() )
+
+		self.assertTrue( IECore.FrozenPathMatcher.load( io, "empty" ).isEmpty() )
+
+	def testModifyThawedMatcher( self ) :
+
+		f = IECore.FrozenPathMatcher( IECore.PathMatcher( [ "/a/b", "/a/c" ] ) )
+
+		m1 = f.pathMatcher()
+		m1.addPath( "/a/d" )
+		m1.removePath( "/a/b" )
+
+		m2 = f.pathMatcher()
+		self.assertEqual( m2, IECore.PathMatcher( [ "/a/b", "/a/c" ] ) )
+		self.assertEqual( m1, IECore.PathMatcher( [ "/a/c", "/a/d" ] ) )
+
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testMatchPerformance( self ) :
+
+		m = IECore.PathMatcher()
+		for i in range( 0, 100 ) :
+			for j in range( 0, 100 ) :
+				for k in range( 0, 10 ) :
+					m.addPath( "/a{0}/b{1}/c{2}".format( i, j, k ) )
+
+		f = IECore.FrozenPathMatcher( m )
+		self.assertEqual( f.size(), m.size() )
+
+		t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+		for i in range( 0, 100 ) :
+			for j in range( 0, 100 ) :
+				f.match( "/a{0}/b{1}/c5".format( i, j ) )
+		t.stop()
+
+		print( "Matched {0} paths : {1}s".format( 100 * 100, t.totalElapsed() ) )
+
+	def tearDown( self ) :
+
+		if os.path.exists( os.path.join( "test", "IECore", "frozenPathMatcher.fio" ) ) :
+			os.remove( os.path.join( "test", "IECore", "frozenPathMatcher.fio" ) )
+
+if __name__ == "__main__":
+	unittest.main()
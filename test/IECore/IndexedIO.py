@@ -39,6 +39,8 @@ import unittest
 import math
 import random
 
+import imath
+
 import IECore
 
 class TestIndexedIO(unittest.TestCase):
@@ -623,6 +625,30 @@ class TestFileIndexedIO(unittest.TestCase):
 
 		self.assertEqual( d, d2 )
 
+	def testLargeCompressedDataIsSplitIntoBlocks( self ):
+
+		filePath = "./test/FileIndexedIO.fio"
+		options = IECore.CompoundData( { "compressor" : "lz4", "compressionLevel" : 9 } )
+
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Write, options = options )
+
+		# 48MB of data, which is compressed as a dozen independent blocks
+		d = IECore.IntVectorData( range( 12 * 1024 * 1024 ) )
+		f.write( "foo", d )
+
+		v = IECore.V3fVectorData( [ imath.V3f( random.random(), i, 0 ) for i in range( 512 * 1024 ) ] )
+		f.write( "bar", v )
+
+		del f
+
+		for readOptions in ( None, IECore.CompoundData( { "memoryMapped" : True } ) ) :
+
+			f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Read, options = readOptions )
+			self.assertEqual( f.read( "foo" ), d )
+			self.assertEqual( f.read( "bar" ), v )
+
+		self.assertTrue( os.path.getsize( filePath ) < 48 * 1024 * 1024 )
+
 	def testCompressionParametersAndVersionStoredInMetaData( self ):
 
 		options = IECore.CompoundData( { "compressor" : "zlib", "compressionLevel" : 3 } )
@@ -670,6 +696,89 @@ class TestFileIndexedIO(unittest.TestCase):
 		self.assertEqual( f.metadata(),
 			IECore.CompoundData( { "compressor" : "lz4", "compressionLevel" : 0, 'version': IECore.IntData( 7 ), "compressionThreadCount" : 1, "decompressionThreadCount" : 1 } ) )
 
+	def testMemoryMappedRead( self ):
+
+		filePath = "./test/FileIndexedIO.fio"
+
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Write, options = IECore.CompoundData( { "compressor" : "lz4", "compressionLevel" : 9 } ) )
+		g = f.subdirectory( "sub1", IECore.IndexedIO.MissingBehaviour.CreateIfMissing )
+
+		uncompressible = IECore.FloatVectorData( [ random.random() for i in range( 4096 ) ] )
+		compressible = IECore.IntVectorData( range( 4096 ) )
+		strings = IECore.StringVectorData( [ "a", "bb", "ccc" ] * 100 )
+
+		g.write( "uncompressible", uncompressible )
+		g.write( "compressible", compressible )
+		g.write( "strings", strings )
+		g.write( "int", 10 )
+		g.write( "string", "hello" )
+
+		del g, f
+
+		options = IECore.CompoundData( { "memoryMapped" : True } )
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Read, options = options )
+		g = f.subdirectory( "sub1" )
+
+		self.assertEqual( g.read( "uncompressible" ), uncompressible )
+		self.assertEqual( g.read( "compressible" ), compressible )
+		self.assertEqual( g.read( "strings" ), strings )
+		self.assertEqual( g.read( "int" ), IECore.IntData( 10 ) )
+		self.assertEqual( g.read( "string" ), IECore.StringData( "hello" ) )
+
+	def testMemoryMappedOptionIgnoredWhenWriting( self ):
+
+		filePath = "./test/FileIndexedIO.fio"
+		options = IECore.CompoundData( { "memoryMapped" : True } )
+
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Write, options = options )
+		f.write( "a", IECore.IntVectorData( range( 10 ) ) )
+		del f
+
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Append, options = options )
+		self.assertEqual( f.read( "a" ), IECore.IntVectorData( range( 10 ) ) )
+		f.write( "b", IECore.IntVectorData( range( 20 ) ) )
+		del f
+
+		f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Read, options = options )
+		self.assertEqual( f.read( "a" ), IECore.IntVectorData( range( 10 ) ) )
+		self.assertEqual( f.read( "b" ), IECore.IntVectorData( range( 20 ) ) )
+
+	def testRangedRead( self ):
+
+		filePath = "./test/FileIndexedIO.fio"
+
+		ints = IECore.IntVectorData( range( 8 * 1024 * 1024 ) )
+		floats = IECore.FloatVectorData( [ random.random() for i in range( 4096 ) ] )
+		strings = IECore.StringVectorData( [ "a", "bb", "ccc" ] * 100 )
+		names = IECore.InternedStringVectorData( [ "a", "bb", "ccc" ] * 100 )
+
+		for writeOptions in ( None, IECore.CompoundData( { "compressor" : "lz4", "compressionLevel" : 9 } ) ) :
+
+			f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Write, options = writeOptions )
+			f.write( "ints", ints )
+			f.write( "floats", floats )
+			f.write( "strings", strings )
+			f.write( "names", names )
+			del f
+
+			for readOptions in ( None, IECore.CompoundData( { "memoryMapped" : True } ) ) :
+
+				f = IECore.IndexedIO.create( filePath, [], IECore.IndexedIO.OpenMode.Read, options = readOptions )
+
+				# ranges within, spanning, and at the edges of the 4MB compressed blocks
+				blockLength = 1024 * 1024
+				for offset, count in ( ( 0, 10 ), ( 10, 0 ), ( blockLength - 5, 10 ), ( 3 * blockLength, 2 * blockLength ), ( len( ints ) - 5, 5 ) ) :
+					self.assertEqual( f.read( "ints", offset, count ), IECore.IntVectorData( ints[offset:offset+count] ) )
+
+				self.assertEqual( f.read( "floats", 100, 200 ), IECore.FloatVectorData( floats[100:300] ) )
+				self.assertEqual( f.read( "strings", 1, 4 ), IECore.StringVectorData( strings[1:5] ) )
+				self.assertEqual( f.read( "names", 1, 4 ), IECore.InternedStringVectorData( names[1:5] ) )
+
+				self.assertRaises( RuntimeError, f.read, "floats", 4000, 200 )
+				self.assertRaises( RuntimeError, f.read, "floats", 5000, 0 )
+
+				del f
+
 	def setUp( self ):
 
 		if os.path.isfile("./test/FileIndexedIO.fio") :
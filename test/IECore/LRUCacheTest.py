@@ -352,5 +352,41 @@ class LRUCacheTest( unittest.TestCase ) :
 		c.set( "d", "d", 1 )
 		self.assertEqual( c.currentCost(), 2 )
 
+	def testStatistics( self ) :
+
+		c = IECore.LRUCache( lambda key : ( key, 1 ), 2 )
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+
+		c.get( "a" )
+		c.get( "a" )
+		c.get( "b" )
+
+		s = c.statistics()
+		self.assertEqual( s.misses, 2 )
+		self.assertEqual( s.hits, 1 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertGreater( s.getterTime, 0 )
+
+		c.get( "c" )
+
+		s = c.statistics()
+		self.assertEqual( s.misses, 3 )
+		self.assertEqual( s.evictions, 1 )
+		self.assertEqual( s.evictedCost, 1 )
+
+		c.resetStatistics()
+
+		s = c.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.evictedCost, 0 )
+		self.assertEqual( s.getterTime, 0 )
+		self.assertEqual( s.concurrentWaits, 0 )
+
 if __name__ == "__main__":
     unittest.main()
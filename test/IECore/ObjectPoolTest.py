@@ -112,5 +112,33 @@ class ObjectPoolTest( unittest.TestCase ) :
 			p.contains( b.hash() )
 		)
 
+	def testStatistics( self ) :
+
+		p = IECore.ObjectPool( 500 )
+		a = p.store( IECore.IntData( 1 ), IECore.ObjectPool.StoreReference )
+		b = IECore.StringData( "abc" )
+
+		self.assertTrue( p.retrieve( a.hash() ).isSame( a ) )
+		self.assertEqual( p.retrieve( b.hash() ), None )
+
+		s = p.statistics()
+		self.assertEqual( s.hits, 1 )
+		self.assertEqual( s.misses, 1 )
+		self.assertEqual( s.evictions, 0 )
+
+		p.store( b, IECore.ObjectPool.StoreReference )
+		p.setMaxMemoryUsage( a.memoryUsage() )
+
+		s = p.statistics()
+		self.assertEqual( s.evictions, 1 )
+		self.assertGreater( s.evictedCost, 0 )
+
+		p.resetStatistics()
+		s = p.statistics()
+		self.assertEqual( s.hits, 0 )
+		self.assertEqual( s.misses, 0 )
+		self.assertEqual( s.evictions, 0 )
+		self.assertEqual( s.evictedCost, 0 )
+
 if __name__ == "__main__":
     unittest.main()
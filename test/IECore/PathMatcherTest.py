@@ -35,6 +35,7 @@
 #
 ##########################################################################
 
+import os
 import unittest
 import random
 
@@ -976,5 +977,116 @@ class PathMatcherTest( unittest.TestCase ) :
 		m.clear()
 		self.assertEqual( m.size(), 0 )
 
+	def testUnionOf( self ) :
+
+		m1 = IECore.PathMatcher( [ "/a", "/a/b/c", "/d/*/e" ] )
+		m2 = IECore.PathMatcher( [ "/a/b", "/d/*/e/f", "/g/..." ] )
+		m3 = IECore.PathMatcher( [ "/" ] )
+
+		self.assertEqual( IECore.PathMatcher.unionOf( [] ), IECore.PathMatcher() )
+		self.assertEqual( IECore.PathMatcher.unionOf( [ m1 ] ), m1 )
+		self.assertEqual( IECore.PathMatcher.unionOf( [ m1, m1 ] ), m1 )
+
+		u = IECore.PathMatcher.unionOf( [ m1, m2, m3 ] )
+		self.assertEqual( set( u.paths() ), set( m1.paths() + m2.paths() + m3.paths() ) )
+
+		# Inputs must not be modified, and the result must be
+		# editable without affecting them.
+		self.assertEqual( m1, IECore.PathMatcher( [ "/a", "/a/b/c", "/d/*/e" ] ) )
+		u.addPath( "/a/b/c/d" )
+		u.removePath( "/d/*/e" )
+		self.assertEqual( m1, IECore.PathMatcher( [ "/a", "/a/b/c", "/d/*/e" ] ) )
+		self.assertEqual( m2, IECore.PathMatcher( [ "/a/b", "/d/*/e/f", "/g/..." ] ) )
+
+	def testIntersectionOf( self ) :
+
+		m1 = IECore.PathMatcher( [ "/a", "/a/b", "/a/b/c", "/d/*/e", "/f" ] )
+		m2 = IECore.PathMatcher( [ "/a/b", "/a/b/c", "/d/*/e", "/g" ] )
+		m3 = IECore.PathMatcher( [ "/a/b/c", "/d/*/e", "/d/x/e" ] )
+
+		self.assertEqual( IECore.PathMatcher.intersectionOf( [] ), IECore.PathMatcher() )
+		self.assertEqual( IECore.PathMatcher.intersectionOf( [ m1 ] ), m1 )
+		self.assertEqual( IECore.PathMatcher.intersectionOf( [ m1, m2 ] ), m1.intersection( m2 ) )
+		self.assertEqual(
+			IECore.PathMatcher.intersectionOf( [ m1, m2, m3 ] ),
+			IECore.PathMatcher( [ "/a/b/c", "/d/*/e" ] )
+		)
+		self.assertTrue( IECore.PathMatcher.intersectionOf( [ m1, m2, IECore.PathMatcher() ] ).isEmpty() )
+
+	def testDifferenceOf( self ) :
+
+		m = IECore.PathMatcher( [ "/", "/a", "/a/b", "/a/b/c", "/d/*/e", "/f" ] )
+		m1 = IECore.PathMatcher( [ "/a/b", "/d/*/e" ] )
+		m2 = IECore.PathMatcher( [ "/", "/f/g" ] )
+
+		self.assertEqual( IECore.PathMatcher.differenceOf( m, [] ), m )
+		self.assertTrue( IECore.PathMatcher.differenceOf( m, [ m ] ).isEmpty() )
+
+		d = IECore.PathMatcher.differenceOf( m, [ m1, m2 ] )
+		self.assertEqual( d, IECore.PathMatcher( [ "/a", "/a/b/c", "/f" ] ) )
+
+		d.addPath( "/h" )
+		self.assertEqual( m, IECore.PathMatcher( [ "/", "/a", "/a/b", "/a/b/c", "/d/*/e", "/f" ] ) )
+
+	def testSetOperationsMatchPairwiseOperations( self ) :
+
+		matchers = []
+		for seed in range( 0, 6 ) :
+			paths = self.generatePaths( seed = seed, depthRange = ( 2, 5 ), numChildrenRange = ( 1, 8 ) )
+			matchers.append( IECore.PathMatcher( paths[:len(paths)//2+seed] ) )
+		# Identical but unshared, to exercise the detection of identical branches.
+		matchers.append( IECore.PathMatcher( matchers[0].paths() ) )
+
+		u = IECore.PathMatcher()
+		for m in matchers :
+			u.addPaths( m )
+		self.assertEqual( IECore.PathMatcher.unionOf( matchers ), u )
+
+		i = matchers[0]
+		for m in matchers[1:] :
+			i = i.intersection( m )
+		self.assertEqual( IECore.PathMatcher.intersectionOf( matchers ), i )
+		self.assertEqual( IECore.PathMatcher.intersectionOf( [ matchers[0], matchers[-1] ] ), matchers[0] )
+
+		d = IECore.PathMatcher( u )
+		for m in matchers[1:4] :
+			d.removePaths( m )
+		self.assertEqual( IECore.PathMatcher.differenceOf( u, matchers[1:4] ), d )
+		self.assertTrue( IECore.PathMatcher.differenceOf( matchers[0], [ matchers[-1] ] ).isEmpty() )
+
+	def testSizeEstimate( self ) :
+
+		m = IECore.PathMatcher()
+		self.assertEqual( m.sizeEstimate(), 0 )
+
+		m = IECore.PathMatcher( [ "/a", "/a/b/c", "/d/e", "/" ] )
+		self.assertEqual( m.sizeEstimate(), m.size() )
+
+		for i in range( 0, 100 ) :
+			for j in range( 0, 100 ) :
+				m.addPath( "/f/g{0}/h{1}".format( i, j ) )
+
+		self.assertEqual( m.sizeEstimate( maxLocations = 100000 ), m.size() )
+		self.assertEqual( m.sizeEstimate( maxLocations = 100 ), m.size() )
+		self.assertGreater( m.sizeEstimate( maxLocations = 0 ), 0 )
+
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testUnionOfPerformance( self ) :
+
+		matchers = []
+		for k in range( 0, 24 ) :
+			m = IECore.PathMatcher()
+			for i in range( 0, 50 ) :
+				for j in range( 0, 40 ) :
+					for l in range( 0, 10 ) :
+						m.addPath( "/world/g{0}/s{1}/p{2}".format( i, j, l + k ) )
+			matchers.append( m )
+
+		t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+		u = IECore.PathMatcher.unionOf( matchers )
+		t.stop()
+
+		print( "Union of {0} matchers with {1} paths : {2}s".format( len( matchers ), u.size(), t.totalElapsed() ) )
+
 if __name__ == "__main__":
 	unittest.main()
@@ -73,6 +73,56 @@ class SequenceLsOpTest( unittest.TestCase ) :
 		self.assertEqual( str( sequences[0] ), "test/IECore/sequences/sequenceLsTest/s.#.tif 1-10" )
 
 
+	def testRecursion( self ) :
+
+		for s in [
+			IECore.FileSequence( "test/IECore/sequences/sequenceLsTest/a.#.tif", IECore.FrameRange( 1, 5 ) ),
+			IECore.FileSequence( "test/IECore/sequences/sequenceLsTest/x/b.#.tif", IECore.FrameRange( 1, 5 ) ),
+			IECore.FileSequence( "test/IECore/sequences/sequenceLsTest/x/y/c.#.exr", IECore.FrameRange( 1, 5 ) ),
+		] :
+			os.system( "mkdir -p " + os.path.dirname( s.fileName ) )
+			for f in s.fileNames() :
+				os.system( "touch '" + f + "'" )
+
+		op = IECore.SequenceLsOp()
+		op['dir'] = IECore.StringData( "test/IECore/sequences/sequenceLsTest/" )
+		op['resultType'] = IECore.StringData( "stringVector" )
+
+		self.assertEqual(
+			list( op() ),
+			[ "test/IECore/sequences/sequenceLsTest/a.#.tif 1-5" ]
+		)
+
+		op['recurse'] = True
+		self.assertEqual(
+			list( op() ),
+			[
+				"test/IECore/sequences/sequenceLsTest/a.#.tif 1-5",
+				"test/IECore/sequences/sequenceLsTest/x/b.#.tif 1-5",
+				"test/IECore/sequences/sequenceLsTest/x/y/c.#.exr 1-5",
+			]
+		)
+
+		op['maxDepth'] = 1
+		self.assertEqual(
+			list( op() ),
+			[
+				"test/IECore/sequences/sequenceLsTest/a.#.tif 1-5",
+				"test/IECore/sequences/sequenceLsTest/x/b.#.tif 1-5",
+			]
+		)
+
+		op['maxDepth'] = 1000
+		op['extensions'] = IECore.StringVectorData( [ "exr" ] )
+		op['type'] = "files"
+		self.assertEqual(
+			list( op() ),
+			[ "test/IECore/sequences/sequenceLsTest/x/y/c.#.exr 1-5" ]
+		)
+
+		op['type'] = "directories"
+		self.assertEqual( list( op() ), [] )
+
 	def setUp( self ) :
 
 		if os.path.exists( "test/IECore/sequences/sequenceLsTest" ) :
@@ -64,6 +64,28 @@ class CachedConverterTest( unittest.TestCase ) :
 
 		self.assertFalse( gm.isSame( gm3 ) )
 
+	def testConvertWithPrevious( self ) :
+
+		c = IECoreGL.CachedConverter( 500 * 1024 * 1024 ) # 500 megs
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 10 ) )
+		gm = c.convert( m )
+
+		m2 = m.copy()
+		m2["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p * 2 for p in m["P"].data ] )
+		)
+
+		gm2 = c.convert( m2, m )
+		self.assertFalse( gm2.isSame( gm ) )
+		self.assertTrue( gm2.isSame( c.convert( m2 ) ) )
+		self.assertTrue( gm2.isSame( c.convert( m2, m ) ) )
+
+		self.assertEqual( gm2.vertexIds(), gm.vertexIds() )
+		self.assertEqual( gm2.getPrimitiveVariableData( "uv" ), gm.getPrimitiveVariableData( "uv" ) )
+		self.assertEqual( gm2.getPrimitiveVariableData( "P" ), IECoreGL.ToGLMeshConverter( m2 ).convert().getPrimitiveVariableData( "P" ) )
+
 	def testDefaultInstance( self ) :
 
 		c1 = IECoreGL.CachedConverter.defaultCachedConverter()
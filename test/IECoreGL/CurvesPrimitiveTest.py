@@ -749,6 +749,72 @@ class CurvesPrimitiveTest( unittest.TestCase ) :
 			shader = self.showColorShader(),
 		)
 
+	def testUpdate( self ) :
+
+		c = IECoreScene.CurvesPrimitive(
+			IECore.IntVectorData( [ 2, 3 ] ),
+			IECore.CubicBasisf.linear(),
+			False,
+			IECore.V3fVectorData( [ imath.V3f( 0 ), imath.V3f( 1, 0, 0 ), imath.V3f( 0, 1, 0 ), imath.V3f( 1, 1, 0 ), imath.V3f( 2, 1, 0 ) ] )
+		)
+		c["Cs"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+			IECore.Color3fVectorData( [ imath.Color3f( 1, 0, 0 ), imath.Color3f( 0, 1, 0 ) ] )
+		)
+
+		glCurves = IECoreGL.ToGLCurvesConverter( c ).convert()
+
+		# Deforming the curves requires only "P" to be converted again.
+		# The reused "Cs" must still hold the per-vertex expansion of the
+		# Uniform values.
+
+		c2 = c.copy()
+		c2["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p + imath.V3f( 0, 0, 1 ) for p in c["P"].data ] )
+		)
+
+		glCurves2 = IECoreGL.ToGLCurvesConverter( c2 ).update( glCurves )
+		expected = IECoreGL.ToGLCurvesConverter( c2 ).convert()
+
+		self.assertEqual( glCurves2.getTopologyHash(), glCurves.getTopologyHash() )
+		self.assertEqual( glCurves2.bound(), expected.bound() )
+		self.assertNotEqual( glCurves2.bound(), glCurves.bound() )
+
+		self.assertNotEqual( glCurves2.getPrimitiveVariableHash( "P" ), glCurves.getPrimitiveVariableHash( "P" ) )
+		self.assertEqual( glCurves2.getPrimitiveVariableData( "P" ), expected.getPrimitiveVariableData( "P" ) )
+
+		self.assertEqual( glCurves2.getPrimitiveVariableHash( "Cs" ), glCurves.getPrimitiveVariableHash( "Cs" ) )
+		self.assertEqual( glCurves2.getPrimitiveVariableData( "Cs" ), expected.getPrimitiveVariableData( "Cs" ) )
+		self.assertEqual(
+			glCurves2.getPrimitiveVariableData( "Cs" ),
+			IECore.Color3fVectorData( [ imath.Color3f( 1, 0, 0 ) ] * 2 + [ imath.Color3f( 0, 1, 0 ) ] * 3 )
+		)
+
+		# Changing the topology requires a full conversion, including
+		# a fresh expansion of the Uniform primitive variables.
+
+		c3 = IECoreScene.CurvesPrimitive(
+			IECore.IntVectorData( [ 3, 2 ] ),
+			IECore.CubicBasisf.linear(),
+			False,
+			c["P"].data
+		)
+		c3["Cs"] = c["Cs"]
+
+		glCurves3 = IECoreGL.ToGLCurvesConverter( c3 ).update( glCurves )
+		expected = IECoreGL.ToGLCurvesConverter( c3 ).convert()
+
+		self.assertNotEqual( glCurves3.getTopologyHash(), glCurves.getTopologyHash() )
+		self.assertEqual( glCurves3.getTopologyHash(), expected.getTopologyHash() )
+		self.assertEqual( glCurves3.bound(), expected.bound() )
+		for name in ( "P", "Cs" ) :
+			self.assertEqual( glCurves3.getPrimitiveVariableData( name ), expected.getPrimitiveVariableData( name ) )
+		self.assertEqual(
+			glCurves3.getPrimitiveVariableData( "Cs" ),
+			IECore.Color3fVectorData( [ imath.Color3f( 1, 0, 0 ) ] * 3 + [ imath.Color3f( 0, 1, 0 ) ] * 2 )
+		)
+
 	def setUp( self ) :
 
 		if not os.path.isdir( "test/IECoreGL/output" ) :
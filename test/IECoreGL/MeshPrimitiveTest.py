@@ -270,6 +270,102 @@ class MeshPrimitiveTest( unittest.TestCase ) :
 
 		self.assertEqual( IECoreImage.ImageDiffOp()( imageA = expectedImage, imageB = actualImage, maxError = 0.05 ).value, False )
 
+	def testWeldedVertices( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 2 ) )
+		self.assertEqual( m["uv"].interpolation, IECoreScene.PrimitiveVariable.Interpolation.FaceVarying )
+
+		# Corners with the same vertex and the same FaceVarying values share a GL vertex.
+
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		self.assertEqual( len( glMesh.vertexIds() ), 24 )
+		self.assertEqual( len( set( glMesh.vertexIds() ) ), 9 )
+
+		# Calculated face normals prevent welding between faces, even
+		# though they are equal for all faces of a plane. This keeps the
+		# welding independent of "P".
+
+		del m["N"]
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		self.assertEqual( len( set( glMesh.vertexIds() ) ), 16 )
+
+		# As do differing Uniform values.
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 2 ) )
+		m["Cs"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+			IECore.Color3fVectorData( [ imath.Color3f( i ) for i in range( 0, 4 ) ] )
+		)
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		self.assertEqual( len( glMesh.vertexIds() ), 24 )
+		self.assertEqual( len( set( glMesh.vertexIds() ) ), 16 )
+
+		# As do differing FaceVarying values.
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 2 ) )
+		m["uv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, m["uv"].expandedData() )
+		m["fv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, IECore.IntVectorData( range( 0, 16 ) ) )
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		self.assertEqual( len( set( glMesh.vertexIds() ) ), 16 )
+
+	def testTriangles( self ) :
+
+		m = IECoreScene.MeshAlgo.triangulate(
+			IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 2 ) )
+		)
+
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+		self.assertEqual( len( glMesh.vertexIds() ), len( m.vertexIds ) )
+		self.assertEqual( len( set( glMesh.vertexIds() ) ), 9 )
+		self.assertEqual( m.bound(), glMesh.bound() )
+
+	def testUpdate( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 2 ) )
+		m["Cs"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+			IECore.Color3fVectorData( [ imath.Color3f( i ) for i in range( 0, 4 ) ] )
+		)
+		del m["N"]
+
+		glMesh = IECoreGL.ToGLMeshConverter( m ).convert()
+
+		# Deforming the mesh requires only "P" and the calculated normals
+		# to be converted again.
+
+		m2 = m.copy()
+		m2["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ p + imath.V3f( 0, 0, p.x ) for p in m["P"].data ] )
+		)
+
+		glMesh2 = IECoreGL.ToGLMeshConverter( m2 ).update( glMesh )
+		expected = IECoreGL.ToGLMeshConverter( m2 ).convert()
+
+		self.assertEqual( glMesh2.getTopologyHash(), glMesh.getTopologyHash() )
+		self.assertEqual( glMesh2.vertexIds(), glMesh.vertexIds() )
+		self.assertEqual( glMesh2.vertexIds(), expected.vertexIds() )
+		self.assertEqual( glMesh2.bound(), expected.bound() )
+
+		for name in ( "P", "N", "uv", "Cs" ) :
+			self.assertEqual( glMesh2.getPrimitiveVariableData( name ), expected.getPrimitiveVariableData( name ) )
+			self.assertEqual( glMesh2.getPrimitiveVariableHash( name ), expected.getPrimitiveVariableHash( name ) )
+
+		self.assertEqual( glMesh2.getPrimitiveVariableHash( "uv" ), glMesh.getPrimitiveVariableHash( "uv" ) )
+		self.assertNotEqual( glMesh2.getPrimitiveVariableHash( "P" ), glMesh.getPrimitiveVariableHash( "P" ) )
+		self.assertNotEqual( glMesh2.getPrimitiveVariableData( "N" ), glMesh.getPrimitiveVariableData( "N" ) )
+
+		# Changing the topology requires a full conversion.
+
+		m3 = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 3 ) )
+		glMesh3 = IECoreGL.ToGLMeshConverter( m3 ).update( glMesh )
+		expected = IECoreGL.ToGLMeshConverter( m3 ).convert()
+
+		self.assertNotEqual( glMesh3.getTopologyHash(), glMesh.getTopologyHash() )
+		self.assertEqual( glMesh3.vertexIds(), expected.vertexIds() )
+		for name in ( "P", "N", "uv" ) :
+			self.assertEqual( glMesh3.getPrimitiveVariableData( name ), expected.getPrimitiveVariableData( name ) )
+
 	def setUp( self ) :
 
 		if not os.path.isdir( "test/IECoreGL/output" ) :
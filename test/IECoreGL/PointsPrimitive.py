@@ -576,6 +576,74 @@ class TestPointsPrimitive( unittest.TestCase ) :
 		self.assertEqual( i["G"][index], 1 )
 		self.assertEqual( i["B"][index], 0 )
 
+	def testUpdate( self ) :
+
+		p = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( i ) for i in range( 0, 4 ) ] ) )
+		p["width"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 1, 1, 1 ] )
+		)
+		p["Cs"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.Color3fVectorData( [ imath.Color3f( i ) for i in range( 0, 4 ) ] )
+		)
+
+		glPoints = IECoreGL.ToGLPointsConverter( p ).convert()
+
+		# Changing only "Cs" should reuse "P" and "width", and leave
+		# the bound untouched.
+
+		p2 = p.copy()
+		p2["Cs"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.Color3fVectorData( [ imath.Color3f( 1, 0, 0 ) ] * 4 )
+		)
+
+		glPoints2 = IECoreGL.ToGLPointsConverter( p2 ).update( glPoints )
+		expected = IECoreGL.ToGLPointsConverter( p2 ).convert()
+
+		self.assertEqual( glPoints2.getTopologyHash(), glPoints.getTopologyHash() )
+		for name in ( "P", "width" ) :
+			self.assertEqual( glPoints2.getPrimitiveVariableHash( name ), glPoints.getPrimitiveVariableHash( name ) )
+			self.assertEqual( glPoints2.getPrimitiveVariableData( name ), glPoints.getPrimitiveVariableData( name ) )
+		self.assertNotEqual( glPoints2.getPrimitiveVariableHash( "Cs" ), glPoints.getPrimitiveVariableHash( "Cs" ) )
+		self.assertEqual( glPoints2.getPrimitiveVariableData( "Cs" ), expected.getPrimitiveVariableData( "Cs" ) )
+		self.assertEqual( glPoints2.bound(), glPoints.bound() )
+
+		# Changing "P" or "width" requires them to be converted again,
+		# and the bound to be recomputed.
+
+		p3 = p.copy()
+		p3["P"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.V3fVectorData( [ imath.V3f( i * 2 ) for i in range( 0, 4 ) ] )
+		)
+
+		glPoints3 = IECoreGL.ToGLPointsConverter( p3 ).update( glPoints )
+		expected = IECoreGL.ToGLPointsConverter( p3 ).convert()
+
+		self.assertNotEqual( glPoints3.getPrimitiveVariableHash( "P" ), glPoints.getPrimitiveVariableHash( "P" ) )
+		self.assertEqual( glPoints3.getPrimitiveVariableData( "P" ), expected.getPrimitiveVariableData( "P" ) )
+		self.assertEqual( glPoints3.getPrimitiveVariableHash( "width" ), glPoints.getPrimitiveVariableHash( "width" ) )
+		self.assertEqual( glPoints3.getPrimitiveVariableHash( "Cs" ), glPoints.getPrimitiveVariableHash( "Cs" ) )
+		self.assertEqual( glPoints3.bound(), expected.bound() )
+		self.assertNotEqual( glPoints3.bound(), glPoints.bound() )
+
+		p4 = p.copy()
+		p4["width"] = IECoreScene.PrimitiveVariable(
+			IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+			IECore.FloatVectorData( [ 1, 1, 1, 4 ] )
+		)
+
+		glPoints4 = IECoreGL.ToGLPointsConverter( p4 ).update( glPoints )
+		expected = IECoreGL.ToGLPointsConverter( p4 ).convert()
+
+		self.assertNotEqual( glPoints4.getPrimitiveVariableHash( "width" ), glPoints.getPrimitiveVariableHash( "width" ) )
+		self.assertEqual( glPoints4.getPrimitiveVariableData( "width" ), expected.getPrimitiveVariableData( "width" ) )
+		self.assertEqual( glPoints4.getPrimitiveVariableHash( "P" ), glPoints.getPrimitiveVariableHash( "P" ) )
+		self.assertEqual( glPoints4.bound(), expected.bound() )
+		self.assertNotEqual( glPoints4.bound(), glPoints.bound() )
+
 	def setUp( self ) :
 
 		if not os.path.isdir( "test/IECoreGL/output" ) :
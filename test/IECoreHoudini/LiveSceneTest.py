@@ -379,6 +379,11 @@ class LiveSceneTest( IECoreHoudini.TestCase ) :
 		# check read primvars
 		self.assertEqual( mesh["P"], box1.readObjectPrimitiveVariables( [ "P" ], 0 )["P"] )
 
+		# check ranged reads, which slice the primvars read above
+		pRange = box1.readObjectPrimitiveVariablesRange( [ "P" ], 0, 2, 3 )["P"]
+		self.assertEqual( pRange.data, IECore.V3fVectorData( vertList[2:5], IECore.GeometricData.Interpretation.Point ) )
+		self.assertEqual( pRange.data.getInterpretation(), IECore.GeometricData.Interpretation.Point )
+
 	def testAnimatedMesh( self ) :
 
 		scene = self.buildScene()
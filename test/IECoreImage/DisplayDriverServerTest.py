@@ -33,6 +33,7 @@
 ##########################################################################
 
 import unittest
+import imath
 
 import IECore
 import IECoreImage
@@ -58,6 +59,41 @@ class DisplayDriverServerTest( unittest.TestCase ) :
 		self.assertNotEqual( s4.portNumber(), 0 )
 		self.assertNotEqual( s4.portNumber(), s3.portNumber() )
 
+	def testMultipleSessions( self ) :
+
+		s = IECoreImage.DisplayDriverServer( 0, numThreads = 4 )
+
+		window = imath.Box2i( imath.V2i( 0 ), imath.V2i( 63 ) )
+		drivers = []
+		for i in range( 0, 4 ) :
+			drivers.append(
+				IECoreImage.ClientDisplayDriver(
+					window, window,
+					[ "Y" ],
+					IECore.CompoundData( {
+						"displayHost" : "localhost",
+						"displayPort" : str( s.portNumber() ),
+						"remoteDisplayType" : "ImageDisplayDriver",
+						"handle" : "multipleSessions{0}".format( i ),
+						"displayTransportSharedMemorySize" : IECore.IntData( 1024 * 1024 if i % 2 else 0 ),
+					} )
+				)
+			)
+
+		for y in range( 0, 64 ) :
+			for i, d in enumerate( drivers ) :
+				d.imageData(
+					imath.Box2i( imath.V2i( 0, y ), imath.V2i( 63, y ) ),
+					IECore.FloatVectorData( [ i + y / 64.0 ] * 64 )
+				)
+
+		for d in drivers :
+			d.imageClose()
+
+		for i in range( 0, 4 ) :
+			image = IECoreImage.ImageDisplayDriver.removeStoredImage( "multipleSessions{0}".format( i ) )
+			self.assertEqual( image["Y"], IECore.FloatVectorData( [ i + y / 64.0 for y in range( 0, 64 ) for x in range( 0, 64 ) ] ) )
+
 if __name__ == "__main__":
 	unittest.main()
 
@@ -139,6 +139,59 @@ class ImageDisplayDriverTest(unittest.TestCase):
 		i = dd.image()
 		self.assertEqual( i["Y"], y )
 
+	def testBuckets( self ) :
+
+		dataWindow = imath.Box2i( imath.V2i( 10, 20 ), imath.V2i( 209, 179 ) )
+		for numChannels in ( 1, 3, 4, 7, 70 ) :
+
+			channelNames = [ "c{0}".format( i ) for i in range( 0, numChannels ) ]
+			dd = IECoreImage.ImageDisplayDriver( dataWindow, dataWindow, channelNames, IECore.CompoundData() )
+
+			# Buckets of varying sizes, including a large one which is
+			# deinterleaved in parallel.
+			for box in [
+				imath.Box2i( imath.V2i( 10, 20 ), imath.V2i( 25, 35 ) ),
+				imath.Box2i( imath.V2i( 26, 20 ), imath.V2i( 209, 20 ) ),
+				imath.Box2i( imath.V2i( 26, 21 ), imath.V2i( 209, 179 ) ),
+				imath.Box2i( imath.V2i( 10, 36 ), imath.V2i( 25, 179 ) ),
+			] :
+				data = IECore.FloatVectorData()
+				for y in range( box.min().y, box.max().y + 1 ) :
+					for x in range( box.min().x, box.max().x + 1 ) :
+						for c in range( 0, numChannels ) :
+							data.append( x + y * 1000 + c * 1000000 )
+				dd.imageData( box, data )
+
+			dd.imageClose()
+
+			image = dd.image()
+			for c, name in enumerate( channelNames ) :
+				expected = IECore.FloatVectorData( [
+					x + y * 1000 + c * 1000000
+					for y in range( dataWindow.min().y, dataWindow.max().y + 1 )
+					for x in range( dataWindow.min().x, dataWindow.max().x + 1 )
+				] )
+				self.assertEqual( image[name], expected )
+
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testImageDataPerformance( self ) :
+
+		dataWindow = imath.Box2i( imath.V2i( 0 ), imath.V2i( 1919, 1079 ) )
+		for numChannels in ( 4, 32 ) :
+			for bucketSize in ( 16, 64, 256 ) :
+
+				channelNames = [ "c{0}".format( i ) for i in range( 0, numChannels ) ]
+				dd = IECoreImage.ImageDisplayDriver( dataWindow, dataWindow, channelNames, IECore.CompoundData() )
+				data = IECore.FloatVectorData( [ 1 ] * ( bucketSize * bucketSize * numChannels ) )
+
+				t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+				for y in range( 0, 1080 - bucketSize + 1, bucketSize ) :
+					for x in range( 0, 1920 - bucketSize + 1, bucketSize ) :
+						dd.imageData( imath.Box2i( imath.V2i( x, y ), imath.V2i( x + bucketSize - 1, y + bucketSize - 1 ) ), data )
+				print( "{0} channels, {1}x{1} buckets : {2}s".format( numChannels, bucketSize, t.stop() ) )
+
+				dd.imageClose()
+
 class ClientServerDisplayDriverTest(unittest.TestCase):
 
 	def setUp( self ):
@@ -165,7 +218,7 @@ class ClientServerDisplayDriverTest(unittest.TestCase):
 
 		self.assertRaises( RuntimeError, lambda : IECoreImage.DisplayDriverServer( 1559 ) )
 
-	def testTransfer( self ):
+	def __transfer( self, extraParameters = {} ) :
 
 		img = IECore.Reader.create( "test/IECoreImage/data/tiff/bluegreen_noise.400x300.tif" )()
 		self.assertEqual( img.keys(), [ 'B', 'G', 'R' ] )
@@ -180,6 +233,7 @@ class ClientServerDisplayDriverTest(unittest.TestCase):
 		params["remoteDisplayType"] = IECore.StringData( "ImageDisplayDriver" )
 		params["handle"] = IECore.StringData( "myHandle" )
 		params["header:myMetadata"] = IECore.StringData( "Metadata!" )
+		params.update( extraParameters )
 		idd = IECoreImage.ClientDisplayDriver( img.displayWindow, img.dataWindow, list( img.channelNames() ), params )
 
 		buf = IECore.FloatVectorData( width * 3 )
@@ -197,8 +251,46 @@ class ClientServerDisplayDriverTest(unittest.TestCase):
 		# remove blindData for comparison
 		newImg.blindData().clear()
 		img.blindData().clear()
+
+		return img, newImg
+
+	def testTransfer( self ):
+
+		img, newImg = self.__transfer()
 		self.assertEqual( newImg, img )
 
+	def testTransferWithTransport( self ) :
+
+		for parameters in [
+			{ "displayTransportBatchSize" : IECore.IntData( 64 * 1024 ) },
+			{ "displayTransportCompression" : IECore.BoolData( True ) },
+			{ "displayTransportQueueSize" : IECore.IntData( 4 ) },
+			{
+				"displayTransportBatchSize" : IECore.IntData( 64 * 1024 ),
+				"displayTransportCompression" : IECore.BoolData( True ),
+				"displayTransportQueueSize" : IECore.IntData( 4 ),
+			},
+			{ "displayTransportSharedMemorySize" : IECore.IntData( 1024 * 1024 ) },
+			# Buffer smaller than the batches, so some must fall back to the socket.
+			{
+				"displayTransportSharedMemorySize" : IECore.IntData( 16 * 1024 ),
+				"displayTransportBatchSize" : IECore.IntData( 64 * 1024 ),
+				"displayTransportQueueSize" : IECore.IntData( 4 ),
+			},
+		] :
+			img, newImg = self.__transfer( parameters )
+			self.assertEqual( newImg, img )
+
+		img, newImg = self.__transfer( {
+			"displayTransportHalf" : IECore.BoolData( True ),
+			"displayTransportCompression" : IECore.BoolData( True ),
+			"displayTransportQueueSize" : IECore.IntData( 4 ),
+		} )
+		self.assertEqual( newImg.dataWindow, img.dataWindow )
+		for channel in img.keys() :
+			for a, b in zip( img[channel], newImg[channel] ) :
+				self.assertAlmostEqual( a, b, delta = abs( a ) / 1000.0 + 1e-6 )
+
 	def testWrongSocketException( self ) :
 
 		parameters = IECore.CompoundData( {
@@ -384,6 +384,77 @@ class ImageReaderTest( unittest.TestCase ) :
 		self.assertEqual( r.dataWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 255, 127 ) ) )
 		self.assertEqual( r.displayWindow(), imath.Box2i( imath.V2i( 0 ), imath.V2i( 255, 127 ) ) )
 
+	def testRegionOfInterest( self ) :
+
+		r = IECoreImage.ImageReader( "test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr" )
+		full = r.read()
+
+		r["regionOfInterest"].setTypedValue( imath.Box2i( imath.V2i( 30, 20 ), imath.V2i( 39, 44 ) ) )
+		i = r.read()
+
+		self.assertEqual( i.dataWindow, imath.Box2i( imath.V2i( 30, 25 ), imath.V2i( 39, 44 ) ) )
+		self.assertEqual( i.displayWindow, full.displayWindow )
+		self.assertEqual( i.blindData(), full.blindData() )
+		self.assertTrue( i.channelsValid() )
+
+		self.__assertIsCrop( i, full )
+
+		r["regionOfInterest"].setTypedValue( imath.Box2i( imath.V2i( 60 ), imath.V2i( 70 ) ) )
+		self.assertRaises( RuntimeError, r.read )
+
+	def testBlocks( self ) :
+
+		for fileName in [
+			"test/IECoreImage/data/exr/uvMapWithDataWindow.100x100.exr",
+			"test/IECoreImage/data/tx/uvMap.512x256.tx",
+			"test/IECoreImage/data/tiff/tilesWithLeftovers.tif",
+		] :
+
+			r = IECoreImage.ImageReader( fileName )
+			full = r.read()
+
+			dataWindow = r.dataWindow()
+			for region in [ imath.Box2i(), imath.Box2i( dataWindow.min() + imath.V2i( 3 ), dataWindow.max() - imath.V2i( 5 ) ) ] :
+
+				blocks = r.blocks( region )
+				expectedRegion = dataWindow if region.isEmpty() else region
+
+				# Blocks must exactly cover the region without overlapping.
+				area = 0
+				union = imath.Box2i()
+				for b in blocks :
+					self.assertFalse( b.isEmpty() )
+					area += ( b.size().x + 1 ) * ( b.size().y + 1 )
+					union.extendBy( b )
+
+				self.assertEqual( union, expectedRegion )
+				self.assertEqual( area, ( expectedRegion.size().x + 1 ) * ( expectedRegion.size().y + 1 ) )
+
+				for b in blocks :
+					i = r.readRegion( b )
+					self.assertEqual( i.dataWindow, b )
+					self.assertTrue( i.channelsValid() )
+					self.__assertIsCrop( i, full )
+
+		self.assertRaises( RuntimeError, r.readRegion, imath.Box2i( imath.V2i( -1 ), imath.V2i( 10 ) ) )
+
+	def __assertIsCrop( self, crop, full ) :
+
+		self.assertEqual( set( crop.keys() ), set( full.keys() ) )
+
+		cropWindow = crop.dataWindow
+		fullWindow = full.dataWindow
+		cropWidth = cropWindow.size().x + 1
+		fullWidth = fullWindow.size().x + 1
+
+		for c in crop.keys() :
+			for y in range( cropWindow.min().y, cropWindow.max().y + 1 ) :
+				for x in range( cropWindow.min().x, cropWindow.max().x + 1 ) :
+					self.assertEqual(
+						crop[c][ (y - cropWindow.min().y) * cropWidth + x - cropWindow.min().x ],
+						full[c][ (y - fullWindow.min().y) * fullWidth + x - fullWindow.min().x ]
+					)
+
 	def setUp( self ) :
 
 		if os.path.isfile( "test/IECoreImage/data/exr/output.exr") :
@@ -839,6 +839,56 @@ class ImageWriterTest( unittest.TestCase ) :
 
 		self.__verifyImageRGB( imgNew, imgOrig )
 
+	def testTileSizeParameter( self ) :
+
+		displayWindow = imath.Box2i( imath.V2i( 0 ), imath.V2i( 199, 149 ) )
+		dataWindow = imath.Box2i( imath.V2i( 10, 5 ), imath.V2i( 170, 140 ) )
+
+		for fileName, formatName, window in (
+			( "test/IECoreImage/data/exr/output.exr", "openexr", dataWindow ),
+			( "test/IECoreImage/data/tiff/output.tif", "tiff", displayWindow ),
+		) :
+
+			imgOrig = self.__makeFloatImage( window, displayWindow )
+
+			for tileSize in ( 0, 16, 64 ) :
+
+				w = IECore.Writer.create( imgOrig, fileName )
+				w["formatSettings"][formatName]["dataType"].setValue( "float" )
+				w["formatSettings"][formatName]["tileSize"].setTypedValue( tileSize )
+				w.write()
+
+				imgNew = IECore.Reader.create( fileName ).read()
+				self.assertEqual( imgNew.dataWindow, window )
+				self.__verifyImageRGB( imgNew, imgOrig, maxError = 0 )
+
+	def testManyChannels( self ) :
+
+		# Sizes chosen so that the image doesn't divide evenly into
+		# the blocks used for writing.
+		dataWindow = imath.Box2i( imath.V2i( -3, 7 ), imath.V2i( 250, 200 ) )
+		displayWindow = imath.Box2i( imath.V2i( 0 ), imath.V2i( 255 ) )
+
+		imgOrig = IECoreImage.ImagePrimitive( dataWindow, displayWindow )
+		numPixels = ( dataWindow.size().x + 1 ) * ( dataWindow.size().y + 1 )
+		for c in range( 0, 20 ) :
+			imgOrig["aov{}".format( c )] = IECore.FloatVectorData( [ float( c * numPixels + i ) for i in range( 0, numPixels ) ] )
+
+		w = IECore.Writer.create( imgOrig, "test/IECoreImage/data/exr/output.exr" )
+		w["formatSettings"]["openexr"]["dataType"].setValue( "float" )
+
+		for tileSize in ( 0, 32 ) :
+
+			w["formatSettings"]["openexr"]["tileSize"].setTypedValue( tileSize )
+			w.write()
+
+			imgNew = IECore.Reader.create( "test/IECoreImage/data/exr/output.exr" ).read()
+			self.assertEqual( imgNew.dataWindow, imgOrig.dataWindow )
+			self.assertEqual( imgNew.displayWindow, imgOrig.displayWindow )
+			self.assertEqual( sorted( imgNew.keys() ), sorted( imgOrig.keys() ) )
+			for c in imgOrig.keys() :
+				self.assertEqual( imgNew[c], imgOrig[c] )
+
 	def tearDown( self ) :
 
 		## \todo: replace with self.temporaryDirectory() once that is available
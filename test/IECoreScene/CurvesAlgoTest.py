@@ -875,6 +875,15 @@ class CurvesAlgoTest( unittest.TestCase ) :
 		self.assertEqual( segments[0]["P"].data, IECore.V3fVectorData( [p0, p1], IECore.GeometricData.Interpretation.Point ) )
 		self.assertEqual( segments[1]["P"].data, IECore.V3fVectorData( [p2, p3], IECore.GeometricData.Interpretation.Point ) )
 
+	def testRaisesExceptionIfSegmentPrimitiveVariableIsNotUniform( self ) :
+		curves = self.curvesLinear()
+
+		curves["v"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.IntVectorData( [0, 0, 1, 1] ) )
+		self.assertRaises( RuntimeError, IECoreScene.CurvesAlgo.segment, curves, curves["v"], IECore.IntVectorData( [0, 1] ) )
+
+		curves["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [0, 1, 1] ) )
+		self.assertRaises( RuntimeError, IECoreScene.CurvesAlgo.segment, curves, curves["u"], IECore.IntVectorData( [0, 1] ) )
+
 	def testCanSegmentUsingStringPrimvar( self ) :
 		curves = self.curvesLinear()
 
@@ -986,6 +995,36 @@ class CurvesAlgoTest( unittest.TestCase ) :
 		self.assertEqual( segments[0]["P"].data, IECore.V3fVectorData( [p2, p3], IECore.GeometricData.Interpretation.Point ) )
 		self.assertEqual( segments[1]["P"].data, IECore.V3fVectorData( [p0, p1], IECore.GeometricData.Interpretation.Point ) )
 
+	def testSegmentMatchesDeleteCurves( self ) :
+
+		verticesPerCurve = [ 4 + ( i % 3 ) for i in range( 0, 50 ) ]
+		numVertices = sum( verticesPerCurve )
+
+		curves = IECoreScene.CurvesPrimitive(
+			IECore.IntVectorData( verticesPerCurve ),
+			IECore.CubicBasisf.bSpline(),
+			False,
+			IECore.V3fVectorData( [ imath.V3f( i ) for i in range( 0, numVertices ) ] )
+		)
+
+		numVarying = curves.variableSize( IECoreScene.PrimitiveVariable.Interpolation.Varying )
+		curves["v"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Varying, IECore.FloatVectorData( range( 0, numVarying ) ) )
+		curves["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ 10, 20, 30 ] ), IECore.IntVectorData( [ i % 3 for i in range( 0, 50 ) ] ) )
+		curves["c"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Constant, IECore.StringData( "c" ) )
+		curves["s"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ ( i * 7 ) % 11 for i in range( 0, 50 ) ] ) )
+
+		segmentValues = IECore.IntVectorData( range( 0, 11 ) )
+		segments = IECoreScene.CurvesAlgo.segment( curves, curves["s"], segmentValues )
+		self.assertEqual( len( segments ), 11 )
+
+		for value, segment in zip( segmentValues, segments ) :
+			toDelete = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+				IECore.BoolVectorData( [ s != value for s in curves["s"].data ] )
+			)
+			self.assertTrue( segment.arePrimitiveVariablesValid() )
+			self.assertEqual( segment, IECoreScene.CurvesAlgo.deleteCurves( curves, toDelete ) )
+
 	# endregion
 
 	# region bezier
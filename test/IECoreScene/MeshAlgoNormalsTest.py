@@ -33,6 +33,7 @@
 ##########################################################################
 
 import math
+import os
 import unittest
 
 import IECore
@@ -91,5 +92,50 @@ class MeshAlgoNormalsTest( unittest.TestCase ) :
 		for n in normals.data :
 			self.assertEqual( n, imath.V3f( 0, 0, 1 ) )
 
+	def testVertexNormalsAreAverageOfFaceNormals( self ) :
+
+		s = IECore.Reader.create( "test/IECore/data/cobFiles/pSphereShape1.cob" ).read()
+		del s["N"]
+
+		vertexNormals = IECoreScene.MeshAlgo.calculateNormals( s ).data
+		faceNormals = IECoreScene.MeshAlgo.calculateNormals( s, interpolation = IECoreScene.PrimitiveVariable.Interpolation.Uniform ).data
+
+		expected = [ imath.V3f( 0 ) ] * len( vertexNormals )
+		offset = 0
+		for face, numVerts in enumerate( s.verticesPerFace ) :
+			for i in range( offset, offset + numVerts ) :
+				expected[s.vertexIds[i]] += faceNormals[face]
+			offset += numVerts
+
+		for v, n in enumerate( vertexNormals ) :
+			self.assertTrue( n.equalWithAbsError( expected[v].normalized(), 1e-6 ) )
+
+	def testSharedTopology( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ) )
+		del m["N"]
+
+		m2 = m.copy()
+		m2["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData( [ imath.V3f( p.x, 0, p.y ) for p in m["P"].data ] ) )
+
+		for n in IECoreScene.MeshAlgo.calculateNormals( m ).data :
+			self.assertEqual( n, imath.V3f( 0, 0, 1 ) )
+
+		for n in IECoreScene.MeshAlgo.calculateNormals( m2 ).data :
+			self.assertEqual( n, imath.V3f( 0, -1, 0 ) )
+
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testPerformance( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 3200 ) )
+		del m["N"]
+
+		for interpolation in ( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECoreScene.PrimitiveVariable.Interpolation.Uniform ) :
+
+			timer = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+			IECoreScene.MeshAlgo.calculateNormals( m, interpolation = interpolation )
+
+			print( "{0} normals for {1} faces : {2}s".format( interpolation, m.numFaces(), timer.totalElapsed() ) )
+
 if __name__ == "__main__":
 	unittest.main()
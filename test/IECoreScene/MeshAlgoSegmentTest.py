@@ -199,5 +199,53 @@ class MeshAlgoSegmentTest( unittest.TestCase ) :
 		self.assertEqual( segments[0].numFaces(), 5)
 		self.assertEqual( segments[1].numFaces(), 4)
 
+	def testSegmentMatchesDeleteFaces( self ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( 0 ), imath.V2f( 10 ) ), imath.V2i( 10 ) )
+		mesh.setCorners( IECore.IntVectorData( [ 0, 12, 120 ] ), IECore.FloatVectorData( [ 1, 2, 3 ] ) )
+		mesh.setCreases( IECore.IntVectorData( [ 3 ] ), IECore.IntVectorData( [ 0, 1, 2 ] ), IECore.FloatVectorData( [ 4 ] ) )
+
+		mesh["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ 10, 20 ] ), IECore.IntVectorData( [ i % 2 for i in range( 0, 100 ) ] ) )
+		mesh["fv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, IECore.FloatVectorData( range( 0, 400 ) ) )
+		mesh["c"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Constant, IECore.StringData( "c" ) )
+		mesh["s"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ ( i * 7 ) % 17 for i in range( 0, 100 ) ] ) )
+
+		segmentValues = IECore.IntVectorData( range( 0, 17 ) )
+		segments = IECoreScene.MeshAlgo.segment( mesh, mesh["s"], segmentValues )
+		self.assertEqual( len( segments ), 17 )
+
+		for value, segment in zip( segmentValues, segments ) :
+			toDelete = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Uniform,
+				IECore.BoolVectorData( [ s != value for s in mesh["s"].data ] )
+			)
+			self.assertTrue( segment.arePrimitiveVariablesValid() )
+			self.assertEqual( segment, IECoreScene.MeshAlgo.deleteFaces( mesh, toDelete ) )
+
+	def testSegmentWithRepeatedValues( self ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( 0 ), imath.V2f( 2 ) ), imath.V2i( 2 ) )
+		mesh["s"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ 0, 0, 1, 1 ] ) )
+
+		segments = IECoreScene.MeshAlgo.segment( mesh, mesh["s"], IECore.IntVectorData( [ 1, 0, 1 ] ) )
+
+		self.assertEqual( len( segments ), 3 )
+		self.assertEqual( segments[0], segments[2] )
+		self.assertFalse( segments[0].isSame( segments[2] ) )
+		self.assertEqual( segments[1]["s"].data, IECore.IntVectorData( [ 0, 0 ] ) )
+
+	def testRaisesExceptionIfSegmentPrimitiveVariableIsNotUniform( self ) :
+
+		mesh = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( 0 ), imath.V2f( 2 ) ), imath.V2i( 2 ) )
+
+		mesh["v"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.IntVectorData( [ 0, 1 ] * 4 + [ 0 ] ) )
+		self.assertRaises( RuntimeError, IECoreScene.MeshAlgo.segment, mesh, mesh["v"], IECore.IntVectorData( [ 0, 1 ] ) )
+
+		mesh["fv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, IECore.IntVectorData( [ 0, 1 ] * 8 ) )
+		self.assertRaises( RuntimeError, IECoreScene.MeshAlgo.segment, mesh, mesh["fv"], IECore.IntVectorData( [ 0, 1 ] ) )
+
+		mesh["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [ 0, 1, 0, 1, 0 ] ) )
+		self.assertRaises( RuntimeError, IECoreScene.MeshAlgo.segment, mesh, mesh["u"], IECore.IntVectorData( [ 0, 1 ] ) )
+
 if __name__ == "__main__" :
 	unittest.main()
@@ -32,6 +32,7 @@
 #
 ##########################################################################
 
+import os
 import unittest
 
 import IECore
@@ -346,6 +347,19 @@ class MeshAlgoTangentsTest( unittest.TestCase ) :
 		self.assertArrayEqual( btRes, biTangent.data )
 
 
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testPerformance( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 3200 ) )
+
+		timer = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+		IECoreScene.MeshAlgo.calculateTangentsFromUV( m )
+		print( "Tangents from UV for {0} faces : {1}s".format( m.numFaces(), timer.totalElapsed() ) )
+
+		timer = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+		IECoreScene.MeshAlgo.calculateTangentsFromFirstEdge( m )
+		print( "Tangents from first edge for {0} faces : {1}s".format( m.numFaces(), timer.totalElapsed() ) )
+
 
 if __name__ == "__main__":
 	unittest.main()
@@ -284,6 +284,37 @@ class MeshAlgoTriangulateTest( unittest.TestCase ) :
 		self.assertEqual( m2.creaseIds(), m.creaseIds() )
 		self.assertEqual( m2.creaseSharpnesses(), m.creaseSharpnesses() )
 
+	def testSharedTopology( self ) :
+
+		m = IECore.Reader.create( "test/IECore/data/cobFiles/polySphereQuads.cob").read()
+		m["fv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, IECore.IntVectorData( range( 0, len( m.vertexIds ) ) ) )
+		m["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( range( 0, m.numFaces() ) ) )
+		mCopy = m.copy()
+
+		# The second triangulation shares the topology of the first, but
+		# must still remap its own primitive variables.
+
+		m2 = m.copy()
+		m2["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData( [ p * 2 for p in m["P"].data ] ) )
+		m2["fv"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.FaceVarying, IECore.IntVectorData( [ i * 2 for i in m["fv"].data ] ) )
+
+		for mesh in ( m, m2 ) :
+
+			# Triangulation with exceptions enabled doesn't share the topology,
+			# so provides a reference.
+			expected = IECoreScene.MeshAlgo.triangulate( mesh, throwExceptions = True )
+			result = IECoreScene.MeshAlgo.triangulate( mesh )
+
+			self.assertTrue( result.arePrimitiveVariablesValid() )
+			self.assertEqual( result, expected )
+
+		self.assertEqual( m, mCopy )
+
+		# Changing the topology must not reuse the previous triangulation.
+
+		m3 = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 3 ) )
+		self.assertEqual( IECoreScene.MeshAlgo.triangulate( m3 ), IECoreScene.MeshAlgo.triangulate( m3, throwExceptions = True ) )
+
 	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
 	def testTriangulatePerformance( self ):
 
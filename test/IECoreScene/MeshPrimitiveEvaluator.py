@@ -33,6 +33,7 @@
 ##########################################################################
 
 import math
+import os
 import unittest
 import random
 import imath
@@ -370,6 +371,130 @@ class TestMeshPrimitiveEvaluator( unittest.TestCase ) :
 					hits = mpe.intersectionPoints( origin, direction )
 					self.assertFalse( hits )
 
+	def testBatchedQueries( self ) :
+
+		m = IECore.Reader.create( "test/IECore/data/cobFiles/pSphereShape1.cob" ).read()
+		mpe = IECoreScene.PrimitiveEvaluator.create( m )
+		r = mpe.createResult()
+
+		random.seed( 2 )
+		points = IECore.V3fVectorData( [
+			3 * imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) )
+			for i in range( 0, 1000 )
+		] )
+
+		results = mpe.closestPoints( points )
+		expectedKeys = { "triangleIndex", "barycentricCoordinates", "P", "N" }
+		if "uv" in m :
+			expectedKeys.add( "uv" )
+		self.assertEqual( set( results.keys() ), expectedKeys )
+		for key in results.keys() :
+			self.assertEqual( len( results[key] ), len( points ) )
+
+		for i, p in enumerate( points ) :
+			self.assertTrue( mpe.closestPoint( p, r ) )
+			self.assertEqual( results["triangleIndex"][i], r.triangleIndex() )
+			self.assertEqual( results["barycentricCoordinates"][i], r.barycentricCoordinates() )
+			self.assertEqual( results["P"][i], r.point() )
+			self.assertEqual( results["N"][i], r.normal() )
+			if "uv" in m :
+				self.assertEqual( results["uv"][i], r.uv() )
+
+		# rays with individual directions
+
+		directions = IECore.V3fVectorData( [ -p for p in points ] )
+		results = mpe.nearestIntersectionPoints( points, directions )
+		for i, p in enumerate( points ) :
+			self.assertTrue( mpe.intersectionPoint( p, directions[i], r ) )
+			self.assertEqual( results["triangleIndex"][i], r.triangleIndex() )
+			self.assertEqual( results["P"][i], r.point() )
+
+		# rays with a shared direction, some of which miss
+
+		direction = IECore.V3fVectorData( [ imath.V3f( 0, 0, 1 ) ] )
+		results = mpe.nearestIntersectionPoints( points, direction, maxDistance = 2 )
+		misses = 0
+		for i, p in enumerate( points ) :
+			if mpe.intersectionPoint( p, direction[0], r, 2 ) :
+				self.assertEqual( results["triangleIndex"][i], r.triangleIndex() )
+				self.assertEqual( results["P"][i], r.point() )
+			else :
+				misses += 1
+				self.assertEqual( results["triangleIndex"][i], -1 )
+				self.assertEqual( results["P"][i], imath.V3f( 0 ) )
+
+		self.assertGreater( misses, 0 )
+
+		self.assertRaises( Exception, mpe.nearestIntersectionPoints, points, IECore.V3fVectorData( [ imath.V3f( 1 ) ] * 2 ) )
+
+	def testBoundingVolumeHierarchy( self ) :
+
+		m = IECore.Reader.create( "test/IECore/data/cobFiles/pSphereShape1.cob" ).read()
+
+		kd = IECoreScene.MeshPrimitiveEvaluator( m )
+		self.assertEqual( kd.accelerationStructure(), IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.KDTree )
+
+		bvh = IECoreScene.MeshPrimitiveEvaluator( m, IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BoundingVolumeHierarchy )
+		self.assertEqual( bvh.accelerationStructure(), IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BoundingVolumeHierarchy )
+
+		kdResult = kd.createResult()
+		bvhResult = bvh.createResult()
+
+		random.seed( 3 )
+		for i in range( 0, 1000 ) :
+
+			p = 3 * imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) )
+
+			# Points may be equidistant from several triangles, so we compare
+			# distances rather than triangle indices.
+			self.assertTrue( kd.closestPoint( p, kdResult ) )
+			self.assertTrue( bvh.closestPoint( p, bvhResult ) )
+			self.assertAlmostEqual( ( kdResult.point() - p ).length(), ( bvhResult.point() - p ).length(), 5 )
+
+			d = imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -1, 1 ) )
+			kdHit = kd.intersectionPoint( p, d, kdResult )
+			self.assertEqual( bvh.intersectionPoint( p, d, bvhResult ), kdHit )
+			if kdHit :
+				self.assertTrue( bvhResult.point().equalWithAbsError( kdResult.point(), 1e-5 ) )
+
+			self.assertEqual( len( bvh.intersectionPoints( p, d ) ), len( kd.intersectionPoints( p, d ) ) )
+
+		# Empty meshes are supported.
+
+		m = IECoreScene.MeshPrimitive()
+		m["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData() )
+		bvh = IECoreScene.MeshPrimitiveEvaluator( m, IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BoundingVolumeHierarchy )
+		r = bvh.createResult()
+		self.assertFalse( bvh.closestPoint( imath.V3f( 0 ), r ) )
+		self.assertFalse( bvh.intersectionPoint( imath.V3f( 0 ), imath.V3f( 0, 0, 1 ), r ) )
+		self.assertEqual( bvh.intersectionPoints( imath.V3f( 0 ), imath.V3f( 0, 0, 1 ) ), [] )
+
+	@unittest.skipUnless( os.environ.get("CORTEX_PERFORMANCE_TEST", False), "'CORTEX_PERFORMANCE_TEST' env var not set" )
+	def testAccelerationStructurePerformance( self ) :
+
+		m = IECoreScene.MeshPrimitive.createPlane( imath.Box2f( imath.V2f( -1 ), imath.V2f( 1 ) ), imath.V2i( 1000 ) )
+		m = IECoreScene.MeshAlgo.triangulate( m )
+
+		random.seed( 4 )
+		points = IECore.V3fVectorData( [
+			imath.V3f( random.uniform( -1, 1 ), random.uniform( -1, 1 ), random.uniform( -0.1, 0.1 ) )
+			for i in range( 0, 100000 )
+		] )
+
+		for accelerationStructure in ( IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.KDTree, IECoreScene.MeshPrimitiveEvaluator.AccelerationStructure.BoundingVolumeHierarchy ) :
+
+			t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+			e = IECoreScene.MeshPrimitiveEvaluator( m, accelerationStructure )
+			print( "{0} build : {1}s".format( accelerationStructure, t.stop() ) )
+
+			t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+			e.closestPoints( points )
+			print( "{0} closestPoints : {1}s".format( accelerationStructure, t.stop() ) )
+
+			t = IECore.Timer( True, IECore.Timer.Mode.WallClock )
+			e.nearestIntersectionPoints( points, IECore.V3fVectorData( [ imath.V3f( 0, 0, 1 ) ] ) )
+			print( "{0} nearestIntersectionPoints : {1}s".format( accelerationStructure, t.stop() ) )
+
 	def testEvaluateIndexedPrimitiveVariables( self ) :
 
 		m = IECoreScene.MeshPrimitive(
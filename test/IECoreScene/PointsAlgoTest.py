@@ -594,6 +594,15 @@ class SegmentPointsTest( unittest.TestCase ) :
 		self.assertEqual( segments[0]["P"].data, IECore.V3fVectorData( [imath.V3f( 0 ), imath.V3f( 1 )], IECore.GeometricData.Interpretation.Point ) )
 		self.assertEqual( segments[1]["P"].data, IECore.V3fVectorData( [imath.V3f( 2 ), imath.V3f( 3 )], IECore.GeometricData.Interpretation.Point ) )
 
+	def testRaisesExceptionIfSegmentPrimitiveVariableIsMismatched( self ) :
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [imath.V3f( x ) for x in range( 0, 4 )] ) )
+
+		points["u"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Uniform, IECore.IntVectorData( [0] ) )
+		self.assertRaises( RuntimeError, IECoreScene.PointsAlgo.segment, points, points["u"], IECore.IntVectorData( [0] ) )
+
+		points["v"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.IntVectorData( [0, 0, 1, 1, 1] ) )
+		self.assertRaises( RuntimeError, IECoreScene.PointsAlgo.segment, points, points["v"], IECore.IntVectorData( [0, 1] ) )
+
 	def testCanSegmentUsingStringPrimvar( self ) :
 		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [imath.V3f( x ) for x in range( 0, 4 )] ) )
 
@@ -678,6 +687,25 @@ class SegmentPointsTest( unittest.TestCase ) :
 		self.assertEqual( len(segments[0]["P"].data), 25 )
 		self.assertEqual( len(segments[1]["P"].data), 25 )
 
+	def testSegmentMatchesDeletePoints( self ) :
+
+		points = IECoreScene.PointsPrimitive( IECore.V3fVectorData( [ imath.V3f( x ) for x in range( 0, 100 ) ] ) )
+		points["r"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.FloatVectorData( [ 1, 2, 3 ] ), IECore.IntVectorData( [ x % 3 for x in range( 0, 100 ) ] ) )
+		points["c"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Constant, IECore.StringData( "c" ) )
+		points["s"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.IntVectorData( [ ( x * 7 ) % 13 for x in range( 0, 100 ) ] ) )
+
+		segmentValues = IECore.IntVectorData( range( 0, 13 ) )
+		segments = IECoreScene.PointsAlgo.segment( points, points["s"], segmentValues )
+		self.assertEqual( len( segments ), 13 )
+
+		for value, segment in zip( segmentValues, segments ) :
+			toDelete = IECoreScene.PrimitiveVariable(
+				IECoreScene.PrimitiveVariable.Interpolation.Vertex,
+				IECore.BoolVectorData( [ s != value for s in points["s"].data ] )
+			)
+			self.assertTrue( segment.arePrimitiveVariablesValid() )
+			self.assertEqual( segment, IECoreScene.PointsAlgo.deletePoints( points, toDelete ) )
+
 
 if __name__ == "__main__":
 	unittest.main()
@@ -676,6 +676,186 @@ class SceneCacheTest( unittest.TestCase ) :
 		self.assertEqual( b.readObject(1)['P'], b.readObjectPrimitiveVariables(['P','Cs'], 1)['P'] )
 		self.assertEqual( b.readObject(1)['Cs'], b.readObjectPrimitiveVariables(['P','Cs'], 1)['Cs'] )
 
+	def testObjectPrimitiveVariablesRangeRead( self ) :
+
+		box = IECoreScene.MeshPrimitive.createBox( imath.Box3f( imath.V3f( 0 ), imath.V3f( 1 ) ) )
+		box2 = box.copy()
+		box2["P"] = IECoreScene.PrimitiveVariable( IECoreScene.PrimitiveVariable.Interpolation.Vertex, IECore.V3fVectorData( [ p * 2 for p in box["P"].data ] ) )
+
+		s = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		b = s.createChild( "b" )
+		b.writeObject( box, 0 )
+		b.writeObject( box2, 1 )
+
+		del s, b
+
+		s = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		b = s.child( "b" )
+
+		for time in ( 0, 0.5, 1 ) :
+
+			p = b.readObject( time )["P"].data
+			pRange = b.readObjectPrimitiveVariablesRange( [ "P" ], time, 2, 3 )["P"]
+			self.assertEqual( pRange.interpolation, IECoreScene.PrimitiveVariable.Interpolation.Vertex )
+			self.assertEqual( pRange.data, IECore.V3fVectorData( p[2:5], p.getInterpretation() ) )
+			self.assertEqual( pRange.data.getInterpretation(), IECore.GeometricData.Interpretation.Point )
+
+		# indexed variables are ranged by their indices
+		uvRange = b.readObjectPrimitiveVariablesRange( [ "uv" ], 0, 4, 6 )["uv"]
+		self.assertEqual( uvRange.data, box["uv"].data )
+		self.assertEqual( uvRange.indices, IECore.IntVectorData( box["uv"].indices[4:10] ) )
+
+		# ranges are clamped
+		pEnd = b.readObjectPrimitiveVariablesRange( [ "P" ], 0, 6, 100 )["P"]
+		self.assertEqual( pEnd.data, IECore.V3fVectorData( box["P"].data[6:], IECore.GeometricData.Interpretation.Point ) )
+		self.assertEqual( pEnd.data.getInterpretation(), IECore.GeometricData.Interpretation.Point )
+
+	def testPrefetch( self ) :
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		for name in ( "a", "b" ) :
+			c = m.createChild( name )
+			c.writeAttribute( "w", IECore.BoolData( True ), 0 )
+			for frame in range( 0, 3 ) :
+				c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( frame, 0, 0 ) ) ), frame / 24.0 )
+				c.writeObject( IECoreScene.SpherePrimitive( frame + 1 ), frame / 24.0 )
+		del m, c
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+
+		paths = IECore.PathMatcher( [ "/a", "/b" ] )
+		m.prefetch( paths, 0, 2, 24.0, IECoreScene.SceneAlgo.ProcessFlags.All )
+
+		s = m.readCacheStatistics()
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertGreater( cacheStatistics.misses, 0 )
+
+		# Reads at the prefetched times should now be served entirely
+		# from the caches.
+
+		m.resetReadCacheStatistics()
+
+		for name in ( "a", "b" ) :
+			for frame in range( 0, 3 ) :
+				self.assertEqual( m.child( name ).readObject( frame / 24.0 ), IECoreScene.SpherePrimitive( frame + 1 ) )
+				self.assertEqual( m.child( name ).readTransformAsMatrix( frame / 24.0 ), imath.M44d().translate( imath.V3d( frame, 0, 0 ) ) )
+				self.assertEqual( m.child( name ).readAttribute( "w", frame / 24.0 ), IECore.BoolData( True ) )
+
+		s = m.readCacheStatistics()
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertEqual( cacheStatistics.misses, 0 )
+			self.assertGreater( cacheStatistics.hits, 0 )
+
+		# Prefetching only objects leaves the transform cache cold.
+
+		m2 = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		m2.prefetch( paths, 0, 2, 24.0, IECoreScene.SceneAlgo.ProcessFlags.Objects )
+
+		s = m2.readCacheStatistics()
+		self.assertGreater( s.object.misses, 0 )
+		self.assertEqual( s.transform.misses, 0 )
+
+		m.prefetch( IECore.PathMatcher( [ "/..." ] ), 0, 2, 24.0 )
+
+		canceller = IECore.Canceller()
+		canceller.cancel()
+		self.assertRaises( IECore.Cancelled, m.prefetch, paths, 0, 2, 24.0, IECoreScene.SceneAlgo.ProcessFlags.All, canceller )
+
+		w = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		self.assertRaises( RuntimeError, w.prefetch, paths, 0, 2, 24.0 )
+
+	def testCacheMemoryOptions( self ) :
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		c = m.createChild( "a" )
+		for frame in range( 0, 3 ) :
+			c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( frame, 0, 0 ) ) ), frame / 24.0 )
+			c.writeObject( IECoreScene.SpherePrimitive( frame + 1 ), frame / 24.0 )
+		del m, c
+
+		# caches too small to hold anything must still read correctly
+		options = IECore.CompoundData( {
+			"objectCacheMemory" : IECore.UInt64Data( 1 ),
+			"attributeCacheMemory" : IECore.UInt64Data( 1 ),
+			"transformCacheMemory" : IECore.UInt64Data( 1 ),
+			"memoryMapped" : IECore.BoolData( True ),
+		} )
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read, options )
+		m2 = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		for i in range( 0, 2 ) :
+			for frame in range( 0, 3 ) :
+				for scene in ( m, m2 ) :
+					self.assertEqual( scene.child( "a" ).readObject( frame / 24.0 ), IECoreScene.SpherePrimitive( frame + 1 ) )
+					self.assertEqual( scene.child( "a" ).readTransformAsMatrix( frame / 24.0 ), imath.M44d().translate( imath.V3d( frame, 0, 0 ) ) )
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read, options = IECore.CompoundData() )
+		self.assertEqual( m.child( "a" ).readObject( 0 ), IECoreScene.SpherePrimitive( 1 ) )
+
+	def testReadCacheStatistics( self ) :
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		c = m.createChild( "a" )
+		c.writeAttribute( "w", IECore.BoolData( True ), 0 )
+		for frame in range( 0, 3 ) :
+			c.writeTransform( IECore.M44dData( imath.M44d().translate( imath.V3d( frame, 0, 0 ) ) ), frame / 24.0 )
+			c.writeObject( IECoreScene.SpherePrimitive( frame + 1 ), frame / 24.0 )
+		del m, c
+
+		m = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+
+		def read() :
+			for frame in range( 0, 3 ) :
+				m.child( "a" ).readObject( frame / 24.0 )
+				m.child( "a" ).readTransformAsMatrix( frame / 24.0 )
+				m.child( "a" ).readAttribute( "w", frame / 24.0 )
+
+		s = m.readCacheStatistics()
+		self.assertIsInstance( s, IECoreScene.SceneCache.ReadCacheStatistics )
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertIsInstance( cacheStatistics, IECore.CacheStatistics )
+			self.assertEqual( cacheStatistics.hits, 0 )
+			self.assertEqual( cacheStatistics.misses, 0 )
+
+		# The first reads are misses, which compute the values.
+
+		read()
+		s = m.readCacheStatistics()
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertGreater( cacheStatistics.misses, 0 )
+			self.assertGreater( cacheStatistics.getterTime, 0 )
+
+		# Subsequent reads are all hits.
+
+		m.resetReadCacheStatistics()
+		read()
+		s = m.readCacheStatistics()
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertEqual( cacheStatistics.misses, 0 )
+			self.assertGreater( cacheStatistics.hits, 0 )
+
+		# The statistics are shared by all locations in the file.
+
+		s2 = m.child( "a" ).readCacheStatistics()
+		self.assertEqual( s2.object.hits, s.object.hits )
+		self.assertEqual( s2.transform.hits, s.transform.hits )
+		self.assertEqual( s2.attribute.hits, s.attribute.hits )
+
+		m.child( "a" ).resetReadCacheStatistics()
+		s = m.readCacheStatistics()
+		for cacheStatistics in ( s.object, s.transform, s.attribute ) :
+			self.assertEqual( cacheStatistics.hits, 0 )
+			self.assertEqual( cacheStatistics.misses, 0 )
+
+		# Other files have their own statistics.
+
+		m2 = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( m2.readCacheStatistics().object.misses, 0 )
+
+		w = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write )
+		self.assertRaises( RuntimeError, w.readCacheStatistics )
+		self.assertRaises( RuntimeError, w.resetReadCacheStatistics )
+
 	def testTags( self ) :
 
 		sphere = IECoreScene.SpherePrimitive( 1 )
@@ -885,6 +1065,85 @@ class SceneCacheTest( unittest.TestCase ) :
 		A3 = readRoot3.child('A')
 		self.assertEqual( A.hashSet("dummySetA"), A3.hashSet("dummySetA") )
 
+	def testSetIndex( self ) :
+
+		def writeScene( fileName, options ) :
+
+			writeRoot = IECoreScene.SceneCache( fileName, IECore.IndexedIO.OpenMode.Write, options )
+
+			A = writeRoot.createChild( "A" )
+			B = A.createChild( "B" )
+			C = A.createChild( "C" )
+			D = B.createChild( "D" )
+			E = writeRoot.createChild( "E" )
+
+			A.writeSet( "don", IECore.PathMatcher( [ "/B/D", "/C" ] ) )
+			B.writeSet( "john", IECore.PathMatcher( [ "/" ] ) )
+			# Only the last set written with a given name should be kept.
+			B.writeSet( "don", IECore.PathMatcher( [ "/D" ] ) )
+			B.writeSet( "don", IECore.PathMatcher( [ "/" ] ) )
+			E.writeSet( "john", IECore.PathMatcher( [ "/" ] ) )
+
+			C.writeTags( [ "tagged" ] )
+			D.writeTags( [ "tagged", "don" ] )
+			D.writeObject( IECoreScene.SpherePrimitive(), 0 )
+
+		writeScene( "/tmp/testIndexed.scc", None )
+		writeScene( "/tmp/testUnindexed.scc", IECore.CompoundData( { "setIndex" : IECore.BoolData( False ) } ) )
+
+		indexed = IECoreScene.SceneCache( "/tmp/testIndexed.scc", IECore.IndexedIO.OpenMode.Read )
+		unindexed = IECoreScene.SceneCache( "/tmp/testUnindexed.scc", IECore.IndexedIO.OpenMode.Read )
+
+		self.assertEqual( set( indexed.readSet( "don" ).paths() ), { "/A/B", "/A/B/D", "/A/C" } )
+		self.assertEqual( set( indexed.readSet( "john" ).paths() ), { "/A/B", "/E" } )
+		self.assertEqual( set( indexed.readSet( "tagged" ).paths() ), { "/A/C", "/A/B/D" } )
+		self.assertEqual( set( indexed.readSet( "ObjectType:SpherePrimitive" ).paths() ), { "/A/B/D" } )
+		self.assertEqual( indexed.readSet( "notASet" ), IECore.PathMatcher() )
+
+		def assertSetsEqual( indexedScene, unindexedScene ) :
+
+			self.assertEqual( indexedScene.setNames(), unindexedScene.setNames() )
+			for setName in [ "don", "john", "tagged", "ObjectType:SpherePrimitive", "notASet" ] :
+				for includeDescendantSets in ( True, False ) :
+					self.assertEqual(
+						indexedScene.readSet( setName, includeDescendantSets ),
+						unindexedScene.readSet( setName, includeDescendantSets )
+					)
+
+			for childName in indexedScene.childNames() :
+				assertSetsEqual( indexedScene.child( childName ), unindexedScene.child( childName ) )
+
+		assertSetsEqual( indexed, unindexed )
+
+	def testReadSetFromManyLocations( self ) :
+
+		# Disable the set index so that we test the parallel traversal
+		# of the hierarchy.
+		options = IECore.CompoundData( { "setIndex" : IECore.BoolData( False ) } )
+		writeRoot = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Write, options )
+
+		expectedSet = IECore.PathMatcher()
+		expectedTag = IECore.PathMatcher()
+		for i in range( 0, 20 ) :
+			a = writeRoot.createChild( "a{}".format( i ) )
+			for j in range( 0, 20 ) :
+				b = a.createChild( "b{}".format( j ) )
+				if ( i + j ) % 3 == 0 :
+					b.writeSet( "set", IECore.PathMatcher( [ "/", "/c" ] ) )
+					expectedSet.addPath( "/a{}/b{}".format( i, j ) )
+					expectedSet.addPath( "/a{}/b{}/c".format( i, j ) )
+				if ( i + j ) % 4 == 0 :
+					b.createChild( "c" ).writeTags( [ "tag" ] )
+					expectedTag.addPath( "/a{}/b{}/c".format( i, j ) )
+
+		del a, b, writeRoot
+
+		readRoot = IECoreScene.SceneCache( "/tmp/test.scc", IECore.IndexedIO.OpenMode.Read )
+		self.assertEqual( readRoot.readSet( "set" ), expectedSet )
+		self.assertEqual( readRoot.readSet( "tag" ), expectedTag )
+		self.assertEqual( readRoot.child( "a2" ).readSet( "set" ), expectedSet.subTree( "/a2" ) )
+		self.assertEqual( readRoot.child( "a2" ).readSet( "tag" ), expectedTag.subTree( "/a2" ) )
+
 	def testTagsConvertedToSets( self ) :
 
 		# A